@@ -0,0 +1,393 @@
+# MindHome - benchmarks/history_generator.py | see version.py for version info
+"""
+MindHome - Synthetic StateHistory Generator
+Fills a local SQLite database with realistic rooms, devices and state history
+so pattern_engine / automation_engine can be profiled without a production DB.
+
+The history is a mix of
+  - embedded routines (morning / evening / night) per room with jittered
+    timing, so time, sequence, correlation and scene detection have real
+    signal to find,
+  - random manual toggles on actionable devices,
+  - numeric sensor noise (temperature, power, humidity),
+  - presence changes of a few persons.
+
+Everything is driven by a seeded RNG: the same arguments give the same rooms,
+devices and event stream. Timestamps are anchored at the current time because
+the detectors only look at the last 14 days, so event counts can differ by a
+few routines that cross the window edge.
+
+Usage (from the repo root):
+    python addon/benchmarks/history_generator.py --db /tmp/mh.db --entities 500
+"""
+
+import argparse
+import contextlib
+import io
+import logging
+import os
+import random
+import sys
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from zoneinfo import ZoneInfo
+
+_MINDHOME_DIR = Path(__file__).resolve().parents[1] / "rootfs" / "opt" / "mindhome"
+if str(_MINDHOME_DIR) not in sys.path:
+    sys.path.insert(0, str(_MINDHOME_DIR))
+
+from sqlalchemy import insert  # noqa: E402
+
+from models import (  # noqa: E402
+    get_engine, get_session, run_migrations,
+    Device, Domain, Room, RoomDomainState, StateHistory, LearningPhase,
+    User, UserRole,
+)
+from init_db import (  # noqa: E402
+    create_default_domains, create_default_settings, create_default_presence_modes,
+)
+
+logger = logging.getLogger("mindhome.benchmarks.history_generator")
+
+LOCAL_TZ = ZoneInfo("Europe/Berlin")
+
+ROOM_NAMES = [
+    "Wohnzimmer", "Kueche", "Schlafzimmer", "Bad", "Flur", "Buero",
+    "Kinderzimmer", "Esszimmer", "Gaestezimmer", "Keller", "Garage",
+    "Ankleide", "Hauswirtschaft", "Dachboden", "Werkstatt", "Terrasse",
+]
+
+# (HA domain, MindHome domain, share of entities, kind)
+# kind: "toggle" = on/off actor, "cover" = open/closed, "climate" = heat/off,
+#       "numeric" = sensor value, "binary" = on/off sensor
+DEVICE_MIX = [
+    ("light", "light", 0.26, "toggle"),
+    ("switch", "switch", 0.10, "toggle"),
+    ("cover", "cover", 0.10, "cover"),
+    ("climate", "climate", 0.06, "climate"),
+    ("media_player", "media", 0.05, "toggle"),
+    ("lock", "lock", 0.02, "lock"),
+    ("binary_sensor", "motion", 0.13, "binary"),
+    ("binary_sensor", "door_window", 0.08, "binary"),
+    ("sensor", "energy", 0.10, "numeric"),
+    ("sensor", "weather", 0.10, "numeric"),
+]
+
+PERSONS = ["person.max", "person.anna", "person.lena"]
+
+# (name, weekday hour, weekend hour, steps) — a step is (kind filter, state, delay seconds)
+ROUTINES = [
+    ("morning", 6.75, 8.5, [
+        ("motion", "on", 0), ("light", "on", 25), ("cover", "open", 90),
+        ("climate", "heat", 140),
+    ]),
+    ("evening", 19.0, 19.5, [
+        ("light", "on", 0), ("media_player", "on", 45), ("cover", "closed", 100),
+    ]),
+    ("night", 23.0, 23.75, [
+        ("media_player", "off", 0), ("light", "off", 20), ("climate", "off", 60),
+        ("motion", "off", 110),
+    ]),
+]
+
+_INSERT_CHUNK = 5000
+
+
+@dataclass
+class GeneratorConfig:
+    """Knobs for the synthetic history (defaults: medium household)."""
+
+    entities: int = 200
+    days: int = 14
+    events_per_entity_day: float = 8.0
+    routine_share: float = 0.6      # share of rooms that follow routines
+    routine_skip: float = 0.1       # probability a routine is skipped on a day
+    jitter_minutes: float = 12.0    # stddev of routine start time
+    seed: int = 42
+    end: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+
+
+@dataclass
+class _Entity:
+    entity_id: str
+    device_id: int
+    room: str
+    ha_domain: str
+    kind: str
+    state: str
+
+
+def _room_names(count):
+    names = []
+    for i in range(count):
+        base = ROOM_NAMES[i % len(ROOM_NAMES)]
+        suffix = i // len(ROOM_NAMES)
+        names.append(base if suffix == 0 else f"{base} {suffix + 1}")
+    return names
+
+
+def _slug(name):
+    return name.lower().replace(" ", "_")
+
+
+def _context(ts_local, persons_home):
+    """Same shape as ContextBuilder.build(), reduced to what the detectors read."""
+    hour = ts_local.hour
+    if 5 <= hour < 9:
+        slot = "morning"
+    elif 9 <= hour < 12:
+        slot = "midday"
+    elif 12 <= hour < 17:
+        slot = "afternoon"
+    elif 17 <= hour < 21:
+        slot = "evening"
+    else:
+        slot = "night"
+    return {
+        "time_slot": slot,
+        "weekday": ts_local.weekday(),
+        "is_weekend": ts_local.weekday() >= 5,
+        "hour": hour,
+        "minute": ts_local.minute,
+        "month": ts_local.month,
+        "persons_home": sorted(persons_home),
+        "anyone_home": bool(persons_home),
+        "sun_elevation": round(40 * (1 - abs(hour + ts_local.minute / 60 - 13) / 7), 1),
+    }
+
+
+def _initial_state(kind):
+    return {"toggle": "off", "cover": "closed", "climate": "off", "lock": "locked",
+            "binary": "off", "numeric": "20.0"}[kind]
+
+
+def _random_state(rng, ent):
+    if ent.kind == "numeric":
+        base = float(ent.state) if ent.state.replace(".", "", 1).lstrip("-").isdigit() else 20.0
+        return f"{base + rng.uniform(-2.5, 2.5):.1f}"
+    flips = {"toggle": ("on", "off"), "cover": ("open", "closed"), "climate": ("heat", "off"),
+             "lock": ("locked", "unlocked"), "binary": ("on", "off")}[ent.kind]
+    return flips[1] if ent.state == flips[0] else flips[0]
+
+
+def _seed_schema(engine):
+    """Tables, migrations and default rows exactly as a fresh add-on install."""
+    run_migrations(engine)
+    session = get_session(engine)
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            create_default_domains(session)
+            create_default_settings(session)
+            create_default_presence_modes(session)
+    finally:
+        session.close()
+
+
+def _create_devices(session, cfg, rng):
+    domains = {d.name: d for d in session.query(Domain).all()}
+    for _ha, mh_domain, _share, _kind in DEVICE_MIX:
+        domains[mh_domain].is_enabled = True
+    domains["presence"].is_enabled = True
+
+    room_count = max(3, cfg.entities // 12)
+    rooms = []
+    for name in _room_names(room_count):
+        room = Room(name=name, ha_area_id=_slug(name), icon="mdi:door")
+        session.add(room)
+        rooms.append(room)
+    session.flush()
+
+    for room in rooms:
+        for _ha, mh_domain, _share, _kind in DEVICE_MIX:
+            session.add(RoomDomainState(
+                room_id=room.id, domain_id=domains[mh_domain].id,
+                learning_phase=LearningPhase.SUGGESTING, confidence_score=0.5,
+            ))
+
+    person_count = min(len(PERSONS), max(1, cfg.entities // 100))
+    actor_count = cfg.entities - person_count
+    specs = []
+    for ha_domain, mh_domain, share, kind in DEVICE_MIX:
+        specs.extend([(ha_domain, mh_domain, kind)] * max(1, round(actor_count * share)))
+    specs = specs[:actor_count]
+    rng.shuffle(specs)
+
+    entities = []
+    counters = {}
+    for i, (ha_domain, mh_domain, kind) in enumerate(specs):
+        room = rooms[i % len(rooms)]
+        key = (room.id, mh_domain)
+        counters[key] = counters.get(key, 0) + 1
+        entity_id = f"{ha_domain}.{_slug(room.name)}_{mh_domain}_{counters[key]}"
+        device = Device(
+            ha_entity_id=entity_id,
+            name=f"{room.name} {mh_domain} {counters[key]}",
+            domain_id=domains[mh_domain].id,
+            room_id=room.id,
+            is_controllable=kind not in ("binary", "numeric"),
+        )
+        session.add(device)
+        entities.append((device, room.name, ha_domain, kind))
+
+    for i, person in enumerate(PERSONS[:person_count]):
+        # Onboarding creates one user per person (the first is admin)
+        session.add(User(name=person.split(".")[1].title(), ha_person_entity=person,
+                         role=UserRole.ADMIN if i == 0 else UserRole.USER))
+        device = Device(ha_entity_id=person, name=person.split(".")[1].title(),
+                        domain_id=domains["presence"].id, is_controllable=False)
+        session.add(device)
+        entities.append((device, None, "person", "person"))
+
+    session.flush()
+    return rooms, [
+        _Entity(d.ha_entity_id, d.id, room, ha_domain, kind,
+                "home" if kind == "person" else _initial_state(kind))
+        for d, room, ha_domain, kind in entities
+    ]
+
+
+def _routine_events(cfg, rng, rooms, entities, start_local, days):
+    """Yield (ts_utc, entity, new_state) for embedded room routines."""
+    by_room = {}
+    for ent in entities:
+        by_room.setdefault(ent.room, []).append(ent)
+
+    routine_rooms = [r.name for r in rooms][: max(1, round(len(rooms) * cfg.routine_share))]
+    for day in range(days):
+        date = (start_local + timedelta(days=day)).date()
+        weekend = date.weekday() >= 5
+        for room in routine_rooms:
+            members = by_room.get(room, [])
+            for _name, wd_hour, we_hour, steps in ROUTINES:
+                if rng.random() < cfg.routine_skip:
+                    continue
+                hour = we_hour if weekend else wd_hour
+                begin = datetime(date.year, date.month, date.day, tzinfo=LOCAL_TZ) + timedelta(
+                    hours=hour, minutes=rng.gauss(0, cfg.jitter_minutes))
+                for kind_filter, state, delay in steps:
+                    for ent in members:
+                        if ent.ha_domain == kind_filter or (
+                                kind_filter == "motion" and ent.kind == "binary"
+                                and "_motion_" in ent.entity_id):
+                            ts = begin + timedelta(seconds=delay + rng.uniform(0, 8))
+                            yield ts.astimezone(timezone.utc), ent, state
+                            break
+
+
+def _noise_events(cfg, rng, entities, start_utc, seconds):
+    """Yield (ts_utc, entity, None) for random toggles / sensor updates."""
+    for ent in entities:
+        if ent.kind == "person":
+            continue
+        rate = cfg.events_per_entity_day * (1.6 if ent.kind == "numeric" else 0.6)
+        count = int(rate * cfg.days)
+        for _ in range(count):
+            # Activity is denser during the day (07-23 local)
+            offset = rng.uniform(0, seconds)
+            ts = start_utc + timedelta(seconds=offset)
+            if ts.astimezone(LOCAL_TZ).hour < 7 and rng.random() < 0.7:
+                continue
+            yield ts, ent, None
+
+
+def _presence_events(rng, entities, start_local, days):
+    persons = [e for e in entities if e.kind == "person"]
+    for day in range(days):
+        date = (start_local + timedelta(days=day)).date()
+        if date.weekday() >= 5:
+            continue
+        base = datetime(date.year, date.month, date.day, tzinfo=LOCAL_TZ)
+        for ent in persons:
+            leave = base + timedelta(hours=7.5, minutes=rng.gauss(0, 20))
+            back = base + timedelta(hours=17.25, minutes=rng.gauss(0, 30))
+            yield leave.astimezone(timezone.utc), ent, "not_home"
+            yield back.astimezone(timezone.utc), ent, "home"
+
+
+def generate(db_path, cfg=None):
+    """Create a fresh benchmark database at db_path. Returns summary dict."""
+    cfg = cfg or GeneratorConfig()
+    rng = random.Random(cfg.seed)
+    if os.path.exists(db_path):
+        os.remove(db_path)
+    for suffix in ("-wal", "-shm"):
+        if os.path.exists(db_path + suffix):
+            os.remove(db_path + suffix)
+
+    engine = get_engine(db_path)
+    _seed_schema(engine)
+
+    session = get_session(engine)
+    try:
+        rooms, entities = _create_devices(session, cfg, rng)
+        session.commit()
+
+        end_utc = cfg.end
+        start_utc = end_utc - timedelta(days=cfg.days)
+        start_local = start_utc.astimezone(LOCAL_TZ)
+        seconds = cfg.days * 86400
+
+        raw = list(_routine_events(cfg, rng, rooms, entities, start_local, cfg.days))
+        raw.extend(_noise_events(cfg, rng, entities, start_utc, seconds))
+        raw.extend(_presence_events(rng, entities, start_local, cfg.days))
+        raw = [r for r in raw if start_utc <= r[0] <= end_utc]
+        raw.sort(key=lambda r: r[0])
+
+        persons_home = {e.entity_id for e in entities if e.kind == "person"}
+        rows = []
+        for ts, ent, state in raw:
+            new_state = state if state is not None else _random_state(rng, ent)
+            if new_state == ent.state and ent.kind != "numeric":
+                continue
+            if ent.kind == "person":
+                (persons_home.add if new_state == "home" else persons_home.discard)(ent.entity_id)
+            rows.append({
+                "device_id": ent.device_id,
+                "entity_id": ent.entity_id,
+                "old_state": ent.state,
+                "new_state": new_state,
+                "context": _context(ts.astimezone(LOCAL_TZ), persons_home),
+                "created_at": ts,
+            })
+            ent.state = new_state
+
+        for i in range(0, len(rows), _INSERT_CHUNK):
+            session.execute(insert(StateHistory), rows[i:i + _INSERT_CHUNK])
+        session.commit()
+    finally:
+        session.close()
+    engine.dispose()
+
+    summary = {
+        "db": db_path,
+        "rooms": len(rooms),
+        "entities": len(entities),
+        "events": len(rows),
+        "days": cfg.days,
+        "seed": cfg.seed,
+    }
+    logger.info("Generated %(events)d events for %(entities)d entities in %(rooms)d rooms", summary)
+    return summary
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Generate a synthetic MindHome history database")
+    parser.add_argument("--db", required=True, help="SQLite path (overwritten)")
+    parser.add_argument("--entities", type=int, default=200)
+    parser.add_argument("--days", type=int, default=14)
+    parser.add_argument("--rate", type=float, default=8.0, help="events per entity and day")
+    parser.add_argument("--routine-share", type=float, default=0.6)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.WARNING, format="%(message)s")
+    summary = generate(args.db, GeneratorConfig(
+        entities=args.entities, days=args.days, events_per_entity_day=args.rate,
+        routine_share=args.routine_share, seed=args.seed,
+    ))
+    print(summary)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,287 @@
+# MindHome - benchmarks/pattern_bench.py | see version.py for version info
+"""
+MindHome - Pattern / Automation Engine Benchmark
+Generates a synthetic history per scale (history_generator.py) and runs the
+real analysis code against it, reporting per stage:
+  - wall time (ms), inclusive of nested stages
+  - SQL statements executed (counted on the engine)
+  - peak Python memory (tracemalloc, top-level stages only)
+  - number of calls (for stages invoked repeatedly, e.g. _upsert_pattern)
+
+Stages are measured by wrapping the engine methods on the instance, so the
+code under test is exactly what runs in production.
+
+Usage (from the repo root):
+    python addon/benchmarks/pattern_bench.py --scales 50,500,2000
+    python addon/benchmarks/pattern_bench.py --json /tmp/pb.json
+    python addon/benchmarks/pattern_bench.py --baseline /tmp/pb.json --fail-on-regression
+
+Nested stages are indented under pattern.full_analysis; their time is part
+of the parent. tracemalloc slows pure-Python code noticeably; use --no-memory
+when only timings matter. The correlation stage grows super-linearly with the
+number of tracked entities, so the 2000-entity scale can take a long time
+(lower --rate or --days for a quick smoke run).
+"""
+
+import argparse
+import functools
+import json
+import logging
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+from contextlib import contextmanager
+
+from history_generator import GeneratorConfig, generate  # also sets sys.path
+
+from sqlalchemy import event  # noqa: E402
+
+import db  # noqa: E402
+import helpers  # noqa: E402
+from models import get_engine  # noqa: E402
+from pattern_engine import PatternDetector  # noqa: E402
+from automation_engine import (  # noqa: E402
+    AnomalyDetector, ConflictDetector, PhaseManager, SuggestionGenerator,
+)
+
+logger = logging.getLogger("mindhome.benchmarks.pattern_bench")
+
+DEFAULT_SCALES = (50, 500, 2000)
+
+# Nested PatternDetector stages measured inside run_full_analysis
+DETECTOR_STAGES = (
+    "_detect_time_patterns",
+    "_detect_sequence_patterns",
+    "_detect_correlation_patterns",
+    "detect_cross_room_correlations",
+    "_apply_domain_scoring",
+    "_upsert_pattern",
+)
+
+# Regressions: relative growth AND an absolute floor (timer noise on tiny stages)
+_MIN_ABS_MS = 5.0
+
+
+class StageProbe:
+    """Collects time, SQL statement count and peak memory per stage."""
+
+    def __init__(self, engine, track_memory=True):
+        self.track_memory = track_memory
+        self.queries = 0
+        self.stats = {}
+        self._depth = 0
+        event.listen(engine, "before_cursor_execute", self._on_execute)
+
+    def _on_execute(self, *args, **kwargs):
+        self.queries += 1
+
+    @contextmanager
+    def stage(self, name):
+        top_level = self._depth == 0
+        if top_level and self.track_memory:
+            tracemalloc.reset_peak()
+            mem_start = tracemalloc.get_traced_memory()[0]
+        # Registered on entry so the report lists parents before nested stages
+        entry = self.stats.setdefault(
+            name, {"ms": 0.0, "queries": 0, "calls": 0, "nested": not top_level}
+        )
+        q_start = self.queries
+        t_start = time.perf_counter()
+        self._depth += 1
+        try:
+            yield
+        finally:
+            self._depth -= 1
+            entry["ms"] += (time.perf_counter() - t_start) * 1000
+            entry["queries"] += self.queries - q_start
+            entry["calls"] += 1
+            if top_level and self.track_memory:
+                peak_kb = (tracemalloc.get_traced_memory()[1] - mem_start) / 1024
+                entry["peak_kb"] = max(entry.get("peak_kb", 0.0), peak_kb)
+
+    def wrap(self, obj, method_name, stage_name=None):
+        """Replace obj.method_name with a measured version (instance only)."""
+        original = getattr(obj, method_name)
+
+        @functools.wraps(original)
+        def _measured(*args, **kwargs):
+            with self.stage(stage_name or method_name):
+                return original(*args, **kwargs)
+
+        setattr(obj, method_name, _measured)
+
+    def result(self):
+        return {
+            name: {
+                "ms": round(s["ms"], 1),
+                "queries": s["queries"],
+                "calls": s["calls"],
+                "nested": s["nested"],
+                **({"peak_kb": round(s["peak_kb"], 1)} if "peak_kb" in s else {}),
+            }
+            for name, s in self.stats.items()
+        }
+
+
+def _run_stages(engine, probe):
+    detector = PatternDetector(engine)
+    for name in DETECTOR_STAGES:
+        probe.wrap(detector, name)
+
+    with probe.stage("pattern.full_analysis"):
+        detector.run_full_analysis()
+
+    session = detector.Session()
+    try:
+        with probe.stage("pattern.detect_scenes"):
+            detector.detect_scenes(session)
+        with probe.stage("pattern.confidence_decay"):
+            detector.apply_confidence_decay(session)
+    finally:
+        session.close()
+
+    with probe.stage("automation.generate_suggestions"):
+        SuggestionGenerator(engine).generate_suggestions()
+    with probe.stage("automation.check_conflicts"):
+        ConflictDetector(engine).check_conflicts()
+    with probe.stage("automation.phase_transitions"):
+        PhaseManager(engine).check_transitions()
+
+    anomaly = AnomalyDetector(engine)
+    with probe.stage("automation.check_anomalies"):
+        anomaly.check_recent_anomalies(minutes=60)
+    session = anomaly.Session()
+    try:
+        with probe.stage("automation.time_clusters"):
+            anomaly.detect_time_clusters(session)
+    finally:
+        session.close()
+
+
+def run_scale(entities, workdir, args):
+    """Generate a database for one scale and measure all stages on it."""
+    db_path = os.path.join(workdir, f"bench_{entities}.db")
+    t0 = time.perf_counter()
+    summary = generate(db_path, GeneratorConfig(
+        entities=entities, days=args.days, events_per_entity_day=args.rate, seed=args.seed,
+    ))
+    summary["generate_ms"] = round((time.perf_counter() - t0) * 1000, 1)
+
+    engine = get_engine(db_path)
+    db.init_db(engine)
+    helpers.invalidate_settings_cache()
+    probe = StageProbe(engine, track_memory=not args.no_memory)
+    try:
+        _run_stages(engine, probe)
+    finally:
+        engine.dispose()
+        if not args.keep_db:
+            for suffix in ("", "-wal", "-shm"):
+                if os.path.exists(db_path + suffix):
+                    os.remove(db_path + suffix)
+
+    return {"data": summary, "stages": probe.result()}
+
+
+def diff_against_baseline(current, baseline, threshold_pct=30.0):
+    """Compare ms and queries per scale/stage. One row per changed value."""
+    rows = []
+    for scale, cur in current.get("scales", {}).items():
+        base_stages = baseline.get("scales", {}).get(scale, {}).get("stages", {})
+        for stage, c in cur["stages"].items():
+            b = base_stages.get(stage)
+            if not b:
+                continue
+            for metric in ("ms", "queries"):
+                delta = c[metric] - b[metric]
+                rel = (delta / b[metric] * 100) if b[metric] else (100.0 if delta else 0.0)
+                floor = _MIN_ABS_MS if metric == "ms" else 0
+                rows.append({
+                    "scale": scale,
+                    "stage": stage,
+                    "metric": metric,
+                    "baseline": b[metric],
+                    "current": c[metric],
+                    "delta_pct": round(rel, 1),
+                    "regression": rel > threshold_pct and delta > floor,
+                })
+    return rows
+
+
+def format_report(report, diff=None):
+    lines = []
+    for scale, res in report["scales"].items():
+        d = res["data"]
+        lines.append(
+            f"== {scale} entities: {d['events']} events, {d['rooms']} rooms, "
+            f"{d['days']} days (generated in {d['generate_ms']:.0f}ms)"
+        )
+        lines.append(f"  {'stage':38s} {'ms':>10s} {'queries':>8s} {'calls':>6s} {'peak KB':>9s}")
+        for stage, s in res["stages"].items():
+            peak = f"{s['peak_kb']:>9.0f}" if "peak_kb" in s else f"{'-':>9s}"
+            label = f"  {stage}" if s.get("nested") else stage
+            lines.append(
+                f"  {label:38s} {s['ms']:>10.1f} {s['queries']:>8d} {s['calls']:>6d} {peak}"
+            )
+    if diff:
+        flagged = [r for r in diff if r["regression"]]
+        lines.append(f"Baseline comparison: {len(flagged)} regression(s)")
+        for r in flagged:
+            lines.append(
+                f"  REGRESSION {r['scale']:>5s} {r['stage']:38s} {r['metric']:7s} "
+                f"{r['baseline']} -> {r['current']} ({r['delta_pct']:+.1f}%)"
+            )
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark pattern/automation engine stages")
+    parser.add_argument("--scales", default=",".join(str(s) for s in DEFAULT_SCALES),
+                        help="comma-separated entity counts")
+    parser.add_argument("--days", type=int, default=14)
+    parser.add_argument("--rate", type=float, default=8.0, help="events per entity and day")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--workdir", help="directory for the generated databases")
+    parser.add_argument("--keep-db", action="store_true")
+    parser.add_argument("--no-memory", action="store_true", help="skip tracemalloc")
+    parser.add_argument("--json", metavar="PATH", help="write the report as JSON")
+    parser.add_argument("--baseline", metavar="PATH")
+    parser.add_argument("--threshold", type=float, default=30.0, help="regression at +N%%")
+    parser.add_argument("--fail-on-regression", action="store_true")
+    parser.add_argument("--log-level", default="WARNING")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=getattr(logging, args.log_level.upper(), logging.WARNING),
+                        format="%(levelname)s %(name)s: %(message)s")
+    scales = [int(s) for s in args.scales.split(",") if s.strip()]
+
+    if not args.no_memory:
+        tracemalloc.start()
+    report = {"meta": {"days": args.days, "rate": args.rate, "seed": args.seed,
+                       "memory": not args.no_memory},
+              "scales": {}}
+    with tempfile.TemporaryDirectory(prefix="mindhome_bench_") as tmp:
+        workdir = args.workdir or tmp
+        os.makedirs(workdir, exist_ok=True)
+        for entities in scales:
+            report["scales"][str(entities)] = run_scale(entities, workdir, args)
+
+    diff = None
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            diff = diff_against_baseline(report, json.load(f), args.threshold)
+    print(format_report(report, diff))
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+
+    if diff and args.fail_on_regression and any(r["regression"] for r in diff):
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
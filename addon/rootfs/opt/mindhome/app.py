@@ -696,6 +696,10 @@ dependencies = {
 from routes import register_blueprints
 register_blueprints(app, dependencies)
 
+# Live updates (SSE): ORM commits + event bus -> /api/live
+from live_updates import install_live_updates, live_client_limit, live_hub
+install_live_updates(event_bus)
+
 
 # ==============================================================================
 # Graceful Shutdown
@@ -848,6 +852,9 @@ def start_app():
     from engines.data_retention import run_data_retention
     task_scheduler.register("data_retention", run_data_retention, interval_seconds=3600)
 
+    # Live updates: publish status changes to connected dashboards
+    task_scheduler.register("live_status", live_hub.poll_watched, interval_seconds=10)
+
     # Phase 4 Batch 1: Energy scheduler tasks
     def run_energy_check():
         """5-min check: standby detection + PV surplus management."""
@@ -1038,14 +1045,44 @@ def start_app():
                             interval_seconds=15 * 60,
                             run_immediately=False)
 
-    # Start task scheduler
+    # Start task scheduler (one shared HA state snapshot per tick)
+    task_scheduler.set_tick_scope(ha.tick_snapshot)
     task_scheduler.start()
     logger.info("  ✅ Task Scheduler started (cleanup:24h, maintenance:7d, energy:5m, sleep:5m, visit:10m, comfort:15m, ventilation:10m, weather:30m, screen:5m, adaptive:15m, drift:7d, health:1h)")
 
     logger.info(f"MindHome {vi['full']} started successfully!")
 
-    # Start Flask
-    app.run(host="0.0.0.0", port=5000, debug=False)
+    # Start HTTP server
+    _serve_http()
+
+
+def _serve_http():
+    """Serve the Flask app via waitress (production WSGI), dev server as fallback.
+
+    One process with a thread pool: engines, event bus and scheduler live
+    in-process, so multiple worker processes would duplicate them. Live
+    (SSE) streams each pin a thread, so the pool gets one extra thread per
+    allowed live client on top of MINDHOME_SERVER_THREADS.
+    """
+    try:
+        threads = max(1, int(os.environ.get("MINDHOME_SERVER_THREADS", "8")))
+    except ValueError:
+        threads = 8
+    live_threads = live_client_limit()
+    threads += live_threads
+    if os.environ.get("MINDHOME_SERVER", "waitress") != "dev":
+        try:
+            from waitress import serve
+        except ImportError:
+            serve = None
+            logger.warning("waitress not installed - falling back to Flask dev server")
+        if serve is not None:
+            logger.info(f"HTTP server: waitress ({threads} threads, "
+                        f"{live_threads} reserved for live streams)")
+            serve(app, host="0.0.0.0", port=5000, threads=threads,
+                  connection_limit=max(100, threads * 16), ident="MindHome")
+            return
+    app.run(host="0.0.0.0", port=5000, debug=False, threaded=True)
 
 
 if __name__ == "__main__":
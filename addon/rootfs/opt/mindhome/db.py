@@ -5,8 +5,10 @@ No more manual session.close() - prevents session leaks.
 """
 
 import logging
+import os
 import time
 from contextlib import contextmanager
+from sqlalchemy import event as sa_event
 from sqlalchemy.exc import OperationalError
 from sqlalchemy.orm import sessionmaker
 from models import get_engine
@@ -16,11 +18,60 @@ logger = logging.getLogger(__name__)
 _engine = None
 _SessionFactory = None
 
+# Slow query log: active in debug mode, or always when MINDHOME_SLOW_QUERY_MS is set
+_SLOW_QUERY_ENV = os.environ.get("MINDHOME_SLOW_QUERY_MS")
+_SLOW_QUERY_DEFAULT_MS = 200.0
+
+
+def _parse_slow_query_ms(value):
+    """Threshold in ms from MINDHOME_SLOW_QUERY_MS; malformed values fall back."""
+    if not value:
+        return _SLOW_QUERY_DEFAULT_MS
+    try:
+        return float(value)
+    except ValueError:
+        logger.warning("Invalid MINDHOME_SLOW_QUERY_MS=%r, using %.0f ms",
+                       value, _SLOW_QUERY_DEFAULT_MS)
+        return _SLOW_QUERY_DEFAULT_MS
+
+
+_SLOW_QUERY_MS = _parse_slow_query_ms(_SLOW_QUERY_ENV)
+
+
+def _slow_query_log_active():
+    if _SLOW_QUERY_ENV:
+        return True
+    from helpers import is_debug_mode  # lazy: helpers imports db
+    return is_debug_mode()
+
+
+def install_slow_query_log(engine):
+    """Log statements slower than MINDHOME_SLOW_QUERY_MS (default 200 ms)."""
+    if getattr(engine, "_mh_slow_query_log", False):
+        return
+    engine._mh_slow_query_log = True
+
+    @sa_event.listens_for(engine, "before_cursor_execute")
+    def _before(conn, cursor, statement, parameters, context, executemany):
+        conn.info["mh_query_start"] = time.perf_counter()
+
+    @sa_event.listens_for(engine, "after_cursor_execute")
+    def _after(conn, cursor, statement, parameters, context, executemany):
+        start = conn.info.pop("mh_query_start", None)
+        if start is None:
+            return
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        if elapsed_ms >= _SLOW_QUERY_MS and _slow_query_log_active():
+            logger.warning("Slow query (%.0f ms): %s | params=%s",
+                           elapsed_ms, " ".join(statement.split())[:500],
+                           str(parameters)[:200])
+
 
 def init_db(engine=None):
     """Initialize the database module with an engine."""
     global _engine, _SessionFactory
     _engine = engine or get_engine()
+    install_slow_query_log(_engine)
     _SessionFactory = sessionmaker(bind=_engine)
     return _engine
 
@@ -30,6 +81,7 @@ def get_engine_instance():
     global _engine
     if _engine is None:
         _engine = get_engine()
+        install_slow_query_log(_engine)
     return _engine
 
 
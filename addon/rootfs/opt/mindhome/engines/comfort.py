@@ -46,8 +46,7 @@ class ComfortCalculator:
 
             with self.get_session() as session:
                 rooms = session.query(Room).filter(Room.is_active == True).all()
-                states = self.ha.get_states() or []
-                state_map = {s.get("entity_id"): s for s in states}
+                state_map = self.ha.get_state_map()
 
                 for room in rooms:
                     devices = session.query(Device).filter(
@@ -357,8 +356,7 @@ class VentilationMonitor:
 
             with self.get_session() as session:
                 rooms = session.query(Room).filter(Room.is_active == True).all()
-                states = self.ha.get_states() or []
-                state_map = {s.get("entity_id"): s for s in states}
+                state_map = self.ha.get_state_map()
                 now = datetime.now(timezone.utc)
 
                 for room in rooms:
@@ -562,8 +560,7 @@ class ScreenTimeMonitor:
                 self._last_reminder.clear()
                 self._last_reset_date = today
 
-            states = self.ha.get_states() or []
-            state_map = {s.get("entity_id"): s for s in states}
+            state_map = self.ha.get_state_map()
 
             with self.get_session() as session:
                 configs = session.query(ScreenTimeConfig).filter(
@@ -641,10 +638,9 @@ class ScreenTimeMonitor:
 
                     # Also check auto-discovered
                     if not monitored:
-                        states = self.ha.get_states() or []
-                        for s in states:
+                        for s in self.ha.get_entities_by_domain("media_player"):
                             eid = s.get("entity_id", "")
-                            if eid.startswith("media_player."):
+                            if eid:
                                 mins = round(self._today_minutes.get(eid, 0))
                                 total += mins
                                 sessions.append({
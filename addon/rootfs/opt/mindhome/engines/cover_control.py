@@ -1144,11 +1144,8 @@ class CoverControlManager:
         if state:
             return state
         # Fallback: first weather entity
-        states = self.ha.get_states() or []
-        for s in states:
-            if s.get("entity_id", "").startswith("weather."):
-                return s
-        return None
+        weather = self.ha.get_entities_by_domain("weather")
+        return weather[0] if weather else None
 
     def _get_presence_mode(self):
         """Get current presence mode."""
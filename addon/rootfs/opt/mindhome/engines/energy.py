@@ -490,10 +490,8 @@ class EnergyForecaster:
     def _get_weather_condition(self):
         """Get current weather condition from HA weather entity."""
         try:
-            states = self.ha.get_states() or []
-            for s in states:
-                if s.get("entity_id", "").startswith("weather."):
-                    return s.get("state", "unknown")
+            for s in self.ha.get_entities_by_domain("weather"):
+                return s.get("state", "unknown")
         except Exception as e:
             logger.debug("Unhandled: %s", e)
         return "unknown"
@@ -110,12 +110,9 @@ class SleepDetector:
         from models import StateHistory
 
         # Priority 1: Bed occupancy sensor (binary_sensor with device_class=occupancy)
-        states = []
         try:
-            states = self.ha.get_states() or []
-            bed_sensors = [s for s in states
-                           if s.get("entity_id", "").startswith("binary_sensor.")
-                           and s.get("attributes", {}).get("device_class") == "occupancy"]
+            bed_sensors = [s for s in self.ha.get_entities_by_domain("binary_sensor")
+                           if s.get("attributes", {}).get("device_class") == "occupancy"]
             if bed_sensors:
                 # If any bed sensor is "on" (occupied), sleep detected
                 occupied = any(s.get("state") == "on" for s in bed_sensors)
@@ -145,10 +142,8 @@ class SleepDetector:
 
         # Check HA: bedroom lights currently on?
         try:
-            if not states:
-                states = self.ha.get_states() or []
-            lights_on = [s for s in states if s.get("entity_id", "").startswith("light.")
-                         and s.get("state") == "on"
+            lights_on = [s for s in self.ha.get_entities_by_domain("light")
+                         if s.get("state") == "on"
                          and ("schlaf" in s.get("entity_id", "").lower()
                               or "bedroom" in s.get("entity_id", "").lower()
                               or "bed" in s.get("entity_id", "").lower())]
@@ -162,10 +157,8 @@ class SleepDetector:
         """Heuristic: Bed sensor off OR motion/lights in last 5 min."""
         # Priority 1: Bed occupancy sensor turned off (person left bed)
         try:
-            states = self.ha.get_states() or []
-            bed_sensors = [s for s in states
-                           if s.get("entity_id", "").startswith("binary_sensor.")
-                           and s.get("attributes", {}).get("device_class") == "occupancy"]
+            bed_sensors = [s for s in self.ha.get_entities_by_domain("binary_sensor")
+                           if s.get("attributes", {}).get("device_class") == "occupancy"]
             if bed_sensors:
                 all_empty = all(s.get("state") == "off" for s in bed_sensors)
                 if all_empty:
@@ -381,19 +374,16 @@ class WakeUpManager:
                     target_offset = min(target_offset, 0)  # Nicht ueber 0 hinaus
                     curve_entity = get_setting("heating_curve_entity", cfg.climate_entity)
                     # Aktuellen Sollwert lesen und Offset anwenden
-                    states = self.ha.get_states() or []
-                    for s in states:
-                        if s.get("entity_id") == curve_entity:
-                            current = s.get("attributes", {}).get("temperature")
-                            if current is not None:
-                                base_temp = float(current) - night_offset  # Basis-Temp zurueckrechnen
-                                new_temp = base_temp + target_offset
-                                self.ha.call_service("climate", "set_temperature", {
-                                    "entity_id": curve_entity,
-                                    "temperature": round(new_temp, 1),
-                                })
-                                logger.debug(f"WakeUp climate curve {curve_entity} offset={target_offset:.1f}")
-                            break
+                    s = self.ha.get_state(curve_entity) if curve_entity else None
+                    current = (s or {}).get("attributes", {}).get("temperature")
+                    if current is not None:
+                        base_temp = float(current) - night_offset  # Basis-Temp zurueckrechnen
+                        new_temp = base_temp + target_offset
+                        self.ha.call_service("climate", "set_temperature", {
+                            "entity_id": curve_entity,
+                            "temperature": round(new_temp, 1),
+                        })
+                        logger.debug(f"WakeUp climate curve {curve_entity} offset={target_offset:.1f}")
                 else:
                     # Raumthermostat-Modus: Absolute Temperatur 18 -> 21°C
                     target_temp = 18 + (progress * 3)  # 18 -> 21°C
@@ -12,11 +12,14 @@ import logging
 import threading
 import time
 import queue
+import contextlib
 from datetime import datetime, timezone, timedelta
 from typing import Optional, Callable, List, Dict, Any
 import requests
 import websocket
 
+from state_snapshot import StateSnapshot
+
 logger = logging.getLogger("mindhome.ha_connection")
 
 MAX_RECONNECT_ATTEMPTS = 20
@@ -24,6 +27,10 @@ RETRY_MAX_ATTEMPTS = 3
 RETRY_BACKOFF_BASE = 1.5
 BATCH_FLUSH_INTERVAL = 2.0
 BATCH_MAX_SIZE = 100
+# A tick snapshot older than this is refetched on the next lookup
+SNAPSHOT_MAX_AGE = 30.0
+# Service domains whose calls change entities other than their target
+_SNAPSHOT_WIDE_DOMAINS = frozenset({"scene", "script", "automation", "homeassistant"})
 
 
 class HAConnection:
@@ -62,6 +69,9 @@ class HAConnection:
             "ws_reconnects": 0, "events_received": 0, "events_batched": 0, "retries": 0,
         }
         self._stats_lock = threading.Lock()
+        # Per-thread scheduler tick scope:
+        # {"snapshot": StateSnapshot | None, "fetches": int, "changed": set}
+        self._tick_local = threading.local()
 
     # ======================================================================
     # Conflict-F: Entity Ownership Check (Assistant-Koordination)
@@ -147,11 +157,88 @@ class HAConnection:
                     return None
 
     def get_states(self):
+        snap = self.current_snapshot()
+        if snap is not None:
+            return snap.states()
         return self._api_request("GET", "states") or []
 
     def get_state(self, entity_id):
+        snap = self.current_snapshot(entity_id)
+        if snap is not None:
+            return snap.get(entity_id)
         return self._api_request("GET", f"states/{entity_id}", retry=False)
 
+    # ======================================================================
+    # Tick Snapshot (one /api/states fetch per scheduler tick)
+    # ======================================================================
+
+    @contextlib.contextmanager
+    def tick_snapshot(self):
+        """Serve get_state/get_states in this thread from one shared snapshot.
+
+        The snapshot is fetched lazily on the first lookup, so ticks whose
+        tasks never touch HA state cost no REST call. Nested scopes reuse
+        the outer one.
+        """
+        if getattr(self._tick_local, "scope", None) is not None:
+            yield
+            return
+        self._tick_local.scope = {"snapshot": None, "fetches": 0, "changed": set()}
+        try:
+            yield
+        finally:
+            self._tick_local.scope = None
+
+    def current_snapshot(self, entity_id=None):
+        """Snapshot of the active tick scope (fetching it if needed), else None.
+
+        Entities changed by call_service() in this tick are not served from
+        the snapshot: a lookup of one of them returns None (the caller reads
+        it live), a bulk lookup refetches the snapshot.
+        """
+        scope = getattr(self._tick_local, "scope", None)
+        if scope is None:
+            return None
+        changed = scope["changed"]
+        if changed:
+            if entity_id is not None:
+                if entity_id in changed:
+                    return None
+            else:
+                changed.clear()
+                scope["snapshot"] = None
+        snap = scope["snapshot"]
+        if snap is None or snap.age() > SNAPSHOT_MAX_AGE:
+            states = self._api_request("GET", "states")
+            if not isinstance(states, list):
+                # HA unreachable: don't pin an empty view for the whole tick
+                return None
+            snap = StateSnapshot(states)
+            scope["snapshot"] = snap
+            scope["fetches"] += 1
+            with self._stats_lock:
+                self._stats["snapshots"] = self._stats.get("snapshots", 0) + 1
+        return snap
+
+    def _invalidate_tick_state(self, domain, entity_id):
+        """A service call changed state: stop serving it from the tick snapshot."""
+        scope = getattr(self._tick_local, "scope", None)
+        if scope is None or scope["snapshot"] is None:
+            return
+        ids = [entity_id] if isinstance(entity_id, str) else list(entity_id or ())
+        if domain in _SNAPSHOT_WIDE_DOMAINS or not ids or "all" in ids:
+            scope["snapshot"] = None
+            scope["changed"].clear()
+        else:
+            scope["changed"].update(ids)
+
+    def get_state_map(self):
+        """Mapping entity_id -> state (snapshot-backed inside a tick)."""
+        snap = self.current_snapshot()
+        if snap is not None:
+            return snap.by_id
+        return {s.get("entity_id"): s for s in self.get_states()}
+
     def get_config(self):
         now = time.time()
         if self._config_cache and (now - self._config_cache_time) < 300:
@@ -186,6 +273,7 @@ class HAConnection:
         if domain == "climate" and service in ("set_temperature", "set_hvac_mode"):
             payload = self._validate_climate_call(payload)
         result = self._api_request("POST", f"services/{domain}/{service}", payload)
+        self._invalidate_tick_state(domain, payload.get("entity_id"))
         if result is None and not self._is_online:
             with self._queue_lock:
                 if len(self._offline_queue) < 1000:
@@ -833,6 +921,9 @@ class HAConnection:
         }
 
     def get_entities_by_domain(self, domain):
+        snap = self.current_snapshot()
+        if snap is not None:
+            return list(snap.domain(domain))
         states = self.get_states()
         return [s for s in states if s.get("entity_id", "").startswith(f"{domain}.")] if states else []
 
@@ -10,10 +10,13 @@ import json
 import logging
 import time
 import hashlib
+import threading
 from datetime import datetime, timezone, timedelta
 from collections import defaultdict
 from functools import wraps
 
+from sqlalchemy import and_, func as sa_func, or_
+
 from db import get_db_session, get_db_readonly
 
 logger = logging.getLogger("mindhome")
@@ -63,6 +66,61 @@ def utc_iso(dt):
     return dt.isoformat()
 
 
+# ==============================================================================
+# Keyset Pagination
+# ==============================================================================
+
+def encode_cursor(created_at, row_id):
+    """Opaque cursor for the position after a (created_at, id) row."""
+    if created_at is None:
+        return None
+    if created_at.tzinfo is not None:
+        created_at = created_at.astimezone(timezone.utc).replace(tzinfo=None)
+    return f"{created_at.isoformat()}_{row_id}"
+
+
+def decode_cursor(cursor):
+    """Parse a cursor from encode_cursor(). Returns (created_at, id) or None."""
+    if not cursor:
+        return None
+    try:
+        ts, _, row_id = cursor.rpartition("_")
+        return datetime.fromisoformat(ts), int(row_id)
+    except ValueError:
+        return None
+
+
+def keyset_page(query, created_col, id_col, cursor, limit):
+    """Newest-first page after cursor, ordered by (created_at, id) desc.
+
+    Uses the composite (…, created_at, id) indexes instead of OFFSET, so the
+    cost per page does not grow with the table. Returns (rows, next_cursor).
+    """
+    position = decode_cursor(cursor)
+    if position:
+        ts, row_id = position
+        query = query.filter(or_(
+            created_col < ts,
+            and_(created_col == ts, id_col < row_id),
+        ))
+    rows = query.order_by(created_col.desc(), id_col.desc()).limit(limit + 1).all()
+    if len(rows) <= limit:
+        return rows, None
+    rows = rows[:limit]
+    last = rows[-1]
+    return rows, encode_cursor(getattr(last, created_col.key), getattr(last, id_col.key))
+
+
+def approximate_count(query, cap=10000):
+    """Count rows up to cap — bounded cost for large tables.
+
+    Returns (count, exact); exact is False when the cap was reached.
+    """
+    subq = query.order_by(None).limit(cap + 1).subquery()
+    count = query.session.query(sa_func.count()).select_from(subq).scalar() or 0
+    return min(count, cap), count <= cap
+
+
 # ==============================================================================
 # Rate Limiting
 # ==============================================================================
@@ -156,16 +214,69 @@ def set_debug_mode(enabled):
 # Settings Helpers
 # ==============================================================================
 
+# In-process settings cache: write-through in set_setting, invalidated by
+# ORM events for direct SystemSetting writes. The TTL is only a safety net
+# for raw-SQL writes that bypass the ORM.
+_SETTINGS_CACHE_TTL = 60
+_SETTING_MISSING = object()
+_settings_cache = {}  # key -> (value | _SETTING_MISSING, expires_at)
+_settings_cache_lock = threading.Lock()
+_settings_cache_gen = 0
+_settings_listeners_registered = False
+
+
+def _register_settings_listeners():
+    """Invalidate cached settings on any ORM insert/update/delete of SystemSetting."""
+    global _settings_listeners_registered
+    if _settings_listeners_registered:
+        return
+    from sqlalchemy import event
+    from models import SystemSetting
+
+    def _invalidate(mapper, connection, target):
+        invalidate_settings_cache(target.key)
+
+    for evt in ("after_insert", "after_update", "after_delete"):
+        event.listen(SystemSetting, evt, _invalidate)
+    _settings_listeners_registered = True
+
+
+def invalidate_settings_cache(key=None):
+    """Drop one cached setting (or all settings when key is None)."""
+    global _settings_cache_gen
+    with _settings_cache_lock:
+        _settings_cache_gen += 1
+        if key is None:
+            _settings_cache.clear()
+        else:
+            _settings_cache.pop(key, None)
+
+
 def get_setting(key, default=None):
-    """Get a system setting value."""
+    """Get a system setting value (cached, see invalidate_settings_cache)."""
+    now = time.monotonic()
+    with _settings_cache_lock:
+        cached = _settings_cache.get(key)
+        if cached is not None and cached[1] > now:
+            value = cached[0]
+            return default if value is _SETTING_MISSING else value
+        gen = _settings_cache_gen
+
     from models import SystemSetting
+    _register_settings_listeners()
     with get_db_readonly() as session:
         setting = session.query(SystemSetting).filter_by(key=key).first()
-        return setting.value if setting else default
+        value = setting.value if setting else _SETTING_MISSING
+
+    with _settings_cache_lock:
+        # Only populate if no write happened while we were reading
+        if gen == _settings_cache_gen:
+            _settings_cache[key] = (value, now + _SETTINGS_CACHE_TTL)
+    return default if value is _SETTING_MISSING else value
 
 
 def set_setting(key, value):
-    """Set a system setting value (with retry on DB lock)."""
+    """Set a system setting value (with retry on DB lock, write-through cache)."""
     from models import SystemSetting
     from db import db_write_with_retry
 
@@ -177,7 +288,11 @@ def set_setting(key, value):
             setting = SystemSetting(key=key, value=str(value))
             session.add(setting)
 
+    _register_settings_listeners()
+    invalidate_settings_cache(key)
     db_write_with_retry(_do_set, retries=3)
+    with _settings_cache_lock:
+        _settings_cache[key] = (str(value), time.monotonic() + _SETTINGS_CACHE_TTL)
 
 
 def get_language():
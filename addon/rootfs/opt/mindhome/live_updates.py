@@ -0,0 +1,266 @@
+# MindHome - live_updates.py | see version.py for version info
+"""
+Live update hub for the dashboard (Server-Sent Events).
+
+Collects compact deltas - new ActionLog rows, person/presence-mode changes,
+unread notification count, system status - into one sequenced ring buffer.
+Clients stream it via /api/live and resume after a reconnect from the last
+sequence number they saw, so idle dashboards no longer poll the DB or HA.
+"""
+
+import logging
+import os
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from sqlalchemy import event as sa_event, func
+from sqlalchemy.orm import Session, object_session
+
+from db import get_db_readonly
+from helpers import utc_iso
+
+logger = logging.getLogger("mindhome.live_updates")
+
+TOPIC_ACTION_LOG = "action_log"
+TOPIC_PRESENCE = "presence"
+TOPIC_PRESENCE_MODE = "presence_mode"
+TOPIC_NOTIFICATIONS = "notifications"
+TOPIC_STATUS = "status"
+
+DEFAULT_MAX_CLIENTS = 8
+
+
+def live_client_limit() -> int:
+    """Max. concurrent live streams (MINDHOME_LIVE_MAX_CLIENTS, default 8).
+
+    Each stream holds one waitress thread for its lifetime. The HTTP server
+    adds this many threads on top of MINDHOME_SERVER_THREADS, so open
+    dashboards never take threads away from regular requests.
+    """
+    try:
+        return max(0, int(os.environ.get(
+            "MINDHOME_LIVE_MAX_CLIENTS", DEFAULT_MAX_CLIENTS)))
+    except ValueError:
+        return DEFAULT_MAX_CLIENTS
+
+
+class LiveUpdateHub:
+    """Sequenced delta buffer shared by all live clients.
+
+    Sequence numbers start at the boot time in milliseconds, so ids from a
+    previous process are never mistaken for current ones after a restart.
+    """
+
+    def __init__(self, buffer_size: int = 500,
+                 max_clients: int = DEFAULT_MAX_CLIENTS):
+        self._cond = threading.Condition()
+        self._seq = int(time.time() * 1000)
+        self._floor = self._seq  # last sequence no longer in the buffer
+        self._buffer: deque = deque(maxlen=buffer_size)
+        self._clients = 0
+        self.max_clients = max_clients
+        self._watched: Dict[str, Callable[[], Optional[dict]]] = {}
+        self._last_watched: Dict[str, Any] = {}
+
+    @property
+    def last_seq(self) -> int:
+        return self._seq
+
+    @property
+    def client_count(self) -> int:
+        return self._clients
+
+    def publish(self, topic: str, data: Any = None) -> int:
+        """Append a delta and wake all waiting streams. Returns its sequence."""
+        with self._cond:
+            if len(self._buffer) == self._buffer.maxlen:
+                self._floor = self._buffer[0][0]
+            self._seq += 1
+            self._buffer.append((self._seq, topic, data))
+            self._cond.notify_all()
+            return self._seq
+
+    def since(self, seq: int) -> Tuple[List[tuple], bool]:
+        """Deltas after seq. complete is False if seq is unknown or too old."""
+        with self._cond:
+            return self._since(seq)
+
+    def wait(self, seq: int, timeout: float) -> Tuple[List[tuple], bool]:
+        """Block until deltas after seq exist (or timeout), then return them."""
+        with self._cond:
+            if self._floor <= seq <= self._seq:
+                self._cond.wait_for(lambda: self._seq > seq, timeout)
+            return self._since(seq)
+
+    def _since(self, seq: int) -> Tuple[List[tuple], bool]:
+        if not self._floor <= seq <= self._seq:
+            return [], False
+        return [e for e in self._buffer if e[0] > seq], True
+
+    def acquire_client(self) -> bool:
+        """Reserve a stream slot - each stream holds one server thread."""
+        with self._cond:
+            if self._clients >= self.max_clients:
+                return False
+            self._clients += 1
+            return True
+
+    def release_client(self):
+        with self._cond:
+            self._clients = max(0, self._clients - 1)
+
+    def watch(self, topic: str, provider: Callable[[], Optional[dict]]):
+        """Register a snapshot provider, published by poll_watched() on change."""
+        self._watched[topic] = provider
+
+    def poll_watched(self):
+        """Publish watched snapshots that changed. No-op without clients."""
+        if not self._clients:
+            return
+        for topic, provider in list(self._watched.items()):
+            try:
+                snapshot = provider()
+            except Exception as e:
+                logger.debug(f"Live provider '{topic}' failed: {e}")
+                continue
+            if snapshot is not None and snapshot != self._last_watched.get(topic):
+                self._last_watched[topic] = snapshot
+                self.publish(topic, snapshot)
+
+
+# Singleton instance
+live_hub = LiveUpdateHub()
+
+
+# ==============================================================================
+# Sources
+# ==============================================================================
+
+_PENDING_KEY = "live_updates_pending"
+_NOTIFY_KEY = "live_updates_notifications"
+_installed = False
+# Set after commits touching notifications; the unread count is re-queried
+# at most once per poll_watched() run instead of on every commit.
+_notifications_dirty = threading.Event()
+
+
+def _action_log_item(log) -> dict:
+    """Same shape as the items of GET /api/action-log."""
+    return {
+        "id": log.id,
+        "action_type": log.action_type,
+        "domain_id": log.domain_id,
+        "room_id": log.room_id,
+        "device_id": log.device_id,
+        "action_data": log.action_data,
+        "reason": log.reason,
+        "was_undone": log.was_undone,
+        "created_at": utc_iso(log.created_at),
+    }
+
+
+def _queue(target, topic, data):
+    session = object_session(target)
+    if session is not None:
+        session.info.setdefault(_PENDING_KEY, []).append((topic, data))
+
+
+def _on_action_log_insert(mapper, connection, target):
+    _queue(target, TOPIC_ACTION_LOG, _action_log_item(target))
+
+
+def _on_presence_log_insert(mapper, connection, target):
+    _queue(target, TOPIC_PRESENCE_MODE, {
+        "mode_id": target.mode_id,
+        "mode": target.mode_name,
+        "trigger": target.trigger,
+    })
+
+
+def _on_notification_change(mapper, connection, target):
+    session = object_session(target)
+    if session is not None:
+        session.info[_NOTIFY_KEY] = True
+
+
+def _on_bulk_change(ctx):
+    from models import NotificationLog
+    if ctx.mapper.class_ is NotificationLog:
+        ctx.session.info[_NOTIFY_KEY] = True
+
+
+def _unread_count() -> int:
+    from models import NotificationLog
+    with get_db_readonly() as session:
+        return session.query(func.count(NotificationLog.id)).filter_by(
+            was_read=False
+        ).scalar() or 0
+
+
+def _unread_snapshot():
+    """Unread count for poll_watched(), only queried after a change."""
+    if not _notifications_dirty.is_set():
+        return None
+    _notifications_dirty.clear()
+    try:
+        return {"unread_count": _unread_count()}
+    except Exception:
+        _notifications_dirty.set()
+        raise
+
+
+def _on_commit(session):
+    pending = session.info.pop(_PENDING_KEY, None)
+    if session.info.pop(_NOTIFY_KEY, False):
+        _notifications_dirty.set()
+    for topic, data in pending or ():
+        live_hub.publish(topic, data)
+
+
+def _on_rollback(session):
+    session.info.pop(_PENDING_KEY, None)
+    session.info.pop(_NOTIFY_KEY, None)
+
+
+def _on_state_changed(event):
+    """Person entity changed state - same item shape as GET /api/ha/persons."""
+    data = event.data or {}
+    entity_id = data.get("entity_id", "")
+    if not entity_id.startswith("person."):
+        return
+    new_state = data.get("new_state") or {}
+    old_state = data.get("old_state") or {}
+    if new_state.get("state") == old_state.get("state"):
+        return
+    live_hub.publish(TOPIC_PRESENCE, {
+        "entity_id": entity_id,
+        "name": (new_state.get("attributes") or {}).get("friendly_name", entity_id),
+        "state": new_state.get("state", "unknown"),
+    })
+
+
+def install_live_updates(event_bus):
+    """Hook the hub into ORM commits and the event bus (idempotent).
+
+    Deltas are published after commit only; rolled back rows never reach
+    the dashboard. The unread notification count is debounced to the
+    poll_watched() interval.
+    """
+    global _installed
+    if _installed:
+        return
+    from models import ActionLog, NotificationLog, PresenceLog
+
+    sa_event.listen(ActionLog, "after_insert", _on_action_log_insert)
+    sa_event.listen(PresenceLog, "after_insert", _on_presence_log_insert)
+    for evt in ("after_insert", "after_update", "after_delete"):
+        sa_event.listen(NotificationLog, evt, _on_notification_change)
+    sa_event.listen(Session, "after_bulk_update", _on_bulk_change)
+    sa_event.listen(Session, "after_bulk_delete", _on_bulk_change)
+    sa_event.listen(Session, "after_commit", _on_commit)
+    sa_event.listen(Session, "after_rollback", _on_rollback)
+    event_bus.subscribe("state.changed", _on_state_changed, priority=-10)
+    live_hub.watch(TOPIC_NOTIFICATIONS, _unread_snapshot)
+    _installed = True
@@ -2176,6 +2176,15 @@ MIGRATIONS = [
             "ALTER TABLE health_metrics ADD COLUMN is_aggregate INTEGER DEFAULT 0",
         ]
     },
+    {
+        "version": 17,
+        "description": "Composite time indexes for keyset pagination of logs and history",
+        "sql": [
+            "CREATE INDEX IF NOT EXISTS idx_action_log_created ON action_log(created_at, id)",
+            "CREATE INDEX IF NOT EXISTS idx_action_log_type_created ON action_log(action_type, created_at, id)",
+            "CREATE INDEX IF NOT EXISTS idx_state_history_entity_created ON state_history(entity_id, created_at, id)",
+        ]
+    },
 ]
 
 
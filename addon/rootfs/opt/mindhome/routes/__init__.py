@@ -39,6 +39,7 @@ def register_blueprints(app, dependencies):
     from routes.security import security_bp, init_security
     from routes.covers import covers_bp, init_covers
     from routes.chat import chat_bp, init_chat
+    from routes.live import live_bp, init_live
 
     # Initialize each module with dependencies
     init_system(dependencies)
@@ -58,6 +59,7 @@ def register_blueprints(app, dependencies):
     init_security(dependencies)
     init_covers(dependencies)
     init_chat(dependencies)
+    init_live(dependencies)
 
     # Register blueprints
     app.register_blueprint(system_bp)
@@ -77,3 +79,4 @@ def register_blueprints(app, dependencies):
     app.register_blueprint(security_bp)
     app.register_blueprint(covers_bp)
     app.register_blueprint(chat_bp)
+    app.register_blueprint(live_bp)
@@ -0,0 +1,119 @@
+# MindHome - routes/live.py | see version.py for version info
+"""
+MindHome API Routes - Live Updates
+Server-Sent Events stream of dashboard deltas (see live_updates.py).
+"""
+
+import json
+import logging
+import time
+from flask import Blueprint, request, jsonify, Response
+
+from helpers import get_setting, get_language
+from live_updates import live_hub, live_client_limit, TOPIC_STATUS
+
+logger = logging.getLogger("mindhome.routes.live")
+
+live_bp = Blueprint("live", __name__)
+
+# Module-level dependencies (set by init function)
+_deps = {}
+
+_HEARTBEAT_SECONDS = 20
+# Streams end after this and the browser reconnects with Last-Event-ID,
+# so a waitress worker thread is never pinned forever.
+_MAX_STREAM_SECONDS = 600
+
+
+def init_live(dependencies):
+    """Initialize live routes with shared dependencies."""
+    global _deps
+    _deps = dependencies
+    live_hub.max_clients = live_client_limit()
+    live_hub.watch(TOPIC_STATUS, _status_snapshot)
+
+
+def _ha():
+    return _deps.get("ha")
+
+
+def _status_snapshot():
+    """Fields of GET /api/system/status that change at runtime."""
+    ha = _ha()
+    if ha is None:
+        return None
+    return {
+        "ha_connected": ha.is_connected(),
+        "offline_queue_size": ha.get_offline_queue_size(),
+        "system_mode": get_setting("system_mode", "normal"),
+        "onboarding_completed": get_setting("onboarding_completed", "false") == "true",
+        "language": get_language(),
+        "theme": get_setting("theme", "dark"),
+        "view_mode": get_setting("view_mode", "simple"),
+    }
+
+
+def _sse(event_type, data, seq=None):
+    lines = []
+    if seq is not None:
+        lines.append(f"id: {seq}")
+    lines.append(f"event: {event_type}")
+    lines.append(f"data: {json.dumps(data, default=str, separators=(',', ':'))}")
+    return "\n".join(lines) + "\n\n"
+
+
+@live_bp.route("/api/live", methods=["GET"])
+def api_live_stream():
+    """Stream live deltas as Server-Sent Events.
+
+    Resume: the browser sends Last-Event-ID on reconnect (or pass ?since=).
+    If that sequence is no longer buffered a 'resync' event tells the client
+    to reload its data once. ?topics=a,b limits the stream to some topics.
+    """
+    since = request.headers.get("Last-Event-ID") or request.args.get("since")
+    try:
+        since = int(since) if since else None
+    except ValueError:
+        since = None
+    topics = {t for t in request.args.get("topics", "").split(",") if t} or None
+
+    if not live_hub.acquire_client():
+        return jsonify({"error": "Too many live clients"}), 503
+
+    def stream():
+        yield "retry: 5000\n\n"
+        seq = since
+        if seq is None:
+            seq = live_hub.last_seq
+            yield _sse("hello", {"seq": seq}, seq)
+        deadline = time.monotonic() + _MAX_STREAM_SECONDS
+        while time.monotonic() < deadline:
+            events, complete = live_hub.wait(seq, _HEARTBEAT_SECONDS)
+            if not complete:
+                seq = live_hub.last_seq
+                yield _sse("resync", {"seq": seq}, seq)
+                continue
+            if not events:
+                yield ": ping\n\n"
+                continue
+            for event_seq, topic, data in events:
+                seq = event_seq
+                if topics is None or topic in topics:
+                    yield _sse(topic, data, event_seq)
+
+    response = Response(stream(), mimetype="text/event-stream", headers={
+        "Cache-Control": "no-cache",
+        "X-Accel-Buffering": "no",
+    })
+    response.call_on_close(live_hub.release_client)
+    return response
+
+
+@live_bp.route("/api/live/status", methods=["GET"])
+def api_live_status():
+    """Live channel state (connected clients, current sequence)."""
+    return jsonify({
+        "clients": live_hub.client_count,
+        "max_clients": live_hub.max_clients,
+        "seq": live_hub.last_seq,
+    })
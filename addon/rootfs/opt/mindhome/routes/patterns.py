@@ -23,6 +23,7 @@ from helpers import (
     get_ha_timezone, local_now, utc_iso, sanitize_input, sanitize_dict,
     audit_log, is_debug_mode, set_debug_mode, get_setting, set_setting,
     get_language, localize, extract_display_attributes, build_state_reason,
+    keyset_page,
 )
 from models import (
     get_engine, get_session, User, UserRole, Room, Domain, Device,
@@ -256,26 +257,32 @@ def api_reclassify_insights():
 
 @patterns_bp.route("/api/state-history", methods=["GET"])
 def api_get_state_history():
-    """Get state history events with filters."""
-    with get_db_session() as session:
+    """Get state history events with filters.
+
+    Newest first; the X-Next-Cursor response header can be passed back as
+    ?cursor= to page further (keyset pagination, no OFFSET).
+    """
+    with get_db_readonly() as session:
         entity_id = request.args.get("entity_id")
         device_id = request.args.get("device_id", type=int)
         hours = request.args.get("hours", 24, type=int)
         limit = max(1, min(1000, request.args.get("limit", 200, type=int)))
+        cursor = request.args.get("cursor")
 
         cutoff = datetime.now(timezone.utc) - timedelta(hours=hours)
         query = session.query(StateHistory).filter(
             StateHistory.created_at >= cutoff
-        ).order_by(StateHistory.created_at.desc())
+        )
 
         if entity_id:
             query = query.filter_by(entity_id=entity_id)
         if device_id:
             query = query.filter_by(device_id=device_id)
 
-        events = query.limit(min(limit, 1000)).all()
+        events, next_cursor = keyset_page(
+            query, StateHistory.created_at, StateHistory.id, cursor, limit)
 
-        return jsonify([{
+        response = jsonify([{
             "id": e.id,
             "entity_id": e.entity_id,
             "device_id": e.device_id,
@@ -285,6 +292,9 @@ def api_get_state_history():
             "context": e.context,
             "created_at": e.created_at.isoformat() if e.created_at else None,
         } for e in events])
+        if next_cursor:
+            response.headers["X-Next-Cursor"] = next_cursor
+        return response
 
 
 
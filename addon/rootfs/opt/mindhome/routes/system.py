@@ -26,6 +26,7 @@ from helpers import (
     get_ha_timezone, local_now, utc_iso, sanitize_input, sanitize_dict,
     audit_log, is_debug_mode, set_debug_mode, get_setting, set_setting,
     get_language, localize, extract_display_attributes, build_state_reason,
+    encode_cursor, keyset_page, approximate_count,
 )
 from models import (
     get_engine, get_session, User, UserRole, Room, Domain, Device,
@@ -511,17 +512,25 @@ def api_onboarding_complete():
 
 @system_bp.route("/api/action-log", methods=["GET"])
 def api_get_action_log():
-    """Get action log with time filters and pagination."""
-    with get_db_session() as session:
+    """Get action log with time filters and pagination.
+
+    Pagination is keyset-based: pass the returned next_cursor as ?cursor= to
+    get the next page. ?offset= is still accepted for older clients. The
+    total is an exact count by default; ?total=approx caps it, ?total=none
+    skips the count for clients that only page via next_cursor.
+    """
+    with get_db_readonly() as session:
         limit = max(1, min(500, request.args.get("limit", 50, type=int)))
         offset = max(0, request.args.get("offset", 0, type=int))
+        cursor = request.args.get("cursor")
+        total_mode = request.args.get("total", "exact")
         action_type = request.args.get("type")
 
         # Fix 2: Time period filter
         period = request.args.get("period", "all")
         now = datetime.now(timezone.utc)
 
-        query = session.query(ActionLog).order_by(ActionLog.created_at.desc())
+        query = session.query(ActionLog)
 
         if action_type:
             query = query.filter_by(action_type=action_type)
@@ -537,8 +546,24 @@ def api_get_action_log():
             query = query.filter(ActionLog.created_at >= start)
         # "all" = no date filter
 
-        total = query.count()
-        logs = query.offset(offset).limit(limit).all()
+        total = None
+        total_exact = None
+        if total_mode == "exact":
+            total, total_exact = query.order_by(None).count(), True
+        elif total_mode == "approx":
+            total, total_exact = approximate_count(query)
+
+        if offset and not cursor:
+            # Legacy offset paging
+            logs = query.order_by(ActionLog.created_at.desc(), ActionLog.id.desc()) \
+                .offset(offset).limit(limit + 1).all()
+            has_more = len(logs) > limit
+            logs = logs[:limit]
+            next_cursor = encode_cursor(logs[-1].created_at, logs[-1].id) if has_more else None
+        else:
+            logs, next_cursor = keyset_page(
+                query, ActionLog.created_at, ActionLog.id, cursor, limit)
+            has_more = next_cursor is not None
 
         return jsonify({
             "items": [{
@@ -553,9 +578,11 @@ def api_get_action_log():
                 "created_at": utc_iso(log.created_at)
             } for log in logs],
             "total": total,
+            "total_exact": total_exact,
             "offset": offset,
             "limit": limit,
-            "has_more": offset + limit < total
+            "has_more": has_more,
+            "next_cursor": next_cursor,
         })
 
 
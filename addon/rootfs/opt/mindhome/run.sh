@@ -20,6 +20,19 @@ else
     export MINDHOME_LOG_LEVEL="info"
 fi
 
+if bashio::config.has_value 'server_threads'; then
+    export MINDHOME_SERVER_THREADS=$(bashio::config 'server_threads')
+else
+    export MINDHOME_SERVER_THREADS="8"
+fi
+
+# Each open dashboard keeps one live (SSE) stream and one extra server thread
+if bashio::config.has_value 'live_clients'; then
+    export MINDHOME_LIVE_MAX_CLIENTS=$(bashio::config 'live_clients')
+else
+    export MINDHOME_LIVE_MAX_CLIENTS="8"
+fi
+
 # Get Home Assistant connection details
 export HA_TOKEN="${SUPERVISOR_TOKEN}"
 export HA_URL="http://supervisor/core"
@@ -36,6 +49,7 @@ export MINDHOME_BACKUPS_PATH="/data/mindhome/backups"
 
 bashio::log.info "Language: ${MINDHOME_LANGUAGE}"
 bashio::log.info "Log Level: ${MINDHOME_LOG_LEVEL}"
+bashio::log.info "Server Threads: ${MINDHOME_SERVER_THREADS} (+${MINDHOME_LIVE_MAX_CLIENTS} live)"
 bashio::log.info "Ingress Path: ${INGRESS_PATH}"
 bashio::log.info "Database: ${MINDHOME_DB_PATH}"
 
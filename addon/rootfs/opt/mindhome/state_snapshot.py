@@ -0,0 +1,67 @@
+# MindHome - state_snapshot.py | see version.py for version info
+"""
+Home Assistant state snapshot shared by all engines of one scheduler tick.
+
+The TaskScheduler opens a tick scope (HAConnection.tick_snapshot) around
+all tasks due in the same tick. Inside that scope the first get_state /
+get_states call fetches /api/states once; every further lookup in the tick
+is served from the snapshot, indexed by entity_id and domain. All engines
+of a tick therefore see one consistent view instead of issuing one REST
+round-trip per sensor.
+
+The state dicts are shared between all readers of a tick and are not
+copied: treat them as read-only. Entities changed via call_service() are
+read live again for the rest of the tick (see HAConnection.current_snapshot).
+"""
+
+import time
+from types import MappingProxyType
+
+
+class StateSnapshot:
+    """View of all HA states at one point in time (shared dicts, do not mutate)."""
+
+    __slots__ = ("_states", "_by_id", "_by_domain", "taken_at")
+
+    def __init__(self, states, taken_at=None):
+        states = tuple(s for s in (states or []) if isinstance(s, dict))
+        by_id = {}
+        by_domain = {}
+        for s in states:
+            eid = s.get("entity_id", "")
+            if not eid:
+                continue
+            by_id[eid] = s
+            by_domain.setdefault(eid.split(".", 1)[0], []).append(s)
+        self._states = states
+        self._by_id = MappingProxyType(by_id)
+        self._by_domain = MappingProxyType(
+            {d: tuple(items) for d, items in by_domain.items()}
+        )
+        self.taken_at = taken_at if taken_at is not None else time.monotonic()
+
+    def get(self, entity_id):
+        """Shared state dict of one entity or None (like a 404 from /api/states/<id>)."""
+        return self._by_id.get(entity_id)
+
+    def domain(self, domain):
+        """All states of one domain (tuple, empty if none)."""
+        return self._by_domain.get(domain, ())
+
+    def states(self):
+        """All states as a new list (callers may filter/sort it freely)."""
+        return list(self._states)
+
+    @property
+    def by_id(self):
+        """Read-only mapping entity_id -> state dict."""
+        return self._by_id
+
+    def age(self):
+        return time.monotonic() - self.taken_at
+
+    def __contains__(self, entity_id):
+        return entity_id in self._by_id
+
+    def __len__(self):
+        return len(self._states)
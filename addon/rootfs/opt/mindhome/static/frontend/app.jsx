@@ -99,6 +99,66 @@ const api = {
     }
 };
 
+// ================================================================
+// Live Updates (SSE) - one shared stream, components fall back to
+// polling while it is not connected
+// ================================================================
+const LIVE_TOPICS = ['action_log', 'presence', 'presence_mode', 'notifications', 'status', 'resync'];
+
+const live = {
+    source: null,
+    lastId: null,
+    connected: false,
+    handlers: {},
+    statusListeners: new Set(),
+    retryTimer: null,
+
+    connect() {
+        if (this.source || this.retryTimer || typeof EventSource === 'undefined') return;
+        const since = this.lastId ? `?since=${encodeURIComponent(this.lastId)}` : '';
+        const src = new EventSource(`${API_BASE}/api/live${since}`);
+        this.source = src;
+        src.onopen = () => this.setConnected(true);
+        src.onerror = () => {
+            // CONNECTING = browser retries itself (resumes via Last-Event-ID)
+            if (src.readyState !== EventSource.CLOSED) return;
+            this.source = null;
+            this.setConnected(false);
+            this.retryTimer = setTimeout(() => { this.retryTimer = null; this.connect(); }, 60000);
+        };
+        src.addEventListener('hello', (e) => { this.lastId = e.lastEventId; });
+        LIVE_TOPICS.forEach(topic => src.addEventListener(topic, (e) => {
+            if (e.lastEventId) this.lastId = e.lastEventId;
+            let data = null;
+            try { data = JSON.parse(e.data); } catch (err) { return; }
+            (this.handlers[topic] || []).forEach(fn => fn(data));
+        }));
+    },
+
+    setConnected(value) {
+        if (this.connected === value) return;
+        this.connected = value;
+        this.statusListeners.forEach(fn => fn(value));
+    },
+
+    on(topic, fn) {
+        (this.handlers[topic] = this.handlers[topic] || []).push(fn);
+        this.connect();
+        return () => { this.handlers[topic] = (this.handlers[topic] || []).filter(h => h !== fn); };
+    }
+};
+
+const useLiveConnected = () => {
+    const [connected, setConnected] = useState(live.connected);
+    useEffect(() => {
+        live.statusListeners.add(setConnected);
+        live.connect();
+        setConnected(live.connected);
+        return () => live.statusListeners.delete(setConnected);
+    }, []);
+    return connected;
+};
+
 // ================================================================
 // Phase 2a: Patterns Page (Muster-Explorer)
 
@@ -6001,16 +6061,16 @@ const ActivitiesPage = () => {
     const [auditTab, setAuditTab] = useState(false);
     const [auditLogs, setAuditLogs] = useState([]);
     const [hasMore, setHasMore] = useState(false);
-    const [offset, setOffset] = useState(0);
+    const [cursor, setCursor] = useState(null);
 
     const loadLogs = async (p, append = false) => {
         setLoading(true);
-        const o = append ? offset : 0;
-        const data = await api.get(`action-log?limit=50&offset=${o}&period=${p}`);
+        const c = append && cursor ? `&cursor=${encodeURIComponent(cursor)}` : '';
+        const data = await api.get(`action-log?limit=50&period=${p}&total=none${c}`);
         if (data && data.items) {
             setLogs(prev => append ? [...prev, ...data.items] : data.items);
             setHasMore(data.has_more);
-            setOffset(o + data.items.length);
+            setCursor(data.next_cursor || null);
         } else {
             setLogs(Array.isArray(data) ? data : []);
             setHasMore(false);
@@ -6018,19 +6078,32 @@ const ActivitiesPage = () => {
         setLoading(false);
     };
 
-    useEffect(() => { setOffset(0); loadLogs(period); }, [period]);
+    useEffect(() => { setCursor(null); loadLogs(period); }, [period]);
 
     const loadMore = () => loadLogs(period, true);
 
     const loadAudit = async () => { const data = await api.get('audit-trail?limit=200'); setAuditLogs(data || []); };
     useEffect(() => { if (auditTab) loadAudit(); }, [auditTab]);
 
-    // Live mode: poll every 10s
+    // Live mode: new entries pushed via /api/live, poll every 10s as fallback
+    const liveConnected = useLiveConnected();
+    useEffect(() => {
+        if (!liveMode || !liveConnected) return;
+        const offLog = live.on('action_log', (item) => {
+            setLogs(prev => prev.some(l => l.id === item.id) ? prev : [item, ...prev]);
+        });
+        const offResync = live.on('resync', () => {
+            api.invalidate(`action-log?limit=50&period=${period}&total=none`);
+            loadLogs(period);
+        });
+        return () => { offLog(); offResync(); };
+    }, [liveMode, liveConnected, period]);
+
     useEffect(() => {
-        if (!liveMode) return;
+        if (!liveMode || liveConnected) return;
         const iv = setInterval(() => loadLogs(period), 10000);
         return () => clearInterval(iv);
-    }, [liveMode, period]);
+    }, [liveMode, liveConnected, period]);
 
     const typeIcons = {
         observation: 'mdi-eye', quick_action: 'mdi-lightning-bolt', automation: 'mdi-robot',
@@ -11916,14 +11989,26 @@ const PresencePage = () => {
     };
     useEffect(() => { load(); }, []);
 
-    // Auto-refresh person status every 15 seconds when on persons tab
+    // Person status: pushed via /api/live, poll every 15 seconds as fallback
+    const liveConnected = useLiveConnected();
     useEffect(() => {
         if (tab !== 'persons') return;
+        if (liveConnected) {
+            const offPresence = live.on('presence', (p) => setHaPersons(prev =>
+                prev.some(x => x.entity_id === p.entity_id)
+                    ? prev.map(x => x.entity_id === p.entity_id ? { ...x, ...p } : x)
+                    : [...prev, p]));
+            const offResync = live.on('resync', () => {
+                api.invalidate('ha/persons');
+                api.get('ha/persons').then(d => setHaPersons(d?.persons || [])).catch(() => {});
+            });
+            return () => { offPresence(); offResync(); };
+        }
         const interval = setInterval(() => {
             api.get('ha/persons').then(d => setHaPersons(d?.persons || [])).catch(() => {});
         }, 15000);
         return () => clearInterval(interval);
-    }, [tab]);
+    }, [tab, liveConnected]);
 
     // Auto-seed modes on first load
     useEffect(() => {
@@ -12751,14 +12836,23 @@ const App = () => {
         }
     }, []);
 
-    // Phase 2b: Poll notification count
+    // Phase 2b: Notification count (pushed via /api/live, polled as fallback)
+    const liveConnected = useLiveConnected();
     useEffect(() => {
-        const fetchUnread = () => api.get('notifications/unread-count')
-            .then(d => setUnreadNotifs(d?.unread_count || 0)).catch(() => {});
+        const fetchUnread = () => {
+            api.invalidate('notifications/unread-count');
+            api.get('notifications/unread-count')
+                .then(d => setUnreadNotifs(d?.unread_count || 0)).catch(() => {});
+        };
         fetchUnread();
+        if (liveConnected) {
+            const offCount = live.on('notifications', (d) => setUnreadNotifs(d?.unread_count || 0));
+            const offResync = live.on('resync', fetchUnread);
+            return () => { offCount(); offResync(); };
+        }
         const interval = setInterval(fetchUnread, 60000);
         return () => clearInterval(interval);
-    }, []);
+    }, [liveConnected]);
 
     const refreshData = useCallback(async () => {
         const [s, d, dev, r, u, qa] = await Promise.all([
@@ -12796,11 +12890,6 @@ const App = () => {
         };
         init();
 
-        // Refresh data: full load only on page change, lightweight poll every 60s
-        const interval = setInterval(() => {
-            api.get('system/status').then(s => { if (s) setStatus(s); });
-        }, 60000);
-
         // Auto-refresh when tab becomes visible again (stale-data check)
         let lastVisible = Date.now();
         const onVisibility = () => {
@@ -12811,9 +12900,24 @@ const App = () => {
         };
         document.addEventListener('visibilitychange', onVisibility);
 
-        return () => { clearInterval(interval); document.removeEventListener('visibilitychange', onVisibility); };
+        return () => document.removeEventListener('visibilitychange', onVisibility);
     }, []);
 
+    // System status: changes pushed via /api/live, lightweight poll every 60s as fallback
+    useEffect(() => {
+        const fetchStatus = () => {
+            api.invalidate('system/status');
+            api.get('system/status').then(s => { if (s && s.status) setStatus(s); });
+        };
+        if (liveConnected) {
+            const offStatus = live.on('status', (d) => setStatus(prev => ({ ...(prev || {}), ...d })));
+            const offResync = live.on('resync', fetchStatus);
+            return () => { offStatus(); offResync(); };
+        }
+        const interval = setInterval(fetchStatus, 60000);
+        return () => clearInterval(interval);
+    }, [liveConnected]);
+
     // Apply theme (only PUT on actual user change, not on initial load)
     useEffect(() => {
         document.documentElement.setAttribute('data-theme', theme);
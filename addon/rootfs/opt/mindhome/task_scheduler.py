@@ -6,6 +6,7 @@ eigene Tasks registrieren ohne eigene Thread-Loops zu brauchen.
 """
 
 import logging
+import contextlib
 import threading
 import time
 from datetime import datetime, timezone
@@ -50,6 +51,7 @@ class TaskScheduler:
         self._running = False
         self._lock = threading.Lock()
         self._tick_interval = tick_interval  # How often to check for due tasks
+        self._tick_scope: Optional[Callable] = None
 
     def register(self, name: str, callback: Callable, interval_seconds: int,
                  run_immediately: bool = False, one_shot: bool = False,
@@ -114,6 +116,13 @@ class TaskScheduler:
                 return True
         return False
 
+    def set_tick_scope(self, scope_factory: Optional[Callable]):
+        """Wrap every tick in scope_factory() (e.g. HAConnection.tick_snapshot).
+
+        All tasks due in the same tick then share one HA state snapshot.
+        """
+        self._tick_scope = scope_factory
+
     def start(self):
         """Start the scheduler thread."""
         if self._running:
@@ -142,8 +151,11 @@ class TaskScheduler:
                     if task.enabled and now >= task.next_run:
                         tasks_to_run.append(task)
 
-            for task in tasks_to_run:
-                self._execute_task(task, now)
+            if tasks_to_run:
+                scope = self._tick_scope() if self._tick_scope else contextlib.nullcontext()
+                with scope:
+                    for task in tasks_to_run:
+                        self._execute_task(task, now)
 
             time.sleep(self._tick_interval)
 
@@ -0,0 +1,469 @@
+"""
+Action Journal — Zeitindizierte Aktions-Historie auf einem Redis Stream.
+
+Die Aktions-Historie lag bisher in mehreren gekappten JSON-Listen
+(mha:action_log, mha:learning:manual_actions, mha:action_outcomes,
+mha:correction_memory:entries). Jeder Leser hat bei jedem Aufruf grosse
+Ausschnitte neu geholt und komplett dekodiert.
+
+Das Journal ist ein append-only Stream pro Eintrags-Art (mha:journal:<kind>),
+jeder mit eigener Aufbewahrung wie die bisherigen Listen — haeufige Arten
+verdraengen seltene (Korrekturen, Outcomes) nicht:
+
+- Typisierte Felder: kind, ts (ms), entity_id, person, data (Eintrag als JSON)
+- Stream-IDs beginnen mit der Schreibzeit in ms — Zeitfenster sind XRANGE
+- Sekundaerindizes pro Entity und Person ueber alle Arten (ZSET, Score = ms,
+  Member = "<kind>:<Stream-ID>"). Sie werden inkrementell nachgezogen
+  (sync_indexes), Schreiber zahlen dafuer keinen Round-Trip.
+- JournalCursor: haelt ein dekodiertes Fenster im Speicher und liest bei jedem
+  refresh() nur Eintraege nach der zuletzt gesehenen ID.
+
+Schreiber haengen ihre Eintraege per append_to(pipe, ...) an ihre bestehende
+Pipeline an. Die Listen werden weiter geschrieben (Leser die noch nicht
+umgestellt sind, Rollback). Beim ersten Start werden sie einmalig ins
+Journal uebernommen.
+"""
+
+import asyncio
+import collections
+import itertools
+import json
+import logging
+import time
+from datetime import datetime
+from typing import Iterable, Optional
+
+from zoneinfo import ZoneInfo
+
+from .config import yaml_config
+
+logger = logging.getLogger(__name__)
+_LOCAL_TZ = ZoneInfo(yaml_config.get("timezone", "Europe/Berlin"))
+
+STREAM_KEY = "mha:journal:{}"  # pro Eintrags-Art
+INDEX_ENTITY_KEY = "mha:journal:idx:entity:{}"
+INDEX_PERSON_KEY = "mha:journal:idx:person:{}"
+INDEX_CURSOR_KEY = "mha:journal:idx:cursor:{}"
+BACKFILL_KEY = "mha:journal:backfilled:v2"
+# Frueherer gemeinsamer Stream aller Arten (wird beim Backfill entfernt)
+_OLD_KEYS = ("mha:journal", "mha:journal:backfilled", "mha:journal:idx:cursor")
+
+# Eintrags-Arten und ihre bisherigen Listen
+KIND_ACTION = "action"  # AnticipationEngine.log_action
+KIND_MANUAL = "manual"  # LearningObserver: manuelle Geraete-Aenderungen
+KIND_OUTCOME = "outcome"  # brain: ausgefuehrte Function Calls (Experiential Memory)
+KIND_CORRECTION = "correction"  # CorrectionMemory
+LEGACY_LISTS = {
+    KIND_ACTION: "mha:action_log",
+    KIND_MANUAL: "mha:learning:manual_actions",
+    KIND_OUTCOME: "mha:action_outcomes",
+    KIND_CORRECTION: "mha:correction_memory:entries",
+}
+
+# Aufbewahrung pro Art = Kappung der bisherigen Listen
+_DEFAULT_RETENTION = {
+    KIND_ACTION: 5000,
+    KIND_MANUAL: 5000,
+    KIND_OUTCOME: 500,
+    KIND_CORRECTION: 500,
+}
+
+_PAGE = 500
+_INDEX_TTL = 365 * 86400
+
+
+def _text(value) -> str:
+    if isinstance(value, bytes):
+        return value.decode("utf-8", errors="ignore")
+    return "" if value is None else str(value)
+
+
+def _timestamp_ms(entry: dict) -> Optional[int]:
+    """Zeitstempel eines Eintrags in ms (naive Zeiten = lokale Zeitzone)."""
+    try:
+        ts = datetime.fromisoformat(entry.get("timestamp", ""))
+    except (TypeError, ValueError):
+        return None
+    if ts.tzinfo is None:
+        ts = ts.replace(tzinfo=_LOCAL_TZ)
+    return int(ts.timestamp() * 1000)
+
+
+def _entity_of(entry: dict) -> str:
+    """entity_id direkt oder aus den (ggf. JSON-kodierten) Aktions-Argumenten."""
+    if entry.get("entity_id"):
+        return str(entry["entity_id"])
+    for key in ("args", "original_args"):
+        args = entry.get(key)
+        if isinstance(args, str):
+            try:
+                args = json.loads(args)
+            except (json.JSONDecodeError, TypeError):
+                continue
+        if isinstance(args, dict) and args.get("entity_id"):
+            return str(args["entity_id"])
+    return ""
+
+
+def _ms_of(stream_id: str) -> int:
+    return int(stream_id.split("-", 1)[0])
+
+
+def _id_key(stream_id: str) -> tuple[int, int]:
+    ms, _, seq = stream_id.partition("-")
+    return int(ms), int(seq or 0)
+
+
+class ActionJournal:
+    """Append-only Aktions-Journal mit Zeit- und Sekundaerindex."""
+
+    def __init__(self):
+        self.redis = None
+        self._ready = False
+        cfg = yaml_config.get("action_journal", {})
+        self.retention = dict(_DEFAULT_RETENTION)
+        self.retention[KIND_CORRECTION] = int(
+            yaml_config.get("correction_memory", {}).get("max_entries", 500)
+        )
+        for kind, maxlen in (cfg.get("retention") or {}).items():
+            if kind in self.retention:
+                self.retention[kind] = int(maxlen)
+        self.index_len = int(cfg.get("index_entries", 500))
+        self._index_cursors: dict[str, str] = {}
+        self._index_lock = asyncio.Lock()
+
+    async def initialize(self, redis_client=None):
+        """Verbindet Redis und uebernimmt beim ersten Start die Listen."""
+        self.redis = redis_client
+        if not self.redis:
+            return
+        try:
+            migrated = await self._backfill()
+        except Exception as e:
+            logger.warning("ActionJournal Backfill fehlgeschlagen: %s", e)
+            return
+        self._ready = True
+        logger.info("ActionJournal initialisiert (%d Eintraege uebernommen)", migrated)
+
+    @property
+    def ready(self) -> bool:
+        """True sobald Redis verbunden und die Listen uebernommen sind."""
+        return self._ready and self.redis is not None
+
+    # ------------------------------------------------------------------
+    # Schreiben
+    # ------------------------------------------------------------------
+
+    def _fields(self, kind: str, entry: dict, ts_ms: Optional[int] = None) -> dict:
+        person = entry.get("person") or ""
+        return {
+            "kind": kind,
+            "ts": str(ts_ms or _timestamp_ms(entry) or int(time.time() * 1000)),
+            "entity_id": _entity_of(entry),
+            "person": str(person).lower(),
+            "data": json.dumps(entry, ensure_ascii=False),
+        }
+
+    def append_to(self, pipe, kind: str, entry: dict) -> bool:
+        """Reiht den Eintrag in eine bestehende Pipeline ein (kein eigener Round-Trip)."""
+        if not self.ready or kind not in self.retention:
+            return False
+        pipe.xadd(
+            STREAM_KEY.format(kind),
+            self._fields(kind, entry),
+            maxlen=self.retention[kind],
+            approximate=True,
+        )
+        return True
+
+    async def append(self, kind: str, entry: dict) -> Optional[str]:
+        """Schreibt einen einzelnen Eintrag. Gibt die Stream-ID zurueck."""
+        if not self.ready or kind not in self.retention:
+            return None
+        stream_id = await self.redis.xadd(
+            STREAM_KEY.format(kind),
+            self._fields(kind, entry),
+            maxlen=self.retention[kind],
+            approximate=True,
+        )
+        return _text(stream_id)
+
+    async def _backfill(self) -> int:
+        """Uebernimmt die bestehenden Listen einmalig, zeitlich sortiert.
+
+        Die Stream-IDs werden aus den Zeitstempeln der Eintraege gebildet,
+        damit auch die Historie per Zeitfenster lesbar ist. Eintraege die
+        waehrend des Backfills geschrieben werden, landen nur in den Listen.
+        """
+        if await self.redis.get(BACKFILL_KEY):
+            return 0
+
+        reads = self.redis.pipeline(transaction=False)
+        for kind, key in LEGACY_LISTS.items():
+            reads.lrange(key, 0, self.retention[kind] - 1)
+            reads.xlen(STREAM_KEY.format(kind))
+        results = await reads.execute()
+
+        now_ms = int(time.time() * 1000)
+        migrated = 0
+        for i, kind in enumerate(LEGACY_LISTS):
+            raw_entries, existing = results[2 * i], results[2 * i + 1]
+            if existing:
+                continue
+            rows = []
+            # Listen sind neueste-zuerst (LPUSH)
+            for raw in reversed(raw_entries or []):
+                try:
+                    entry = json.loads(_text(raw))
+                except (json.JSONDecodeError, TypeError):
+                    continue
+                ts_ms = _timestamp_ms(entry) if isinstance(entry, dict) else None
+                if ts_ms is not None:
+                    rows.append((ts_ms, entry))
+            rows.sort(key=lambda r: r[0])
+
+            last_ms, seq = -1, 0
+            for start in range(0, len(rows), _PAGE):
+                pipe = self.redis.pipeline(transaction=False)
+                for ts_ms, entry in rows[start:start + _PAGE]:
+                    # IDs muessen streng steigen und duerfen nicht in der Zukunft liegen
+                    ms = min(max(ts_ms, last_ms), now_ms)
+                    seq = seq + 1 if ms == last_ms else 0
+                    last_ms = ms
+                    pipe.xadd(
+                        STREAM_KEY.format(kind),
+                        self._fields(kind, entry, ts_ms),
+                        id=f"{ms}-{seq}",
+                    )
+                await pipe.execute()
+            migrated += len(rows)
+        await self.redis.delete(*_OLD_KEYS)
+        await self.redis.set(BACKFILL_KEY, "1")
+        return migrated
+
+    # ------------------------------------------------------------------
+    # Lesen
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _decode(raw_fields) -> Optional[dict]:
+        fields = {_text(k): _text(v) for k, v in (raw_fields or {}).items()}
+        try:
+            data = json.loads(fields.get("data", ""))
+        except (json.JSONDecodeError, TypeError):
+            return None
+        fields["data"] = data
+        return fields
+
+    async def range(
+        self,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+        kinds: Iterable[str] = (),
+        limit: int = 0,
+    ) -> list[dict]:
+        """Eintraege im Zeitfenster (aelteste zuerst) per XRANGE ueber die IDs."""
+        if not self.ready:
+            return []
+        low = str(int(since.timestamp() * 1000)) if since else "-"
+        high = str(int(until.timestamp() * 1000)) if until else "+"
+        hits = []
+        for kind in self._kinds(kinds):
+            key, cursor = STREAM_KEY.format(kind), low
+            found = 0
+            while True:
+                batch = await self.redis.xrange(key, min=cursor, max=high, count=_PAGE)
+                for stream_id, raw_fields in batch:
+                    fields = self._decode(raw_fields)
+                    if fields:
+                        hits.append((_id_key(_text(stream_id)), fields["data"]))
+                        found += 1
+                if len(batch) < _PAGE or (limit and found >= limit):
+                    break
+                cursor = f"({_text(batch[-1][0])}"
+        hits.sort(key=lambda h: h[0])
+        result = [data for _, data in hits]
+        return result[:limit] if limit else result
+
+    def _kinds(self, kinds: Iterable[str] = ()) -> list[str]:
+        kinds = set(kinds)
+        return [k for k in self.retention if not kinds or k in kinds]
+
+    async def for_entity(
+        self, entity_id: str, since: Optional[datetime] = None, limit: int = 50
+    ) -> list[dict]:
+        """Letzte Eintraege zu einer Entity (neueste zuerst) ueber den Index."""
+        return await self._from_index(INDEX_ENTITY_KEY.format(entity_id), since, limit)
+
+    async def for_person(
+        self, person: str, since: Optional[datetime] = None, limit: int = 50
+    ) -> list[dict]:
+        """Letzte Eintraege einer Person (neueste zuerst) ueber den Index."""
+        return await self._from_index(
+            INDEX_PERSON_KEY.format(person.lower()), since, limit
+        )
+
+    async def _from_index(
+        self, index_key: str, since: Optional[datetime], limit: int
+    ) -> list[dict]:
+        if not self.ready:
+            return []
+        await self.sync_indexes()
+        low = int(since.timestamp() * 1000) if since else "-inf"
+        ids = await self.redis.zrevrangebyscore(
+            index_key, "+inf", low, start=0, num=limit
+        )
+        if not ids:
+            return []
+        pipe = self.redis.pipeline(transaction=False)
+        queued = 0
+        for member in ids:
+            kind, _, sid = _text(member).partition(":")
+            if kind in self.retention and sid:
+                pipe.xrange(STREAM_KEY.format(kind), min=sid, max=sid, count=1)
+                queued += 1
+        if not queued:
+            return []
+        result = []
+        # Vom Stream bereits getrimmte Eintraege fallen hier heraus
+        for hit in await pipe.execute():
+            if hit:
+                fields = self._decode(hit[0][1])
+                if fields:
+                    result.append(fields["data"])
+        return result
+
+    async def sync_indexes(self) -> int:
+        """Traegt neue Stream-Eintraege in die Entity-/Person-Indizes ein.
+
+        Inkrementell ab der zuletzt indizierten ID je Art (in Redis
+        gespeichert). Gibt die Anzahl neu indizierter Eintraege zurueck.
+        """
+        if not self.ready:
+            return 0
+        async with self._index_lock:
+            kinds = list(self.retention)
+            if len(self._index_cursors) < len(kinds):
+                stored = await self.redis.mget(
+                    *(INDEX_CURSOR_KEY.format(k) for k in kinds)
+                )
+                for kind, value in zip(kinds, stored):
+                    self._index_cursors.setdefault(kind, _text(value) or "0-0")
+            total = 0
+            for kind in kinds:
+                total += await self._sync_kind(kind)
+            return total
+
+    async def _sync_kind(self, kind: str) -> int:
+        cursor = self._index_cursors[kind]
+        total = 0
+        while True:
+            batch = await self.redis.xrange(
+                STREAM_KEY.format(kind), min=f"({cursor}", max="+", count=_PAGE
+            )
+            if not batch:
+                break
+            pipe = self.redis.pipeline(transaction=False)
+            touched = set()
+            for stream_id, raw_fields in batch:
+                cursor = _text(stream_id)
+                fields = {_text(k): _text(v) for k, v in raw_fields.items()}
+                for template, value in (
+                    (INDEX_ENTITY_KEY, fields.get("entity_id")),
+                    (INDEX_PERSON_KEY, fields.get("person")),
+                ):
+                    if value:
+                        key = template.format(value)
+                        pipe.zadd(key, {f"{kind}:{cursor}": _ms_of(cursor)})
+                        touched.add(key)
+            for key in touched:
+                pipe.zremrangebyrank(key, 0, -(self.index_len + 1))
+                pipe.expire(key, _INDEX_TTL)
+            pipe.set(INDEX_CURSOR_KEY.format(kind), cursor)
+            await pipe.execute()
+            total += len(batch)
+            if len(batch) < _PAGE:
+                break
+        self._index_cursors[kind] = cursor
+        return total
+
+    def cursor(self, kinds: Iterable[str], window: int = 1000) -> "JournalCursor":
+        """Neuer inkrementeller Leser fuer die gegebenen Eintrags-Arten."""
+        return JournalCursor(self, kinds, window)
+
+
+class JournalCursor:
+    """Inkrementelles Lesefenster ueber das Journal.
+
+    Haelt die letzten ``window`` Eintraege der gewuenschten Arten dekodiert im
+    Speicher. refresh() liest nur Stream-IDs nach der zuletzt gesehenen —
+    jeder Eintrag wird pro Leser genau einmal dekodiert. Es werden nur die
+    Streams der gewuenschten Arten gelesen.
+    """
+
+    def __init__(self, journal: ActionJournal, kinds: Iterable[str], window: int):
+        self.journal = journal
+        self.kinds = frozenset(kinds)
+        self.window = window
+        self._entries: collections.deque = collections.deque(maxlen=window)
+        self._last_ids: Optional[dict[str, str]] = None
+        self._lock = asyncio.Lock()
+
+    @property
+    def ready(self) -> bool:
+        return self.journal.ready
+
+    async def refresh(self) -> int:
+        """Liest neue Eintraege nach. Gibt die Anzahl neuer Eintraege zurueck."""
+        if not self.ready:
+            return 0
+        async with self._lock:
+            if self._last_ids is None:
+                return await self._load_window()
+            return await self._read_new()
+
+    def latest(self, limit: int = 0) -> list[dict]:
+        """Eintraege im Fenster, neueste zuerst (wie LRANGE auf den Listen)."""
+        newest_first = reversed(self._entries)
+        if limit:
+            return list(itertools.islice(newest_first, limit))
+        return list(newest_first)
+
+    async def _load_window(self) -> int:
+        """Erstes Laden: die letzten ``window`` Eintraege je Art."""
+        redis = self.journal.redis
+        last_ids: dict[str, str] = {}
+        found = []
+        for kind in self.journal._kinds(self.kinds):
+            batch = await redis.xrevrange(
+                STREAM_KEY.format(kind), max="+", min="-", count=self.window
+            )
+            last_ids[kind] = _text(batch[0][0]) if batch else "0-0"
+            for stream_id, raw_fields in batch:
+                fields = ActionJournal._decode(raw_fields)
+                if fields:
+                    found.append((_id_key(_text(stream_id)), fields["data"]))
+        found.sort(key=lambda h: h[0])
+        self._entries.extend(data for _, data in found[-self.window:])
+        self._last_ids = last_ids
+        return min(len(found), self.window)
+
+    async def _read_new(self) -> int:
+        redis = self.journal.redis
+        new = []
+        for kind, last_id in self._last_ids.items():
+            while True:
+                batch = await redis.xrange(
+                    STREAM_KEY.format(kind), min=f"({last_id}", max="+", count=_PAGE
+                )
+                for stream_id, raw_fields in batch:
+                    last_id = _text(stream_id)
+                    fields = ActionJournal._decode(raw_fields)
+                    if fields:
+                        new.append((_id_key(last_id), fields["data"]))
+                if len(batch) < _PAGE:
+                    break
+            self._last_ids[kind] = last_id
+        new.sort(key=lambda h: h[0])
+        self._entries.extend(data for _, data in new)
+        return len(new)
@@ -26,6 +26,7 @@ import redis.asyncio as redis
 
 from zoneinfo import ZoneInfo
 
+from .action_journal import KIND_ACTION
 from .config import yaml_config
 
 logger = logging.getLogger(__name__)
@@ -65,6 +66,10 @@ class AnticipationEngine:
         self._climate_model = None
         self._ha_client = None
 
+        # Action Journal: inkrementeller Leser statt LRANGE + json.loads pro Aufruf
+        self._journal = None
+        self._action_cursor = None
+
     async def initialize(self, redis_client: Optional[redis.Redis] = None):
         """Initialisiert die Engine."""
         self.redis = redis_client
@@ -100,6 +105,14 @@ class AnticipationEngine:
         self._climate_model = climate_model
         self._ha_client = ha_client
 
+    def set_action_journal(self, journal):
+        """Verbindet das ActionJournal (Schreiben + inkrementelles Lesen).
+
+        Solange das Journal nicht bereit ist, wird weiter mha:action_log gelesen.
+        """
+        self._journal = journal
+        self._action_cursor = journal.cursor((KIND_ACTION,), window=1000)
+
     async def stop(self):
         """Stoppt die Engine."""
         self._running = False
@@ -146,11 +159,31 @@ class AnticipationEngine:
             pipe.expire("mha:action_log", 365 * 86400)
             pipe.lpush(day_key, entry_json)
             pipe.expire(day_key, 365 * 86400)
+            if self._journal:
+                self._journal.append_to(pipe, KIND_ACTION, entry)
             await pipe.execute()
 
         except Exception as e:
             logger.error("Fehler beim Action-Logging: %s", e)
 
+    async def _recent_actions(self, limit: int = 1000) -> list[dict]:
+        """Letzte Aktionen, neueste zuerst.
+
+        Mit Journal: nur neue Eintraege werden gelesen und dekodiert.
+        Sonst wie bisher aus der Liste mha:action_log.
+        """
+        if self._action_cursor and self._action_cursor.ready:
+            await self._action_cursor.refresh()
+            return self._action_cursor.latest(limit)
+        raw_entries = await self.redis.lrange("mha:action_log", 0, limit - 1)
+        entries = []
+        for e in raw_entries:
+            try:
+                entries.append(json.loads(e.decode() if isinstance(e, bytes) else e))
+            except (json.JSONDecodeError, TypeError):
+                continue
+        return entries
+
     # ------------------------------------------------------------------
     # Pattern Detection
     # ------------------------------------------------------------------
@@ -167,15 +200,10 @@ class AnticipationEngine:
 
         try:
             # Alle Aktionen laden
-            raw_entries = await self.redis.lrange("mha:action_log", 0, 999)
-            if len(raw_entries) < 10:
+            entries = await self._recent_actions()
+            if len(entries) < 10:
                 return []  # Zu wenig Daten
 
-            entries = [
-                json.loads(e.decode() if isinstance(e, bytes) else e)
-                for e in raw_entries
-            ]
-
             patterns = []
 
             # 1. Zeit-Muster erkennen
@@ -1049,10 +1077,9 @@ class AnticipationEngine:
 
             elif pattern["type"] == "sequence":
                 # Wurde der Trigger gerade ausgefuehrt? (letzte 5 Min)
-                recent = await self.redis.lrange("mha:action_log", 0, 4)
-                for entry_json in recent:
+                recent = await self._recent_actions(5)
+                for entry in recent:
                     try:
-                        entry = json.loads(entry_json)
                         ts_str = entry.get("timestamp", "")
                         if not ts_str:
                             continue
@@ -1068,7 +1095,7 @@ class AnticipationEngine:
                                     "confidence": pattern["confidence"],
                                     "description": pattern["description"],
                                 }
-                    except (json.JSONDecodeError, ValueError, TypeError):
+                    except (ValueError, TypeError):
                         continue
 
             elif pattern["type"] == "context":
@@ -1787,15 +1814,10 @@ class AnticipationEngine:
         try:
             now = datetime.now(_LOCAL_TZ)
             # Alle Eintraege laden
-            raw_entries = await self.redis.lrange("mha:action_log", 0, 999)
-            if len(raw_entries) < 10:
+            entries = await self._recent_actions()
+            if len(entries) < 10:
                 return []
 
-            entries = [
-                json.loads(e.decode() if isinstance(e, bytes) else e)
-                for e in raw_entries
-            ]
-
             # In zwei Zeitraeume aufteilen
             recent_start = now - timedelta(days=7)
             previous_start = now - timedelta(days=14)
@@ -2000,11 +2022,7 @@ class AnticipationEngine:
             return []
 
         try:
-            raw_entries = await self.redis.lrange("mha:action_log", 0, 999)
-            entries = [
-                json.loads(e.decode() if isinstance(e, bytes) else e)
-                for e in raw_entries
-            ]
+            entries = await self._recent_actions()
 
             for person in persons_away:
                 # Alle Ankunfts-Events dieser Person sammeln
@@ -2077,19 +2095,10 @@ class AnticipationEngine:
 
         try:
             # Zeitmuster-Daten laden
-            raw_entries = await self.redis.lrange("mha:action_log", 0, 999)
-            if len(raw_entries) < 10:
+            entries = await self._recent_actions()
+            if len(entries) < 10:
                 return []
 
-            entries = []
-            for e in raw_entries:
-                try:
-                    entries.append(
-                        json.loads(e.decode() if isinstance(e, bytes) else e)
-                    )
-                except (json.JSONDecodeError, TypeError):
-                    continue
-
             # Zeitmuster pro Aktion+Wochentag+Stunde zaehlen
             from collections import defaultdict
 
@@ -2322,7 +2331,8 @@ class AnticipationEngine:
                     except (ValueError, TypeError):
                         pass
 
-            suggestions = []
+            target = 21.0  # Standard-Komforttemperatur
+            candidates = []
             for pred in climate_preds:
                 action = pred.get("action", "")
                 # Raum aus Aktion extrahieren (z.B. "set_climate_wohnzimmer")
@@ -2335,8 +2345,6 @@ class AnticipationEngine:
                     room = next(iter(temp_by_room))
 
                 current = temp_by_room.get(room, 20.0)
-                target = 21.0  # Standard-Komforttemperatur
-
                 room_state = RoomThermalState(
                     room=room,
                     current_temp=current,
@@ -2345,7 +2353,15 @@ class AnticipationEngine:
                     heating_active=False,
                     windows_open=0,
                 )
-                comfort = self._climate_model.estimate_comfort_time(room_state, target)
+                candidates.append((pred, action, room, current, room_state))
+
+            # Alle Raeume in einer Batch-Simulation
+            comforts = self._climate_model.estimate_comfort_times(
+                [c[4] for c in candidates], target
+            )
+
+            suggestions = []
+            for (pred, action, room, current, _), comfort in zip(candidates, comforts):
                 preheat_min = comfort.get("minutes")
 
                 if preheat_min and preheat_min > 5:
@@ -0,0 +1,158 @@
+"""
+Audio Convert — In-Process Dekodierung + Resampling auf 16kHz mono PCM.
+
+Whisper (Wyoming STT) erwartet 16-bit PCM, 16kHz, mono. Bisher wurde fuer
+jeden Voice-Request ein ffmpeg-Prozess gestartet — Prozess-Start plus
+Codec-Probing kosten bei jedem Browser-/Handy-Turn spuerbar Latenz.
+
+Schneller Pfad (ohne Subprozess):
+  - WAV (PCM 8/16/24/32 bit, beliebige Rate/Kanaele) via wave + numpy
+  - Ogg/Opus, Ogg/Vorbis, FLAC, MP3 via soundfile (libsndfile), falls
+    installiert und vom gebundenen libsndfile unterstuetzt
+
+Alles andere (WebM/Matroska, MP4/AAC, ...) liefert None — der Aufrufer
+faellt dann auf ffmpeg zurueck.
+
+Resampling: bandbegrenzt per FFT (Spektrum abschneiden/auffuellen). Fuer
+Sprach-Clips bis 30s ist das schnell und ohne Aliasing.
+"""
+
+import io
+import logging
+import wave
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+TARGET_RATE = 16000
+
+# Container-Signaturen die libsndfile lesen kann (WebM/MP4 bewusst nicht)
+_SNDFILE_MAGIC = (b"OggS", b"fLaC", b"ID3", b"\xff\xfb", b"\xff\xf3", b"\xff\xf2")
+
+
+def is_pcm16_mono_16k(audio_bytes: bytes) -> bool:
+    """True wenn audio_bytes bereits ein WAV im Zielformat ist."""
+    if audio_bytes[:4] != b"RIFF":
+        return False
+    try:
+        with wave.open(io.BytesIO(audio_bytes), "rb") as wf:
+            return (
+                wf.getframerate() == TARGET_RATE
+                and wf.getnchannels() == 1
+                and wf.getsampwidth() == 2
+            )
+    except (wave.Error, EOFError):
+        return False
+
+
+def resample(samples, rate_in: int, rate_out: int = TARGET_RATE):
+    """Bandbegrenztes Resampling eines float-Mono-Signals per FFT."""
+    import numpy as np
+
+    if rate_in == rate_out or len(samples) == 0:
+        return samples
+    n_in = len(samples)
+    n_out = max(1, int(round(n_in * rate_out / rate_in)))
+    spectrum = np.fft.rfft(samples)
+    bins_out = n_out // 2 + 1
+    if bins_out <= len(spectrum):
+        spectrum = spectrum[:bins_out]
+    else:
+        spectrum = np.concatenate(
+            [spectrum, np.zeros(bins_out - len(spectrum), dtype=spectrum.dtype)]
+        )
+    return np.fft.irfft(spectrum, n_out) * (n_out / n_in)
+
+
+def _to_pcm16(samples) -> bytes:
+    import numpy as np
+
+    clipped = np.clip(samples, -1.0, 1.0)
+    return (clipped * 32767.0).astype("<i2").tobytes()
+
+
+def _decode_wav(audio_bytes: bytes):
+    """WAV → (float32 mono, rate). None bei nicht-PCM WAV (z.B. A-law)."""
+    import numpy as np
+
+    try:
+        with wave.open(io.BytesIO(audio_bytes), "rb") as wf:
+            rate = wf.getframerate()
+            channels = wf.getnchannels()
+            width = wf.getsampwidth()
+            frames = wf.readframes(wf.getnframes())
+    except (wave.Error, EOFError):
+        return None
+
+    if width == 1:
+        data = (np.frombuffer(frames, dtype=np.uint8).astype(np.float32) - 128.0) / 128.0
+    elif width == 2:
+        data = np.frombuffer(frames, dtype="<i2").astype(np.float32) / 32768.0
+    elif width == 3:
+        raw = np.frombuffer(frames, dtype=np.uint8).reshape(-1, 3)
+        ints = (
+            raw[:, 0].astype(np.int32)
+            | (raw[:, 1].astype(np.int32) << 8)
+            | (raw[:, 2].astype(np.int32) << 16)
+        )
+        ints = np.where(ints & 0x800000, ints - 0x1000000, ints)
+        data = ints.astype(np.float32) / 8388608.0
+    elif width == 4:
+        data = np.frombuffer(frames, dtype="<i4").astype(np.float32) / 2147483648.0
+    else:
+        return None
+
+    if channels > 1:
+        usable = len(data) - len(data) % channels
+        data = data[:usable].reshape(-1, channels).mean(axis=1)
+    return data, rate
+
+
+def _decode_sndfile(audio_bytes: bytes):
+    """Ogg/FLAC/MP3 via soundfile → (float32 mono, rate). None wenn nicht lesbar."""
+    try:
+        import soundfile
+    except (ImportError, OSError):
+        # OSError: Python-Paket da, aber libsndfile fehlt
+        return None
+    try:
+        data, rate = soundfile.read(
+            io.BytesIO(audio_bytes), dtype="float32", always_2d=True
+        )
+    except (RuntimeError, TypeError, ValueError) as e:
+        # soundfile.LibsndfileError erbt von RuntimeError
+        logger.debug("soundfile konnte Audio nicht lesen: %s", e)
+        return None
+    return data.mean(axis=1), rate
+
+
+def decode_to_16k_mono(audio_bytes: bytes) -> Optional[bytes]:
+    """Dekodiert Audio in-process zu 16kHz 16-bit mono PCM (raw, ohne Header).
+
+    Gibt None zurueck wenn das Format hier nicht dekodiert werden kann —
+    dann ist ffmpeg zustaendig. Blockierend (numpy), im Thread aufrufen.
+    """
+    if not audio_bytes:
+        return None
+    if is_pcm16_mono_16k(audio_bytes):
+        # Bereits im Zielformat — nur die Frames ausschneiden
+        with wave.open(io.BytesIO(audio_bytes), "rb") as wf:
+            return wf.readframes(wf.getnframes())
+    try:
+        import numpy  # noqa: F401
+    except ImportError:
+        return None
+
+    if audio_bytes[:4] == b"RIFF" and audio_bytes[8:12] == b"WAVE":
+        decoded = _decode_wav(audio_bytes)
+    elif audio_bytes.startswith(_SNDFILE_MAGIC):
+        decoded = _decode_sndfile(audio_bytes)
+    else:
+        return None
+    if decoded is None:
+        return None
+
+    samples, rate = decoded
+    if rate <= 0:
+        return None
+    return _to_pcm16(resample(samples, rate, TARGET_RATE))
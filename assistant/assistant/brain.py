@@ -66,6 +66,7 @@ from .follow_me import FollowMeEngine
 from .light_engine import LightEngine
 from .personality import PersonalityEngine
 from .proactive import ProactiveManager
+from .action_journal import KIND_OUTCOME, ActionJournal
 from .anticipation import AnticipationEngine
 from .inner_state import InnerStateEngine
 from .insight_engine import InsightEngine
@@ -98,8 +99,11 @@ from .tts_enhancer import TTSEnhancer
 from .brain_callbacks import BrainCallbacksMixin
 from .brain_humanizers import BrainHumanizersMixin
 from .pre_classifier import PreClassifier
+from .intent_matcher import intent_matcher
 from .response_cache import ResponseCache
+from .init_graph import InitGraph
 from .latency_tracker import latency_tracker
+from .context_prefetch import ContextPrefetcher
 from .constants import (
     REDIS_SECURITY_CONFIRM_KEY,
     REDIS_SECURITY_CONFIRM_TTL,
@@ -354,6 +358,210 @@ def _extract_multi_rooms(text: str) -> list[str]:
     return rooms if len(rooms) >= 2 else []
 
 
+# ------------------------------------------------------------------
+# Keyword-Tabellen fuer Intent-Klassifikation und Tool-Selektion.
+# Alle im gemeinsamen IntentMatcher registriert (ein Scan pro Utterance).
+# ------------------------------------------------------------------
+
+# _classify_intent: Memory-Fragen (Fallback wenn kein Pre-Classifier Profile)
+_INTENT_MEMORY_KEYWORDS = (
+    "erinnerst du dich",
+    "weisst du noch",
+    "was weisst du",
+    "habe ich dir",
+    "hab ich gesagt",
+    "was war",
+    "habe ich erwaehnt",
+    "habe ich erzaehlt",
+    "kennst du mein",
+    "kennst du meine",
+    "wann habe ich",
+    "wann ist mein",
+    "wie heisst mein",
+    "wie heisst meine",
+    "wo wohne ich",
+    "wo arbeite ich",
+    "was mache ich beruflich",
+    "mein geburtstag",
+    "mein name",
+    "meine frau",
+    "mein mann",
+    "was mag ich",
+    "was habe ich gesagt",
+    "erinnere dich",
+    "was hast du dir gemerkt",
+    "wer bin ich",
+    "wie heisse ich",
+    "wie heiße ich",
+    "letzte woche",
+    "gestern",
+    "remember",
+    "do you know my",
+    "what did i tell you",
+    "what do you know about",
+    "did i mention",
+)
+
+# _classify_intent: Steuerungs-Befehle → immer mit Tools (frueh raus)
+_INTENT_ACTION_STARTERS = (
+    "mach ",
+    "schalte ",
+    "stell ",
+    "setz ",
+    "dreh ",
+    "oeffne ",
+    "schliess",
+    "aktivier",
+    "deaktivier",
+    "spiel ",
+    "stopp",
+    "pause",
+    "lauter",
+    "leiser",
+)
+
+# _classify_intent: Geraete-Befehle die mit Raum/Geraet statt Verb anfangen
+_INTENT_DEVICE_NOUNS = (
+    "rollladen",
+    "rolladen",
+    "rollo",
+    "jalousie",
+    "licht",
+    "lampe",
+    "leuchte",
+    "heizung",
+    "thermostat",
+    "steckdose",
+    "schalter",
+)
+
+_INTENT_DEVICE_ACTIONS = (
+    "auf",
+    "zu",
+    "an",
+    "aus",
+    "hoch",
+    "runter",
+    "offen",
+    "ein",
+    "ab",
+    "halb",
+    "stopp",
+)
+
+# _classify_intent: Wissensfragen-Muster
+_INTENT_KNOWLEDGE_PATTERNS = (
+    "wie lange",
+    "wie viel",
+    "wie viele",
+    "was ist",
+    "was sind",
+    "was bedeutet",
+    "erklaer mir",
+    "erklaere",
+    "warum ist",
+    "wer ist",
+    "wer war",
+    "was passiert wenn",
+    "wie funktioniert",
+    "wie macht man",
+    "wie kocht man",
+    "rezept für",
+    "rezept für",
+    "definition von",
+    "unterschied zwischen",
+)
+
+# _classify_intent: Smart-Home-Keywords — wenn vorhanden, brauchen wir Tools
+_INTENT_SMART_HOME_KEYWORDS = (
+    "licht",
+    "lampe",
+    "heizung",
+    "temperatur",
+    "rollladen",
+    "rollläden",
+    "jalousie",
+    "szene",
+    "alarm",
+    "tuer",
+    "tür",
+    "fenster",
+    "musik",
+    "tv",
+    "fernseher",
+    "kamera",
+    "sensor",
+    "steckdose",
+    "schalter",
+    "thermostat",
+    "status",
+    "hausstatus",
+    "haus-status",
+    "ueberblick",
+    "watt",
+    "verbrauch",
+    "strom",
+    "energie",
+    "kilowatt",
+    "kwh",
+    "maschine",
+    "geraet",
+    "geraete",
+)
+
+# _select_tools_for_intent (P06e)
+_TOOL_CONTROL_KEYWORDS = (
+    "mach",
+    "schalte",
+    "stell",
+    "dreh",
+    "dimm",
+    "oeffne",
+    "schliess",
+    "fahr",
+    "setz",
+    "einschalten",
+    "ausschalten",
+    "anmachen",
+    "ausmachen",
+    "licht",
+    "lampe",
+    "rollladen",
+    "rollo",
+    "jalousie",
+    "heizung",
+    "thermostat",
+    "temperatur",
+    "steckdose",
+    "schalter",
+)
+
+_TOOL_QUERY_KEYWORDS = (
+    "wie ist",
+    "was ist",
+    "status",
+    "wie warm",
+    "wie kalt",
+    "ist das",
+    "sind die",
+    "offen",
+    "geschlossen",
+    "welche",
+    "zeig",
+    "liste",
+    "an oder aus",
+)
+
+intent_matcher.register("brain.intent_memory", _INTENT_MEMORY_KEYWORDS, "sub")
+intent_matcher.register("brain.intent_action_starters", _INTENT_ACTION_STARTERS, "start")
+intent_matcher.register("brain.intent_device_nouns", _INTENT_DEVICE_NOUNS, "sub")
+intent_matcher.register("brain.intent_device_actions", _INTENT_DEVICE_ACTIONS, "lead")
+intent_matcher.register("brain.intent_knowledge", _INTENT_KNOWLEDGE_PATTERNS, "lead")
+intent_matcher.register("brain.intent_smart_home", _INTENT_SMART_HOME_KEYWORDS, "sub")
+intent_matcher.register("brain.tool_control", _TOOL_CONTROL_KEYWORDS, "sub")
+intent_matcher.register("brain.tool_query", _TOOL_QUERY_KEYWORDS, "sub")
+
+
 class AssistantBrain(BrainHumanizersMixin, BrainCallbacksMixin):
     """Das zentrale Gehirn von MindHome Assistant."""
 
@@ -527,6 +735,9 @@ class AssistantBrain(BrainHumanizersMixin, BrainCallbacksMixin):
         self.state_change_log = StateChangeLog()
         self.learning_transfer = LearningTransfer()
         self.dialogue_state = DialogueStateManager()
+        # Unified Action Journal (Redis Stream) + Leser fuer Action-Outcomes
+        self.action_journal = ActionJournal()
+        self._outcome_cursor = self.action_journal.cursor((KIND_OUTCOME,), window=100)
         self.climate_model = ClimateModel()
         self.predictive_maintenance = PredictiveMaintenance()
 
@@ -560,6 +771,9 @@ class AssistantBrain(BrainHumanizersMixin, BrainCallbacksMixin):
         # Latenz-Optimierung: Semantic Response Cache + Latency Tracker
         self.response_cache = ResponseCache()
         self.latency_tracker = latency_tracker
+        # Spekulativer Context-Prefetch (Partial-STT / Pre-Classification)
+        self.context_prefetch = ContextPrefetcher()
+        self.context_prefetch.set_latency_tracker(self.latency_tracker)
 
         # Letzte fehlgeschlagene Anfrage für Retry bei "Ja"
         self._last_failed_query: Optional[str] = None
@@ -1033,23 +1247,107 @@ class AssistantBrain(BrainHumanizersMixin, BrainCallbacksMixin):
             self._states_cache_ts = now
             return states
 
+    def prefetch_context(
+        self,
+        request_id: str,
+        partial_text: str,
+        person: Optional[str] = None,
+        room: Optional[str] = None,
+    ) -> bool:
+        """Startet spekulatives Kontext-Vorladen fuer einen laufenden Sprach-Turn.
+
+        Wird mit Teil-Transkripten aufgerufen (z.B. WebSocket assistant.partial).
+        Startet die kontext-unabhaengigen Teile des Mega-Gather (States-Snapshot,
+        letzte Gespraeche, Memory-Callback, RAG), die _process_inner spaeter
+        ueber dieselbe request_id abholt.
+
+        Returns:
+            True wenn neue Prefetch-Tasks gestartet wurden.
+        """
+        if not self.context_prefetch.enabled or not partial_text:
+            return False
+        partial_text = self._normalize_stt_text(partial_text)
+        profile = self.pre_classifier.classify(partial_text)
+        # Einfache Geraete-Befehle laufen ueber den Fast-Path — kein Prefetch
+        if profile.category == "device_command":
+            return False
+
+        sources = {
+            "states": self.context_builder._get_states_cached,
+            "conv_mode_msgs": lambda: self.memory.get_recent_conversations(limit=10),
+            "memory_callback": lambda: self.personality.build_memory_callback_section(
+                person or ""
+            ),
+        }
+        if profile.need_rag:
+            sources["rag"] = lambda: self._get_rag_context(partial_text)
+        return self.context_prefetch.start(
+            request_id,
+            partial_text,
+            sources,
+            person=person or "",
+            room=room or "",
+            category=profile.category,
+        )
+
+    async def reply_tts_preview(self, room: Optional[str] = None) -> dict:
+        """Lautstaerke + Ziel-Speaker einer direkten Antwort, bevor der Text steht.
+
+        Gleiche Regeln wie die TTS-Anreicherung in process() (Stimmung aus dem
+        letzten Turn). Streaming-Clients setzen damit die Lautstaerke vor dem
+        ersten Satz; der done-Frame liefert den endgueltigen Wert.
+        """
+        activity_result = await self.activity.should_deliver("medium")
+        activity = activity_result.get("activity", "relaxing")
+        activity_volume = activity_result.get("volume", 0.8)
+        if activity == "sleeping":
+            activity, activity_volume = "relaxing", 0.7
+        volume = self._direct_reply_volume(
+            self.tts_enhancer.get_volume(activity=activity, urgency="medium"),
+            activity_volume,
+            getattr(self, "_current_mood", "neutral"),
+            "medium",
+        )
+        preview = {"volume": volume}
+        if room:
+            speaker = await self.executor._find_speaker_in_room(room)
+            if speaker:
+                preview["target_speaker"] = speaker
+        return preview
+
+    def _direct_reply_volume(
+        self, volume: float, activity_volume: float, mood: str, urgency: str
+    ) -> float:
+        """Lautstaerke einer direkten User-Antwort.
+
+        Activity-Volume ueberschreibt das TTS-Volume (ausser Whisper-Modus und
+        Notfall), mindestens 0.5; bei Muedigkeit hoechstens 0.6.
+        """
+        whisper = self.tts_enhancer.is_whisper_mode
+        if not whisper and urgency != "critical":
+            volume = max(activity_volume, 0.5)
+        if mood == "tired" and not whisper:
+            volume = min(volume, 0.6)
+        return volume
+
     async def initialize(self):
-        """Initialisiert alle Komponenten."""
+        """Initialisiert alle Komponenten.
+
+        Ablauf: Memory (Redis/ChromaDB, Voraussetzung fuer fast alles) →
+        Verdrahtung (reine Setter, keine I/O) → Init-Graph: alle Subsysteme
+        mit deklarierten Abhaengigkeiten parallel → Post-Init (Lern-Kill-Switch,
+        Proactive-Start, Background-Loops). Init-Dauern landen im LatencyTracker.
+        """
+        _t_mem = time.perf_counter()
         await self.memory.initialize()
+        self.latency_tracker.record_init(
+            "Memory", (time.perf_counter() - _t_mem) * 1000
+        )
 
-        # Model-Router: Verfuegbare Modelle von Ollama holen und pruefen
-        try:
-            available_models = await self.ollama.list_models()
-            await self.model_router.initialize(available_models)
-            logger.info(
-                "Modell-Erkennung: %d Modelle verfuegbar, bestes: %s",
-                len(available_models),
-                self.model_router.get_best_available(),
-            )
-        except Exception as e:
-            logger.warning(
-                "Modell-Erkennung fehlgeschlagen: %s (alle Modelle angenommen)", e
-            )
+        # ------------------------------------------------------------------
+        # Verdrahtung: nur Referenzen setzen, damit jede Init-/Start-Routine
+        # im Graph bereits alle Cross-Module-Referenzen vorfindet.
+        # ------------------------------------------------------------------
 
         # Semantic Memory mit Context Builder verbinden
         self.context_builder.set_semantic_memory(self.memory.semantic)
@@ -1091,9 +1389,16 @@ class AssistantBrain(BrainHumanizersMixin, BrainCallbacksMixin):
             predictive_preload=_rcache_cfg.get("predictive_preload", {}),
         )
         self.latency_tracker.set_redis(self.memory.redis)
+        _prefetch_cfg = cfg.yaml_config.get("speculative_prefetch", {})
+        self.context_prefetch.configure(
+            enabled=_prefetch_cfg.get("enabled", True),
+            max_age_seconds=_prefetch_cfg.get("max_age_seconds", 15),
+            max_entries=_prefetch_cfg.get("max_entries", 16),
+            min_words=_prefetch_cfg.get("min_words", 2),
+            rag_min_overlap=_prefetch_cfg.get("rag_min_overlap", 0.75),
+        )
 
-        # Mood Detector initialisieren
-        await self.mood.initialize(redis_client=self.memory.redis)
+        # Mood Detector verbinden
         self.mood.set_ollama(self.ollama)  # N1: LLM-basierte Stimmungserkennung
         self.personality.set_mood_detector(self.mood)
         self.personality.set_inner_state(
@@ -1109,231 +1414,45 @@ class AssistantBrain(BrainHumanizersMixin, BrainCallbacksMixin):
         # C5: Redis fuer cross-session Intent-Referenzierung
         self.dialogue_state.set_redis(self.memory.redis)
 
+        # Action Journal: Schreiber + inkrementelle Leser anbinden
+        self.dialogue_state.set_action_journal(self.action_journal)
+        self.anticipation.set_action_journal(self.action_journal)
+        self.learning_observer.set_action_journal(self.action_journal)
+        self.correction_memory.set_action_journal(self.action_journal)
+
         # D5: Quality Feedback → Personality
         self.personality.set_response_quality(self.response_quality)
         self.personality.set_ollama(self.ollama)
 
-        # Gelernten Sarkasmus-Level laden
-        await self.personality.load_learned_sarcasm_level()
-        # MCU Sprint 2: Running Gags + Learned Opinions aus Redis laden
-        await self.personality.load_running_gags_from_redis()
-        await self.personality.load_learned_opinions()
-        # MCU Sprint 6: Cross-Session Sarcasm-Streaks aus Redis laden
-        await self.personality.load_sarcasm_streaks_from_redis()
-
-        # F-069: Nicht-kritische Module in try/except wrappen für Degraded Startup.
-        # Wenn ein Modul fehlschlaegt, laeuft der Assistent trotzdem —
-        # nur die betroffene Funktionalitaet fehlt.
-        _degraded_modules: list[str] = []
-
-        async def _safe_init(name: str, init_coro):
-            """F-069: Modul-Init mit Graceful Degradation."""
-            try:
-                await init_coro
-            except Exception as e:
-                _degraded_modules.append(name)
-                logger.error(
-                    "F-069: %s Initialisierung fehlgeschlagen (degraded): %s", name, e
-                )
-
-        # Fix: Module 1-30 ebenfalls in _safe_init wrappen (waren vorher ungeschuetzt)
-        # Fact Decay + Autonomy Evolution Background-Tasks
-        await _safe_init("FactDecay", self._start_fact_decay_task())
-        await _safe_init("AutonomyEvolution", self._start_autonomy_evolution_task())
-
-        # Memory Extractor initialisieren
-        try:
-            self.memory_extractor = MemoryExtractor(self.ollama, self.memory.semantic)
-        except Exception as e:
-            _degraded_modules.append("MemoryExtractor")
-            logger.error("F-069: MemoryExtractor init fehlgeschlagen: %s", e)
-
-        # Feedback Tracker initialisieren
-        await _safe_init(
-            "FeedbackTracker", self.feedback.initialize(redis_client=self.memory.redis)
-        )
-
-        # Daily Summarizer initialisieren
+        # Daily Summarizer
         self.summarizer.memory = self.memory
-        await _safe_init(
-            "Summarizer",
-            self.summarizer.initialize(
-                redis_client=self.memory.redis,
-                chroma_collection=self.memory.chroma_collection,
-            ),
-        )
         self.summarizer.set_notify_callback(self._handle_daily_summary)
 
-        # Phase 6: TimeAwareness initialisieren und starten
-        await _safe_init(
-            "TimeAwareness",
-            self.time_awareness.initialize(redis_client=self.memory.redis),
-        )
+        # Phase 6: TimeAwareness + LightEngine (Praesenz, Bettsensor, Lux-Adaptiv,
+        # Daemmerung, Override)
         self.time_awareness.set_notify_callback(self._handle_time_alert)
-        if "TimeAwareness" not in _degraded_modules:
-            await _safe_init("TimeAwareness.start", self.time_awareness.start())
-
-        # LightEngine: Praesenz, Bettsensor, Lux-Adaptiv, Daemmerung, Override
-        await _safe_init(
-            "LightEngine", self.light_engine.initialize(redis_client=self.memory.redis)
-        )
         self.light_engine.mood = self.mood
-        if "LightEngine" not in _degraded_modules:
-            await _safe_init("LightEngine.start", self.light_engine.start())
         self.executor._light_engine = self.light_engine
         self.time_awareness._light_engine = self.light_engine
 
-        # Phase 7: RoutineEngine initialisieren
-        await _safe_init(
-            "RoutineEngine", self.routines.initialize(redis_client=self.memory.redis)
-        )
+        # Phase 7: RoutineEngine
         self.routines.set_executor(self.executor)
         self.routines.set_personality(self.personality)
         self.routines.set_explainability(self.explainability)
         self.routines._semantic_memory = self.memory.semantic
-        if "RoutineEngine" not in _degraded_modules:
-            await _safe_init(
-                "RoutineEngine.birthdays",
-                self.routines.migrate_yaml_birthdays(self.memory.semantic),
-            )
-
-        # Relationship Cache initial befuellen
-        await _safe_init(
-            "RelationshipCache", self.memory.semantic.refresh_relationship_cache()
-        )
 
         # Phase 8: Anticipation Engine + Intent Tracker
-        await _safe_init(
-            "InnerState", self.inner_state.initialize(redis_client=self.memory.redis)
-        )
-        await _safe_init(
-            "Anticipation", self.anticipation.initialize(redis_client=self.memory.redis)
-        )
         self.anticipation.set_notify_callback(self._handle_anticipation_suggestion)
-        await _safe_init(
-            "IntentTracker",
-            self.intent_tracker.initialize(redis_client=self.memory.redis),
-        )
         self.intent_tracker.set_notify_callback(self._handle_intent_reminder)
 
-        # Phase 9: Speaker Recognition initialisieren
-        await _safe_init(
-            "SpeakerRecognition",
-            self.speaker_recognition.initialize(redis_client=self.memory.redis),
-        )
-
-        # Phase 11: Koch-Assistent mit Semantic Memory verbinden
+        # Phase 11: Koch-Assistent mit Semantic Memory + Recipe Store verbinden
         self.cooking.semantic_memory = self.memory.semantic
         self.cooking.set_notify_callback(self._handle_cooking_timer)
+        self.cooking.recipe_store = self.recipe_store
         # MCU Sprint 3: Post-crisis debrief callback
         self.threat_assessment.set_notify_callback(self._handle_threat_debrief)
 
-        # Phase 11.1: Knowledge Base initialisieren
-        await _safe_init("KnowledgeBase", self.knowledge_base.initialize())
-
-        # Knowledge Graph initialisieren
-        await _safe_init(
-            "KnowledgeGraph",
-            self.knowledge_graph.initialize(redis_client=self.memory.redis),
-        )
-
-        # Recipe Store initialisieren und mit Koch-Assistent verbinden
-        await _safe_init("RecipeStore", self.recipe_store.initialize())
-        self.cooking.recipe_store = self.recipe_store
-
-        # P06b: Mittlere Features parallel initialisieren
-        await asyncio.gather(
-            _safe_init(
-                "Inventory", self.inventory.initialize(redis_client=self.memory.redis)
-            ),
-            _safe_init(
-                "SmartShopping",
-                self.smart_shopping.initialize(redis_client=self.memory.redis),
-            ),
-            _safe_init(
-                "ConversationMemory",
-                self.conversation_memory.initialize(redis_client=self.memory.redis),
-            ),
-            _safe_init(
-                "MultiRoomAudio",
-                self.multi_room_audio.initialize(redis_client=self.memory.redis),
-            ),
-            _safe_init(
-                "SelfAutomation",
-                self.self_automation.initialize(redis_client=self.memory.redis),
-            ),
-            _safe_init(
-                "ConfigVersioning",
-                self.config_versioning.initialize(redis_client=self.memory.redis),
-            ),
-            _safe_init(
-                "SelfOptimization",
-                self.self_optimization.initialize(redis_client=self.memory.redis),
-            ),
-            _safe_init("OCR", self.ocr.initialize(redis_client=self.memory.redis)),
-            _safe_init(
-                "AmbientAudio",
-                self.ambient_audio.initialize(redis_client=self.memory.redis),
-            ),
-            _safe_init(
-                "ConflictResolver",
-                self.conflict_resolver.initialize(redis_client=self.memory.redis),
-            ),
-            _safe_init(
-                "HealthMonitor",
-                self.health_monitor.initialize(redis_client=self.memory.redis),
-            ),
-            _safe_init(
-                "DeviceHealth",
-                self.device_health.initialize(redis_client=self.memory.redis),
-            ),
-            _safe_init(
-                "TimerManager",
-                self.timer_manager.initialize(redis_client=self.memory.redis),
-            ),
-            _safe_init(
-                "ConditionalCommands",
-                self.conditional_commands.initialize(redis_client=self.memory.redis),
-            ),
-            _safe_init(
-                "EnergyOptimizer",
-                self.energy_optimizer.initialize(redis_client=self.memory.redis),
-            ),
-            _safe_init(
-                "CookingAssistant",
-                self.cooking.initialize(redis_client=self.memory.redis),
-            ),
-            _safe_init(
-                "RepairPlanner",
-                self.repair_planner.initialize(redis_client=self.memory.redis),
-            ),
-            _safe_init(
-                "WorkshopGenerator",
-                self.workshop_generator.initialize(redis_client=self.memory.redis),
-            ),
-            _safe_init(
-                "TaskManager",
-                self.task_manager.initialize(redis_client=self.memory.redis),
-            ),
-            _safe_init(
-                "PersonalDates",
-                self.personal_dates.initialize(redis_client=self.memory.redis),
-            ),
-            _safe_init(
-                "FamilyManager",
-                self.family_manager.initialize(redis_client=self.memory.redis),
-            ),
-            _safe_init(
-                "NoteManager",
-                self.note_manager.initialize(redis_client=self.memory.redis),
-            ),
-            _safe_init(
-                "MealPlanner",
-                self.meal_planner.initialize(redis_client=self.memory.redis),
-            ),
-        )
-
-        # Post-init wiring (Callbacks, Cross-References, Start-Calls)
+        # Executor: Feature-Module
         self.executor._smart_shopping = self.smart_shopping
         self.executor._conversation_memory = self.conversation_memory
         self.executor._multi_room_audio = self.multi_room_audio
@@ -1366,16 +1485,7 @@ class AssistantBrain(BrainHumanizersMixin, BrainCallbacksMixin):
         self.meal_planner.ha = self.ha
         self.meal_planner.set_model_router(self.model_router)
 
-        if "MultiRoomAudio" not in _degraded_modules:
-            await _safe_init(
-                "MultiRoomAudio.presets", self.multi_room_audio.load_presets()
-            )
-        if "AmbientAudio" not in _degraded_modules:
-            await _safe_init("AmbientAudio.start", self.ambient_audio.start())
-        if "HealthMonitor" not in _degraded_modules:
-            await _safe_init("HealthMonitor.start", self.health_monitor.start())
-        if "DeviceHealth" not in _degraded_modules:
-            await _safe_init("DeviceHealth.start", self.device_health.start())
+        # Werkstatt
         self.repair_planner.set_generator(self.workshop_generator)
         self.repair_planner.set_model_router(self.model_router)
         self.repair_planner.semantic_memory = self.memory.semantic
@@ -1383,77 +1493,8 @@ class AssistantBrain(BrainHumanizersMixin, BrainCallbacksMixin):
         self.repair_planner.camera_manager = self.camera_manager
         self.repair_planner.ocr_engine = self.ocr
         self.workshop_generator.set_model_router(self.model_router)
-        # Workshop Library (gleiche ChromaDB-Instanz, eigene Collection)
-        try:
-            if self.knowledge_base._chroma_client:
-                from .embeddings import get_embedding_function
 
-                _ws_ef = get_embedding_function()
-                await self.workshop_library.initialize(
-                    chroma_client=self.knowledge_base._chroma_client,
-                    embedding_fn=_ws_ef,
-                )
-            else:
-                _degraded_modules.append("WorkshopLibrary")
-                logger.warning(
-                    "WorkshopLibrary: ChromaDB nicht verfuegbar (KnowledgeBase ohne Client)"
-                )
-        except Exception as e:
-            _degraded_modules.append("WorkshopLibrary")
-            logger.error("F-069: WorkshopLibrary init fehlgeschlagen: %s", e)
-
-        # P06b: Spaete Features parallel initialisieren
-        await asyncio.gather(
-            _safe_init(
-                "ThreatAssessment",
-                self.threat_assessment.initialize(redis_client=self.memory.redis),
-            ),
-            _safe_init(
-                "LearningObserver",
-                self.learning_observer.initialize(redis_client=self.memory.redis),
-            ),
-            _safe_init(
-                "ProtocolEngine",
-                self.protocol_engine.initialize(redis_client=self.memory.redis),
-            ),
-            _safe_init(
-                "SpontaneousObserver",
-                self.spontaneous.initialize(redis_client=self.memory.redis),
-            ),
-            _safe_init(
-                "MusicDJ", self.music_dj.initialize(redis_client=self.memory.redis)
-            ),
-            _safe_init(
-                "VisitorManager",
-                self.visitor_manager.initialize(redis_client=self.memory.redis),
-            ),
-            _safe_init(
-                "WellnessAdvisor",
-                self.wellness_advisor.initialize(redis_client=self.memory.redis),
-            ),
-            _safe_init(
-                "InsightEngine",
-                self.insight_engine.initialize(
-                    redis_client=self.memory.redis, ollama=self.ollama
-                ),
-            ),
-            _safe_init(
-                "SituationModel",
-                self.situation_model.initialize(redis_client=self.memory.redis),
-            ),
-            _safe_init(
-                "ProactivePlanner",
-                self.proactive_planner.initialize(redis_client=self.memory.redis),
-            ),
-            _safe_init(
-                "SeasonalInsight",
-                self.seasonal_insight.initialize(
-                    redis_client=self.memory.redis, notify_callback=self._handle_insight
-                ),
-            ),
-        )
-
-        # Post-init wiring
+        # Spaete Features
         self.learning_observer.set_notify_callback(self._handle_learning_suggestion)
         self.protocol_engine.set_executor(self.executor)
         self.spontaneous.set_notify_callback(self._handle_spontaneous_observation)
@@ -1467,7 +1508,7 @@ class AssistantBrain(BrainHumanizersMixin, BrainCallbacksMixin):
         self.wellness_advisor.executor = self.executor
         self.insight_engine.set_notify_callback(self._handle_insight)
 
-        # Post-init wiring: Cross-Modul-Referenzen (Plan Phase 1-3)
+        # Cross-Modul-Referenzen (Plan Phase 1-3)
         # 1A: SpontaneousObserver ↔ SemanticMemory + InsightEngine
         if hasattr(self.spontaneous, "semantic_memory"):
             self.spontaneous.semantic_memory = self.memory.semantic
@@ -1514,70 +1555,243 @@ class AssistantBrain(BrainHumanizersMixin, BrainCallbacksMixin):
         self.learning_observer.set_ollama(self.ollama)
         self.correction_memory.set_ollama(self.ollama)
 
-        if "WellnessAdvisor" not in _degraded_modules:
-            await _safe_init("WellnessAdvisor.start", self.wellness_advisor.start())
+        # ------------------------------------------------------------------
+        # Init-Graph: Subsysteme mit Abhaengigkeiten, Unabhaengiges parallel.
+        # F-069: Nicht-kritische Module → Degraded Startup statt Abbruch.
+        # ------------------------------------------------------------------
+        graph = InitGraph(on_timing=self.latency_tracker.record_init)
+        redis = self.memory.redis
 
-        # Woechentlicher Lern-Bericht
-        weekly_cfg = cfg.yaml_config.get("learning", {}).get("weekly_report", {})
-        if weekly_cfg.get("enabled", True):
-            self._task_registry.create_task(
-                self._weekly_learning_report_loop(), name="weekly_learning_report"
+        async def _init_model_router():
+            # Model-Router: Verfuegbare Modelle von Ollama holen und pruefen
+            try:
+                available_models = await self.ollama.list_models()
+                await self.model_router.initialize(available_models)
+                logger.info(
+                    "Modell-Erkennung: %d Modelle verfuegbar, bestes: %s",
+                    len(available_models),
+                    self.model_router.get_best_available(),
+                )
+            except Exception as e:
+                logger.warning(
+                    "Modell-Erkennung fehlgeschlagen: %s (alle Modelle angenommen)", e
+                )
+
+        async def _init_personality():
+            # Gelernten Sarkasmus-Level laden
+            await self.personality.load_learned_sarcasm_level()
+            # MCU Sprint 2: Running Gags + Learned Opinions aus Redis laden
+            await self.personality.load_running_gags_from_redis()
+            await self.personality.load_learned_opinions()
+            # MCU Sprint 6: Cross-Session Sarcasm-Streaks aus Redis laden
+            await self.personality.load_sarcasm_streaks_from_redis()
+
+        async def _init_memory_extractor():
+            self.memory_extractor = MemoryExtractor(self.ollama, self.memory.semantic)
+
+        async def _init_workshop_library():
+            # Workshop Library (gleiche ChromaDB-Instanz, eigene Collection)
+            if not self.knowledge_base._chroma_client:
+                raise RuntimeError(
+                    "ChromaDB nicht verfuegbar (KnowledgeBase ohne Client)"
+                )
+            from .embeddings import aget_embedding_function
+
+            await self.workshop_library.initialize(
+                chroma_client=self.knowledge_base._chroma_client,
+                embedding_fn=await aget_embedding_function(),
             )
 
-        # P06b: Intelligenz + Self-Improvement parallel initialisieren
-        await asyncio.gather(
-            _safe_init(
-                "CalendarIntelligence",
-                self.calendar_intelligence.initialize(redis_client=self.memory.redis),
-            ),
-            _safe_init(
-                "Explainability",
-                self.explainability.initialize(redis_client=self.memory.redis),
-            ),
-            _safe_init(
-                "StateChangeLog",
-                self.state_change_log.initialize(redis_client=self.memory.redis),
-            ),
-            _safe_init(
-                "LearningTransfer",
-                self.learning_transfer.initialize(redis_client=self.memory.redis),
-            ),
-            _safe_init(
-                "PredictiveMaintenance",
-                self.predictive_maintenance.initialize(redis_client=self.memory.redis),
-            ),
-            _safe_init(
-                "OutcomeTracker",
-                self.outcome_tracker.initialize(
-                    redis_client=self.memory.redis,
-                    ha_client=self.ha,
-                    task_registry=self._task_registry,
-                ),
-            ),
-            _safe_init(
-                "CorrectionMemory",
-                self.correction_memory.initialize(redis_client=self.memory.redis),
+        async def _init_entity_catalog():
+            # Entity-Katalog: Echte Raum-/Entity-Namen aus HA laden
+            # für dynamische Tool-Beschreibungen (hilft dem LLM beim Matching)
+            try:
+                from .function_calling import refresh_entity_catalog
+
+                await refresh_entity_catalog(self.ha)
+            except Exception as e:
+                logger.debug("Entity-Katalog initial nicht geladen: %s", e)
+
+        # Kern: ohne diese Schritte startet Jarvis nicht (wie bisher ungeschuetzt)
+        graph.add("ModelRouter", _init_model_router)
+        graph.add(
+            "Mood", lambda: self.mood.initialize(redis_client=redis), critical=True
+        )
+        graph.add("Personality", _init_personality, critical=True)
+
+        # Fact Decay + Autonomy Evolution Background-Tasks
+        graph.add("FactDecay", self._start_fact_decay_task)
+        graph.add("AutonomyEvolution", self._start_autonomy_evolution_task)
+        graph.add("MemoryExtractor", _init_memory_extractor)
+        graph.add(
+            "FeedbackTracker", lambda: self.feedback.initialize(redis_client=redis)
+        )
+        graph.add(
+            "Summarizer",
+            lambda: self.summarizer.initialize(
+                redis_client=redis,
+                chroma_collection=self.memory.chroma_collection,
             ),
-            _safe_init(
-                "ResponseQuality",
-                self.response_quality.initialize(redis_client=self.memory.redis),
+        )
+        graph.add(
+            "TimeAwareness",
+            lambda: self.time_awareness.initialize(redis_client=redis),
+        )
+        graph.add(
+            "TimeAwareness.start",
+            self.time_awareness.start,
+            requires=("TimeAwareness",),
+        )
+        graph.add(
+            "LightEngine", lambda: self.light_engine.initialize(redis_client=redis)
+        )
+        graph.add(
+            "LightEngine.start", self.light_engine.start, requires=("LightEngine",)
+        )
+        graph.add(
+            "RoutineEngine", lambda: self.routines.initialize(redis_client=redis)
+        )
+        graph.add(
+            "RoutineEngine.birthdays",
+            lambda: self.routines.migrate_yaml_birthdays(self.memory.semantic),
+            requires=("RoutineEngine",),
+        )
+        # Relationship Cache initial befuellen
+        graph.add("RelationshipCache", self.memory.semantic.refresh_relationship_cache)
+        graph.add(
+            "InnerState", lambda: self.inner_state.initialize(redis_client=redis)
+        )
+        graph.add(
+            "ActionJournal", lambda: self.action_journal.initialize(redis_client=redis)
+        )
+        graph.add(
+            "Anticipation", lambda: self.anticipation.initialize(redis_client=redis)
+        )
+        graph.add(
+            "IntentTracker",
+            lambda: self.intent_tracker.initialize(redis_client=redis),
+        )
+        # Phase 9: Speaker Recognition
+        graph.add(
+            "SpeakerRecognition",
+            lambda: self.speaker_recognition.initialize(redis_client=redis),
+        )
+        # Phase 11.1: Knowledge Base, Knowledge Graph, Recipe Store
+        graph.add("KnowledgeBase", self.knowledge_base.initialize)
+        graph.add(
+            "KnowledgeGraph",
+            lambda: self.knowledge_graph.initialize(redis_client=redis),
+        )
+        graph.add("RecipeStore", self.recipe_store.initialize)
+        graph.add(
+            "WorkshopLibrary", _init_workshop_library, after=("KnowledgeBase",)
+        )
+
+        # Module die nur Redis brauchen (keine Abhaengigkeiten untereinander)
+        for _name, _module in (
+            ("Inventory", self.inventory),
+            ("SmartShopping", self.smart_shopping),
+            ("ConversationMemory", self.conversation_memory),
+            ("MultiRoomAudio", self.multi_room_audio),
+            ("SelfAutomation", self.self_automation),
+            ("ConfigVersioning", self.config_versioning),
+            ("SelfOptimization", self.self_optimization),
+            ("OCR", self.ocr),
+            ("AmbientAudio", self.ambient_audio),
+            ("ConflictResolver", self.conflict_resolver),
+            ("HealthMonitor", self.health_monitor),
+            ("DeviceHealth", self.device_health),
+            ("TimerManager", self.timer_manager),
+            ("ConditionalCommands", self.conditional_commands),
+            ("EnergyOptimizer", self.energy_optimizer),
+            ("RepairPlanner", self.repair_planner),
+            ("WorkshopGenerator", self.workshop_generator),
+            ("TaskManager", self.task_manager),
+            ("PersonalDates", self.personal_dates),
+            ("FamilyManager", self.family_manager),
+            ("NoteManager", self.note_manager),
+            ("MealPlanner", self.meal_planner),
+            ("ThreatAssessment", self.threat_assessment),
+            ("LearningObserver", self.learning_observer),
+            ("ProtocolEngine", self.protocol_engine),
+            ("SpontaneousObserver", self.spontaneous),
+            ("MusicDJ", self.music_dj),
+            ("VisitorManager", self.visitor_manager),
+            ("WellnessAdvisor", self.wellness_advisor),
+            ("SituationModel", self.situation_model),
+            ("ProactivePlanner", self.proactive_planner),
+            ("CalendarIntelligence", self.calendar_intelligence),
+            ("Explainability", self.explainability),
+            ("StateChangeLog", self.state_change_log),
+            ("LearningTransfer", self.learning_transfer),
+            ("PredictiveMaintenance", self.predictive_maintenance),
+            ("CorrectionMemory", self.correction_memory),
+            ("ResponseQuality", self.response_quality),
+            ("ErrorPatterns", self.error_patterns),
+            ("AdaptiveThresholds", self.adaptive_thresholds),
+        ):
+            graph.add(
+                _name,
+                lambda _m=_module: _m.initialize(redis_client=redis),
+            )
+        graph.add(
+            "CookingAssistant",
+            lambda: self.cooking.initialize(redis_client=redis),
+            after=("RecipeStore",),
+        )
+        graph.add(
+            "InsightEngine",
+            lambda: self.insight_engine.initialize(
+                redis_client=redis, ollama=self.ollama
             ),
-            _safe_init(
-                "ErrorPatterns",
-                self.error_patterns.initialize(redis_client=self.memory.redis),
+        )
+        graph.add(
+            "SeasonalInsight",
+            lambda: self.seasonal_insight.initialize(
+                redis_client=redis, notify_callback=self._handle_insight
             ),
-            _safe_init(
-                "SelfReport",
-                self.self_report.initialize(
-                    redis_client=self.memory.redis, ollama_client=self.ollama
-                ),
+        )
+        graph.add(
+            "OutcomeTracker",
+            lambda: self.outcome_tracker.initialize(
+                redis_client=redis,
+                ha_client=self.ha,
+                task_registry=self._task_registry,
             ),
-            _safe_init(
-                "AdaptiveThresholds",
-                self.adaptive_thresholds.initialize(redis_client=self.memory.redis),
+        )
+        graph.add(
+            "SelfReport",
+            lambda: self.self_report.initialize(
+                redis_client=redis, ollama_client=self.ollama
             ),
         )
 
+        # Start-/Lade-Schritte: nur wenn das jeweilige Modul initialisiert ist
+        graph.add(
+            "MultiRoomAudio.presets",
+            self.multi_room_audio.load_presets,
+            requires=("MultiRoomAudio",),
+        )
+        graph.add(
+            "AmbientAudio.start", self.ambient_audio.start, requires=("AmbientAudio",)
+        )
+        graph.add(
+            "HealthMonitor.start",
+            self.health_monitor.start,
+            requires=("HealthMonitor",),
+        )
+        graph.add(
+            "DeviceHealth.start", self.device_health.start, requires=("DeviceHealth",)
+        )
+        graph.add(
+            "WellnessAdvisor.start",
+            self.wellness_advisor.start,
+            requires=("WellnessAdvisor",),
+        )
+        graph.add("EntityCatalog", _init_entity_catalog)
+
+        await graph.run()
+
         # Global Learning Kill Switch
         _learning_enabled = cfg.yaml_config.get("learning", {}).get("enabled", True)
         if not _learning_enabled:
@@ -1597,16 +1811,16 @@ class AssistantBrain(BrainHumanizersMixin, BrainCallbacksMixin):
         ):
             self.outcome_tracker.set_personality(self.personality)
 
-        await _safe_init("Proactive.start", self.proactive.start())
-
-        # Entity-Katalog: Echte Raum-/Entity-Namen aus HA laden
-        # für dynamische Tool-Beschreibungen (hilft dem LLM beim Matching)
-        try:
-            from .function_calling import refresh_entity_catalog
+        # Proactive startet zuletzt: nutzt nahezu alle anderen Subsysteme
+        graph.add("Proactive.start", self.proactive.start)
+        await graph.run()
 
-            await refresh_entity_catalog(self.ha)
-        except Exception as e:
-            logger.debug("Entity-Katalog initial nicht geladen: %s", e)
+        # Woechentlicher Lern-Bericht
+        weekly_cfg = cfg.yaml_config.get("learning", {}).get("weekly_report", {})
+        if weekly_cfg.get("enabled", True):
+            self._task_registry.create_task(
+                self._weekly_learning_report_loop(), name="weekly_learning_report"
+            )
 
         # Entity-Katalog: Periodischer Background-Refresh (alle 270s = 4.5 Min).
         # Ersetzt den lazy-load im Hot-Path und spart 200-500ms pro Request
@@ -1623,6 +1837,7 @@ class AssistantBrain(BrainHumanizersMixin, BrainCallbacksMixin):
             )
 
         # Store degraded modules on instance for runtime access
+        _degraded_modules = list(graph.degraded)
         self._degraded_modules = list(_degraded_modules)
         self._degraded_notified = False  # One-time user notification flag
 
@@ -2290,6 +2505,7 @@ class AssistantBrain(BrainHumanizersMixin, BrainCallbacksMixin):
         stream_callback=None,
         voice_metadata: Optional[dict] = None,
         device_id: Optional[str] = None,
+        request_id: Optional[str] = None,
     ) -> dict:
         """
         Verarbeitet eine User-Eingabe.
@@ -2300,6 +2516,7 @@ class AssistantBrain(BrainHumanizersMixin, BrainCallbacksMixin):
             room: Raum aus dem die Anfrage kommt (optional)
             files: Liste von Datei-Metadaten aus file_handler.save_upload() (optional)
             stream_callback: Optionaler async callback(token: str) für Streaming
+            request_id: ID des Sprach-Turns — holt Ergebnisse von prefetch_context() ab
 
         Returns:
             Dict mit response, actions, model_used
@@ -2339,9 +2556,18 @@ class AssistantBrain(BrainHumanizersMixin, BrainCallbacksMixin):
 
         try:
             return await self._process_inner(
-                text, person, room, files, stream_callback, voice_metadata, device_id
+                text,
+                person,
+                room,
+                files,
+                stream_callback,
+                voice_metadata,
+                device_id,
+                request_id=request_id,
             )
         finally:
+            if request_id:
+                self.context_prefetch.discard(request_id)
             self._active_persons.discard(_person_key)
             self._last_interaction_ts = time.time()  # B4: auch nach Antwort
             _lock.release()
@@ -2397,6 +2623,7 @@ class AssistantBrain(BrainHumanizersMixin, BrainCallbacksMixin):
         stream_callback=None,
         voice_metadata: Optional[dict] = None,
         device_id: Optional[str] = None,
+        request_id: Optional[str] = None,
     ) -> dict:
         """Innere process()-Implementierung, geschuetzt durch _process_lock."""
         # Reset think-ahead flag for new request (max 1 suggestion per response)
@@ -2411,7 +2638,7 @@ class AssistantBrain(BrainHumanizersMixin, BrainCallbacksMixin):
         )
 
         # Latency Tracking: Trace starten
-        _ltrace = self.latency_tracker.begin()
+        _ltrace = self.latency_tracker.begin(request_id or "")
         self._active_ltrace = _ltrace
 
         # STT Text-Normalisierung: Typische Whisper-Fehler korrigieren
@@ -3063,7 +3290,7 @@ class AssistantBrain(BrainHumanizersMixin, BrainCallbacksMixin):
                 tts_data = self.tts_enhancer.enhance(
                     response_text, message_type="casual"
                 )
-                if stream_callback:
+                if stream_callback and not self._request_from_pipeline:
                     if not room:
                         room = await self._get_occupied_room()
                     self._task_registry.create_task(
@@ -3432,7 +3659,7 @@ class AssistantBrain(BrainHumanizersMixin, BrainCallbacksMixin):
                     tts_data = self.tts_enhancer.enhance(
                         response_text, message_type="confirmation"
                     )
-                    if stream_callback:
+                    if stream_callback and not self._request_from_pipeline:
                         if not room:
                             room = await self._get_occupied_room()
                         self._task_registry.create_task(
@@ -3721,7 +3948,7 @@ class AssistantBrain(BrainHumanizersMixin, BrainCallbacksMixin):
                             response_text,
                             message_type="confirmation",
                         )
-                        if stream_callback:
+                        if stream_callback and not self._request_from_pipeline:
                             if not room:
                                 room = await self._get_occupied_room()
                             self._task_registry.create_task(
@@ -3826,7 +4053,7 @@ class AssistantBrain(BrainHumanizersMixin, BrainCallbacksMixin):
                         response_text,
                         message_type="confirmation",
                     )
-                    if stream_callback:
+                    if stream_callback and not self._request_from_pipeline:
                         if not room:
                             room = await self._get_occupied_room()
                         self._task_registry.create_task(
@@ -3916,7 +4143,7 @@ class AssistantBrain(BrainHumanizersMixin, BrainCallbacksMixin):
                         response_text,
                         message_type="confirmation",
                     )
-                    if stream_callback:
+                    if stream_callback and not self._request_from_pipeline:
                         if not room:
                             room = await self._get_occupied_room()
                         self._task_registry.create_task(
@@ -3967,7 +4194,7 @@ class AssistantBrain(BrainHumanizersMixin, BrainCallbacksMixin):
                             briefing_text,
                             message_type="briefing",
                         )
-                        if stream_callback:
+                        if stream_callback and not self._request_from_pipeline:
                             if not room:
                                 room = await self._get_occupied_room()
                             self._task_registry.create_task(
@@ -4070,7 +4297,7 @@ class AssistantBrain(BrainHumanizersMixin, BrainCallbacksMixin):
                             briefing_text,
                             message_type="briefing",
                         )
-                        if stream_callback:
+                        if stream_callback and not self._request_from_pipeline:
                             if not room:
                                 room = await self._get_occupied_room()
                             self._task_registry.create_task(
@@ -4158,7 +4385,7 @@ class AssistantBrain(BrainHumanizersMixin, BrainCallbacksMixin):
                         response_text,
                         message_type="status",
                     )
-                    if stream_callback:
+                    if stream_callback and not self._request_from_pipeline:
                         if not room:
                             room = await self._get_occupied_room()
                         self._task_registry.create_task(
@@ -4254,7 +4481,7 @@ class AssistantBrain(BrainHumanizersMixin, BrainCallbacksMixin):
                         response_text,
                         message_type="briefing",
                     )
-                    if stream_callback:
+                    if stream_callback and not self._request_from_pipeline:
                         if not room:
                             room = await self._get_occupied_room()
                         self._task_registry.create_task(
@@ -4322,7 +4549,7 @@ class AssistantBrain(BrainHumanizersMixin, BrainCallbacksMixin):
                             response_text,
                             message_type="status",
                         )
-                        if stream_callback:
+                        if stream_callback and not self._request_from_pipeline:
                             if not room:
                                 room = await self._get_occupied_room()
                             self._task_registry.create_task(
@@ -4407,7 +4634,7 @@ class AssistantBrain(BrainHumanizersMixin, BrainCallbacksMixin):
                             response_text,
                             message_type="confirmation",
                         )
-                        if stream_callback:
+                        if stream_callback and not self._request_from_pipeline:
                             if not room:
                                 room = await self._get_occupied_room()
                             self._task_registry.create_task(
@@ -4446,7 +4673,7 @@ class AssistantBrain(BrainHumanizersMixin, BrainCallbacksMixin):
             tts_data = self.tts_enhancer.enhance(
                 smalltalk_response, message_type="casual"
             )
-            if stream_callback:
+            if stream_callback and not self._request_from_pipeline:
                 if not room:
                     room = await self._get_occupied_room()
                 self._task_registry.create_task(
@@ -4795,21 +5022,28 @@ class AssistantBrain(BrainHumanizersMixin, BrainCallbacksMixin):
                 logger.debug("Security Score Fehler: %s", e)
                 return None
 
+        # Spekulativer Prefetch: Ergebnisse aus prefetch_context() abholen
+        _prefetched = self.context_prefetch.claim(request_id, text, person or "")
+        _pf_states = _prefetched.pop("states", None)
+
+        async def _build_context():
+            # Laufenden States-Prefetch abwarten statt HA doppelt abzufragen
+            if _pf_states is not None and not _pf_states.done():
+                await asyncio.wait([_pf_states])
+            return await self.context_builder.build(
+                trigger="voice",
+                user_text=text,
+                person=person or "",
+                profile=profile,
+            )
+
         _mega_tasks: list[tuple[str, object]] = []
 
         # Context Build (mit Timeout-Wrapper)
         _mega_tasks.append(
             (
                 "context",
-                asyncio.wait_for(
-                    self.context_builder.build(
-                        trigger="voice",
-                        user_text=text,
-                        person=person or "",
-                        profile=profile,
-                    ),
-                    timeout=ctx_timeout,
-                ),
+                asyncio.wait_for(_build_context(), timeout=ctx_timeout),
             )
         )
 
@@ -4968,6 +5202,22 @@ class AssistantBrain(BrainHumanizersMixin, BrainCallbacksMixin):
             )
         )
 
+        # Spekulativer Prefetch: Bereits laufende/fertige Tasks aus
+        # prefetch_context() uebernehmen statt sie neu zu starten.
+        if _prefetched:
+            _merged_tasks = []
+            for _key, _coro in _mega_tasks:
+                _pf_task = _prefetched.pop(_key, None)
+                if _pf_task is not None:
+                    if asyncio.iscoroutine(_coro):
+                        _coro.close()  # Neu erzeugte Coroutine wird nicht gebraucht
+                    _coro = _pf_task
+                _merged_tasks.append((_key, _coro))
+            _mega_tasks = _merged_tasks
+            # Vom finalen Profil nicht benoetigt (z.B. RAG) → verwerfen
+            for _pf_task in _prefetched.values():
+                _pf_task.cancel()
+
         _mega_keys, _mega_coros = zip(*_mega_tasks)
 
         # Individuelle Timeouts pro Task: Wenn ein einzelner Task haengt,
@@ -6356,6 +6606,9 @@ class AssistantBrain(BrainHumanizersMixin, BrainCallbacksMixin):
                     emitted=True,
                 )
 
+        # Nur der Tool-Pfad liefert Thinking — Planner/Wissen/Memory nicht
+        _llm_thinking = ""
+
         # 6. Komplexe Anfragen ueber Action Planner routen
         if self.action_planner.is_complex_request(text):
             _deep_model = self.model_router._cap_model(self.model_router.model_deep)
@@ -7710,6 +7963,7 @@ class AssistantBrain(BrainHumanizersMixin, BrainCallbacksMixin):
 
             # Post-Execution State Verification (LLM-Pfad):
             # Nach allen Tool-Calls pruefen ob set_*-Aktionen tatsaechlich gewirkt haben.
+            _verify_targets = []
             for _ea in executed_actions:
                 _ea_fn = _ea.get("function", "")
                 _ea_result = _ea.get("result", {})
@@ -7720,10 +7974,24 @@ class AssistantBrain(BrainHumanizersMixin, BrainCallbacksMixin):
                 _ea_eid = _ea_result.get("entity_id") or _ea.get("args", {}).get(
                     "entity_id", ""
                 )
-                if not _ea_eid:
-                    continue
+                if _ea_eid:
+                    _verify_targets.append((_ea, _ea_fn, _ea_eid))
+            # Mehrere Aktionen: ein Snapshot statt N Einzel-Reads
+            _verify_snapshot = None
+            if len(_verify_targets) > 1:
                 try:
-                    _ea_actual = await self.ha.get_state(_ea_eid)
+                    _verify_snapshot = {
+                        s.get("entity_id"): s
+                        for s in (await self.ha.get_states() or [])
+                    }
+                except Exception as e:
+                    logger.debug("State-Verify Snapshot fehlgeschlagen: %s", e)
+            for _ea, _ea_fn, _ea_eid in _verify_targets:
+                try:
+                    if _verify_snapshot is not None:
+                        _ea_actual = _verify_snapshot.get(_ea_eid)
+                    else:
+                        _ea_actual = await self.ha.get_state(_ea_eid)
                     if _ea_actual and _ea_actual.get("state") == "unavailable":
                         logger.warning(
                             "State-Verify (LLM-Pfad): %s unavailable nach %s",
@@ -9027,15 +9295,13 @@ class AssistantBrain(BrainHumanizersMixin, BrainCallbacksMixin):
                     )
                 # Experiential Memory: Aktion + Kontext speichern für "Letztes Mal..."
                 if self.memory.redis:
-                    outcome_entry = json.dumps(
-                        {
-                            "action": action["function"],
-                            "args": action.get("args", {}),
-                            "timestamp": datetime.now(timezone.utc).isoformat(),
-                            "person": person or "",
-                            "context_hint": situation_delta or "",
-                        }
-                    )
+                    outcome_entry = {
+                        "action": action["function"],
+                        "args": action.get("args", {}),
+                        "timestamp": datetime.now(timezone.utc).isoformat(),
+                        "person": person or "",
+                        "context_hint": situation_delta or "",
+                    }
                     self._task_registry.create_task(
                         self._log_experiential_memory(outcome_entry),
                         name="log_experiential",
@@ -9241,14 +9507,10 @@ class AssistantBrain(BrainHumanizersMixin, BrainCallbacksMixin):
         elif _mood_tts_speed != 100:
             tts_data["speed"] = _mood_tts_speed / 100
 
-        # Activity-Volume ueberschreibt TTS-Volume (ausser Whisper-Modus)
-        # Mindest-Lautstaerke für direkte User-Antworten sicherstellen
-        if not self.tts_enhancer.is_whisper_mode and urgency != "critical":
-            tts_data["volume"] = max(activity_volume, 0.5)
-
-        # Phase 17.4: Bei Muedigkeit leiser sprechen (Fürsorge)
-        if _current_mood == "tired" and not self.tts_enhancer.is_whisper_mode:
-            tts_data["volume"] = min(tts_data.get("volume", 0.8), 0.6)
+        # Activity-Volume, Mindest-Lautstaerke, Phase 17.4: muede = leiser
+        tts_data["volume"] = self._direct_reply_volume(
+            tts_data.get("volume", 0.8), activity_volume, _current_mood, urgency
+        )
 
         # Phase 10: Multi-Room TTS — Speaker anhand Raum bestimmen
         if room:
@@ -9368,8 +9630,9 @@ class AssistantBrain(BrainHumanizersMixin, BrainCallbacksMixin):
 
         # WebSocket + Sprachausgabe ueber HA-Speaker
         # Bei Streaming sendet main.py via emit_stream_end — hier KEIN emit_speaking
-        # (verhindert doppelte Chat-Nachrichten), aber TTS-Ausgabe trotzdem starten
-        if stream_callback:
+        # (verhindert doppelte Chat-Nachrichten), aber TTS-Ausgabe trotzdem starten.
+        # C-2: Streamt die HA Assist Pipeline (/chat/stream), spricht sie selbst.
+        if stream_callback and not self._request_from_pipeline:
             if not room:
                 room = await self._get_occupied_room()
             self._task_registry.create_task(
@@ -11566,11 +11829,7 @@ class AssistantBrain(BrainHumanizersMixin, BrainCallbacksMixin):
                         # Aehnliches Topic vorhanden — nur Timestamp aktualisieren
                         _eid = existing.get("fact_id", "")
                         if _eid and self.memory.redis:
-                            await self.memory.redis.hset(
-                                f"mha:fact:{_eid}",
-                                "updated_at",
-                                datetime.now(timezone.utc).isoformat(),
-                            )
+                            await self.memory.semantic.touch_fact(_eid)
                         logger.debug(
                             "Topic-Dedup: '%s' existiert bereits als '%s'",
                             topic_text[:40],
@@ -13360,49 +13619,10 @@ class AssistantBrain(BrainHumanizersMixin, BrainCallbacksMixin):
         Reduziert die Tool-Liste von 45+ auf max ~15, um kleine Modelle
         nicht zu ueberfordern. Bei unklarem Intent → alle Tools.
         """
-        CONTROL_KEYWORDS = {
-            "mach",
-            "schalte",
-            "stell",
-            "dreh",
-            "dimm",
-            "oeffne",
-            "schliess",
-            "fahr",
-            "setz",
-            "einschalten",
-            "ausschalten",
-            "anmachen",
-            "ausmachen",
-            "licht",
-            "lampe",
-            "rollladen",
-            "rollo",
-            "jalousie",
-            "heizung",
-            "thermostat",
-            "temperatur",
-            "steckdose",
-            "schalter",
-        }
-        QUERY_KEYWORDS = {
-            "wie ist",
-            "was ist",
-            "status",
-            "wie warm",
-            "wie kalt",
-            "ist das",
-            "sind die",
-            "offen",
-            "geschlossen",
-            "welche",
-            "zeig",
-            "liste",
-            "an oder aus",
-        }
 
-        is_control = any(kw in text_lower for kw in CONTROL_KEYWORDS)
-        is_query = any(kw in text_lower for kw in QUERY_KEYWORDS)
+        features = intent_matcher.analyze(text_lower)
+        is_control = features.has("brain.tool_control")
+        is_query = features.has("brain.tool_query")
 
         all_tools = get_assistant_tools()
 
@@ -13481,7 +13701,10 @@ class AssistantBrain(BrainHumanizersMixin, BrainCallbacksMixin):
         aber der Text offensichtlich ein Geraetebefehl ist.
         """
         t = text.lower().replace("ß", "ss")
-        has_noun = any(n in t for n in self._device_nouns)
+        intent_matcher.register(
+            "brain.device_nouns", self._device_nouns, "sub", fold_sharp_s=True
+        )
+        has_noun = intent_matcher.analyze(text).has("brain.device_nouns")
         # Wort-genaue Aktionserkennung (kein Partial-Match auf "eine", "Auge" etc.)
         words = set(re.split(r"[\s,.!?]+", t))
         has_action = bool(words & self._action_words) or "%" in t
@@ -13508,16 +13731,25 @@ class AssistantBrain(BrainHumanizersMixin, BrainCallbacksMixin):
         werden NICHT als Status-Query erkannt, auch wenn sie "ist" enthalten.
         """
         t = text.lower().replace("ß", "ss")
-        has_noun = any(n in t for n in self._status_nouns)
-        if not has_noun:
+        intent_matcher.register(
+            "brain.status_nouns", self._status_nouns, "sub", fold_sharp_s=True
+        )
+        intent_matcher.register(
+            "brain.action_exclusions", self._action_exclusions, "sub", fold_sharp_s=True
+        )
+        intent_matcher.register(
+            "brain.query_markers", self._query_markers, "sub", fold_sharp_s=True
+        )
+        features = intent_matcher.analyze(text)
+        if not features.has("brain.status_nouns"):
             return False
         # Ausschluss: Wenn Aktionswoerter vorhanden → Steuerbefehl, keine Query
         # Prozent-Angabe mit Aktionskontext: "auf 10%" ist ein Befehl
         if re.search(r"auf\s+\d+\s*%", t):
             return False
-        if any(a in t for a in self._action_exclusions):
+        if features.has("brain.action_exclusions"):
             return False
-        if any(m in t for m in self._query_markers):
+        if features.has("brain.query_markers"):
             return True
         # Fragen mit ? die ein Geraete-Nomen enthalten: "Rolllaeden?", "Lichter?"
         if t.rstrip().endswith("?"):
@@ -15851,6 +16083,7 @@ class AssistantBrain(BrainHumanizersMixin, BrainCallbacksMixin):
         'general' ans LLM mit Tools.
         """
         text_lower = text.lower().strip()
+        features = intent_matcher.analyze(text)
 
         # Pre-Classifier Shortcut: device_command/device_query → general (braucht Tools)
         if profile and profile.category in ("device_command", "device_query"):
@@ -15865,168 +16098,29 @@ class AssistantBrain(BrainHumanizersMixin, BrainCallbacksMixin):
                 return "delegation"
 
         # Memory-Fragen (Fallback wenn kein Pre-Classifier Profile)
-        memory_keywords = [
-            "erinnerst du dich",
-            "weisst du noch",
-            "was weisst du",
-            "habe ich dir",
-            "hab ich gesagt",
-            "was war",
-            "habe ich erwaehnt",
-            "habe ich erzaehlt",
-            "kennst du mein",
-            "kennst du meine",
-            "wann habe ich",
-            "wann ist mein",
-            "wie heisst mein",
-            "wie heisst meine",
-            "wo wohne ich",
-            "wo arbeite ich",
-            "was mache ich beruflich",
-            "mein geburtstag",
-            "mein name",
-            "meine frau",
-            "mein mann",
-            "was mag ich",
-            "was habe ich gesagt",
-            "erinnere dich",
-            "was hast du dir gemerkt",
-            "wer bin ich",
-            "wie heisse ich",
-            "wie heiße ich",
-            "letzte woche",
-            "gestern",
-            "remember",
-            "do you know my",
-            "what did i tell you",
-            "what do you know about",
-            "did i mention",
-        ]
-        if any(kw in text_lower for kw in memory_keywords):
+        if features.has("brain.intent_memory"):
             return "memory"
 
         # Steuerungs-Befehle → immer mit Tools (frueh raus)
-        action_starters = [
-            "mach ",
-            "schalte ",
-            "stell ",
-            "setz ",
-            "dreh ",
-            "oeffne ",
-            "schliess",
-            "aktivier",
-            "deaktivier",
-            "spiel ",
-            "stopp",
-            "pause",
-            "lauter",
-            "leiser",
-        ]
-        if any(text_lower.startswith(s) for s in action_starters):
+        if features.has("brain.intent_action_starters"):
             return "general"
 
         # Geraete-Befehle die mit Raum/Geraet statt Verb anfangen
         # z.B. "Schlafzimmer Rollladen auf 10%", "Wohnzimmer Licht aus"
-        _DEVICE_NOUNS = [
-            "rollladen",
-            "rolladen",
-            "rollo",
-            "jalousie",
-            "licht",
-            "lampe",
-            "leuchte",
-            "heizung",
-            "thermostat",
-            "steckdose",
-            "schalter",
-        ]
-        _DEVICE_ACTIONS = [
-            "auf",
-            "zu",
-            "an",
-            "aus",
-            "hoch",
-            "runter",
-            "offen",
-            "ein",
-            "ab",
-            "halb",
-            "stopp",
-        ]
         # Pruefen ob ein Geraete-Nomen + Aktion/Prozent im Text vorkommt
-        has_device_noun = any(noun in text_lower for noun in _DEVICE_NOUNS)
+        has_device_noun = features.has("brain.intent_device_nouns")
         has_device_action = (
-            any(f" {act}" in f" {text_lower}" for act in _DEVICE_ACTIONS)
-            or "%" in text_lower
+            features.has("brain.intent_device_actions") or "%" in text_lower
         )
         if has_device_noun and has_device_action:
             return "general"
 
         # Wissensfragen-Muster
-        knowledge_patterns = [
-            "wie lange",
-            "wie viel",
-            "wie viele",
-            "was ist",
-            "was sind",
-            "was bedeutet",
-            "erklaer mir",
-            "erklaere",
-            "warum ist",
-            "wer ist",
-            "wer war",
-            "was passiert wenn",
-            "wie funktioniert",
-            "wie macht man",
-            "wie kocht man",
-            "rezept für",
-            "rezept für",
-            "definition von",
-            "unterschied zwischen",
-        ]
 
         # Smart-Home-Keywords — wenn vorhanden, brauchen wir Tools
-        smart_home_keywords = [
-            "licht",
-            "lampe",
-            "heizung",
-            "temperatur",
-            "rollladen",
-            "rollläden",
-            "jalousie",
-            "szene",
-            "alarm",
-            "tuer",
-            "tür",
-            "fenster",
-            "musik",
-            "tv",
-            "fernseher",
-            "kamera",
-            "sensor",
-            "steckdose",
-            "schalter",
-            "thermostat",
-            "status",
-            "hausstatus",
-            "haus-status",
-            "ueberblick",
-            "watt",
-            "verbrauch",
-            "strom",
-            "energie",
-            "kilowatt",
-            "kwh",
-            "maschine",
-            "geraet",
-            "geraete",
-        ]
 
-        is_knowledge = any(
-            text_lower.startswith(kw) or f" {kw}" in text_lower
-            for kw in knowledge_patterns
-        )
-        has_smart_home = any(kw in text_lower for kw in smart_home_keywords)
+        is_knowledge = features.has("brain.intent_knowledge")
+        has_smart_home = features.has("brain.intent_smart_home")
 
         if is_knowledge and not has_smart_home:
             return "knowledge"
@@ -16639,27 +16733,40 @@ Regeln:
         if not self.memory.redis:
             return
         try:
-            raw = await self.memory.redis.lrange("mha:action_outcomes", 0, 99)
-            entries = []
-            for r in raw:
-                try:
-                    entry = (
-                        json.loads(r) if isinstance(r, str) else json.loads(r.decode())
-                    )
-                    entries.append(entry)
-                except (json.JSONDecodeError, TypeError, AttributeError):
-                    continue
-            self.dialogue_state.set_action_log_cache(entries)
+            self.dialogue_state.set_action_log_cache(await self._recent_outcomes())
         except Exception as e:
             logger.debug("C5 Action-Log Cache Fehler: %s", e)
 
-    async def _log_experiential_memory(self, entry_json: str) -> None:
-        """Speichert eine Action-Outcome-Entry in Redis."""
+    async def _recent_outcomes(self) -> list[dict]:
+        """Letzte 100 Action-Outcomes, neueste zuerst.
+
+        Ueber den Journal-Cursor werden nur neue Eintraege gelesen; ohne
+        Journal wie bisher aus der Liste mha:action_outcomes.
+        """
+        if self._outcome_cursor.ready:
+            await self._outcome_cursor.refresh()
+            return self._outcome_cursor.latest()
+        raw = await self.memory.redis.lrange("mha:action_outcomes", 0, 99)
+        entries = []
+        for r in raw:
+            try:
+                entries.append(
+                    json.loads(r) if isinstance(r, str) else json.loads(r.decode())
+                )
+            except (json.JSONDecodeError, TypeError, AttributeError):
+                continue
+        return entries
+
+    async def _log_experiential_memory(self, entry: dict) -> None:
+        """Speichert eine Action-Outcome-Entry in Redis (Liste + Journal)."""
         if not self.memory.redis:
             return
         try:
-            await self.memory.redis.lpush("mha:action_outcomes", entry_json)
-            await self.memory.redis.ltrim("mha:action_outcomes", 0, 499)
+            pipe = self.memory.redis.pipeline(transaction=False)
+            pipe.lpush("mha:action_outcomes", json.dumps(entry))
+            pipe.ltrim("mha:action_outcomes", 0, 499)
+            self.action_journal.append_to(pipe, KIND_OUTCOME, entry)
+            await pipe.execute()
         except Exception as e:
             logger.debug("Experiential Memory Log Fehler: %s", e)
 
@@ -16695,19 +16802,13 @@ Regeln:
             return None
 
         try:
-            recent_outcomes = await self.memory.redis.lrange(
-                "mha:action_outcomes", 0, 99
-            )
+            recent_outcomes = await self._recent_outcomes()
         except Exception:
-            logger.debug("Redis lrange fehlgeschlagen", exc_info=True)
+            logger.debug("Action-Outcomes lesen fehlgeschlagen", exc_info=True)
             return None
 
         relevant = []
-        for raw in recent_outcomes:
-            try:
-                entry = json.loads(raw)
-            except (json.JSONDecodeError, TypeError):
-                continue
+        for entry in recent_outcomes:
             if entry.get("action") in target_actions:
                 try:
                     ts = datetime.fromisoformat(entry["timestamp"])
@@ -17941,7 +18042,31 @@ Regeln:
 
                 await asyncio.sleep(wait_seconds)
                 logger.info("Fact Decay gestartet (täglich 04:00)")
-                await self.memory.semantic.apply_decay()
+                decay_stats = await self.memory.semantic.apply_decay() or {}
+                if decay_stats:
+                    logger.info(
+                        "Fact Decay: %d Fakten in %.0fms (%.0f/s), %d reduziert, %d geloescht",
+                        decay_stats.get("scanned", 0),
+                        decay_stats.get("duration_ms", 0.0),
+                        decay_stats.get("facts_per_s", 0.0),
+                        decay_stats.get("decayed", 0),
+                        decay_stats.get("deleted", 0),
+                    )
+                    if self.memory.redis:
+                        try:
+                            await self.memory.redis.set(
+                                "mha:facts:decay:last_run",
+                                json.dumps(
+                                    {
+                                        **decay_stats,
+                                        "finished_at": datetime.now(
+                                            timezone.utc
+                                        ).isoformat(),
+                                    }
+                                ),
+                            )
+                        except Exception as e:
+                            logger.debug("Decay-Statistik nicht gespeichert: %s", e)
 
                 # F4: Stale Facts entfernen (>90 Tage ohne Update)
                 try:
@@ -7,10 +7,16 @@ Medium Effort Feature: Simuliert Temperaturverlauf basierend auf:
 - Ermoeglicht Vorhersagen: "Wenn du das Fenster schliesst, ist es in 20 Min warm"
 
 Konfigurierbar in der Jarvis Assistant UI unter "Intelligenz".
+
+Die Physik steckt in genau einem Kernel (_thermal_step). Einzelne Zeilen
+(simulate()/simulate_scenario()) und Systeme ohne numpy rechnen ihn mit
+Skalaren; mehrere Raeume bzw. Varianten (Fenster, Sollwert, Szenario) laufen
+als Batch mit numpy-Arrays durch denselben Kernel — identische Verlaeufe.
 """
 
 import logging
-from typing import Optional
+import operator
+from typing import Optional, Union
 
 from .config import yaml_config
 from .constants import (
@@ -24,6 +30,61 @@ from .constants import (
 
 logger = logging.getLogger(__name__)
 
+
+def _numpy():
+    """numpy falls installiert, sonst None (Batch laeuft dann zeilenweise)."""
+    try:
+        import numpy
+    except ImportError:
+        return None
+    return numpy
+
+
+class _ScalarOps:
+    """Die vom Kernel genutzten numpy-Funktionen fuer Skalare einer Zeile."""
+
+    maximum = staticmethod(max)
+    minimum = staticmethod(min)
+    abs = staticmethod(abs)
+
+    @staticmethod
+    def where(cond, a, b):
+        return a if cond else b
+
+    # Operanden sind immer bool (Flags/Vergleiche) — & und | genuegen
+    logical_and = staticmethod(operator.and_)
+    logical_or = staticmethod(operator.or_)
+    logical_not = staticmethod(operator.not_)
+
+    @staticmethod
+    def full_like(a, value, dtype=None):
+        return value
+
+
+def _thermal_step(xp, temp, c: dict, step: int):
+    """Ein Integrationsschritt des thermischen Modells.
+
+    xp ist _ScalarOps (temp und c sind Skalare einer Zeile) oder numpy (Arrays
+    ueber alle Zeilen, siehe _columns()). Koeffizienten aus
+    ClimateModel._coefficients().
+    """
+    # Waermeverlust/-gewinn durch Temperatur-Differenz, Rolladen daempfen,
+    # Fenster verstaerken
+    rate = (c["outdoor"] - temp) * c["loss"] * c["cover"] / c["mass"]
+    rate = rate * c["window_mult"]
+    # Heizung/Kuehlung nur solange das Ziel nicht erreicht ist
+    rate = rate + c["heating_gain"] * xp.logical_and(c["heating"], temp < c["target"])
+    rate = rate - c["cooling_loss"] * xp.logical_and(c["cooling"], temp > c["target"])
+    rate = rate + c["solar"]
+    temp = temp + rate * step
+    # Clamp auf realistische Werte
+    return xp.maximum(c["floor"], xp.minimum(40.0, temp))
+
+
+def _columns(np, rows: list[dict]) -> dict:
+    """Zeilen-Dicts → ein Array je Schluessel (Eingabe fuer den numpy-Batch)."""
+    return {key: np.array([row[key] for row in rows]) for key in rows[0]}
+
 # Typische thermische Eigenschaften (vereinfacht)
 DEFAULT_ROOM_THERMAL = {
     "heat_loss_coefficient": 0.015,  # Waermeverlust pro Minute pro Grad Delta (gut isoliert)
@@ -121,7 +182,199 @@ class ClimateModel:
         """
         if not self.enabled:
             return {"error": "Climate Model deaktiviert"}
+        return self.simulate_batch([state], duration_minutes, [changes])[0]
+
+    def simulate_batch(
+        self,
+        states: list[RoomThermalState],
+        duration_minutes: int = 60,
+        changes: Union[dict, list[Optional[dict]], None] = None,
+    ) -> list[dict]:
+        """Simuliert viele Raeume/Varianten gemeinsam.
+
+        Jede Zeile ist ein (Zustand, Aenderungen)-Paar. Fuer Varianten eines
+        Raumes denselben Zustand mehrfach uebergeben, z.B.
+        ``simulate_batch([state] * 3, 120, [{"set_target": 20}, {"set_target": 21}, {"close_windows": True}])``.
+
+        Args:
+            states: Thermische Zustaende (Raeume)
+            duration_minutes: Simulationsdauer in Minuten (fuer alle Zeilen)
+            changes: Ein Dict fuer alle Zeilen oder eine Liste parallel zu states
+
+        Returns:
+            Liste von Ergebnis-Dicts wie bei simulate(), in Eingabereihenfolge
+        """
+        if not self.enabled:
+            return [{"error": "Climate Model deaktiviert"} for _ in states]
+        if not states:
+            return []
+        if changes is None or isinstance(changes, dict):
+            changes_list = [changes] * len(states)
+        else:
+            changes_list = list(changes)
+            if len(changes_list) != len(states):
+                raise ValueError("changes muss dieselbe Laenge wie states haben")
+
+        duration = min(duration_minutes, self.max_simulation_minutes)
+        step = self.simulation_step_minutes
+
+        for state in states:
+            self._warn_out_of_range(state)
+        sims = [self._apply_changes(s, c) for s, c in zip(states, changes_list)]
+        np = _numpy() if len(sims) > 1 else None
+        if np is None:
+            minutes, trajectories, times = self._integrate_python(sims, duration, step)
+        else:
+            minutes, trajectories, times = self._integrate_numpy(
+                np, sims, duration, step
+            )
+
+        results = []
+        for i, (state, sim_state) in enumerate(zip(states, sims)):
+            timeline = [(m, round(t, 1)) for m, t in zip(minutes, trajectories[i])]
+            final_temp = round(trajectories[i][-1], 1)
+            temp_change = round(final_temp - state.current_temp, 1)
+            ttt = times[i]
+            reached_target = ttt is not None
+            row_changes = changes_list[i] or {}
+
+            description = self._generate_description(
+                state,
+                sim_state,
+                row_changes,
+                final_temp,
+                temp_change,
+                duration,
+                reached_target,
+                ttt,
+            )
 
+            results.append(
+                {
+                    "room": state.room,
+                    "initial_temp": state.current_temp,
+                    "final_temp": final_temp,
+                    "temp_change": temp_change,
+                    "timeline": timeline,
+                    "reaches_target": reached_target,
+                    "time_to_target_minutes": ttt,
+                    "duration_minutes": duration,
+                    "changes_applied": row_changes,
+                    "description": description,
+                }
+            )
+        return results
+
+    def _coefficients(
+        self,
+        room: str,
+        outdoor: float,
+        target: float,
+        heating: bool = False,
+        cooling: bool = False,
+        windows: float = 0,
+        sun: bool = False,
+        cover: float = 1.0,
+    ) -> dict:
+        """Konstanten einer Zeile fuer _thermal_step()."""
+        thermal = self._get_params(room)
+        mass = thermal["thermal_mass_factor"]
+        return {
+            "outdoor": float(outdoor),
+            "target": float(target),
+            "floor": float(outdoor) - 5,
+            "loss": thermal["heat_loss_coefficient"],
+            "cover": cover,
+            "mass": mass,
+            "window_mult": (
+                1 + thermal["window_open_factor"] * windows if windows > 0 else 1.0
+            ),
+            "heating": bool(heating),
+            "heating_gain": thermal["heating_power_per_min"] / mass,
+            "cooling": bool(cooling),
+            "cooling_loss": thermal["cooling_power_per_min"] / mass,
+            "solar": thermal["sun_gain_per_min"] / mass if sun else 0.0,
+        }
+
+    def _sim_row(self, sim: RoomThermalState) -> dict:
+        """Startwert und Koeffizienten einer simulate()-Zeile."""
+        return {
+            "temp": float(sim.current_temp),
+            **self._coefficients(
+                sim.room,
+                sim.outdoor_temp,
+                sim.target_temp,
+                heating=sim.heating_active,
+                cooling=sim.cooling_active,
+                windows=sim.windows_open,
+                sun=sim.sun_exposure,
+            ),
+        }
+
+    def _integrate(self, xp, c: dict, duration: int, step: int) -> tuple:
+        """Integriert ab c["temp"] bis duration (Skalare oder Arrays, siehe xp).
+
+        Returns:
+            (Minuten der Timeline, Temperatur je Timeline-Punkt,
+            Ziel erreicht, Minute des Erreichens)
+        """
+        temp, target = c["temp"], c["target"]
+        uncontrolled = xp.logical_not(xp.logical_or(c["heating"], c["cooling"]))
+        reached = xp.full_like(temp, False, dtype=bool)
+        time_to_target = xp.full_like(temp, 0, dtype=int)
+        minutes, snapshots = [0], [temp]
+
+        for minute in range(step, duration + step, step):
+            temp = _thermal_step(xp, temp, c, step)
+
+            if minute % 5 == 0 or minute == duration:
+                minutes.append(minute)
+                snapshots.append(temp)
+
+            # Zieltemperatur erreicht? (ohne Regelung: Ziel = Gleichgewicht)
+            hit = xp.logical_or(
+                xp.logical_or(
+                    xp.logical_and(c["heating"], temp >= target - 0.5),
+                    xp.logical_and(c["cooling"], temp <= target + 0.5),
+                ),
+                xp.logical_and(uncontrolled, xp.abs(temp - target) < 0.5),
+            )
+            newly = xp.logical_and(hit, xp.logical_not(reached))
+            time_to_target = xp.where(newly, minute, time_to_target)
+            reached = xp.logical_or(reached, newly)
+        return minutes, snapshots, reached, time_to_target
+
+    def _integrate_python(
+        self, sims: list[RoomThermalState], duration: int, step: int
+    ) -> tuple[list[int], list[list[float]], list[Optional[int]]]:
+        """Integriert Zeile fuer Zeile mit Skalaren (eine Zeile oder ohne numpy).
+
+        Returns:
+            (Minuten der Timeline, Verlauf je Zeile, Minuten bis Ziel oder None)
+        """
+        minutes, trajectories, times = [0], [], []
+        for sim in sims:
+            minutes, snapshots, reached, minute = self._integrate(
+                _ScalarOps, self._sim_row(sim), duration, step
+            )
+            trajectories.append(snapshots)
+            times.append(minute if reached else None)
+        return minutes, trajectories, times
+
+    def _integrate_numpy(
+        self, np, sims: list[RoomThermalState], duration: int, step: int
+    ) -> tuple[list[int], list[list[float]], list[Optional[int]]]:
+        """Wie _integrate_python(), alle Zeilen gemeinsam als numpy-Arrays."""
+        c = _columns(np, [self._sim_row(s) for s in sims])
+        minutes, snapshots, reached, time_to_target = self._integrate(
+            np, c, duration, step
+        )
+        # Zeilen = Raeume/Varianten, Spalten = Zeitpunkte
+        trajectories = np.stack(snapshots, axis=1).tolist()
+        times = [int(t) if r else None for r, t in zip(reached, time_to_target)]
+        return minutes, trajectories, times
+
+    def _warn_out_of_range(self, state: RoomThermalState):
         if (
             state.current_temp < CLIMATE_TEMP_MIN
             or state.current_temp > CLIMATE_TEMP_MAX
@@ -142,11 +395,10 @@ class ClimateModel:
                 state.target_temp,
             )
 
-        duration = min(duration_minutes, self.max_simulation_minutes)
-        params = self._get_params(state.room)
-        step = self.simulation_step_minutes
-
-        # Aenderungen anwenden
+    def _apply_changes(
+        self, state: RoomThermalState, changes: Optional[dict]
+    ) -> RoomThermalState:
+        """Kopie des Zustands mit angewendeten Aenderungen."""
         sim_state = RoomThermalState(
             room=state.room,
             current_temp=state.current_temp,
@@ -183,94 +435,7 @@ class ClimateModel:
                 sim_state.cooling_active = False
             if changes.get("cooling_on"):
                 sim_state.cooling_active = True
-
-        # Simulation
-        temp = sim_state.current_temp
-        timeline = [(0, round(temp, 1))]
-        time_to_target = None
-        reached_target = False
-
-        heat_loss_coeff = params["heat_loss_coefficient"]
-        heating_power = params["heating_power_per_min"]
-        cooling_power = params["cooling_power_per_min"]
-        window_factor = params["window_open_factor"]
-        sun_gain = params["sun_gain_per_min"]
-        thermal_mass = params["thermal_mass_factor"]
-
-        for minute in range(step, duration + step, step):
-            delta = sim_state.outdoor_temp - temp
-            # Waermeverlust/-gewinn durch Temperatur-Differenz
-            loss = delta * heat_loss_coeff / thermal_mass
-
-            # Fenster verstaerken den Waermeaustausch
-            if sim_state.windows_open > 0:
-                loss *= 1 + (window_factor * sim_state.windows_open)
-
-            # Heizung
-            heating_gain = 0
-            if sim_state.heating_active and temp < sim_state.target_temp:
-                heating_gain = heating_power / thermal_mass
-
-            # Kuehlung
-            cooling_loss = 0
-            if sim_state.cooling_active and temp > sim_state.target_temp:
-                cooling_loss = cooling_power / thermal_mass
-
-            # Sonneneinstrahlung
-            solar = 0
-            if sim_state.sun_exposure:
-                solar = sun_gain / thermal_mass
-
-            # Temperaturveraenderung pro Schritt
-            temp += (loss + heating_gain - cooling_loss + solar) * step
-
-            # Clamp auf realistische Werte
-            temp = max(sim_state.outdoor_temp - 5, min(40, temp))
-
-            if minute % 5 == 0 or minute == duration:
-                timeline.append((minute, round(temp, 1)))
-
-            # Zieltemperatur erreicht?
-            if not reached_target:
-                if sim_state.heating_active and temp >= sim_state.target_temp - 0.5:
-                    reached_target = True
-                    time_to_target = minute
-                elif sim_state.cooling_active and temp <= sim_state.target_temp + 0.5:
-                    reached_target = True
-                    time_to_target = minute
-                elif not sim_state.heating_active and not sim_state.cooling_active:
-                    # Ohne aktive Regelung: Ziel = Gleichgewicht
-                    if abs(temp - sim_state.target_temp) < 0.5:
-                        reached_target = True
-                        time_to_target = minute
-
-        final_temp = round(temp, 1)
-        temp_change = round(final_temp - state.current_temp, 1)
-
-        # Beschreibung generieren
-        description = self._generate_description(
-            state,
-            sim_state,
-            changes or {},
-            final_temp,
-            temp_change,
-            duration,
-            reached_target,
-            time_to_target,
-        )
-
-        return {
-            "room": state.room,
-            "initial_temp": state.current_temp,
-            "final_temp": final_temp,
-            "temp_change": temp_change,
-            "timeline": timeline,
-            "reaches_target": reached_target,
-            "time_to_target_minutes": time_to_target,
-            "duration_minutes": duration,
-            "changes_applied": changes or {},
-            "description": description,
-        }
+        return sim_state
 
     def what_if(
         self,
@@ -345,36 +510,56 @@ class ClimateModel:
         Returns:
             Dict mit minutes, description
         """
-        if abs(state.current_temp - comfort_temp) < 0.5:
-            return {
-                "minutes": 0,
-                "description": f"{state.room}: Bereits bei Komforttemperatur ({state.current_temp}°C).",
-            }
+        return self.estimate_comfort_times([state], comfort_temp)[0]
 
-        sim_state = RoomThermalState(
-            room=state.room,
-            current_temp=state.current_temp,
-            target_temp=comfort_temp,
-            outdoor_temp=state.outdoor_temp,
-            heating_active=state.current_temp < comfort_temp,
-            cooling_active=state.current_temp > comfort_temp,
-            windows_open=state.windows_open,
-            sun_exposure=state.sun_exposure,
-            humidity=state.humidity,
-        )
+    def estimate_comfort_times(
+        self,
+        states: list[RoomThermalState],
+        comfort_temp: float = CLIMATE_COMFORT_DEFAULT,
+    ) -> list[dict]:
+        """Wie estimate_comfort_time(), fuer mehrere Raeume in einer Simulation."""
+        results: list[Optional[dict]] = [None] * len(states)
+        pending, sim_states = [], []
+        for i, state in enumerate(states):
+            if abs(state.current_temp - comfort_temp) < 0.5:
+                results[i] = {
+                    "minutes": 0,
+                    "description": f"{state.room}: Bereits bei Komforttemperatur ({state.current_temp}°C).",
+                }
+                continue
+            pending.append(i)
+            sim_states.append(
+                RoomThermalState(
+                    room=state.room,
+                    current_temp=state.current_temp,
+                    target_temp=comfort_temp,
+                    outdoor_temp=state.outdoor_temp,
+                    heating_active=state.current_temp < comfort_temp,
+                    cooling_active=state.current_temp > comfort_temp,
+                    windows_open=state.windows_open,
+                    sun_exposure=state.sun_exposure,
+                    humidity=state.humidity,
+                )
+            )
 
-        result = self.simulate(sim_state, duration_minutes=180)
-        if result.get("reaches_target"):
-            minutes = result["time_to_target_minutes"]
-            return {
-                "minutes": minutes,
-                "description": f"{state.room}: Komforttemperatur ({comfort_temp}°C) wird in ca. {minutes} Minuten erreicht.",
-            }
+        if not self.enabled:
+            sims = [{"error": "Climate Model deaktiviert"} for _ in sim_states]
         else:
-            return {
-                "minutes": None,
-                "description": f"{state.room}: Komforttemperatur ({comfort_temp}°C) wird voraussichtlich nicht innerhalb von 3 Stunden erreicht.",
-            }
+            sims = self.simulate_batch(sim_states, duration_minutes=180)
+        for i, result in zip(pending, sims):
+            room = states[i].room
+            if result.get("reaches_target"):
+                minutes = result["time_to_target_minutes"]
+                results[i] = {
+                    "minutes": minutes,
+                    "description": f"{room}: Komforttemperatur ({comfort_temp}°C) wird in ca. {minutes} Minuten erreicht.",
+                }
+            else:
+                results[i] = {
+                    "minutes": None,
+                    "description": f"{room}: Komforttemperatur ({comfort_temp}°C) wird voraussichtlich nicht innerhalb von 3 Stunden erreicht.",
+                }
+        return results
 
     def get_context_hint(self, rooms: list[RoomThermalState] = None) -> str:
         """Gibt einen Kontext-Hinweis fuer den LLM-Prompt zurueck."""
@@ -426,88 +611,172 @@ class ClimateModel:
         """
         if not self.enabled:
             return {"error": "Climate Model deaktiviert"}
+        return self.simulate_scenarios([(scenario, params)], duration_hours)[0]
 
-        p = params or {}
-        room = p.get("room", "wohnzimmer")
-        current_temp = p.get("current_temp", 21.5)
-        outdoor_temp = p.get("outdoor_temp", CLIMATE_TEMP_MIN)
-        target_temp = p.get("target_temp", CLIMATE_COMFORT_DEFAULT)
-        critical_temp = p.get("critical_temp", 17.0)
+    def simulate_scenarios(
+        self,
+        scenarios: list[tuple[str, Optional[dict]]],
+        duration_hours: int = 24,
+    ) -> list[dict]:
+        """Simuliert mehrere (Szenario, Parameter)-Paare in einem Durchlauf.
 
-        # Szenario-spezifische Anpassungen
-        if scenario == "vacation_3days":
-            duration_hours = 72
-            target_temp = CLIMATE_VACATION_TARGET
+        Zeilen mit unterschiedlicher Dauer (vacation_3days = 72h) werden bis
+        zur laengsten Dauer gemeinsam integriert und danach pro Zeile
+        abgeschnitten.
+
+        Returns:
+            Liste von Ergebnis-Dicts wie bei simulate_scenario()
+        """
+        if not self.enabled:
+            return [{"error": "Climate Model deaktiviert"} for _ in scenarios]
+        if not scenarios:
+            return []
 
-        thermal = self._get_params(room)
         step_minutes = 10  # Groessere Schritte fuer Langzeit-Simulation
-        total_minutes = duration_hours * 60
+        rows = []
+        for scenario, params in scenarios:
+            p = params or {}
+            row = {
+                "scenario": scenario,
+                "room": p.get("room", "wohnzimmer"),
+                "current_temp": p.get("current_temp", 21.5),
+                "outdoor_temp": p.get("outdoor_temp", CLIMATE_TEMP_MIN),
+                "target_temp": p.get("target_temp", CLIMATE_COMFORT_DEFAULT),
+                "critical_temp": p.get("critical_temp", 17.0),
+                "hours": duration_hours,
+            }
+            # Szenario-spezifische Anpassungen
+            if scenario == "vacation_3days":
+                row["hours"] = 72
+                row["target_temp"] = CLIMATE_VACATION_TARGET
+            rows.append(row)
+
+        np = _numpy() if len(rows) > 1 else None
+        if np is None:
+            hours, trajectories, min_temps, times = self._integrate_scenarios_python(
+                rows, step_minutes
+            )
+        else:
+            hours, trajectories, min_temps, times = self._integrate_scenarios_numpy(
+                np, rows, step_minutes
+            )
 
-        temp = current_temp
-        timeline = [{"hour": 0, "temp": round(temp, 1)}]
-        min_temp = temp
-        time_to_critical = None
-
-        heat_loss_coeff = thermal["heat_loss_coefficient"]
-        heating_power = thermal["heating_power_per_min"]
-        window_factor = thermal["window_open_factor"]
-        thermal_mass = thermal["thermal_mass_factor"]
-
-        # Szenario-Flags
-        heating_active = scenario not in ("heating_off",)
-        windows_open = 1 if scenario == "windows_open" else 0
-        # Geschlossene Rolladen reduzieren Waermeverlust um ca. 30%
-        cover_factor = (
-            CLIMATE_COVER_HEAT_FACTOR if scenario == "all_covers_closed" else 1.0
-        )
+        results = []
+        for i, row in enumerate(rows):
+            timeline = [
+                {"hour": h, "temp": round(t, 1)}
+                for h, t in zip(hours, trajectories[i])
+                if h <= row["hours"]
+            ]
+            row_min = round(min_temps[i], 1)
+            ttc = times[i]
+
+            # Empfehlung generieren
+            recommendation = self._generate_scenario_recommendation(
+                row["scenario"],
+                row_min,
+                ttc,
+                row["critical_temp"],
+                row["outdoor_temp"],
+            )
+            results.append(
+                {
+                    "scenario": row["scenario"],
+                    "timeline": timeline,
+                    "min_temp": row_min,
+                    "time_to_critical": ttc,
+                    "recommendation": recommendation,
+                }
+            )
+        return results
 
-        for minute in range(step_minutes, total_minutes + step_minutes, step_minutes):
-            delta = outdoor_temp - temp
-            # Waermeverlust durch Temperaturdifferenz
-            loss = delta * heat_loss_coeff * cover_factor / thermal_mass
+    def _scenario_row(self, row: dict) -> dict:
+        """Startwert und Koeffizienten einer simulate_scenarios()-Zeile."""
+        return {
+            "temp": float(row["current_temp"]),
+            "critical": float(row["critical_temp"]),
+            "total_minutes": row["hours"] * 60,
+            **self._coefficients(
+                row["room"],
+                row["outdoor_temp"],
+                row["target_temp"],
+                heating=row["scenario"] != "heating_off",
+                windows=1.0 if row["scenario"] == "windows_open" else 0.0,
+                # Geschlossene Rolladen reduzieren Waermeverlust um ca. 30%
+                cover=(
+                    CLIMATE_COVER_HEAT_FACTOR
+                    if row["scenario"] == "all_covers_closed"
+                    else 1.0
+                ),
+            ),
+        }
+
+    def _integrate_scenario(self, xp, c: dict, longest: int, step: int) -> tuple:
+        """Langzeit-Verlauf ab c["temp"] (Skalare oder Arrays, siehe xp).
 
-            # Fenster verstaerken Waermeaustausch
-            if windows_open > 0:
-                loss *= 1 + (window_factor * windows_open)
+        Zeilen mit kuerzerer Dauer laufen bis longest mit, zaehlen nach
+        c["total_minutes"] aber nicht mehr fuer Minimum und kritische Zeit.
 
-            # Heizung: nur aktiv wenn unter Zieltemperatur
-            heating_gain = 0
-            if heating_active and temp < target_temp:
-                heating_gain = heating_power / thermal_mass
+        Returns:
+            (Stunden der Timeline, Temperatur je Stunde, Minimum,
+            Stunden bis kritisch oder -1)
+        """
+        temp = c["temp"]
+        min_temp = temp
+        time_to_critical = xp.full_like(temp, -1, dtype=int)
+        hours, snapshots = [0], [temp]
 
-            temp += (loss + heating_gain) * step_minutes
-            temp = max(outdoor_temp - 5, min(40, temp))
+        for minute in range(step, longest + step, step):
+            temp = _thermal_step(xp, temp, c, step)
 
             # Timeline: jede volle Stunde
             if minute % 60 == 0:
-                hour = minute // 60
-                timeline.append({"hour": hour, "temp": round(temp, 1)})
-
-            if temp < min_temp:
-                min_temp = temp
-
-            # Kritische Temperatur erreicht?
-            if time_to_critical is None and temp < critical_temp:
-                time_to_critical = minute // 60
+                hours.append(minute // 60)
+                snapshots.append(temp)
+
+            # Nur Zeilen deren Dauer noch laeuft
+            active = minute <= c["total_minutes"]
+            min_temp = xp.where(active, xp.minimum(min_temp, temp), min_temp)
+            critical_now = xp.logical_and(
+                xp.logical_and(active, time_to_critical < 0), temp < c["critical"]
+            )
+            time_to_critical = xp.where(critical_now, minute // 60, time_to_critical)
+        return hours, snapshots, min_temp, time_to_critical
 
-        min_temp = round(min_temp, 1)
+    def _integrate_scenarios_python(
+        self, rows: list[dict], step_minutes: int
+    ) -> tuple[list[int], list[list[float]], list[float], list[Optional[int]]]:
+        """Integriert Szenario-Zeilen einzeln mit Skalaren.
 
-        # Empfehlung generieren
-        recommendation = self._generate_scenario_recommendation(
-            scenario,
-            min_temp,
-            time_to_critical,
-            critical_temp,
-            outdoor_temp,
+        Returns:
+            (Stunden der laengsten Zeile, Verlauf je Zeile, Minimum je Zeile,
+            Stunden bis kritisch oder None)
+        """
+        hours, trajectories, min_temps, times = [0], [], [], []
+        for row in rows:
+            c = self._scenario_row(row)
+            row_hours, snapshots, min_temp, critical = self._integrate_scenario(
+                _ScalarOps, c, c["total_minutes"], step_minutes
+            )
+            if len(row_hours) > len(hours):
+                hours = row_hours
+            trajectories.append(snapshots)
+            min_temps.append(min_temp)
+            times.append(critical if critical >= 0 else None)
+        return hours, trajectories, min_temps, times
+
+    def _integrate_scenarios_numpy(
+        self, np, rows: list[dict], step_minutes: int
+    ) -> tuple[list[int], list[list[float]], list[float], list[Optional[int]]]:
+        """Wie _integrate_scenarios_python(), alle Zeilen gemeinsam als Arrays."""
+        c = _columns(np, [self._scenario_row(r) for r in rows])
+        longest = int(c["total_minutes"].max())
+        hours, snapshots, min_temp, critical = self._integrate_scenario(
+            np, c, longest, step_minutes
         )
-
-        return {
-            "scenario": scenario,
-            "timeline": timeline,
-            "min_temp": min_temp,
-            "time_to_critical": time_to_critical,
-            "recommendation": recommendation,
-        }
+        trajectories = np.stack(snapshots, axis=1).tolist()
+        times = [int(t) if t >= 0 else None for t in critical]
+        return hours, trajectories, min_temp.tolist(), times
 
     def _generate_scenario_recommendation(
         self,
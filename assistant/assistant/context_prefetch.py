@@ -0,0 +1,288 @@
+"""
+Context Prefetch — Spekulatives Vorladen von Kontext waehrend der User spricht.
+
+Der Mega-Gather in brain._process_inner startet erst wenn der finale Text
+vorliegt. Sobald ein Teil-Transkript (Partial-STT) oder die Pre-Classification
+ein Profil nahelegt, werden hier die kontext-unabhaengigen Teile bereits
+gestartet:
+  - states: HA-States-Snapshot (waermt den ContextBuilder-Cache)
+  - conv_mode_msgs: letzte Gespraeche aus dem Working Memory
+  - memory_callback: bemerkenswerte Interaktionen der Person
+  - rag: Wissensbasis-Suche fuer den Teil-Text
+
+Beim finalen Text werden die Ergebnisse per request_id abgeholt (claim) und
+abgeglichen: Person-abhaengige Teile nur bei gleicher Person, RAG nur wenn
+der finale Text den Teil-Text im Wesentlichen enthaelt. Alles andere wird
+verworfen. Hit-Rate und gesparte Zeit landen im LatencyTracker.
+"""
+
+import asyncio
+import logging
+import re
+import time
+from dataclasses import dataclass, field
+from typing import Awaitable, Callable
+
+logger = logging.getLogger(__name__)
+
+# Quellen die unabhaengig vom finalen Text sind
+PREFETCH_KEYS = ("states", "conv_mode_msgs", "memory_callback", "rag")
+
+# Quellen die vom Text bzw. von der Person abhaengen
+_TEXT_DEPENDENT = frozenset({"rag"})
+_PERSON_DEPENDENT = frozenset({"memory_callback"})
+
+_WORD_RE = re.compile(r"\w+", re.UNICODE)
+
+
+def _tokens(text: str) -> set[str]:
+    return set(_WORD_RE.findall((text or "").lower()))
+
+
+@dataclass
+class _PrefetchEntry:
+    """Laufender Prefetch fuer eine request_id."""
+
+    request_id: str
+    text: str
+    person: str
+    room: str
+    category: str
+    created: float = field(default_factory=time.monotonic)
+    tasks: dict = field(default_factory=dict)  # key -> asyncio.Task
+    started: dict = field(default_factory=dict)  # key -> monotonic start
+    finished: dict = field(default_factory=dict)  # key -> monotonic ende
+
+
+class ContextPrefetcher:
+    """Verwaltet spekulative Kontext-Prefetches, indiziert nach request_id."""
+
+    def __init__(self):
+        self._enabled = True
+        self._max_age = 15.0
+        self._max_entries = 16
+        self._min_words = 2
+        self._rag_min_overlap = 0.75
+        self._entries: dict[str, _PrefetchEntry] = {}
+        self._latency_tracker = None
+
+    def configure(
+        self,
+        *,
+        enabled: bool = True,
+        max_age_seconds: float = 15.0,
+        max_entries: int = 16,
+        min_words: int = 2,
+        rag_min_overlap: float = 0.75,
+    ) -> None:
+        """Konfiguriert den Prefetcher (aus settings.yaml speculative_prefetch)."""
+        self._enabled = enabled
+        self._max_age = float(max_age_seconds)
+        self._max_entries = max(1, int(max_entries))
+        self._min_words = max(1, int(min_words))
+        self._rag_min_overlap = min(1.0, max(0.0, float(rag_min_overlap)))
+
+    def set_latency_tracker(self, tracker) -> None:
+        """Setzt den LatencyTracker fuer Hit-Rate und gesparte Zeit."""
+        self._latency_tracker = tracker
+
+    @property
+    def enabled(self) -> bool:
+        return self._enabled
+
+    def pending(self) -> int:
+        """Anzahl offener Prefetches."""
+        return len(self._entries)
+
+    def start(
+        self,
+        request_id: str,
+        text: str,
+        sources: dict[str, Callable[[], Awaitable]],
+        *,
+        person: str = "",
+        room: str = "",
+        category: str = "",
+    ) -> bool:
+        """Startet (oder aktualisiert) den Prefetch fuer eine request_id.
+
+        Args:
+            request_id: Eindeutige ID des laufenden Sprach-Turns.
+            text: Bisher erkannter Teil-Text.
+            sources: key -> Coroutine-Factory. Nur Keys aus PREFETCH_KEYS.
+            person: Vermutete Person.
+            room: Raum des Satelliten.
+            category: Vom Pre-Classifier vermutete Kategorie.
+
+        Returns:
+            True wenn mindestens eine Quelle neu gestartet wurde.
+        """
+        if not self._enabled or not request_id:
+            return False
+        if len(_WORD_RE.findall(text or "")) < self._min_words:
+            return False
+
+        self._evict_expired()
+        entry = self._entries.get(request_id)
+        if entry is not None and entry.person != (person or ""):
+            # Sprecher hat sich geaendert — alles neu
+            self._cancel(entry)
+            entry = None
+        if entry is None:
+            if len(self._entries) >= self._max_entries:
+                oldest = min(self._entries.values(), key=lambda e: e.created)
+                self.discard(oldest.request_id)
+            entry = _PrefetchEntry(
+                request_id=request_id,
+                text=text,
+                person=person or "",
+                room=room or "",
+                category=category,
+            )
+            self._entries[request_id] = entry
+        else:
+            # Folge-Partial: text-abhaengige Quellen mit neuem Text neu starten
+            if text != entry.text:
+                for key in _TEXT_DEPENDENT:
+                    task = entry.tasks.pop(key, None)
+                    if task and not task.done():
+                        task.cancel()
+                    entry.started.pop(key, None)
+                    entry.finished.pop(key, None)
+            entry.text = text
+            entry.category = category or entry.category
+
+        started_any = False
+        for key, factory in sources.items():
+            if key not in PREFETCH_KEYS or key in entry.tasks:
+                continue
+            try:
+                task = asyncio.ensure_future(factory())
+            except Exception as e:
+                logger.debug("Prefetch '%s' konnte nicht starten: %s", key, e)
+                continue
+            entry.started[key] = time.monotonic()
+            task.add_done_callback(self._make_done_callback(entry, key))
+            entry.tasks[key] = task
+            started_any = True
+
+        if started_any:
+            logger.debug(
+                "Prefetch [%s] gestartet: %s (Kategorie: %s)",
+                request_id,
+                ", ".join(sorted(entry.tasks)),
+                entry.category or "?",
+            )
+        return started_any
+
+    def claim(
+        self, request_id: str, final_text: str, person: str = ""
+    ) -> dict[str, asyncio.Task]:
+        """Holt die wiederverwendbaren Prefetch-Tasks fuer den finalen Text ab.
+
+        Nicht passende Tasks (andere Person, abweichender Text, abgelaufen)
+        werden abgebrochen. Hit-Rate und gesparte Zeit gehen an den
+        LatencyTracker.
+
+        Returns:
+            key -> asyncio.Task (laufend oder fertig). Leer bei Miss.
+        """
+        if not request_id:
+            return {}
+        entry = self._entries.pop(request_id, None)
+        if entry is None:
+            return {}
+
+        now = time.monotonic()
+        if now - entry.created > self._max_age:
+            self._cancel(entry)
+            self._record(hits=0, misses=len(entry.tasks), saved_ms=0.0)
+            return {}
+
+        same_person = entry.person == (person or "")
+        text_ok = self._text_matches(entry.text, final_text)
+
+        reusable: dict[str, asyncio.Task] = {}
+        saved_ms = 0.0
+        misses = 0
+        for key, task in entry.tasks.items():
+            usable = not task.cancelled()
+            if key in _PERSON_DEPENDENT and not same_person:
+                usable = False
+            if key in _TEXT_DEPENDENT and not text_ok:
+                usable = False
+            if not usable:
+                if not task.done():
+                    task.cancel()
+                misses += 1
+                continue
+            reusable[key] = task
+            start = entry.started.get(key, entry.created)
+            saved_ms += (entry.finished.get(key, now) - start) * 1000
+
+        self._record(hits=len(reusable), misses=misses, saved_ms=saved_ms)
+        if reusable:
+            logger.info(
+                "Prefetch [%s] HIT: %s (~%.0fms vorgezogen)",
+                request_id,
+                ", ".join(sorted(reusable)),
+                saved_ms,
+            )
+        return reusable
+
+    def discard(self, request_id: str) -> None:
+        """Verwirft einen Prefetch (z.B. abgebrochener Sprach-Turn)."""
+        entry = self._entries.pop(request_id, None)
+        if entry is not None:
+            self._cancel(entry)
+
+    def _text_matches(self, partial: str, final: str) -> bool:
+        """True wenn der finale Text den Teil-Text im Wesentlichen enthaelt."""
+        partial_norm = " ".join((partial or "").lower().split())
+        final_norm = " ".join((final or "").lower().split())
+        if not partial_norm or not final_norm:
+            return False
+        if final_norm.startswith(partial_norm) and len(partial_norm) >= (
+            self._rag_min_overlap * len(final_norm)
+        ):
+            return True
+        final_tokens = _tokens(final_norm)
+        if not final_tokens:
+            return False
+        overlap = len(_tokens(partial_norm) & final_tokens) / len(final_tokens)
+        return overlap >= self._rag_min_overlap
+
+    def _make_done_callback(self, entry: _PrefetchEntry, key: str):
+        def _done(task: asyncio.Task) -> None:
+            entry.finished[key] = time.monotonic()
+            if not task.cancelled() and task.exception():
+                logger.debug("Prefetch '%s' Fehler: %s", key, task.exception())
+
+        return _done
+
+    def _evict_expired(self) -> None:
+        now = time.monotonic()
+        for rid in [
+            rid
+            for rid, e in self._entries.items()
+            if now - e.created > self._max_age
+        ]:
+            entry = self._entries.pop(rid)
+            self._cancel(entry)
+            self._record(hits=0, misses=len(entry.tasks), saved_ms=0.0)
+
+    @staticmethod
+    def _cancel(entry: _PrefetchEntry) -> None:
+        for task in entry.tasks.values():
+            if not task.done():
+                task.cancel()
+
+    def _record(self, *, hits: int, misses: int, saved_ms: float) -> None:
+        if self._latency_tracker is None or (hits == 0 and misses == 0):
+            return
+        try:
+            self._latency_tracker.record_prefetch(
+                hits=hits, misses=misses, saved_ms=saved_ms
+            )
+        except Exception as e:
+            logger.debug("Prefetch-Metrik fehlgeschlagen: %s", e)
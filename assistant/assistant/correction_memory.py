@@ -6,6 +6,12 @@ Leitet Regeln ab wenn gleiche Korrektur-Muster 2+ mal auftreten.
 Injiziert relevante Korrekturen als LLM-Kontext bei zukuenftigen Aktionen.
 
 Sicherheit: Read-only Memory. Beeinflusst nur LLM-Kontext. Max 200 Eintraege.
+
+Lesepfad: Eintraege und Regeln werden einmal geladen und geparst im Speicher
+gehalten (_CorrectionIndex, Regel-Dict). store_correction und die Regel-
+Ableitung aktualisieren beides inkrementell. Das Scoring fuer den Prompt
+betrachtet nur Kandidaten aus den Indizes (Aktion, Raum, Person, Stunde,
+kausaler Kontext) statt jedes Mal alle Eintraege zu holen und zu dekodieren.
 """
 
 import asyncio
@@ -13,9 +19,11 @@ import json
 import logging
 import re
 import time
+from collections import defaultdict
 from datetime import datetime, timezone
 from typing import Optional
 
+from .action_journal import KIND_CORRECTION
 from .config import yaml_config
 
 logger = logging.getLogger(__name__)
@@ -42,6 +50,78 @@ RULES_PER_DAY_LIMIT = 5
 CONFIDENCE_DECAY_PER_DAY = 0.05 / 30
 
 
+def _hour_of(entry: dict) -> int:
+    try:
+        return int(entry.get("hour", 12)) % 24
+    except (TypeError, ValueError):
+        return 12
+
+
+class _CorrectionIndex:
+    """Geparste Korrektur-Eintraege im Speicher, indiziert fuer das Scoring.
+
+    Jeder Eintrag bekommt eine laufende Nummer (hoeher = neuer). Die Indizes
+    bilden Schluessel auf Nummern ab; beim Ueberschreiten von max_entries
+    faellt der aelteste Eintrag heraus (wie LTRIM auf der Liste).
+    """
+
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        self._entries: dict[int, dict] = {}  # aelteste zuerst
+        self._seq = 0
+        self.by_action: dict[str, set[int]] = defaultdict(set)
+        self.by_room: dict = defaultdict(set)
+        self.by_person: dict[str, set[int]] = defaultdict(set)
+        self.by_hour: dict[int, set[int]] = defaultdict(set)
+        self.with_causal: set[int] = set()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _keys(self, entry: dict):
+        yield self.by_action, entry.get("original_action")
+        yield self.by_room, (entry.get("original_args") or {}).get("room")
+        yield self.by_person, entry.get("person")
+        yield self.by_hour, _hour_of(entry)
+
+    def add(self, entry: dict):
+        seq = self._seq
+        self._seq += 1
+        self._entries[seq] = entry
+        for index, key in self._keys(entry):
+            try:
+                index[key].add(seq)
+            except TypeError:  # nicht hashbar (kaputter Eintrag)
+                pass
+        if entry.get("causal_context"):
+            self.with_causal.add(seq)
+        while len(self._entries) > self.max_entries:
+            self._remove(next(iter(self._entries)))
+
+    def _remove(self, seq: int):
+        entry = self._entries.pop(seq)
+        for index, key in self._keys(entry):
+            try:
+                bucket = index.get(key)
+            except TypeError:
+                continue
+            if bucket is not None:
+                bucket.discard(seq)
+                if not bucket:
+                    del index[key]
+        self.with_causal.discard(seq)
+
+    def get(self, seq: int) -> dict:
+        return self._entries[seq]
+
+    def latest(self, limit: int = 0) -> list[dict]:
+        """Eintraege neueste zuerst (wie LRANGE 0..limit-1)."""
+        newest_first = reversed(self._entries.values())
+        if not limit:
+            return list(newest_first)
+        return [e for _, e in zip(range(limit), newest_first)]
+
+
 class CorrectionMemory:
     """Speichert und lernt aus User-Korrekturen."""
 
@@ -56,6 +136,11 @@ class CorrectionMemory:
         self._last_rules_day = ""
         self._rules_lock = asyncio.Lock()
         self._cross_domain_enabled = self._cfg.get("cross_domain_rules", True)
+        self._journal = None
+        self._entries_cursor = None
+        # Im Speicher gehaltene, geparste Eintraege und Regeln (lazy geladen)
+        self._index: Optional[_CorrectionIndex] = None
+        self._rules_cache: Optional[dict[str, dict]] = None
 
     async def initialize(self, redis_client):
         """Initialisiert mit Redis Client."""
@@ -67,6 +152,13 @@ class CorrectionMemory:
         """Setzt den OllamaClient fuer LLM-basierte Regel-Begruendungen."""
         self._ollama = ollama_client
 
+    def set_action_journal(self, journal):
+        """Verbindet das ActionJournal: Korrekturen werden nur einmal dekodiert."""
+        self._journal = journal
+        self._entries_cursor = journal.cursor(
+            (KIND_CORRECTION,), window=self._max_entries
+        )
+
     async def store_correction(
         self,
         original_action: str,
@@ -129,9 +221,13 @@ class CorrectionMemory:
             await self.redis.ltrim(
                 "mha:correction_memory:entries", 0, self._max_entries - 1
             )
+            if self._journal:
+                await self._journal.append(KIND_CORRECTION, entry)
         except Exception as e:
             logger.warning("Korrektur-Speicherung fehlgeschlagen: %s", e)
             return
+        if self._index is not None:
+            self._index.add(entry)
 
         logger.info(
             "Korrektur gespeichert: %s -> %s (Person: %s)",
@@ -150,80 +246,105 @@ class CorrectionMemory:
         if not self.enabled or not self.redis:
             return None
 
-        entries = await self._get_entries()
-        if not entries:
+        index = await self._get_index()
+        if not len(index):
             return None
 
+        # Nur Kandidaten bewerten: Eintraege die mindestens ein Kriterium
+        # erfuellen koennen (sonst Score 0)
+        current_hour = datetime.now(_LOCAL_TZ).hour
+        current_ctx = (args or {}).get("_causal_context") or {}
+        candidates: set[int] = set()
+        if action_type:
+            candidates |= index.by_action.get(action_type, set())
+        if args:
+            try:
+                candidates |= index.by_room.get(args.get("room"), set())
+            except TypeError:
+                pass
+        if person:
+            candidates |= index.by_person.get(person, set())
+        for delta in range(-2, 3):
+            candidates |= index.by_hour.get((current_hour + delta) % 24, set())
+        if current_ctx:
+            candidates |= index.with_causal
+
         # Scoring: Relevanteste Korrekturen finden
         scored = []
-        for entry in entries:
-            score = 0.0
-
-            # Aktionstyp-Match
-            if action_type and entry.get("original_action") == action_type:
-                score += 2.0
-
-            # Raum-Match
-            if args and entry.get("original_args", {}).get("room") == args.get("room"):
-                score += 1.0
-
-            # Person-Match (Feature 6)
-            if person and entry.get("person") == person:
-                score += 1.0
-
-            # Tageszeit-Aehnlichkeit (mit Mitternachts-Wrap)
-            current_hour = datetime.now(_LOCAL_TZ).hour
-            entry_hour = entry.get("hour", 12)
-            hour_diff = min(
-                abs(current_hour - entry_hour), 24 - abs(current_hour - entry_hour)
-            )
-            if hour_diff <= 2:
-                score += 0.5
-
-            # Kausaler Kontext-Match: Wenn die aktuelle Situation dem
-            # kausalen Kontext der Korrektur aehnelt, ist die Korrektur
-            # besonders relevant (gleiche Ursache → gleiche Korrektur).
-            _entry_ctx = entry.get("causal_context", {})
-            if _entry_ctx and args:
-                _current_ctx = args.get("_causal_context", {})
-                if _current_ctx:
-                    # Fenster-Status-Match
-                    if (
-                        _entry_ctx.get("windows_open")
-                        and _current_ctx.get("windows_open")
-                    ):
-                        score += 1.5  # Starker Indikator: gleiche Ursache
-                    # Aktivitaets-Match
-                    if (
-                        _entry_ctx.get("activity")
-                        and _entry_ctx.get("activity") == _current_ctx.get("activity")
-                    ):
-                        score += 1.0
-                    # Wetter-Match
-                    if (
-                        _entry_ctx.get("weather")
-                        and _entry_ctx.get("weather") == _current_ctx.get("weather")
-                    ):
-                        score += 0.5
-
+        for seq in candidates:
+            entry = index.get(seq)
+            score = self._score(entry, action_type, args, person, current_hour)
             if score > 0:
-                scored.append((score, entry))
+                scored.append((score, seq, entry))
 
         if not scored:
             return None
 
-        # Top N nach Score sortieren
-        scored.sort(key=lambda x: x[0], reverse=True)
+        # Top N nach Score sortieren (bei Gleichstand neueste zuerst)
+        scored.sort(key=lambda x: (x[0], x[1]), reverse=True)
         top = scored[: self._max_context]
 
         lines = ["BISHERIGE KORREKTUREN (beachte diese):"]
-        for _, entry in top:
+        for _, _, entry in top:
             text = entry.get("correction_text", "")
             action = entry.get("original_action", "")
             lines.append(f"- Bei '{action}': {text}")
 
         return "\n".join(lines)
 
+    @staticmethod
+    def _score(
+        entry: dict,
+        action_type: str,
+        args: Optional[dict],
+        person: str,
+        current_hour: int,
+    ) -> float:
+        """Relevanz eines Eintrags fuer die aktuelle Aktion."""
+        score = 0.0
+
+        # Aktionstyp-Match
+        if action_type and entry.get("original_action") == action_type:
+            score += 2.0
+
+        # Raum-Match
+        if args and (entry.get("original_args") or {}).get("room") == args.get("room"):
+            score += 1.0
+
+        # Person-Match (Feature 6)
+        if person and entry.get("person") == person:
+            score += 1.0
+
+        # Tageszeit-Aehnlichkeit (mit Mitternachts-Wrap)
+        entry_hour = _hour_of(entry)
+        hour_diff = min(
+            abs(current_hour - entry_hour), 24 - abs(current_hour - entry_hour)
+        )
+        if hour_diff <= 2:
+            score += 0.5
+
+        # Kausaler Kontext-Match: Wenn die aktuelle Situation dem
+        # kausalen Kontext der Korrektur aehnelt, ist die Korrektur
+        # besonders relevant (gleiche Ursache → gleiche Korrektur).
+        _entry_ctx = entry.get("causal_context", {})
+        if _entry_ctx and args:
+            _current_ctx = args.get("_causal_context", {})
+            if _current_ctx:
+                # Fenster-Status-Match
+                if _entry_ctx.get("windows_open") and _current_ctx.get("windows_open"):
+                    score += 1.5  # Starker Indikator: gleiche Ursache
+                # Aktivitaets-Match
+                if _entry_ctx.get("activity") and _entry_ctx.get(
+                    "activity"
+                ) == _current_ctx.get("activity"):
+                    score += 1.0
+                # Wetter-Match
+                if _entry_ctx.get("weather") and _entry_ctx.get(
+                    "weather"
+                ) == _current_ctx.get("weather"):
+                    score += 0.5
+        return score
+
     async def get_active_rules(
         self, action_type: str = "", person: str = ""
     ) -> list[dict]:
@@ -231,17 +352,14 @@ class CorrectionMemory:
         if not self.enabled or not self.redis:
             return []
 
-        raw = await self.redis.hgetall("mha:correction_memory:rules")
-        if not raw:
+        stored = await self._get_rules()
+        if not stored:
             return []
 
         rules = []
         now = time.time()
-        for key, val in raw.items():
-            try:
-                rule = json.loads(val)
-            except json.JSONDecodeError:
-                continue
+        for key, stored_rule in list(stored.items()):
+            rule = dict(stored_rule)
 
             # Confidence-Decay anwenden
             created_ts = rule.get("created_ts", now)
@@ -253,6 +371,7 @@ class CorrectionMemory:
             if decayed_conf < 0.4:
                 # Regel abgelaufen — loeschen
                 await self.redis.hdel("mha:correction_memory:rules", key)
+                stored.pop(key, None)
                 continue
 
             rule["confidence"] = round(decayed_conf, 3)
@@ -278,9 +397,8 @@ class CorrectionMemory:
         if not self.redis:
             return {}
 
-        entry_count = await self.redis.llen("mha:correction_memory:entries")
-        rules_raw = await self.redis.hgetall("mha:correction_memory:rules")
-        rule_count = len(rules_raw) if rules_raw else 0
+        entry_count = len(await self._get_index())
+        rule_count = len(await self._get_rules())
 
         # Top Korrektur-Typen zaehlen
         entries = await self._get_entries(limit=100)
@@ -340,20 +458,54 @@ class CorrectionMemory:
     # --- Private Methoden ---
 
     async def _get_entries(self, limit: int = 0) -> list[dict]:
-        """Laedt Korrektur-Eintraege aus Redis."""
+        """Korrektur-Eintraege neueste zuerst (aus dem Speicher-Index)."""
         if not self.redis:
             return []
-
-        n = limit or self._max_entries
-        raw = await self.redis.lrange("mha:correction_memory:entries", 0, n - 1)
+        index = await self._get_index()
+        return index.latest(limit or self._max_entries)
+
+    async def _get_index(self) -> _CorrectionIndex:
+        """Laedt die Eintraege beim ersten Zugriff einmal in den Index."""
+        if self._index is None:
+            index = _CorrectionIndex(self._max_entries)
+            for entry in reversed(await self._load_entries()):
+                index.add(entry)
+            self._index = index
+        return self._index
+
+    async def _load_entries(self) -> list[dict]:
+        """Liest die Eintraege aus Redis (Journal oder Liste), neueste zuerst."""
+        if self._entries_cursor and self._entries_cursor.ready:
+            await self._entries_cursor.refresh()
+            return self._entries_cursor.latest(self._max_entries)
+        raw = await self.redis.lrange(
+            "mha:correction_memory:entries", 0, self._max_entries - 1
+        )
         entries = []
         for item in raw:
             try:
-                entries.append(json.loads(item))
+                entry = json.loads(item)
             except json.JSONDecodeError:
                 continue
+            if isinstance(entry, dict):
+                entries.append(entry)
         return entries
 
+    async def _get_rules(self) -> dict[str, dict]:
+        """Geparste Regeln (rule_key -> Regel), beim ersten Zugriff geladen."""
+        if self._rules_cache is None:
+            rules = {}
+            raw = await self.redis.hgetall("mha:correction_memory:rules")
+            for key, val in (raw or {}).items():
+                try:
+                    rule = json.loads(val)
+                except (json.JSONDecodeError, TypeError):
+                    continue
+                if isinstance(rule, dict):
+                    rules[key.decode() if isinstance(key, bytes) else key] = rule
+            self._rules_cache = rules
+        return self._rules_cache
+
     @staticmethod
     def _classify_correction(entry: dict) -> str:
         """Bestimmt den Korrektur-Typ anhand des Korrektur-Texts.
@@ -622,6 +774,8 @@ class CorrectionMemory:
             json.dumps(rule, ensure_ascii=False),
         )
         await self.redis.expire("mha:correction_memory:rules", 365 * 86400)
+        if self._rules_cache is not None:
+            self._rules_cache[rule_key] = rule
 
         logger.info(
             "Neue Regel [%s]: %s (confidence: %.2f, similar: %d%s)",
@@ -727,6 +881,8 @@ class CorrectionMemory:
                 cross_key,
                 json.dumps(cross_rule, ensure_ascii=False),
             )
+            if self._rules_cache is not None:
+                self._rules_cache[cross_key] = cross_rule
             self._rules_created_today += 1
             propagated += 1
 
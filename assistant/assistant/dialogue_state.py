@@ -25,6 +25,7 @@ from collections import deque
 from datetime import datetime, timedelta, timezone
 from typing import Optional
 
+from .action_journal import KIND_OUTCOME
 from .config import yaml_config
 
 logger = logging.getLogger(__name__)
@@ -167,11 +168,26 @@ class DialogueStateManager:
 
         # C5: Redis-Client fuer cross-session Referenzierung
         self._redis = None
+        self._journal = None
 
     def set_redis(self, redis_client):
         """C5: Setzt Redis-Client fuer Action-Log Zugriff."""
         self._redis = redis_client
 
+    def set_action_journal(self, journal):
+        """C5: Zeitfenster-Abfragen ueber das ActionJournal statt 200er-LRANGE."""
+        self._journal = journal
+
+    async def _outcomes_between(self, start: datetime, end: datetime) -> list:
+        """Action-Outcomes im Zeitfenster (Journal) bzw. die letzten 200 (Liste).
+
+        Neueste zuerst, wie in der Liste.
+        """
+        if self._journal and self._journal.ready:
+            entries = await self._journal.range(start, end, kinds=(KIND_OUTCOME,))
+            return entries[::-1]
+        return await self._redis.lrange("mha:action_outcomes", 0, 199)
+
     def _get_state(self, person: str = "") -> DialogueState:
         """Gibt den Dialog-Zustand fuer eine Person zurueck."""
         key = (person or "_default").lower()
@@ -626,16 +642,18 @@ class DialogueStateManager:
                 window_end = now
 
             # Redis Action-Outcomes direkt abfragen
-            raw = await self._redis.lrange("mha:action_outcomes", 0, 199)
+            raw = await self._outcomes_between(window_start, window_end)
             matching_actions = []
             for entry_raw in raw:
                 try:
-                    entry_str = (
-                        entry_raw.decode()
-                        if isinstance(entry_raw, bytes)
-                        else entry_raw
-                    )
-                    entry = json.loads(entry_str)
+                    if isinstance(entry_raw, dict):
+                        entry = entry_raw
+                    else:
+                        entry = json.loads(
+                            entry_raw.decode()
+                            if isinstance(entry_raw, bytes)
+                            else entry_raw
+                        )
                     ts_str = entry.get("timestamp", "")
                     if not ts_str:
                         continue
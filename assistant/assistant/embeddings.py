@@ -11,7 +11,9 @@ Modell: paraphrase-multilingual-MiniLM-L12-v2
   (all-MiniLM-L6-v2, nur Englisch trainiert)
 """
 
+import asyncio
 import logging
+import threading
 from collections import OrderedDict
 from typing import Optional
 
@@ -23,6 +25,8 @@ DEFAULT_MODEL = "paraphrase-multilingual-MiniLM-L12-v2"
 _EMBEDDING_CACHE_MAX = 1000
 
 _embedding_fn: Optional[object] = None
+# Modell-Load nur einmal, auch wenn mehrere Subsysteme parallel initialisieren
+_embedding_lock = threading.Lock()
 _embedding_cache: OrderedDict = OrderedDict()
 
 
@@ -56,6 +60,26 @@ def get_embedding_function():
     Falls sentence-transformers nicht installiert ist, wird None
     zurueckgegeben und ChromaDB nutzt seinen Server-Default.
     """
+    if _embedding_fn is not None:
+        return _embedding_fn
+    with _embedding_lock:
+        return _load_embedding_function()
+
+
+async def aget_embedding_function():
+    """Wie get_embedding_function, laedt das Modell aber ausserhalb des Event-Loops.
+
+    sentence-transformers wird erst hier (beim ersten Bedarf) importiert;
+    der Modell-Load dauert Sekunden und darf den parallelen Startup
+    (InitGraph) nicht blockieren.
+    """
+    if _embedding_fn is not None:
+        return _embedding_fn
+    return await asyncio.to_thread(get_embedding_function)
+
+
+def _load_embedding_function():
+    """Laedt das Embedding-Modell (Aufrufer haelt _embedding_lock)."""
     global _embedding_fn
 
     if _embedding_fn is not None:
@@ -0,0 +1,224 @@
+"""
+Event Dispatcher — Begrenzte, nebenlaeufige Verarbeitung von HA-Events.
+
+Die HA-WebSocket-Leseschleife dekodiert Events nur noch und reiht sie hier
+ein. Ein kleiner Worker-Pool arbeitet sie ab:
+
+- Reihenfolge pro Schluessel (entity_id) bleibt erhalten: ein Schluessel ist
+  hoechstens bei einem Worker gleichzeitig in Arbeit.
+- Prioritaets-Lanes: Worker nehmen immer zuerst aus der hoechsten nicht
+  leeren Lane. Sicherheits-Events ueberholen so einen Rueckstau von
+  Energie-/Klima-Updates.
+- Begrenzt: Bei vollem Puffer wird das aelteste Event der niedrigsten
+  verwerfbaren Lane verworfen. Die hoechste Lane wird nie verworfen.
+
+Metriken (get_stats): Queue-Tiefe pro Lane, Lag (Einreihen → Start),
+Handler-Dauer, verarbeitete/verworfene Events.
+"""
+
+import asyncio
+import collections
+import logging
+import time
+from typing import Awaitable, Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+# Lanes in absteigender Prioritaet
+LANE_CRITICAL = "critical"
+LANE_NORMAL = "normal"
+LANE_BULK = "bulk"
+LANES = (LANE_CRITICAL, LANE_NORMAL, LANE_BULK)
+
+
+class KeyedEventDispatcher:
+    """Worker-Pool mit Per-Key-Reihenfolge und Prioritaets-Lanes."""
+
+    def __init__(
+        self,
+        handler: Callable[[dict], Awaitable[None]],
+        workers: int = 4,
+        max_pending: int = 2000,
+        name: str = "events",
+    ):
+        self._handler = handler
+        self.workers = max(1, int(workers))
+        self.max_pending = max(1, int(max_pending))
+        self.name = name
+
+        # Pro Schluessel: FIFO aus (enqueued_at, event); Lane des Schluessels
+        self._pending: dict[str, collections.deque] = {}
+        self._key_lane: dict[str, str] = {}
+        # Pro Lane: Schluessel die bereit sind (Events vorhanden, nicht in Arbeit)
+        self._ready: dict[str, collections.deque] = {
+            lane: collections.deque() for lane in LANES
+        }
+        self._in_flight: set[str] = set()
+        self._depth = {lane: 0 for lane in LANES}
+        self._has_work = asyncio.Event()
+        self._tasks: list[asyncio.Task] = []
+
+        # Metriken
+        self.processed = 0
+        self.dropped = {lane: 0 for lane in LANES}
+        self.last_lag = 0.0
+        self.max_lag = 0.0
+        self.handler_seconds_total = 0.0
+
+    # ------------------------------------------------------------------
+    # Lebenszyklus
+    # ------------------------------------------------------------------
+
+    def start(self):
+        """Startet die Worker (idempotent)."""
+        self._tasks = [t for t in self._tasks if not t.done()]
+        for i in range(len(self._tasks), self.workers):
+            task = asyncio.create_task(self._worker(), name=f"{self.name}_worker_{i}")
+            task.add_done_callback(
+                lambda t: t.exception() if not t.cancelled() else None
+            )
+            self._tasks.append(task)
+
+    async def stop(self):
+        """Stoppt die Worker. Noch wartende Events werden verworfen."""
+        for task in self._tasks:
+            task.cancel()
+        for task in self._tasks:
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        self._tasks = []
+        self._pending.clear()
+        self._key_lane.clear()
+        self._in_flight.clear()
+        for lane in LANES:
+            self._ready[lane].clear()
+            self._depth[lane] = 0
+
+    # ------------------------------------------------------------------
+    # Einreihen (aus der Leseschleife, nicht blockierend)
+    # ------------------------------------------------------------------
+
+    def submit(self, key: str, event: dict, lane: str = LANE_NORMAL) -> bool:
+        """Reiht ein Event ein. False wenn es wegen vollem Puffer verworfen wurde."""
+        if lane not in self._depth:
+            lane = LANE_NORMAL
+        if self.queued >= self.max_pending and not self._drop_oldest(below=lane):
+            self.dropped[lane] += 1
+            return False
+
+        queue = self._pending.get(key)
+        if queue is None:
+            queue = self._pending[key] = collections.deque()
+        # Ein Schluessel bleibt in der Lane in der er eingereiht wurde, bis
+        # er leer ist — sonst koennte Per-Key-Reihenfolge verloren gehen
+        key_lane = self._key_lane.setdefault(key, lane)
+        if not queue and key not in self._in_flight:
+            self._ready[key_lane].append(key)
+        queue.append((time.monotonic(), event))
+        self._depth[key_lane] += 1
+        self._has_work.set()
+        return True
+
+    def _drop_oldest(self, below: str) -> bool:
+        """Verwirft das aelteste Event der niedrigsten Lane (nie critical).
+
+        ``below``: Lane des neuen Events — es werden nur Events aus gleich-
+        oder niedriger priorisierten Lanes verdraengt.
+        """
+        floor = LANES.index(below)
+        for lane in reversed(LANES[1:]):
+            if LANES.index(lane) < floor:
+                break
+            for key in self._ready[lane]:
+                if self._pending.get(key):
+                    self._pending[key].popleft()
+                    self._depth[lane] -= 1
+                    self.dropped[lane] += 1
+                    if not self._pending[key]:
+                        self._ready[lane].remove(key)
+                        self._forget(key)
+                    return True
+        if below == LANE_CRITICAL:
+            # Sicherheits-Events nie verwerfen — notfalls Puffer ueberziehen
+            return True
+        return False
+
+    def _forget(self, key: str):
+        self._pending.pop(key, None)
+        self._key_lane.pop(key, None)
+
+    # ------------------------------------------------------------------
+    # Worker
+    # ------------------------------------------------------------------
+
+    def _next_key(self) -> Optional[tuple[str, str]]:
+        for lane in LANES:
+            if self._ready[lane]:
+                return lane, self._ready[lane].popleft()
+        return None
+
+    async def _worker(self):
+        while True:
+            picked = self._next_key()
+            if picked is None:
+                self._has_work.clear()
+                await self._has_work.wait()
+                continue
+            lane, key = picked
+            queue = self._pending.get(key)
+            if not queue:
+                self._forget(key)
+                continue
+            enqueued_at, event = queue.popleft()
+            self._depth[lane] -= 1
+            self._in_flight.add(key)
+
+            started = time.monotonic()
+            self.last_lag = started - enqueued_at
+            self.max_lag = max(self.max_lag, self.last_lag)
+            try:
+                await self._handler(event)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error("Event-Worker Fehler (%s): %s", key, e)
+            finally:
+                self.handler_seconds_total += time.monotonic() - started
+                self.processed += 1
+                self._in_flight.discard(key)
+                if self._pending.get(key):
+                    # Weitere Events desselben Schluessels hinten anstellen
+                    self._ready[lane].append(key)
+                    self._has_work.set()
+                else:
+                    self._forget(key)
+
+    # ------------------------------------------------------------------
+    # Metriken
+    # ------------------------------------------------------------------
+
+    @property
+    def queued(self) -> int:
+        return sum(self._depth.values())
+
+    def get_stats(self) -> dict:
+        """Queue-Tiefe, Lag und Zaehler fuer /metrics."""
+        oldest = 0.0
+        now = time.monotonic()
+        for queue in self._pending.values():
+            if queue:
+                oldest = max(oldest, now - queue[0][0])
+        return {
+            "workers": len([t for t in self._tasks if not t.done()]),
+            "queued": self.queued,
+            "queued_by_lane": dict(self._depth),
+            "in_flight": len(self._in_flight),
+            "processed": self.processed,
+            "dropped_by_lane": dict(self.dropped),
+            "last_lag_seconds": round(self.last_lag, 4),
+            "max_lag_seconds": round(self.max_lag, 4),
+            "oldest_pending_seconds": round(oldest, 4),
+            "handler_seconds_total": round(self.handler_seconds_total, 3),
+        }
@@ -7,6 +7,7 @@ Phase 10: Room-aware TTS, Person Messaging, Trust-Level Pre-Check.
 
 import asyncio
 import copy
+import json
 import logging
 import re
 import time
@@ -23,7 +24,7 @@ from .declarative_tools import (
     DeclarativeToolExecutor,
     get_registry as get_decl_registry,
 )
-from .ha_client import HomeAssistantClient
+from .ha_client import HomeAssistantClient, service_batch
 
 # ============================================================
 # KERN-SCHUTZ: JARVIS darf seinen eigenen Kern NICHT ändern.
@@ -4351,6 +4352,57 @@ class FunctionExecutor:
             except Exception as e:
                 logger.debug("Redis Cover-Jarvis-Acting Flag fehlgeschlagen: %s", e)
 
+    async def _mark_covers_jarvis_acting(self, entity_ids: list[str]):
+        """Setzt die Jarvis-Flags fuer mehrere Covers parallel."""
+        if entity_ids:
+            await asyncio.gather(
+                *(self._mark_cover_jarvis_acting(eid) for eid in entity_ids)
+            )
+
+    async def _call_service_grouped(
+        self, domain: str, service: str, targets: list[tuple[str, dict]]
+    ) -> int:
+        """Bulk-Op: Fasst Einzel-Calls zu Gruppen-Calls mit entity_id-Liste zusammen.
+
+        Args:
+            domain: HA-Domain (z.B. "cover")
+            service: HA-Service (z.B. "set_cover_position")
+            targets: Liste von (entity_id, service_data ohne entity_id)
+
+        Gruppiert nach identischen Service-Daten (z.B. gleiche Position) —
+        statt N Requests einer pro Gruppe, unabhaengige Gruppen parallel.
+
+        Returns:
+            Anzahl Entities in erfolgreichen Gruppen-Calls
+        """
+        groups: dict[str, tuple[dict, list[str]]] = {}
+        for eid, data in targets:
+            key = json.dumps(data, sort_keys=True, default=str)
+            groups.setdefault(key, (data, []))[1].append(eid)
+
+        async def _send(data: dict, eids: list[str]) -> int:
+            payload = dict(data)
+            payload["entity_id"] = eids[0] if len(eids) == 1 else eids
+            ok = await self.ha.call_service(domain, service, payload)
+            return len(eids) if ok else 0
+
+        results = await asyncio.gather(
+            *(_send(data, eids) for data, eids in groups.values()),
+            return_exceptions=True,
+        )
+        for r in results:
+            if isinstance(r, BaseException):
+                logger.warning("Gruppen-Call %s.%s fehlgeschlagen: %s", domain, service, r)
+        if len(targets) > len(groups):
+            logger.debug(
+                "Bulk %s.%s: %d Entities in %d Requests",
+                domain,
+                service,
+                len(targets),
+                len(groups),
+            )
+        return sum(r for r in results if isinstance(r, int))
+
     # Whitelist erlaubter Tool-Funktionsnamen (verhindert Zugriff auf interne Methoden)
     _ALLOWED_FUNCTIONS = frozenset(
         {
@@ -4746,6 +4798,10 @@ class FunctionExecutor:
     async def execute_parallel(self, calls: list[tuple[str, dict]]) -> list[dict]:
         """N4: Fuehrt mehrere Funktionen parallel aus.
 
+        HA-Service-Calls der einzelnen Handler laufen ueber einen
+        service_batch: kompatible Calls (gleiche domain/service/data) werden
+        zu einem Request mit entity_id-Liste zusammengefasst.
+
         Args:
             calls: Liste von (function_name, arguments) Tuples
 
@@ -4756,10 +4812,18 @@ class FunctionExecutor:
             return []
         if len(calls) == 1:
             return [await self.execute(calls[0][0], calls[0][1])]
-        results = await asyncio.gather(
-            *(self.execute(name, args) for name, args in calls),
-            return_exceptions=True,
-        )
+        with service_batch(self.ha) as batch:
+            results = await asyncio.gather(
+                *(self.execute(name, args) for name, args in calls),
+                return_exceptions=True,
+            )
+        if batch.calls > batch.requests:
+            logger.info(
+                "N4: %d Tool-Calls, %d Service-Calls in %d HA-Requests",
+                len(calls),
+                batch.calls,
+                batch.requests,
+            )
         return [
             r
             if isinstance(r, dict)
@@ -5340,6 +5404,7 @@ class FunctionExecutor:
         # Bulk-Op: Dependency-Check ueberspringen — wird bereits vom Executor geprueft
         self.ha._skip_dep_check_depth = getattr(self.ha, "_skip_dep_check_depth", 0) + 1
         try:
+            targets = []
             for s in states:
                 eid = s.get("entity_id", "")
                 if not eid.startswith("light."):
@@ -5347,7 +5412,7 @@ class FunctionExecutor:
                 if not is_entity_annotated(eid) or is_entity_hidden(eid):
                     continue
                 if s.get("state") != state or (state == "on" and "brightness" in args):
-                    service_data = {"entity_id": eid}
+                    service_data = {}
                     if state == "on":
                         if "brightness" in args:
                             bri_pct = self._parse_brightness(args)
@@ -5359,8 +5424,10 @@ class FunctionExecutor:
                             service_data["brightness_pct"] = (
                                 self.get_adaptive_brightness(room_name, eid)
                             )
-                    await self.ha.call_service("light", service, service_data)
-                    count += 1
+                    targets.append((eid, service_data))
+            # Gruppen-Calls: gleiche Helligkeit → ein Request
+            await self._call_service_grouped("light", service, targets)
+            count = len(targets)
         finally:
             self.ha._skip_dep_check_depth = max(
                 0, getattr(self.ha, "_skip_dep_check_depth", 1) - 1
@@ -6828,6 +6895,7 @@ class FunctionExecutor:
 
         count = 0
         last_pos = position  # Track actual position for message
+        targets = []
         for room_name in floor_rooms:
             for s in states:
                 eid = s.get("entity_id", "")
@@ -6845,11 +6913,8 @@ class FunctionExecutor:
                 if cover_type == "rollladen" and self._is_markise(eid, s):
                     continue
 
-                await self._mark_cover_jarvis_acting(eid)
                 if is_stop:
-                    await self.ha.call_service(
-                        "cover", "stop_cover", {"entity_id": eid}
-                    )
+                    targets.append((eid, {}))
                 elif adjust in ("up", "down"):
                     # Relative Anpassung pro Cover
                     current_position = 50
@@ -6871,22 +6936,20 @@ class FunctionExecutor:
                     final_pos = max(0, min(100, final_pos))
                     last_pos = final_pos
                     ha_pos = self._translate_cover_position(eid, final_pos)
-                    await self.ha.call_service(
-                        "cover",
-                        "set_cover_position",
-                        {"entity_id": eid, "position": ha_pos},
-                    )
+                    targets.append((eid, {"position": ha_pos}))
                 else:
                     final_pos = position if position is not None else 0
                     last_pos = final_pos
                     ha_pos = self._translate_cover_position(eid, final_pos)
-                    await self.ha.call_service(
-                        "cover",
-                        "set_cover_position",
-                        {"entity_id": eid, "position": ha_pos},
-                    )
+                    targets.append((eid, {"position": ha_pos}))
                 count += 1
 
+        # Etage: ein Gruppen-Call pro Zielposition statt N Einzel-Requests
+        await self._mark_covers_jarvis_acting([eid for eid, _ in targets])
+        await self._call_service_grouped(
+            "cover", "stop_cover" if is_stop else "set_cover_position", targets
+        )
+
         if is_stop:
             action_str = "gestoppt"
         elif adjust == "up":
@@ -6948,15 +7011,15 @@ class FunctionExecutor:
 
         count = 0
         last_pos = position  # Track actual position for message
+        targets = []
         for s in states:
             eid = s.get("entity_id", "")
             if not eid.startswith("cover."):
                 continue
             if not self._is_markise(eid, s):
                 continue
-            await self._mark_cover_jarvis_acting(eid)
             if is_stop:
-                await self.ha.call_service("cover", "stop_cover", {"entity_id": eid})
+                targets.append((eid, {}))
             elif adjust in ("up", "down"):
                 # Relative Anpassung pro Markise
                 current_position = 50
@@ -6976,22 +7039,19 @@ class FunctionExecutor:
                 final_pos = max(0, min(100, final_pos))
                 last_pos = final_pos
                 ha_pos = self._translate_cover_position(eid, final_pos)
-                await self.ha.call_service(
-                    "cover",
-                    "set_cover_position",
-                    {"entity_id": eid, "position": ha_pos},
-                )
+                targets.append((eid, {"position": ha_pos}))
             else:
                 final_pos = position if position is not None else 0
                 last_pos = final_pos
                 ha_pos = self._translate_cover_position(eid, final_pos)
-                await self.ha.call_service(
-                    "cover",
-                    "set_cover_position",
-                    {"entity_id": eid, "position": ha_pos},
-                )
+                targets.append((eid, {"position": ha_pos}))
             count += 1
 
+        await self._mark_covers_jarvis_acting([eid for eid, _ in targets])
+        await self._call_service_grouped(
+            "cover", "stop_cover" if is_stop else "set_cover_position", targets
+        )
+
         if count == 0:
             return {"success": False, "message": "Keine Markisen gefunden"}
         if is_stop:
@@ -7018,6 +7078,7 @@ class FunctionExecutor:
         # Bulk-Op: Dependency-Check ueberspringen — wird bereits vom Executor geprueft
         self.ha._skip_dep_check_depth = getattr(self.ha, "_skip_dep_check_depth", 0) + 1
         try:
+            targets = []
             for s in states:
                 eid = s.get("entity_id", "")
                 if not eid.startswith("cover."):
@@ -7033,13 +7094,11 @@ class FunctionExecutor:
                 if cover_type == "markise" and not self._is_markise(eid, s):
                     continue
                 ha_pos = self._translate_cover_position(eid, position)
-                await self._mark_cover_jarvis_acting(eid)
-                await self.ha.call_service(
-                    "cover",
-                    "set_cover_position",
-                    {"entity_id": eid, "position": ha_pos},
-                )
-                count += 1
+                targets.append((eid, {"position": ha_pos}))
+            # Invertierte Covers landen in einer eigenen Positions-Gruppe
+            await self._mark_covers_jarvis_acting([eid for eid, _ in targets])
+            await self._call_service_grouped("cover", "set_cover_position", targets)
+            count = len(targets)
         finally:
             self.ha._skip_dep_check_depth = max(
                 0, getattr(self.ha, "_skip_dep_check_depth", 1) - 1
@@ -7061,6 +7120,7 @@ class FunctionExecutor:
         count = 0
         self.ha._skip_dep_check_depth = getattr(self.ha, "_skip_dep_check_depth", 0) + 1
         try:
+            targets = []
             for s in states:
                 eid = s.get("entity_id", "")
                 if not eid.startswith("cover."):
@@ -7069,9 +7129,10 @@ class FunctionExecutor:
                     continue
                 if not await self._is_safe_cover(eid, s):
                     continue
-                await self._mark_cover_jarvis_acting(eid)
-                await self.ha.call_service("cover", service, {"entity_id": eid})
-                count += 1
+                targets.append((eid, {}))
+            await self._mark_covers_jarvis_acting([eid for eid, _ in targets])
+            await self._call_service_grouped("cover", service, targets)
+            count = len(targets)
         finally:
             self.ha._skip_dep_check_depth = max(
                 0, getattr(self.ha, "_skip_dep_check_depth", 1) - 1
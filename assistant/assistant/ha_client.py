@@ -16,10 +16,13 @@ API-Endpoints an die tatsaechlichen MindHome Add-on Routes angepasst:
 """
 
 import asyncio
+import contextlib
+import contextvars
+import json
 import logging
 import time
 import traceback
-from typing import Any, Optional
+from typing import Any, Iterator, Optional
 from urllib.parse import quote, urlencode
 
 import aiohttp
@@ -50,6 +53,14 @@ _ACTION_DOMAINS = frozenset(
 _dep_check_cache: dict[str, float] = {}
 _DEP_CHECK_INTERVAL = 30.0
 
+# Service-Coalescing: call_service-Aufrufe innerhalb eines service_batch()
+# werden pro (domain, service, data) fuer dieses Zeitfenster gesammelt und als
+# EIN HA-Request mit entity_id-Liste gesendet.
+_COALESCE_WINDOW = 0.015  # Sekunden
+_active_batch: contextvars.ContextVar[Optional["ServiceBatch"]] = (
+    contextvars.ContextVar("ha_service_batch", default=None)
+)
+
 # Retry-Konfiguration
 MAX_RETRIES = 3
 RETRY_BACKOFF_BASE = 1.5  # Sekunden: 1.5, 3.0, 4.5
@@ -271,14 +282,26 @@ class HomeAssistantClient:
         """
         HA Service aufrufen (z.B. light.turn_off).
 
+        Innerhalb eines service_batch() werden kompatible Aufrufe gesammelt
+        und als ein Request mit entity_id-Liste gesendet.
+
         Args:
             domain: z.B. "light", "climate", "scene"
             service: z.B. "turn_on", "turn_off", "activate"
-            data: Service-Daten (entity_id, brightness, etc.)
+            data: Service-Daten (entity_id als String oder Liste, brightness, etc.)
 
         Returns:
             True bei Erfolg
         """
+        batch = _active_batch.get()
+        if batch is not None and batch.client is self:
+            return await batch.submit(domain, service, data)
+        return await self._call_service_now(domain, service, data)
+
+    async def _call_service_now(
+        self, domain: str, service: str, data: Optional[dict] = None
+    ) -> bool:
+        """Sendet den Service-Call sofort (ohne Coalescing)."""
         # Audit-Log fuer Licht-Aktionen
         if domain == "light":
             logger.debug(
@@ -292,11 +315,26 @@ class HomeAssistantClient:
         _eid = (data or {}).get("entity_id", "")
         if _eid and domain in _ACTION_DOMAINS:
             try:
-                _state = await self.get_state(_eid)
-                if _state and _state.get("state") == "unavailable":
+                if isinstance(_eid, str):
+                    _state = await self.get_state(_eid)
+                    _unavailable = (
+                        [_eid]
+                        if _state and _state.get("state") == "unavailable"
+                        else []
+                    )
+                else:
+                    # Gruppen-Call: ein Snapshot statt N Einzel-Reads
+                    _wanted = set(_eid)
+                    _unavailable = [
+                        s.get("entity_id")
+                        for s in (await self.get_states() or [])
+                        if s.get("entity_id") in _wanted
+                        and s.get("state") == "unavailable"
+                    ]
+                for _ueid in _unavailable:
                     logger.warning(
                         "Geraet nicht erreichbar: %s (state=unavailable), Aktion %s.%s wird trotzdem versucht",
-                        _eid,
+                        _ueid,
                         domain,
                         service,
                     )
@@ -340,16 +378,22 @@ class HomeAssistantClient:
         Rate-Limited: gleiche Entity maximal alle 30s pruefen.
         """
         try:
-            entity_id = (data or {}).get("entity_id", "")
-            if not entity_id:
+            raw_ids = (data or {}).get("entity_id", "")
+            if not raw_ids:
                 return
+            entity_ids = [raw_ids] if isinstance(raw_ids, str) else list(raw_ids)
 
             # Rate-Limiter: nicht staendig die gleiche Entity pruefen
             now = time.monotonic()
-            last_check = _dep_check_cache.get(entity_id, 0.0)
-            if now - last_check < _DEP_CHECK_INTERVAL:
+            entity_ids = [
+                eid
+                for eid in entity_ids
+                if now - _dep_check_cache.get(eid, 0.0) >= _DEP_CHECK_INTERVAL
+            ]
+            if not entity_ids:
                 return
-            _dep_check_cache[entity_id] = now
+            for eid in entity_ids:
+                _dep_check_cache[eid] = now
 
             # Cache aufraeumen (max 200 Eintraege)
             if len(_dep_check_cache) > 200:
@@ -391,26 +435,27 @@ class HomeAssistantClient:
 
             states = await self.get_states() or []
 
-            # Action-Args zusammenbauen fuer praeziseres Matching
-            action_args = {"entity_id": entity_id, "state": state_val}
-            if "temperature" in data_dict:
-                action_args["temperature"] = data_dict["temperature"]
-            if "offset" in data_dict:
-                action_args["offset"] = data_dict["offset"]
-
-            hints = StateChangeLog.check_action_dependencies(
-                f"set_{domain}",
-                action_args,
-                states,
-            )
-            if hints:
-                logger.info(
-                    "Dependency-Konflikt: %s.%s(%s) → %s",
-                    domain,
-                    service,
-                    entity_id,
-                    hints[0],
+            for entity_id in entity_ids:
+                # Action-Args zusammenbauen fuer praeziseres Matching
+                action_args = {"entity_id": entity_id, "state": state_val}
+                if "temperature" in data_dict:
+                    action_args["temperature"] = data_dict["temperature"]
+                if "offset" in data_dict:
+                    action_args["offset"] = data_dict["offset"]
+
+                hints = StateChangeLog.check_action_dependencies(
+                    f"set_{domain}",
+                    action_args,
+                    states,
                 )
+                if hints:
+                    logger.info(
+                        "Dependency-Konflikt: %s.%s(%s) → %s",
+                        domain,
+                        service,
+                        entity_id,
+                        hints[0],
+                    )
         except Exception as e:
             # Dependency-Check darf NIEMALS die Aktion verhindern
             logger.warning("Dependency-Check fehlgeschlagen: %s", e)
@@ -1071,3 +1116,125 @@ class HomeAssistantClient:
             last_error,
         )
         return None
+
+
+class _ServiceGroup:
+    """Offene Gruppe kompatibler Service-Calls (gleiche domain/service/data)."""
+
+    __slots__ = ("domain", "service", "data", "entity_ids", "future")
+
+    def __init__(self, domain: str, service: str, data: dict, future: asyncio.Future):
+        self.domain = domain
+        self.service = service
+        self.data = data
+        self.entity_ids: list[str] = []
+        self.future = future
+
+
+class ServiceBatch:
+    """Fasst call_service-Aufrufe zu Gruppen-Calls mit entity_id-Liste zusammen.
+
+    Aufrufe mit gleichem (domain, service, data ohne entity_id) die innerhalb
+    des Zeitfensters eintreffen werden als EIN Request gesendet. Jeder
+    Aufrufer bekommt das Ergebnis des Gruppen-Calls. Unabhaengige Gruppen
+    laufen parallel; steckt eine Entity bereits in einer anderen offenen
+    Gruppe, wird auf deren Ergebnis gewartet (Reihenfolge pro Entity bleibt).
+    """
+
+    def __init__(self, client: "HomeAssistantClient", window: float = _COALESCE_WINDOW):
+        self.client = client
+        self._window = window
+        self._groups: dict[tuple, _ServiceGroup] = {}
+        self._inflight: dict[str, asyncio.Future] = {}
+        self._flush_tasks: set[asyncio.Task] = set()
+        self.requests = 0  # tatsaechlich gesendete HA-Requests
+        self.calls = 0  # eingegangene call_service-Aufrufe
+
+    async def submit(
+        self, domain: str, service: str, data: Optional[dict] = None
+    ) -> bool:
+        """Reiht einen Service-Call in die passende Gruppe ein."""
+        self.calls += 1
+        rest = dict(data or {})
+        eid = rest.pop("entity_id", None)
+        if not isinstance(eid, str) or not eid:
+            # Ohne einzelne entity_id (Szene, Listen-Call, ...) direkt senden
+            self.requests += 1
+            return await self.client._call_service_now(domain, service, data)
+
+        key = (domain, service, json.dumps(rest, sort_keys=True, default=str))
+        while True:
+            group = self._groups.get(key)
+            pending = self._inflight.get(eid)
+            if (
+                pending is None
+                or pending.done()
+                or (group is not None and pending is group.future)
+            ):
+                break
+            # Entity wartet noch auf eine andere Gruppe → erst deren Ergebnis
+            await asyncio.wait([pending])
+
+        if group is None:
+            group = _ServiceGroup(
+                domain, service, rest, asyncio.get_running_loop().create_future()
+            )
+            self._groups[key] = group
+            task = asyncio.ensure_future(self._flush_later(key, group))
+            self._flush_tasks.add(task)
+            task.add_done_callback(self._flush_tasks.discard)
+        if eid not in group.entity_ids:
+            group.entity_ids.append(eid)
+        self._inflight[eid] = group.future
+        return await asyncio.shield(group.future)
+
+    async def _flush_later(self, key: tuple, group: _ServiceGroup) -> None:
+        await asyncio.sleep(self._window)
+        if self._groups.get(key) is group:
+            del self._groups[key]
+        ids = group.entity_ids
+        data = dict(group.data)
+        data["entity_id"] = ids[0] if len(ids) == 1 else list(ids)
+        self.requests += 1
+        if len(ids) > 1:
+            logger.debug(
+                "Service-Coalescing: %s.%s fuer %d Entities in einem Request",
+                group.domain,
+                group.service,
+                len(ids),
+            )
+        try:
+            result = await self.client._call_service_now(
+                group.domain, group.service, data
+            )
+        except asyncio.CancelledError:
+            group.future.cancel()
+            raise
+        except Exception as e:
+            group.future.set_exception(e)
+        else:
+            group.future.set_result(result)
+        finally:
+            for eid in ids:
+                if self._inflight.get(eid) is group.future:
+                    del self._inflight[eid]
+
+
+@contextlib.contextmanager
+def service_batch(
+    client: "HomeAssistantClient", window: float = _COALESCE_WINDOW
+) -> Iterator[ServiceBatch]:
+    """Aktiviert Service-Coalescing fuer alle Tasks die im Block entstehen.
+
+    Verschachtelte Aufrufe fuer denselben Client nutzen den aeusseren Batch.
+    """
+    current = _active_batch.get()
+    if current is not None and current.client is client:
+        yield current
+        return
+    batch = ServiceBatch(client, window)
+    token = _active_batch.set(batch)
+    try:
+        yield batch
+    finally:
+        _active_batch.reset(token)
@@ -0,0 +1,174 @@
+"""
+Init Graph — Abhaengigkeits-basierter, paralleler Startup der Subsysteme.
+
+AssistantBrain.initialize hat bisher ~70 Init-Schritte in fester Reihenfolge
+nacheinander ausgefuehrt (nur einzelne Bloecke per gather). Hier deklariert
+jeder Schritt seine Abhaengigkeiten; alle Schritte deren Abhaengigkeiten
+erledigt sind laufen sofort parallel los.
+
+Abhaengigkeits-Arten:
+  - requires: Schritt laeuft nur wenn die Abhaengigkeit ERFOLGREICH war
+              (sonst "skipped", z.B. "LightEngine.start" braucht "LightEngine")
+  - after:    reine Reihenfolge — laeuft auch wenn die Abhaengigkeit fehlschlug
+
+Fehlerbehandlung (F-069 Graceful Degradation):
+  - Nicht-kritische Schritte: Fehler wird geloggt, Name landet in `degraded`
+  - Kritische Schritte: Fehler bricht run() ab (wie ein ungeschuetztes await)
+
+Jede Schritt-Dauer wird an einen optionalen Callback gemeldet
+(LatencyTracker.record_init), damit Startup-Regressionen sichtbar sind.
+"""
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+STATUS_OK = "ok"
+STATUS_FAILED = "failed"
+STATUS_SKIPPED = "skipped"
+
+
+@dataclass
+class InitStep:
+    """Ein Init-Schritt: Factory liefert das Awaitable erst beim Start."""
+
+    name: str
+    factory: Callable[[], Awaitable]
+    requires: tuple = ()
+    after: tuple = ()
+    critical: bool = False
+
+
+class InitGraph:
+    """Fuehrt Init-Schritte entlang ihrer Abhaengigkeiten parallel aus."""
+
+    def __init__(self, on_timing: Optional[Callable[[str, float, str], None]] = None):
+        self._steps: dict[str, InitStep] = {}
+        self._pending: list[str] = []
+        self._on_timing = on_timing
+        self.status: dict[str, str] = {}
+        self.durations: dict[str, float] = {}
+        self.degraded: list[str] = []
+
+    def add(
+        self,
+        name: str,
+        factory: Callable[[], Awaitable],
+        requires: tuple = (),
+        after: tuple = (),
+        critical: bool = False,
+    ) -> None:
+        """Registriert einen Schritt. Namen muessen eindeutig sein."""
+        if name in self._steps:
+            raise ValueError(f"Init-Schritt doppelt registriert: {name}")
+        self._steps[name] = InitStep(
+            name=name,
+            factory=factory,
+            requires=tuple(requires),
+            after=tuple(after),
+            critical=critical,
+        )
+        self._pending.append(name)
+
+    def ok(self, name: str) -> bool:
+        """True wenn der Schritt erfolgreich gelaufen ist."""
+        return self.status.get(name) == STATUS_OK
+
+    def _validate(self, names: list[str]) -> None:
+        """Unbekannte Abhaengigkeiten und Zyklen frueh erkennen."""
+        for name in names:
+            step = self._steps[name]
+            for dep in step.requires + step.after:
+                if dep not in self._steps:
+                    raise ValueError(f"Init-Schritt {name}: unbekannte Abhaengigkeit {dep}")
+
+        visiting: set = set()
+        done: set = set(self.status)
+
+        def _visit(name: str, path: tuple) -> None:
+            if name in done:
+                return
+            if name in visiting:
+                raise ValueError("Init-Zyklus: " + " -> ".join(path + (name,)))
+            visiting.add(name)
+            step = self._steps[name]
+            for dep in step.requires + step.after:
+                _visit(dep, path + (name,))
+            visiting.discard(name)
+            done.add(name)
+
+        for name in names:
+            _visit(name, ())
+
+    async def run(self) -> None:
+        """Fuehrt alle noch offenen Schritte aus. Mehrfach aufrufbar."""
+        names, self._pending = self._pending, []
+        if not names:
+            return
+        self._validate(names)
+
+        finished: dict[str, asyncio.Event] = {}
+        for name in names:
+            finished[name] = asyncio.Event()
+
+        async def _wait_for(dep: str) -> None:
+            event = finished.get(dep)
+            if event is not None:
+                await event.wait()
+
+        async def _run_step(step: InitStep) -> None:
+            try:
+                for dep in step.requires + step.after:
+                    await _wait_for(dep)
+                if any(self.status.get(d) != STATUS_OK for d in step.requires):
+                    self._finish(step.name, STATUS_SKIPPED, 0.0)
+                    return
+                t0 = time.perf_counter()
+                try:
+                    await step.factory()
+                except Exception as e:
+                    ms = (time.perf_counter() - t0) * 1000
+                    self._finish(step.name, STATUS_FAILED, ms)
+                    if step.critical:
+                        raise
+                    self.degraded.append(step.name)
+                    logger.error(
+                        "F-069: %s Initialisierung fehlgeschlagen (degraded): %s",
+                        step.name,
+                        e,
+                    )
+                    return
+                self._finish(step.name, STATUS_OK, (time.perf_counter() - t0) * 1000)
+            finally:
+                finished[step.name].set()
+
+        t_start = time.perf_counter()
+        results = await asyncio.gather(
+            *(_run_step(self._steps[n]) for n in names), return_exceptions=True
+        )
+        wall_ms = (time.perf_counter() - t_start) * 1000
+        serial_ms = sum(self.durations.get(n, 0.0) for n in names)
+        slowest = sorted(names, key=lambda n: self.durations.get(n, 0.0), reverse=True)
+        logger.info(
+            "Init-Graph: %d Schritte in %.0fms (seriell %.0fms), langsamste: %s",
+            len(names),
+            wall_ms,
+            serial_ms,
+            ", ".join(f"{n}={self.durations.get(n, 0.0):.0f}ms" for n in slowest[:5]),
+        )
+        for res in results:
+            if isinstance(res, BaseException):
+                raise res
+
+    def _finish(self, name: str, status: str, ms: float) -> None:
+        self.status[name] = status
+        self.durations[name] = round(ms, 1)
+        if self._on_timing and status != STATUS_SKIPPED:
+            try:
+                self._on_timing(name, round(ms, 1), status)
+            except Exception as e:
+                logger.debug("Init-Timing Callback fehlgeschlagen: %s", e)
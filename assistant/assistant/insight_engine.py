@@ -6,7 +6,10 @@ und proaktiv Hinweise gibt.
 
 Architektur:
   1. Daten sammeln (HA States, Kalender, Energie-Baselines)
-  2. Regel-basierte Checks (schnell, kein LLM)
+     — Voll-Abruf nur beim Sicherheits-Sweep, dazwischen inkrementell aus
+       dem Entity-Snapshot (gepflegt via note_state)
+  2. Regel-basierte Checks (schnell, kein LLM) — nur die, deren deklarierte
+     Datenquellen (_CHECK_SOURCES) sich seit dem letzten Zyklus geaendert haben
   3. Hinweis-Text direkt generiert (Template-basiert)
   4. Delivery via Callback → brain._handle_insight → Silence Matrix → TTS
 
@@ -23,6 +26,7 @@ Checks:
 import asyncio
 import json
 import logging
+import time
 from datetime import datetime, timedelta, timezone
 from typing import Optional
 
@@ -69,6 +73,25 @@ _RAIN_CONDITIONS = [
     "exceptional",
 ]
 
+# Aggregat-Buckets des Entity-Snapshots (entsprechen den Keys in data)
+_AGGREGATES = (
+    "weather",
+    "open_windows",
+    "open_doors",
+    "lights_on",
+    "climate",
+    "persons_home",
+    "persons_away",
+    "alarm_state",
+    "temperatures",
+)
+
+# Kalender-Events im inkrementellen Zyklus max. so alt (Sekunden)
+_CALENDAR_TTL_SECONDS = 3600
+
+# Ab so vielen veralteten Entities lieber ein Voll-Abruf statt Einzel-GETs
+_MAX_STALE_REFRESH = 25
+
 _STORM_CONDITIONS = [
     "pouring",
     "lightning-rainy",
@@ -159,6 +182,21 @@ class InsightEngine:
         self._cross_domain_min_count = int(_cross_cfg.get("min_count", 5))
         self._cross_domain_ttl = int(_cross_cfg.get("ttl_days", 90)) * 86400
 
+        # Aenderungs-getriebene Auswertung: Snapshot + Dirty-Set
+        self._change_driven = insight_checks_cfg.get("change_driven", True)
+        self._full_sweep_interval = (
+            insight_checks_cfg.get("full_sweep_minutes", 180) * 60
+        )
+        self._entities: dict[str, dict] = {}
+        self._aggregates: dict[str, dict] = {name: {} for name in _AGGREGATES}
+        self._entity_bucket: dict[str, str] = {}
+        self._snapshot_loaded = False
+        self._stale_entities: set[str] = set()
+        self._dirty_sources: set[str] = set()
+        self._last_full_sweep = 0.0
+        self._calendar_events: list[dict] = []
+        self._calendar_loaded_at = 0.0
+
     async def initialize(
         self,
         redis_client: Optional[aioredis.Redis] = None,
@@ -239,6 +277,72 @@ class InsightEngine:
         "sensor.*co2": ["_check_weather_windows"],
         "sensor.*humid": ["_check_humidity_contradiction"],
     }
+    # Check-Methode -> Datenquellen von denen das Ergebnis abhaengt:
+    # HA-Domains (Aenderung einer Entity dieser Domain macht den Check dirty),
+    # "calendar" (auch Kalender-Events), "clock" (Uhrzeit/Redis-Historie —
+    # laeuft jeden Zyklus), "*" (beliebige Entity). Nicht gelistete Checks
+    # laufen immer.
+    _CHECK_SOURCES: dict[str, frozenset[str]] = {
+        "_check_weather_windows": frozenset({"binary_sensor", "weather", "clock"}),
+        "_check_frost_heating": frozenset({"climate", "weather"}),
+        "_check_calendar_travel": frozenset(
+            {"calendar", "alarm_control_panel", "climate", "binary_sensor"}
+        ),
+        "_check_energy_anomaly": frozenset({"clock"}),
+        "_check_away_devices": frozenset({"person", "light", "binary_sensor", "clock"}),
+        "_check_temp_drop": frozenset({"sensor", "climate", "binary_sensor", "clock"}),
+        "_check_window_temp_drop": frozenset({"binary_sensor", "climate", "weather"}),
+        "_check_calendar_weather_cross": frozenset({"calendar", "weather", "clock"}),
+        "_check_comfort_contradiction": frozenset({"binary_sensor", "climate"}),
+        "_check_guest_preparation": frozenset(
+            {
+                "calendar",
+                "alarm_control_panel",
+                "light",
+                "climate",
+                "binary_sensor",
+                "clock",
+            }
+        ),
+        "_check_away_security_full": frozenset({"person", "binary_sensor", "light"}),
+        "_check_health_work_pattern": frozenset({"climate", "weather", "clock"}),
+        "_check_humidity_contradiction": frozenset(
+            {
+                "sensor",
+                "climate",
+                "switch",
+                "fan",
+                "humidifier",
+                "binary_sensor",
+                "weather",
+            }
+        ),
+        "_check_trend_prediction": frozenset({"clock"}),
+        "_check_night_security": frozenset(
+            {"alarm_control_panel", "binary_sensor", "person", "weather", "clock"}
+        ),
+        "_check_heating_vs_sun": frozenset(
+            {"climate", "weather", "cover", "media_player"}
+        ),
+        "_check_forgotten_devices": frozenset({"media_player", "person", "clock"}),
+        "_check_device_dependency_conflicts": frozenset({"*", "clock"}),
+        "_check_llm_causal": frozenset(
+            {
+                "binary_sensor",
+                "climate",
+                "light",
+                "person",
+                "weather",
+                "alarm_control_panel",
+                "sensor",
+                "calendar",
+            }
+        ),
+        "_check_weather_forecast_warning": frozenset(
+            {"binary_sensor", "weather", "clock"}
+        ),
+    }
+
     _STATE_CHANGE_DEBOUNCE_KEY = "mha:insight:debounce:{entity}"
     _STATE_CHANGE_DEBOUNCE_SECONDS = 60  # Max 1 Check pro Entity pro 60s
 
@@ -305,9 +409,11 @@ class InsightEngine:
             len(check_methods),
         )
 
-        # Daten sammeln und Checks ausfuehren
+        # Daten aus dem Snapshot und Checks ausfuehren
         try:
-            data = await self._gather_data()
+            data = await self._current_data(
+                need_calendar=self._needs_calendar(check_methods)
+            )
             if not data.get("states"):
                 return
             for method_name in check_methods:
@@ -369,6 +475,10 @@ class InsightEngine:
         self.check_heating_vs_sun = insight_checks_cfg.get("heating_vs_sun", True)
         self.check_forgotten_devices = insight_checks_cfg.get("forgotten_devices", True)
         self._dedup_enabled = insight_checks_cfg.get("deduplication", True)
+        self._change_driven = insight_checks_cfg.get("change_driven", True)
+        self._full_sweep_interval = (
+            insight_checks_cfg.get("full_sweep_minutes", 180) * 60
+        )
 
         thresholds = cfg.get("thresholds", {})
         self.frost_temp = thresholds.get("frost_temp_c", 2)
@@ -484,21 +594,9 @@ class InsightEngine:
     # ------------------------------------------------------------------
 
     async def _gather_data(self) -> dict:
-        """Sammelt alle benoetigten Daten parallel."""
-        data = {
-            "states": [],
-            "calendar_events": [],
-            "weather": None,
-            "forecast": [],
-            "open_windows": [],
-            "open_doors": [],
-            "lights_on": [],
-            "climate": [],
-            "persons_home": [],
-            "persons_away": [],
-            "alarm_state": None,
-            "temperatures": {},
-        }
+        """Voll-Abruf: laedt alle States neu in den Snapshot, dazu Kalender."""
+        data = self._build_data()
+        data["states"] = []
 
         try:
             # HA States (ein Call fuer alles)
@@ -506,101 +604,224 @@ class InsightEngine:
             if not states:
                 return data
 
-            data["states"] = states
+            self._load_snapshot(states)
+            data = self._build_data()
 
-            # States durchparsen
-            for s in states:
-                eid = s.get("entity_id", "")
-                state = s.get("state", "")
-                attrs = s.get("attributes", {})
+            # Kalender-Events (naechste 24h) — States durchreichen, kein doppelter API-Call
+            try:
+                self._calendar_events = await self._get_upcoming_events(states=states)
+                self._calendar_loaded_at = time.monotonic()
+                data["calendar_events"] = self._calendar_events
+            except Exception as e:
+                logger.debug("Kalender-Abfrage fehlgeschlagen: %s", e)
 
-                # Wetter
-                if eid.startswith("weather.") and not data["weather"]:
-                    data["weather"] = {
-                        "condition": state,
-                        "temp": attrs.get("temperature"),
-                        "humidity": attrs.get("humidity"),
-                    }
-                    forecast = attrs.get("forecast", [])
-                    if forecast:
-                        data["forecast"] = forecast[:5]
-
-                # Offene Fenster
-                elif (
-                    eid.startswith("binary_sensor.")
-                    and state == "on"
-                    and any(kw in eid for kw in ("window", "fenster"))
-                ):
-                    name = attrs.get("friendly_name", eid)
-                    data["open_windows"].append(name)
-
-                # Offene Türen
-                elif (
-                    eid.startswith("binary_sensor.")
-                    and state == "on"
-                    and any(kw in eid for kw in ("door", "tuer", "eingang"))
-                ):
-                    # Ausschluss: Garagentore, Briefkasten etc.
-                    if not any(x in eid for x in ("garage", "briefkasten", "mailbox")):
-                        name = attrs.get("friendly_name", eid)
-                        data["open_doors"].append(name)
-
-                # Lichter an
-                elif eid.startswith("light.") and state == "on":
-                    name = attrs.get("friendly_name", eid)
-                    data["lights_on"].append(name)
-
-                # Climate / Heizung
-                elif eid.startswith("climate.") and state != "unavailable":
-                    data["climate"].append(
-                        {
-                            "entity_id": eid,
-                            "name": attrs.get("friendly_name", eid),
-                            "state": state,
-                            "current_temp": attrs.get("current_temperature"),
-                            "target_temp": attrs.get("temperature"),
-                            "preset_mode": attrs.get("preset_mode", ""),
-                            "hvac_action": attrs.get("hvac_action", ""),
-                        }
-                    )
+        except Exception as e:
+            logger.error("Datensammlung fehlgeschlagen: %s", e)
 
-                # Personen
-                elif eid.startswith("person."):
-                    name = attrs.get("friendly_name", eid)
-                    if state == "home":
-                        data["persons_home"].append(name)
-                    else:
-                        data["persons_away"].append(name)
+        return data
 
-                # Alarm
-                elif eid.startswith("alarm_control_panel."):
-                    data["alarm_state"] = state
+    async def _current_data(self, need_calendar: bool = True) -> dict:
+        """Daten aus dem Snapshot — HA wird nur fuer veraltete Entities gefragt.
 
-                # Temperatur-Sensoren
-                elif (
-                    eid.startswith("sensor.")
-                    and "temperature" in eid
-                    and state not in ("unavailable", "unknown", "")
-                ):
-                    try:
-                        data["temperatures"][eid] = {
-                            "name": attrs.get("friendly_name", eid),
-                            "value": float(state),
-                        }
-                    except (ValueError, TypeError):
-                        pass
+        Ohne geladenen Snapshot (Start, Change-Driven aus) wird voll gesammelt.
+        """
+        if not self._snapshot_loaded or not self._change_driven:
+            return await self._gather_data()
 
-            # Kalender-Events (naechste 24h) — States durchreichen, kein doppelter API-Call
+        await self._refresh_stale_entities()
+        data = self._build_data()
+        if (
+            need_calendar
+            and time.monotonic() - self._calendar_loaded_at > _CALENDAR_TTL_SECONDS
+        ):
             try:
-                calendar_events = await self._get_upcoming_events(states=states)
-                data["calendar_events"] = calendar_events
+                self._calendar_events = await self._get_upcoming_events(
+                    states=data["states"]
+                )
+                self._calendar_loaded_at = time.monotonic()
             except Exception as e:
                 logger.debug("Kalender-Abfrage fehlgeschlagen: %s", e)
+        data["calendar_events"] = self._calendar_events
+        return data
 
-        except Exception as e:
-            logger.error("Datensammlung fehlgeschlagen: %s", e)
+    async def _refresh_stale_entities(self) -> None:
+        """Holt Entities nach, deren Aenderung ohne State-Objekt gemeldet wurde."""
+        if not self._stale_entities:
+            return
+        stale, self._stale_entities = self._stale_entities, set()
+        if len(stale) > _MAX_STALE_REFRESH:
+            try:
+                states = await self.ha.get_states()
+                if states:
+                    self._load_snapshot(states)
+            except Exception as e:
+                logger.debug("Snapshot-Refresh fehlgeschlagen: %s", e)
+            return
+        eids = sorted(stale)
+        results = await asyncio.gather(
+            *(self.ha.get_state(eid) for eid in eids), return_exceptions=True
+        )
+        for eid, state in zip(eids, results):
+            if isinstance(state, dict):
+                self._apply_state(eid, state)
 
-        return data
+    # ------------------------------------------------------------------
+    # Entity-Snapshot + Aggregate (inkrementell gepflegt)
+    # ------------------------------------------------------------------
+
+    def note_state(self, entity_id: str, state: Optional[dict] = None) -> None:
+        """Nimmt eine State-Aenderung (auch reine Attribut-Aenderung) auf.
+
+        Aktualisiert Snapshot und Aggregate und markiert die Domain als
+        dirty, damit der naechste Zyklus nur die betroffenen Checks prueft.
+        Ohne State-Objekt wird die Entity beim naechsten Zyklus nachgeladen.
+        """
+        self._dirty_sources.add(entity_id.split(".", 1)[0])
+        if not self._snapshot_loaded:
+            return
+        if isinstance(state, dict) and "state" in state:
+            self._apply_state(entity_id, state)
+        else:
+            self._stale_entities.add(entity_id)
+
+    def _load_snapshot(self, states: list[dict]) -> None:
+        self._entities = {}
+        self._aggregates = {name: {} for name in _AGGREGATES}
+        self._entity_bucket = {}
+        self._stale_entities = set()
+        for s in states:
+            eid = s.get("entity_id", "")
+            if eid:
+                self._apply_state(eid, s)
+        self._snapshot_loaded = True
+
+    def _apply_state(self, entity_id: str, state: dict) -> None:
+        """Aktualisiert Snapshot und Aggregate fuer eine Entity.
+
+        Bleibt der Bucket gleich, wird der Wert an seiner Position ersetzt:
+        die Reihenfolge der Aggregate folgt der ersten Erfassung (wie die
+        State-Liste) und nicht der Update-Reihenfolge — "weather" bleibt
+        die erste Wetter-Entity, "alarm_state" die letzte Alarmanlage.
+        """
+        self._entities[entity_id] = state
+        classified = self._classify_state(entity_id, state)
+        bucket = classified[0] if classified else None
+        previous = self._entity_bucket.get(entity_id)
+        if previous and previous != bucket:
+            self._aggregates[previous].pop(entity_id, None)
+            del self._entity_bucket[entity_id]
+        if classified:
+            self._aggregates[bucket][entity_id] = classified[1]
+            self._entity_bucket[entity_id] = bucket
+
+    @staticmethod
+    def _classify_state(eid: str, s: dict) -> Optional[tuple[str, object]]:
+        """Ordnet einen State einem Aggregat-Bucket zu (bucket, wert)."""
+        state = s.get("state", "")
+        attrs = s.get("attributes", {}) or {}
+
+        # Wetter
+        if eid.startswith("weather."):
+            weather = {
+                "condition": state,
+                "temp": attrs.get("temperature"),
+                "humidity": attrs.get("humidity"),
+            }
+            return "weather", (weather, (attrs.get("forecast") or [])[:5])
+
+        # Offene Fenster
+        if (
+            eid.startswith("binary_sensor.")
+            and state == "on"
+            and any(kw in eid for kw in ("window", "fenster"))
+        ):
+            return "open_windows", attrs.get("friendly_name", eid)
+
+        # Offene Türen
+        if (
+            eid.startswith("binary_sensor.")
+            and state == "on"
+            and any(kw in eid for kw in ("door", "tuer", "eingang"))
+        ):
+            # Ausschluss: Garagentore, Briefkasten etc.
+            if not any(x in eid for x in ("garage", "briefkasten", "mailbox")):
+                return "open_doors", attrs.get("friendly_name", eid)
+            return None
+
+        # Lichter an
+        if eid.startswith("light.") and state == "on":
+            return "lights_on", attrs.get("friendly_name", eid)
+
+        # Climate / Heizung
+        if eid.startswith("climate.") and state != "unavailable":
+            return "climate", {
+                "entity_id": eid,
+                "name": attrs.get("friendly_name", eid),
+                "state": state,
+                "current_temp": attrs.get("current_temperature"),
+                "target_temp": attrs.get("temperature"),
+                "preset_mode": attrs.get("preset_mode", ""),
+                "hvac_action": attrs.get("hvac_action", ""),
+            }
+
+        # Personen
+        if eid.startswith("person."):
+            bucket = "persons_home" if state == "home" else "persons_away"
+            return bucket, attrs.get("friendly_name", eid)
+
+        # Alarm
+        if eid.startswith("alarm_control_panel."):
+            return "alarm_state", state
+
+        # Temperatur-Sensoren
+        if (
+            eid.startswith("sensor.")
+            and "temperature" in eid
+            and state not in ("unavailable", "unknown", "")
+        ):
+            try:
+                value = float(state)
+            except (ValueError, TypeError):
+                return None
+            return "temperatures", {
+                "name": attrs.get("friendly_name", eid),
+                "value": value,
+            }
+        return None
+
+    def _build_data(self) -> dict:
+        """Baut das data-Dict fuer die Checks aus Snapshot und Aggregaten."""
+        agg = self._aggregates
+        weather, forecast = next(iter(agg["weather"].values()), (None, []))
+        return {
+            "states": list(self._entities.values()),
+            "calendar_events": [],
+            "weather": weather,
+            "forecast": forecast,
+            "open_windows": list(agg["open_windows"].values()),
+            "open_doors": list(agg["open_doors"].values()),
+            "lights_on": list(agg["lights_on"].values()),
+            "climate": list(agg["climate"].values()),
+            "persons_home": list(agg["persons_home"].values()),
+            "persons_away": list(agg["persons_away"].values()),
+            "alarm_state": next(reversed(agg["alarm_state"].values()), None),
+            "temperatures": dict(agg["temperatures"]),
+        }
+
+    def _is_affected(self, method_name: str, dirty: set[str]) -> bool:
+        """True wenn eine deklarierte Datenquelle des Checks dirty ist."""
+        sources = self._CHECK_SOURCES.get(method_name)
+        if sources is None:
+            return True
+        if "*" in sources and dirty - {"clock"}:
+            return True
+        return not sources.isdisjoint(dirty)
+
+    def _needs_calendar(self, method_names) -> bool:
+        return any(
+            "calendar" in self._CHECK_SOURCES.get(name, ("calendar",))
+            for name in method_names
+        )
 
     async def _get_upcoming_events(self, states: list[dict] = None) -> list[dict]:
         """Holt Kalender-Events der naechsten 24 Stunden."""
@@ -725,14 +946,42 @@ class InsightEngine:
         except Exception as e:
             logger.debug("Checked-Domains speichern fehlgeschlagen: %s", e)
 
-    async def _run_all_checks(self) -> list[dict]:
-        """Fuehrt alle aktivierten Checks aus."""
-        data = await self._gather_data()
+    async def _run_all_checks(self, full: bool = False) -> list[dict]:
+        """Fuehrt die aktivierten Checks aus.
+
+        Im Normalfall nur die Checks, deren Datenquellen seit dem letzten
+        Zyklus dirty wurden (plus zeitabhaengige). Alle full_sweep_minutes
+        (oder ohne Snapshot) laeuft ein voller Sweep als Sicherheitsnetz.
+        """
+        now = time.monotonic()
+        full = (
+            full
+            or not self._change_driven
+            or not self._snapshot_loaded
+            or now - self._last_full_sweep >= self._full_sweep_interval
+        )
+        dirty, self._dirty_sources = self._dirty_sources | {"clock"}, set()
+        check_methods = self._get_check_list()
+        if full:
+            data = await self._gather_data()
+            if data["states"]:
+                self._last_full_sweep = now
+        else:
+            check_methods = [
+                (enabled, method)
+                for enabled, method in check_methods
+                if self._is_affected(method.__name__, dirty)
+            ]
+            data = await self._current_data(
+                need_calendar=self._needs_calendar(
+                    method.__name__ for enabled, method in check_methods if enabled
+                )
+            )
         if not data["states"]:
             return []
 
-        # E5: Gelernte Muster aus LearningObserver einbeziehen
-        if self.learning_observer and hasattr(
+        # E5: Gelernte Muster aus LearningObserver einbeziehen (nur im Sweep)
+        if full and self.learning_observer and hasattr(
             self.learning_observer, "get_learning_report"
         ):
             try:
@@ -746,8 +995,6 @@ class InsightEngine:
         insights = []
         self._current_cycle_entities.clear()
 
-        check_methods = self._get_check_list()
-
         for enabled, method in check_methods:
             if not enabled:
                 continue
@@ -770,12 +1017,13 @@ class InsightEngine:
             except Exception as e:
                 logger.warning("Check %s fehlgeschlagen: %s", method.__name__, e)
 
-        # Kreuzreferenz mit LearningObserver
-        try:
-            learning_insights = await self._check_learning_pattern_insights()
-            insights.extend(learning_insights)
-        except Exception as e:
-            logger.debug("Learning insight check: %s", e)
+        # Kreuzreferenz mit LearningObserver (Muster aendern sich langsam)
+        if full:
+            try:
+                learning_insights = await self._check_learning_pattern_insights()
+                insights.extend(learning_insights)
+            except Exception as e:
+                logger.debug("Learning insight check: %s", e)
 
         # MCU Sprint 3: Recurring-Problem-Erkennung
         for insight in insights:
@@ -1573,7 +1821,7 @@ class InsightEngine:
             return []
 
         try:
-            data = await self._gather_data()
+            data = await self._current_data()
             if not data["states"]:
                 return []
 
@@ -0,0 +1,315 @@
+"""
+Intent Matcher — Ein kompilierter Multi-Pattern-Automat fuer alle Keyword-Tabellen.
+
+Bisher hat jede Klassifikations-Stufe (PreClassifier, ModelRouter, Brain-
+Intent/Tool-Selektion, Device-/Status-Erkennung) den Text selbst
+kleingeschrieben und gegen ihre eigenen Keyword-Listen gescannt — pro
+Anfrage O(Keywords x Text) mehrfach hintereinander.
+
+Hier werden alle Tabellen in EINEN Aho-Corasick-Automaten kompiliert. Ein
+einziger Durchlauf ueber den Text liefert einen Feature-Vektor
+(IntentFeatures: Tabelle -> gematchte Keywords), den alle Klassifikatoren
+konsumieren. Ergebnisse werden pro Utterance gecacht (LRU), d.h. alle
+Stufen einer Anfrage teilen sich denselben Scan.
+
+Match-Modi pro Tabelle (entsprechen den bisherigen Einzel-Checks):
+  - sub:        kw in text
+  - word:       re.search(r"\\bkw\\b", text)
+  - short_word: word fuer Keywords <= 3 Zeichen, sonst sub (ModelRouter)
+  - lead:       text.startswith(kw) or f" {kw}" in text
+  - start:      text.startswith(kw)
+
+Text-Normalisierung: lower().strip(). Tabellen mit fold_sharp_s=True werden
+gegen die ß→ss-Variante geprueft (PreClassifier, Device-Erkennung).
+"""
+
+import logging
+import time
+from collections import OrderedDict, deque
+from dataclasses import dataclass, field
+from typing import Iterable, Optional
+
+logger = logging.getLogger(__name__)
+
+MATCH_MODES = frozenset({"sub", "word", "short_word", "lead", "start"})
+
+_FEATURE_CACHE_SIZE = 128
+
+
+def _is_word_char(ch: str) -> bool:
+    """Entspricht \\w in Python-Regex (Unicode)."""
+    return ch.isalnum() or ch == "_"
+
+
+@dataclass(frozen=True)
+class IntentFeatures:
+    """Feature-Vektor einer Utterance: welche Keywords aus welcher Tabelle matchen."""
+
+    text: str  # lower().strip()
+    word_count: int
+    hits: dict = field(default_factory=dict)  # Tabelle -> tuple(Keywords)
+
+    def has(self, table: str) -> bool:
+        """True wenn mindestens ein Keyword der Tabelle matcht."""
+        return bool(self.hits.get(table))
+
+    def matches(self, table: str) -> tuple:
+        """Alle gematchten Keywords der Tabelle (in Tabellen-Reihenfolge)."""
+        return self.hits.get(table, ())
+
+    def first(self, table: str) -> Optional[str]:
+        """Erstes gematchtes Keyword (in Tabellen-Reihenfolge) oder None."""
+        found = self.hits.get(table)
+        return found[0] if found else None
+
+
+@dataclass
+class _Table:
+    keywords: tuple
+    mode: str
+    fold_sharp_s: bool
+    source: object = None  # Original-Objekt (Identitaets-Check bei register)
+
+
+class IntentMatcher:
+    """Registry aller Keyword-Tabellen + kompilierter Aho-Corasick-Automat."""
+
+    def __init__(self, cache_size: int = _FEATURE_CACHE_SIZE):
+        self._tables: dict[str, _Table] = {}
+        self._dirty = True
+        # Automat: goto[state] = {char: state}, out[state] = [keyword_id, ...]
+        self._goto: list[dict] = [{}]
+        self._fail: list[int] = [0]
+        self._out: list[list] = [[]]
+        # keyword_id -> (laenge, [(tabelle, index_in_tabelle), ...])
+        self._kw_info: list[tuple] = []
+        # Leere Keywords matchen immer (wie "" in text)
+        self._always: dict[str, set] = {}
+        self._cache: OrderedDict = OrderedDict()
+        self._cache_size = cache_size
+        # Metriken
+        self._scans = 0
+        self._cache_hits = 0
+        self._scan_ns: deque = deque(maxlen=200)
+        self._builds = 0
+
+    # ------------------------------------------------------------------
+    # Registry
+    # ------------------------------------------------------------------
+
+    def register(
+        self,
+        name: str,
+        keywords: Iterable[str],
+        mode: str = "sub",
+        fold_sharp_s: bool = False,
+    ) -> None:
+        """Registriert (oder aktualisiert) eine Keyword-Tabelle.
+
+        Idempotent: gleiche Liste (Identitaet oder Inhalt) → kein Rebuild.
+        Konfigurierbare Listen koennen deshalb vor jeder Nutzung erneut
+        registriert werden. Keywords werden nicht normalisiert — wie bisher
+        muessen sie kleingeschrieben sein um gegen den Text zu matchen.
+        """
+        if mode not in MATCH_MODES:
+            raise ValueError(f"Unbekannter Match-Modus: {mode}")
+        existing = self._tables.get(name)
+        if (
+            existing is not None
+            and existing.source is keywords
+            and existing.mode == mode
+            and existing.fold_sharp_s == fold_sharp_s
+            and len(existing.keywords) == len(keywords)
+        ):
+            return
+        kw_tuple = tuple(str(k) for k in keywords)
+        if (
+            existing is not None
+            and existing.keywords == kw_tuple
+            and existing.mode == mode
+            and existing.fold_sharp_s == fold_sharp_s
+        ):
+            existing.source = keywords
+            return
+        self._tables[name] = _Table(
+            keywords=kw_tuple, mode=mode, fold_sharp_s=fold_sharp_s, source=keywords
+        )
+        self._dirty = True
+
+    def tables(self) -> list[str]:
+        """Namen aller registrierten Tabellen."""
+        return sorted(self._tables)
+
+    # ------------------------------------------------------------------
+    # Automat
+    # ------------------------------------------------------------------
+
+    def _build(self) -> None:
+        """Kompiliert alle Tabellen in einen Aho-Corasick-Automaten."""
+        goto: list[dict] = [{}]
+        out: list[list] = [[]]
+        kw_ids: dict[str, int] = {}
+        kw_info: list[tuple] = []
+        always: dict[str, set] = {}
+
+        for name, table in self._tables.items():
+            for idx, kw in enumerate(table.keywords):
+                if not kw:
+                    always.setdefault(name, set()).add(idx)
+                    continue
+                kid = kw_ids.get(kw)
+                if kid is None:
+                    kid = len(kw_info)
+                    kw_ids[kw] = kid
+                    kw_info.append((len(kw), []))
+                    state = 0
+                    for ch in kw:
+                        nxt = goto[state].get(ch)
+                        if nxt is None:
+                            nxt = len(goto)
+                            goto[state][ch] = nxt
+                            goto.append({})
+                            out.append([])
+                        state = nxt
+                    out[state].append(kid)
+                kw_info[kid][1].append((name, idx))
+
+        # Failure-Links per BFS, Outputs entlang der Fail-Kette zusammenfuehren
+        fail = [0] * len(goto)
+        queue = deque()
+        for nxt in goto[0].values():
+            queue.append(nxt)
+        while queue:
+            state = queue.popleft()
+            for ch, nxt in goto[state].items():
+                queue.append(nxt)
+                f = fail[state]
+                while f and ch not in goto[f]:
+                    f = fail[f]
+                fail[nxt] = goto[f].get(ch, 0)
+                if out[fail[nxt]]:
+                    out[nxt] = out[nxt] + out[fail[nxt]]
+
+        self._goto = goto
+        self._fail = fail
+        self._out = out
+        self._kw_info = kw_info
+        self._always = always
+        self._cache.clear()
+        self._dirty = False
+        self._builds += 1
+        logger.debug(
+            "IntentMatcher kompiliert: %d Tabellen, %d Keywords, %d Zustaende",
+            len(self._tables),
+            len(kw_info),
+            len(goto),
+        )
+
+    def _scan(self, text: str, hits: dict, fold: Optional[bool] = None) -> None:
+        """Ein Durchlauf ueber den Text. Sammelt Treffer-Indizes pro Tabelle.
+
+        fold=None wertet alle Tabellen aus, True/False nur Tabellen mit
+        passendem fold_sharp_s-Flag.
+        """
+        goto = self._goto
+        fail = self._fail
+        out = self._out
+        kw_info = self._kw_info
+        tables = self._tables
+        mode_ok = self._mode_ok
+        n = len(text)
+        state = 0
+        for i, ch in enumerate(text):
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            if not out[state]:
+                continue
+            for kid in out[state]:
+                length, regs = kw_info[kid]
+                start = i - length + 1
+                for name, idx in regs:
+                    table = tables[name]
+                    if fold is not None and table.fold_sharp_s != fold:
+                        continue
+                    if not mode_ok(table.mode, text, start, i + 1, n, length):
+                        continue
+                    hits.setdefault(name, set()).add(idx)
+
+    @staticmethod
+    def _mode_ok(mode: str, text: str, start: int, end: int, n: int, length: int) -> bool:
+        if mode == "sub":
+            return True
+        if mode == "start":
+            return start == 0
+        if mode == "lead":
+            return start == 0 or text[start - 1] == " "
+        if mode == "short_word" and length > 3:
+            return True
+        # word / short_word: \b an beiden Enden (Regex-Semantik)
+        before = start > 0 and _is_word_char(text[start - 1])
+        first = _is_word_char(text[start])
+        if before == first:
+            return False
+        last = _is_word_char(text[end - 1])
+        after = end < n and _is_word_char(text[end])
+        return last != after
+
+    # ------------------------------------------------------------------
+    # Analyse
+    # ------------------------------------------------------------------
+
+    def analyze(self, text: str) -> IntentFeatures:
+        """Berechnet (oder liefert gecacht) den Feature-Vektor einer Utterance."""
+        if self._dirty:
+            self._build()
+        norm = (text or "").lower().strip()
+        cached = self._cache.get(norm)
+        if cached is not None:
+            self._cache.move_to_end(norm)
+            self._cache_hits += 1
+            return cached
+
+        t0 = time.perf_counter_ns()
+        idx_hits: dict[str, set] = {}
+        for name, idxs in self._always.items():
+            idx_hits[name] = set(idxs)
+        if "ß" in norm:
+            # ß-Faltung: Fold-Tabellen gegen die ss-Variante pruefen
+            self._scan(norm, idx_hits, fold=False)
+            self._scan(norm.replace("ß", "ss"), idx_hits, fold=True)
+        else:
+            self._scan(norm, idx_hits)
+
+        hits = {
+            name: tuple(self._tables[name].keywords[i] for i in sorted(idxs))
+            for name, idxs in idx_hits.items()
+            if idxs
+        }
+        features = IntentFeatures(text=norm, word_count=len(norm.split()), hits=hits)
+        self._scan_ns.append(time.perf_counter_ns() - t0)
+        self._scans += 1
+
+        self._cache[norm] = features
+        if len(self._cache) > self._cache_size:
+            self._cache.popitem(last=False)
+        return features
+
+    def stats(self) -> dict:
+        """Klassifikations-Kosten: Scans, Cache-Treffer, Scan-Dauer (µs)."""
+        samples = sorted(self._scan_ns)
+        result = {
+            "tables": len(self._tables),
+            "keywords": len(self._kw_info),
+            "builds": self._builds,
+            "scans": self._scans,
+            "cache_hits": self._cache_hits,
+        }
+        if samples:
+            result["scan_us_p50"] = round(samples[len(samples) // 2] / 1000, 1)
+            result["scan_us_max"] = round(samples[-1] / 1000, 1)
+        return result
+
+
+# Modul-Level Singleton — alle Klassifikatoren registrieren hier ihre Tabellen
+intent_matcher = IntentMatcher()
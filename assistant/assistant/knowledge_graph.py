@@ -7,6 +7,12 @@ als Redis-Sets/Hashes. Ermoeglicht 2-Hop-Queries wie:
 
 Keine externe Dependency (kein NetworkX) — nutzt Redis-Primitiven fuer
 Graph-Traversal. Nodes und Edges werden ueber Pipelines atomar geschrieben.
+
+Lesepfad (Prompt-Aufbau): Kanten-Metadaten werden gebuendelt gelesen
+(Pipeline/HMGET statt HGET pro Kante), 2-Hop-Traversals laufen in einem
+Lua-Aufruf. Optional haelt ein prozesslokaler Adjazenz-Cache pro Relation
+alle Kanten samt Metadaten (HGETALL pro Relation, gefiltert ueber die
+out:-Sets); add_edge, increment_edge und prune_weak_edges halten ihn aktuell.
 """
 
 import json
@@ -24,6 +30,24 @@ _PREFIX = "mha:kg"
 _MAX_NODES = 1000
 _EDGE_TTL = 180 * 86400  # 180 Tage
 
+# 2-Hop in einem Server-Aufruf: start -[rel1]-> mid -[rel2]-> Ziel (dedupliziert)
+_LUA_2HOP = """
+local result, seen = {}, {}
+for _, mid in ipairs(redis.call('SMEMBERS', KEYS[1])) do
+  for _, target in ipairs(redis.call('SMEMBERS', ARGV[1] .. mid)) do
+    if not seen[target] then
+      seen[target] = true
+      result[#result + 1] = target
+    end
+  end
+end
+return result
+"""
+
+
+def _text(value) -> str:
+    return value.decode() if isinstance(value, bytes) else value
+
 
 class KnowledgeGraph:
     """Redis-basierter Wissensgraph fuer Relationen zwischen Entitaeten."""
@@ -33,6 +57,10 @@ class KnowledgeGraph:
         cfg = yaml_config.get("knowledge_graph", {})
         self.enabled = cfg.get("enabled", True)
         self.max_nodes = cfg.get("max_nodes", _MAX_NODES)
+        # Adjazenz-Cache: relation -> (geladen_um, {from_id: {to_id: meta}})
+        # 0 = aus (jede Abfrage geht an Redis)
+        self.cache_ttl = cfg.get("cache_ttl_seconds", 300)
+        self._edge_cache: dict[str, tuple[float, dict[str, dict[str, dict]]]] = {}
 
     async def initialize(self, redis_client: Optional[aioredis.Redis] = None):
         """Initialisiert den Graphen mit Redis-Verbindung."""
@@ -147,6 +175,7 @@ class KnowledgeGraph:
         pipe.sadd(f"{_PREFIX}:neighbors:{from_id}", to_id)
         pipe.expire(f"{_PREFIX}:neighbors:{from_id}", _EDGE_TTL)
         await pipe.execute()
+        self._cache_put(relation, from_id, to_id, meta)
 
     async def increment_edge(
         self, from_id: str, relation: str, to_id: str, delta: float = 0.05
@@ -161,14 +190,135 @@ class KnowledgeGraph:
             data = json.loads(raw)
             data["weight"] = min(1.0, data.get("weight", 0.5) + delta)
             data["updated"] = time.time()
+            meta = json.dumps(data)
             await self.redis.hset(
                 f"{_PREFIX}:edge_meta:{relation}",
                 edge_key,
-                json.dumps(data),
+                meta,
             )
+            self._cache_put(relation, from_id, to_id, meta)
         else:
             await self.add_edge(from_id, relation, to_id, weight=0.5 + delta)
 
+    # ------------------------------------------------------------------
+    # Adjazenz-Cache
+    # ------------------------------------------------------------------
+
+    def _cache_put(self, relation: str, from_id: str, to_id: str, meta: str):
+        """Traegt eine geschriebene Kante in eine bereits geladene Relation ein."""
+        cached = self._edge_cache.get(relation)
+        if cached:
+            cached[1].setdefault(from_id, {})[to_id] = json.loads(meta)
+
+    def invalidate_cache(self, relation: str = ""):
+        """Verwirft den Adjazenz-Cache (eine Relation oder alle)."""
+        if relation:
+            self._edge_cache.pop(relation, None)
+        else:
+            self._edge_cache.clear()
+
+    async def _adjacency(self, relations: tuple) -> dict[str, dict[str, dict]]:
+        """Alle Kanten der Relationen als {from_id: {to_id: meta}}.
+
+        Fehlende oder abgelaufene Relationen werden geladen: HGETALL der
+        Metadaten je Relation, dann SMEMBERS der out:-Sets der Quellknoten
+        (je ein Round-Trip). Massgeblich sind die out:-Sets — sie laufen pro
+        Knoten ab, der Metadaten-Hash nur pro Relation. Felder ohne
+        out:-Eintrag werden dabei aus dem Hash entfernt.
+        """
+        now = time.monotonic()
+        stale = [
+            r
+            for r in relations
+            if r not in self._edge_cache
+            or now - self._edge_cache[r][0] > self.cache_ttl
+        ]
+        if stale:
+            pipe = self.redis.pipeline()
+            for relation in stale:
+                pipe.hgetall(f"{_PREFIX}:edge_meta:{relation}")
+            loaded: dict[str, dict[str, dict[str, dict]]] = {}
+            for relation, raw_edges in zip(stale, await pipe.execute()):
+                adjacency: dict[str, dict[str, dict]] = {}
+                for edge_key, meta_raw in (raw_edges or {}).items():
+                    from_id, sep, to_id = _text(edge_key).partition(">")
+                    if not sep:
+                        continue
+                    try:
+                        meta = json.loads(meta_raw)
+                    except (json.JSONDecodeError, TypeError):
+                        meta = {}
+                    adjacency.setdefault(from_id, {})[to_id] = meta
+                loaded[relation] = adjacency
+
+            sources = [(r, f) for r, adjacency in loaded.items() for f in adjacency]
+            if sources:
+                pipe = self.redis.pipeline()
+                for relation, from_id in sources:
+                    pipe.smembers(f"{_PREFIX}:out:{relation}:{from_id}")
+                orphans: dict[str, list[str]] = {}
+                for (relation, from_id), members in zip(
+                    sources, await pipe.execute()
+                ):
+                    live = {_text(m) for m in members or ()}
+                    edges = loaded[relation][from_id]
+                    for to_id in [t for t in edges if t not in live]:
+                        del edges[to_id]
+                        orphans.setdefault(relation, []).append(f"{from_id}>{to_id}")
+                    if not edges:
+                        del loaded[relation][from_id]
+                if orphans:
+                    pipe = self.redis.pipeline()
+                    for relation, edge_keys in orphans.items():
+                        pipe.hdel(f"{_PREFIX}:edge_meta:{relation}", *edge_keys)
+                    await pipe.execute()
+
+            for relation, adjacency in loaded.items():
+                self._edge_cache[relation] = (now, adjacency)
+        return {r: self._edge_cache[r][1] for r in relations}
+
+    async def _outgoing_with_meta(
+        self, node_id: str, relations: tuple
+    ) -> dict[str, dict[str, dict]]:
+        """Ausgehende Kanten eines Knotens samt Metadaten: {relation: {to_id: meta}}.
+
+        Mit Cache ohne Redis-Zugriff; sonst zwei Round-Trips (SMEMBERS der
+        Relationen, dann HMGET der Metadaten) statt HGET pro Kante.
+        """
+        if self.cache_ttl:
+            adjacency = await self._adjacency(relations)
+            return {r: adjacency[r].get(node_id, {}) for r in relations}
+
+        pipe = self.redis.pipeline()
+        for relation in relations:
+            pipe.smembers(f"{_PREFIX}:out:{relation}:{node_id}")
+        targets = [
+            sorted(_text(m) for m in members or ())
+            for members in await pipe.execute()
+        ]
+
+        pipe = self.redis.pipeline()
+        queued = []
+        for relation, to_ids in zip(relations, targets):
+            if to_ids:
+                pipe.hmget(
+                    f"{_PREFIX}:edge_meta:{relation}",
+                    [f"{node_id}>{t}" for t in to_ids],
+                )
+                queued.append(relation)
+        raw_metas = dict(zip(queued, await pipe.execute())) if queued else {}
+
+        result = {}
+        for relation, to_ids in zip(relations, targets):
+            edges = {}
+            for to_id, meta_raw in zip(to_ids, raw_metas.get(relation) or []):
+                try:
+                    edges[to_id] = json.loads(meta_raw) if meta_raw else {}
+                except (json.JSONDecodeError, TypeError):
+                    edges[to_id] = {}
+            result[relation] = edges
+        return result
+
     # ------------------------------------------------------------------
     # Query Operations
     # ------------------------------------------------------------------
@@ -213,12 +363,23 @@ class KnowledgeGraph:
         if not self.redis:
             return []
 
-        intermediates = await self.get_related(start, rel1, direction="out")
-        results = []
-        for mid in intermediates:
-            targets = await self.get_related(mid, rel2, direction="out")
-            results.extend(targets)
-        return list(set(results))  # Deduplizieren
+        if self.cache_ttl:
+            adjacency = await self._adjacency((rel1, rel2))
+            results = {
+                target
+                for mid in adjacency[rel1].get(start, {})
+                for target in adjacency[rel2].get(mid, {})
+            }
+            return list(results)
+
+        # Ohne Cache: ein Lua-Aufruf statt SMEMBERS pro Zwischenknoten
+        members = await self.redis.eval(
+            _LUA_2HOP,
+            1,
+            f"{_PREFIX}:out:{rel1}:{start}",
+            f"{_PREFIX}:out:{rel2}:",
+        )
+        return [_text(m) for m in members or []]
 
     async def query_context(
         self, person: str, room: str = "", time_slot: str = ""
@@ -235,15 +396,10 @@ class KnowledgeGraph:
 
         results = []
         person_id = f"person:{person}"
+        edges = await self._outgoing_with_meta(person_id, ("prefers", "uses_often"))
 
         # 1. Direkte Praeferenzen der Person
-        prefs = await self.get_related(person_id, "prefers")
-        for pref in prefs:
-            meta_raw = await self.redis.hget(
-                f"{_PREFIX}:edge_meta:prefers",
-                f"{person_id}>{pref}",
-            )
-            meta = json.loads(meta_raw) if meta_raw else {}
+        for pref, meta in edges["prefers"].items():
             # Raum-Filter
             if room and meta.get("room") and meta["room"] != room:
                 continue
@@ -262,13 +418,7 @@ class KnowledgeGraph:
             )
 
         # 2. Geraete die Person oft nutzt
-        devices = await self.get_related(person_id, "uses_often")
-        for dev in devices:
-            meta_raw = await self.redis.hget(
-                f"{_PREFIX}:edge_meta:uses_often",
-                f"{person_id}>{dev}",
-            )
-            meta = json.loads(meta_raw) if meta_raw else {}
+        for dev, meta in edges["uses_often"].items():
             if room and meta.get("room") and meta["room"] != room:
                 continue
             results.append(
@@ -314,6 +464,7 @@ class KnowledgeGraph:
                         pipe.srem(f"{_PREFIX}:in:{relation}:{parts[1]}", parts[0])
                     await pipe.execute()
                     removed += 1
+                    self.invalidate_cache(relation)
 
         if removed:
             logger.info(
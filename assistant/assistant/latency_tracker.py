@@ -74,6 +74,12 @@ class LatencyTracker:
         self._redis = None
         # Phase 2C: Model Router Feedback
         self._model_router = None
+        # Spekulativer Context-Prefetch: Treffer/Fehlschlaege + gesparte Zeit
+        self._prefetch_hits: int = 0
+        self._prefetch_misses: int = 0
+        self._prefetch_saved: deque = deque(maxlen=max_history)
+        # Startup: Init-Dauer pro Subsystem (letzter Start)
+        self._init_timings: dict[str, dict] = {}
 
     def set_redis(self, redis_client) -> None:
         """Setzt den Redis-Client fuer periodisches Stats-Schreiben."""
@@ -119,6 +125,53 @@ class LatencyTracker:
 
         return durations
 
+    def record_prefetch(
+        self, hits: int = 0, misses: int = 0, saved_ms: float = 0.0
+    ) -> None:
+        """Zaehlt Context-Prefetch Treffer/Fehlschlaege und die gesparte Zeit.
+
+        Pro abgeholtem Prefetch (claim) ein Aufruf. saved_ms ist die Summe
+        der Arbeitszeit die vor dem finalen Text bereits erledigt war.
+        """
+        self._prefetch_hits += max(0, hits)
+        self._prefetch_misses += max(0, misses)
+        if hits:
+            self._prefetch_saved.append(round(saved_ms, 1))
+
+    def get_prefetch_stats(self) -> dict:
+        """Gibt Hit-Rate und gesparte Zeit des Context-Prefetch zurueck."""
+        total = self._prefetch_hits + self._prefetch_misses
+        if not total:
+            return {}
+        saved = sorted(self._prefetch_saved)
+        stats = {
+            "hits": self._prefetch_hits,
+            "misses": self._prefetch_misses,
+            "hit_rate": round(self._prefetch_hits / total, 3),
+        }
+        if saved:
+            stats["saved_ms_p50"] = saved[len(saved) // 2]
+            stats["saved_ms_total"] = round(sum(saved), 1)
+        return stats
+
+    def record_init(self, name: str, ms: float, status: str = "ok") -> None:
+        """Speichert die Init-Dauer eines Subsystems (AssistantBrain.initialize)."""
+        self._init_timings[name] = {"ms": round(ms, 1), "status": status}
+
+    def get_init_stats(self) -> dict:
+        """Init-Dauern des letzten Starts, langsamste zuerst."""
+        if not self._init_timings:
+            return {}
+        ordered = sorted(
+            self._init_timings.items(), key=lambda i: i[1]["ms"], reverse=True
+        )
+        return {
+            "steps": len(ordered),
+            "serial_ms": round(sum(v["ms"] for _, v in ordered), 1),
+            "failed": [n for n, v in ordered if v["status"] != "ok"],
+            "slowest": {n: v["ms"] for n, v in ordered[:10]},
+        }
+
     def _ensure_sorted(self) -> None:
         """Baut sortierte Listen fuer Percentil-Berechnung (nur wenn dirty)."""
         if not self._dirty:
@@ -163,6 +216,12 @@ class LatencyTracker:
                 "min": round(min(vals), 1),
                 "max": round(max(vals), 1),
             }
+        prefetch = self.get_prefetch_stats()
+        if prefetch:
+            stats["prefetch"] = prefetch
+        startup = self.get_init_stats()
+        if startup:
+            stats["startup"] = startup
         return stats
 
     async def flush_to_redis(self) -> None:
@@ -197,6 +256,19 @@ class LatencyTracker:
                 f"p95={s['p95']:>7.0f}ms  p99={s['p99']:>7.0f}ms  "
                 f"(n={s['count']}, min={s['min']:.0f}, max={s['max']:.0f})"
             )
+        pf = stats.get("prefetch")
+        if pf:
+            lines.append(
+                f"  {'prefetch':20s}  hit_rate={pf['hit_rate']:.0%}  "
+                f"(hits={pf['hits']}, misses={pf['misses']}, "
+                f"saved_p50={pf.get('saved_ms_p50', 0):.0f}ms)"
+            )
+        su = stats.get("startup")
+        if su:
+            lines.append(
+                f"  {'startup':20s}  serial={su['serial_ms']:.0f}ms  "
+                f"(steps={su['steps']}, failed={len(su['failed'])})"
+            )
         return "\n".join(lines)
 
 
@@ -12,6 +12,7 @@ Ergaenzt die bestehende anticipation.py mit manuellen Aktions-Mustern.
 """
 
 import asyncio
+import hashlib
 import json
 import logging
 from datetime import datetime, timezone
@@ -20,6 +21,7 @@ from zoneinfo import ZoneInfo
 
 import redis.asyncio as aioredis
 
+from .action_journal import KIND_MANUAL
 from .config import get_person_title
 
 from .config import yaml_config
@@ -79,6 +81,8 @@ class LearningObserver:
         self.redis: Optional[aioredis.Redis] = None
         self._ollama = None
         self._notify_callback = None
+        self._journal = None
+        self._manual_cursor = None
 
         learn_cfg = yaml_config.get("learning", {})
         self.enabled = learn_cfg.get("enabled", True)
@@ -99,6 +103,24 @@ class LearningObserver:
         self._ollama = ollama_client
         logger.info("LearningObserver: LLM-Rewrite aktiviert")
 
+    def set_action_journal(self, journal):
+        """Verbindet das ActionJournal (Schreiben + inkrementelles Lesen)."""
+        self._journal = journal
+        self._manual_cursor = journal.cursor((KIND_MANUAL,), window=500)
+
+    async def _recent_manual_actions(self, limit: int) -> list[dict]:
+        """Letzte manuelle Aktionen, neueste zuerst (Journal oder Liste)."""
+        if self._manual_cursor and self._manual_cursor.ready:
+            await self._manual_cursor.refresh()
+            return self._manual_cursor.latest(limit)
+        actions = []
+        for raw in await self.redis.lrange(KEY_MANUAL_ACTIONS, 0, limit - 1):
+            try:
+                actions.append(json.loads(raw if isinstance(raw, str) else raw.decode()))
+            except (json.JSONDecodeError, UnicodeDecodeError):
+                continue
+        return actions
+
     async def boost_pattern_confidence(
         self,
         action_type: str,
@@ -163,6 +185,9 @@ class LearningObserver:
         # Kurzzeitiger Marker (30 Sek) um state_changed Events zu ignorieren
         await self.redis.setex(f"{JARVIS_ACTION_KEY}:{entity_id}", 30, "1")
 
+    # Domains deren manuelle Aenderungen beobachtet werden
+    _OBSERVED_DOMAINS = ("light.", "cover.", "climate.", "switch.", "media_player.")
+
     async def observe_state_change(
         self, entity_id: str, new_state: str, old_state: str, person: str = ""
     ):
@@ -171,6 +196,12 @@ class LearningObserver:
         Wird von proactive.py bei jedem state_changed aufgerufen.
         Ignoriert Jarvis-gesteuerte Aenderungen.
 
+        Redis-Zugriffe sind gebuendelt, damit Szenen-Aktivierungen (dutzende
+        Events pro Sekunde) nicht hunderte Round-Trips erzeugen:
+          1. Lese-Pipeline: Marker, Kontext, Vorschlags-Flags, letzte Aktionen
+          2. Schreib-Pipeline: Aktion speichern, alle Zaehler erhoehen
+          3. Nur bei Treffern: Vorschlags-Marker/Cluster-Details setzen
+
         Args:
             entity_id: HA Entity-ID
             new_state: Neuer Zustand
@@ -181,15 +212,7 @@ class LearningObserver:
             return
 
         # Nur relevante Domains
-        if not any(
-            entity_id.startswith(d)
-            for d in ["light.", "cover.", "climate.", "switch.", "media_player."]
-        ):
-            return
-
-        # Jarvis-Aktion? → Ignorieren
-        jarvis_marker = await self.redis.get(f"{JARVIS_ACTION_KEY}:{entity_id}")
-        if jarvis_marker:
+        if not entity_id.startswith(self._OBSERVED_DOMAINS):
             return
 
         # Triviale Aenderungen ignorieren
@@ -209,31 +232,53 @@ class LearningObserver:
             action_key = f"{entity_id}:{new_state}"
             person_prefix = f"{person}:" if person else ""
             time_slot = f"{hour:02d}:{(minute // 5) * 5:02d}"  # 5-Min-Slots
+            slot_key = f"{person_prefix}{action_key}:{time_slot}"
+            person_key = person or "global"
 
+            # --- Round-Trip 1: alles lesen was die Checks brauchen ---
+            reads = self.redis.pipeline(transaction=False)
+            reads.get(f"{JARVIS_ACTION_KEY}:{entity_id}")
             # F-053: Cycle detection — skip entities+timeslots that have already been
             # automated via a previous suggestion. Without this, the automation fires
             # a state change, which the observer counts again, leading to duplicate
             # suggestions or infinite observe->suggest->automate->observe loops.
-            automated_key = f"{KEY_AUTOMATED}:{person_prefix}{action_key}:{time_slot}"
-            if await self.redis.get(automated_key):
+            reads.get(f"{KEY_AUTOMATED}:{slot_key}")
+            reads.get(f"{KEY_AUTOMATED}:{slot_key}:{weekday}")
+            # Kontext: Wetter und Anwesenheit fuer kontextbasierte Muster
+            reads.get("mha:weather:current_condition")
+            reads.get("mha:presence:away_persons")
+            reads.get(f"{KEY_SUGGESTED}:{slot_key}")
+            reads.get(f"{KEY_SUGGESTED}:weekday:{slot_key}:{weekday}")
+            # Letzte 9 Aktionen — zusammen mit der aktuellen die 10 fuers Clustering
+            reads.lrange(KEY_MANUAL_ACTIONS, 0, 8)
+            reads.get(self._COMBO_KEY.format(person=person_key))
+            reads.get(f"mha:learning:combo_cooldown:{person_key}")
+            (
+                jarvis_marker,
+                automated,
+                weekday_automated,
+                _wc,
+                _away,
+                daily_suggested,
+                weekday_suggested,
+                recent_raw,
+                combo_raw,
+                combo_cooldown,
+            ) = await reads.execute()
+
+            # Jarvis-Aktion? → Ignorieren
+            if jarvis_marker or automated:
                 return
 
-            # Kontext: Wetter und Anwesenheit fuer kontextbasierte Muster
             weather_condition = ""
-            anyone_home = True
-            try:
-                _wc = await self.redis.get("mha:weather:current_condition")
-                if _wc:
-                    weather_condition = (
-                        _wc.decode("utf-8", errors="ignore")
-                        if isinstance(_wc, bytes)
-                        else str(_wc)
-                    )[:30]
-                _away = await self.redis.get("mha:presence:away_persons")
-                if _away:
-                    anyone_home = False  # Jemand ist als abwesend markiert
-            except Exception:
-                pass  # Kontext ist optional — kein Fehler loggen
+            if _wc:
+                weather_condition = (
+                    _wc.decode("utf-8", errors="ignore")
+                    if isinstance(_wc, bytes)
+                    else str(_wc)
+                )[:30]
+            weather_norm = self._normalize_weather(weather_condition)
+            anyone_home = not _away  # Jemand ist als abwesend markiert
 
             action = {
                 "entity_id": entity_id,
@@ -245,168 +290,244 @@ class LearningObserver:
                 "weather": weather_condition,
                 "anyone_home": anyone_home,
             }
+            cluster = self._temporal_cluster(action, recent_raw or [])
+            combo_actions = self._combo_window(entity_id, combo_raw)
 
+            # --- Round-Trip 2: speichern + alle Zaehler erhoehen ---
+            # EXPIRE NX setzt die TTL nur beim ersten Auftreten (wie bisher
+            # "TTL nur wenn noch keine gesetzt")
+            writes = self.redis.pipeline(transaction=False)
             # In Redis-Liste speichern (max 5000 letzte Aktionen, 365 Tage)
-            await self.redis.lpush(KEY_MANUAL_ACTIONS, json.dumps(action))
-            await self.redis.ltrim(KEY_MANUAL_ACTIONS, 0, 4999)
-            await self.redis.expire(KEY_MANUAL_ACTIONS, 365 * 86400)
+            writes.lpush(KEY_MANUAL_ACTIONS, json.dumps(action))
+            writes.ltrim(KEY_MANUAL_ACTIONS, 0, 4999)
+            writes.expire(KEY_MANUAL_ACTIONS, 365 * 86400)
+            pattern_key = f"{KEY_PATTERNS}:{slot_key}"
+            writes.incr(pattern_key)
+            writes.expire(pattern_key, 365 * 86400, nx=True)
+            if not weekday_automated:
+                weekday_key = f"{KEY_WEEKDAY_PATTERNS}:{slot_key}:{weekday}"
+                writes.incr(weekday_key)
+                writes.expire(weekday_key, 60 * 86400, nx=True)
+            if weather_norm:
+                weather_key = f"mha:learning:weather_patterns:{person_prefix}{action_key}:{weather_norm}"
+                writes.incr(weather_key)
+                writes.expire(weather_key, 120 * 86400, nx=True)
+                writes.get(
+                    f"{KEY_SUGGESTED}:weather:{person_prefix}{action_key}:{weather_norm}"
+                )
+            if cluster:
+                cluster_count_key = (
+                    f"mha:learning:temporal_clusters:{person_key}:{cluster[0]}"
+                )
+                writes.incr(cluster_count_key)
+                writes.expire(cluster_count_key, 90 * 86400, nx=True)
+            if combo_actions:
+                writes.setex(
+                    self._COMBO_KEY.format(person=person_key),
+                    self._COMBO_WINDOW_SECONDS * 2,
+                    json.dumps(combo_actions),
+                )
+            # Journal zuletzt: die Zaehler-Ergebnisse bleiben an fester Position
+            if self._journal:
+                self._journal.append_to(writes, KIND_MANUAL, action)
+            results = iter((await writes.execute())[3:])
+
+            daily_count = next(results)
+            next(results)
+            weekday_count = 0
+            if not weekday_automated:
+                weekday_count = next(results)
+                next(results)
+            weather_count, weather_suggested = 0, None
+            if weather_norm:
+                weather_count = next(results)
+                next(results)
+                weather_suggested = next(results)
+            cluster_count = 0
+            if cluster:
+                cluster_count = next(results)
+
+            # --- Auswertung; Marker sammeln fuer Round-Trip 3 ---
+            followup = self.redis.pipeline(transaction=False)
+            notifications = []
 
             # Pattern-Check: Wurde diese Aktion schon oefter zur gleichen Zeit gemacht?
-            await self._check_pattern(
-                action_key, time_slot, entity_id, new_state, person=person
+            daily = self._check_pattern(
+                action_key,
+                time_slot,
+                entity_id,
+                new_state,
+                daily_count,
+                bool(daily_suggested),
+                followup,
+                person=person,
             )
+            if daily:
+                notifications.append(daily)
 
             # Wochentag-spezifischer Pattern-Check
-            await self._check_weekday_pattern(
-                action_key, time_slot, weekday, entity_id, new_state, person=person
-            )
+            if not weekday_automated:
+                wd = self._check_weekday_pattern(
+                    action_key,
+                    time_slot,
+                    weekday,
+                    entity_id,
+                    new_state,
+                    weekday_count,
+                    bool(daily_suggested or daily),
+                    bool(weekday_suggested),
+                    followup,
+                    person=person,
+                )
+                if wd:
+                    notifications.append(wd)
 
             # Wetter-Kontext-Pattern: Erkennt wetterbasierte Muster
-            if weather_condition:
-                await self._check_weather_pattern(
-                    action_key, weather_condition, entity_id, new_state, person=person
+            if weather_norm:
+                wp = self._check_weather_pattern(
+                    action_key,
+                    weather_condition,
+                    entity_id,
+                    new_state,
+                    weather_count,
+                    bool(weather_suggested),
+                    followup,
+                    person=person,
                 )
+                if wp:
+                    notifications.append(wp)
 
             # Temporal Auto-Clustering: Automatisch Cluster erkennen
             # wenn mehrere manuelle Aktionen innerhalb von 5 Minuten passieren
-            await self._check_temporal_cluster(action, person=person)
+            if cluster:
+                tc = self._check_temporal_cluster(
+                    action, cluster, cluster_count, followup, person=person
+                )
+                if tc:
+                    notifications.append(tc)
 
             # MCU Sprint 4: Cross-Domain-Combo-Erkennung
-            await self._check_cross_domain_combo(person, entity_id)
+            combo = self._check_cross_domain_combo(
+                person, combo_actions, bool(combo_cooldown), followup
+            )
+
+            # Marker zuerst setzen, dann benachrichtigen (kein Doppel-Vorschlag
+            # wenn der Callback haengt)
+            if len(followup):
+                await followup.execute()
+            if self._notify_callback:
+                for payload in notifications:
+                    await self._notify_callback(payload)
+                if combo:
+                    await self._notify_callback(*combo)
         except Exception as e:
             logger.warning("Learning Observer state_change Fehler: %s", e)
 
-    async def _check_pattern(
+    def _check_pattern(
         self,
         action_key: str,
         time_slot: str,
         entity_id: str,
         new_state: str,
+        count: int,
+        already_suggested: bool,
+        followup,
         person: str = "",
-    ):
-        """Prueft ob ein Muster erkannt wurde."""
+    ) -> Optional[dict]:
+        """Prueft ob ein Muster erkannt wurde.
+
+        Returns:
+            Vorschlag fuer den Notify-Callback oder None. Der Vorschlags-
+            Marker wird in ``followup`` (Redis-Pipeline) eingereiht.
+        """
+        # Genug Wiederholungen fuer einen Vorschlag? Schon vorgeschlagen?
+        if count < self.min_repetitions or already_suggested:
+            return None
+
         person_prefix = f"{person}:" if person else ""
-        pattern_key = f"{KEY_PATTERNS}:{person_prefix}{action_key}:{time_slot}"
-
-        # Zaehler erhoehen (Pipeline fuer atomares incr+expire)
-        pipe = self.redis.pipeline()
-        pipe.incr(pattern_key)
-        pipe.ttl(pattern_key)
-        incr_result, current_ttl = await pipe.execute()
-        count = incr_result
-        # TTL auf 365 Tage setzen (nur wenn noch keine TTL gesetzt)
-        if current_ttl is None or current_ttl < 0:
-            await self.redis.expire(pattern_key, 365 * 86400)
-
-        # Genug Wiederholungen fuer einen Vorschlag?
-        if count >= self.min_repetitions:
-            # Schon vorgeschlagen?
-            suggested_key = f"{KEY_SUGGESTED}:{person_prefix}{action_key}:{time_slot}"
-            already_suggested = await self.redis.get(suggested_key)
-            if already_suggested:
-                return
+        suggested_key = f"{KEY_SUGGESTED}:{person_prefix}{action_key}:{time_slot}"
 
-            # Konflikt-Check: Wuerde die Automatisierung Geraete-Konflikte erzeugen?
-            conflict_hint = ""
-            try:
-                from .state_change_log import StateChangeLog
+        # Konflikt-Check: Wuerde die Automatisierung Geraete-Konflikte erzeugen?
+        conflict_hint = ""
+        try:
+            from .state_change_log import StateChangeLog
 
-                hints = StateChangeLog.check_action_dependencies(
-                    entity_id, {"entity_id": entity_id, "state": new_state}, {}
-                )
-                if hints:
-                    conflict_hint = hints[0]
-            except Exception as e:
-                logger.debug("Abhaengigkeitspruefung fehlgeschlagen: %s", e)
-
-            # Als vorgeschlagen markieren (7 Tage Cooldown)
-            await self.redis.setex(suggested_key, 7 * 86400, "1")
-
-            # Vorschlag generieren
-            friendly = entity_id.split(".", 1)[1].replace("_", " ").title()
-            action_de = (
-                "eingeschaltet"
-                if new_state == "on"
-                else "ausgeschaltet"
-                if new_state == "off"
-                else new_state
+            hints = StateChangeLog.check_action_dependencies(
+                entity_id, {"entity_id": entity_id, "state": new_state}, {}
             )
+            if hints:
+                conflict_hint = hints[0]
+        except Exception as e:
+            logger.debug("Abhaengigkeitspruefung fehlgeschlagen: %s", e)
 
-            title = get_person_title()
-            person_hint = f" ({person})" if person else ""
-            message = (
-                f"{title}, mir ist aufgefallen, dass du{person_hint} {friendly} jeden Tag "
-                f"um {time_slot} Uhr {action_de}. "
-                f"Soll ich das automatisieren?"
-            )
-            if conflict_hint:
-                message += f" Beachte: {conflict_hint}"
+        # Als vorgeschlagen markieren (7 Tage Cooldown)
+        followup.setex(suggested_key, 7 * 86400, "1")
 
-            logger.info(
-                "Learning: Muster erkannt - %s um %s (%dx, Person: %s)",
-                action_key,
-                time_slot,
-                count,
-                person or "global",
-            )
+        # Vorschlag generieren
+        friendly = entity_id.split(".", 1)[1].replace("_", " ").title()
+        action_de = (
+            "eingeschaltet"
+            if new_state == "on"
+            else "ausgeschaltet"
+            if new_state == "off"
+            else new_state
+        )
 
-            if self._notify_callback:
-                await self._notify_callback(
-                    {
-                        "message": message,
-                        "type": "learning_suggestion",
-                        "entity_id": entity_id,
-                        "new_state": new_state,
-                        "time_slot": time_slot,
-                        "count": count,
-                        "person": person,
-                    }
-                )
+        title = get_person_title()
+        person_hint = f" ({person})" if person else ""
+        message = (
+            f"{title}, mir ist aufgefallen, dass du{person_hint} {friendly} jeden Tag "
+            f"um {time_slot} Uhr {action_de}. "
+            f"Soll ich das automatisieren?"
+        )
+        if conflict_hint:
+            message += f" Beachte: {conflict_hint}"
 
-    async def _check_weekday_pattern(
+        logger.info(
+            "Learning: Muster erkannt - %s um %s (%dx, Person: %s)",
+            action_key,
+            time_slot,
+            count,
+            person or "global",
+        )
+
+        return {
+            "message": message,
+            "type": "learning_suggestion",
+            "entity_id": entity_id,
+            "new_state": new_state,
+            "time_slot": time_slot,
+            "count": count,
+            "person": person,
+        }
+
+    def _check_weekday_pattern(
         self,
         action_key: str,
         time_slot: str,
         weekday: int,
         entity_id: str,
         new_state: str,
+        count: int,
+        daily_suggested: bool,
+        already_suggested: bool,
+        followup,
         person: str = "",
-    ):
+    ) -> Optional[dict]:
         """Prueft Wochentag-spezifische Muster (z.B. nur Werktags)."""
-        person_prefix = f"{person}:" if person else ""
-        # F-053: Cycle detection for weekday-specific patterns
-        automated_key = (
-            f"{KEY_AUTOMATED}:{person_prefix}{action_key}:{time_slot}:{weekday}"
-        )
-        if await self.redis.get(automated_key):
-            return
-
-        pattern_key = (
-            f"{KEY_WEEKDAY_PATTERNS}:{person_prefix}{action_key}:{time_slot}:{weekday}"
-        )
-
-        count = await self.redis.incr(pattern_key)
-        if count == 1:
-            await self.redis.expire(pattern_key, 60 * 86400)  # 60 Tage TTL
-
         # Erst ab 3 Wiederholungen am gleichen Wochentag
         if count < self.min_repetitions:
-            return
+            return None
 
         # Taeglich schon vorgeschlagen? Dann Wochentag-Vorschlag ueberspringen
-        daily_suggested = await self.redis.get(
-            f"{KEY_SUGGESTED}:{person_prefix}{action_key}:{time_slot}"
-        )
-        if daily_suggested:
-            return
+        if daily_suggested or already_suggested:
+            return None
 
+        person_prefix = f"{person}:" if person else ""
         suggested_key = (
             f"{KEY_SUGGESTED}:weekday:{person_prefix}{action_key}:{time_slot}:{weekday}"
         )
-        if await self.redis.get(suggested_key):
-            return
-
-        await self.redis.setex(suggested_key, 14 * 86400, "1")  # 14 Tage Cooldown
+        followup.setex(suggested_key, 14 * 86400, "1")  # 14 Tage Cooldown
 
         friendly = entity_id.split(".", 1)[1].replace("_", " ").title()
         action_de = (
@@ -435,20 +556,17 @@ class LearningObserver:
             person or "global",
         )
 
-        if self._notify_callback:
-            await self._notify_callback(
-                {
-                    "message": message,
-                    "type": "learning_suggestion",
-                    "entity_id": entity_id,
-                    "new_state": new_state,
-                    "time_slot": time_slot,
-                    "weekday": weekday,
-                    "weekday_name": day_name,
-                    "count": count,
-                    "person": person,
-                }
-            )
+        return {
+            "message": message,
+            "type": "learning_suggestion",
+            "entity_id": entity_id,
+            "new_state": new_state,
+            "time_slot": time_slot,
+            "weekday": weekday,
+            "weekday_name": day_name,
+            "count": count,
+            "person": person,
+        }
 
     # Wetter-Bedingungen zu lesbaren deutschen Labels
     _WEATHER_LABELS_DE = {
@@ -465,40 +583,36 @@ class LearningObserver:
         "hail": "Hagel",
     }
 
-    async def _check_weather_pattern(
+    @staticmethod
+    def _normalize_weather(weather: str) -> str:
+        """Wetter normalisieren (nur Hauptkategorie)."""
+        return weather.lower().strip().split(",")[0].split("-")[0][:20]
+
+    def _check_weather_pattern(
         self,
         action_key: str,
         weather: str,
         entity_id: str,
         new_state: str,
+        count: int,
+        already_suggested: bool,
+        followup,
         person: str = "",
-    ):
+    ) -> Optional[dict]:
         """Prueft wetterbasierte Muster (z.B. 'bei Regen Rolllaeden zu')."""
-        person_prefix = f"{person}:" if person else ""
-        # Wetter normalisieren (nur Hauptkategorie)
-        weather_norm = weather.lower().strip().split(",")[0].split("-")[0][:20]
+        weather_norm = self._normalize_weather(weather)
         if not weather_norm:
-            return
-
-        pattern_key = (
-            f"mha:learning:weather_patterns:{person_prefix}{action_key}:{weather_norm}"
-        )
-
-        count = await self.redis.incr(pattern_key)
-        if count == 1:
-            await self.redis.expire(pattern_key, 120 * 86400)  # 120 Tage TTL
+            return None
 
         # Hoehere Schwelle fuer Wetter-Muster (4 statt 3) — Wetter ist variabler
-        if count < self.min_repetitions + 1:
-            return
+        if count < self.min_repetitions + 1 or already_suggested:
+            return None
 
+        person_prefix = f"{person}:" if person else ""
         suggested_key = (
             f"{KEY_SUGGESTED}:weather:{person_prefix}{action_key}:{weather_norm}"
         )
-        if await self.redis.get(suggested_key):
-            return
-
-        await self.redis.setex(suggested_key, 14 * 86400, "1")  # 14 Tage Cooldown
+        followup.setex(suggested_key, 14 * 86400, "1")  # 14 Tage Cooldown
 
         friendly = entity_id.split(".", 1)[1].replace("_", " ").title()
         action_de = (
@@ -526,46 +640,39 @@ class LearningObserver:
             person or "global",
         )
 
-        if self._notify_callback:
-            await self._notify_callback(
-                {
-                    "message": message,
-                    "type": "learning_suggestion",
-                    "subtype": "weather",
-                    "entity_id": entity_id,
-                    "new_state": new_state,
-                    "weather": weather_norm,
-                    "count": count,
-                    "person": person,
-                }
-            )
+        return {
+            "message": message,
+            "type": "learning_suggestion",
+            "subtype": "weather",
+            "entity_id": entity_id,
+            "new_state": new_state,
+            "weather": weather_norm,
+            "count": count,
+            "person": person,
+        }
 
-    async def _check_temporal_cluster(self, action: dict, person: str = ""):
-        """Erkennt automatisch zeitliche Cluster von manuellen Aktionen.
+    @staticmethod
+    def _temporal_cluster(
+        action: dict, recent_raw: list
+    ) -> Optional[tuple[str, list[str]]]:
+        """Aktionen innerhalb von 5 Minuten um ``action`` gruppieren.
 
-        Wenn innerhalb von 5 Minuten 2+ manuelle Aktionen passieren,
-        wird das als potenzieller Cluster gespeichert. Nach 3+ Wiederholungen
-        des gleichen Clusters wird er als abstraktes Konzept erkannt —
-        auch ohne expliziten trigger_text vom User.
+        ``recent_raw``: die letzten Aktionen aus Redis (vor der aktuellen).
+
+        Returns:
+            (Signatur-Hash, Aktions-Keys) bei 2+ verschiedenen Aktionen, sonst None.
         """
         try:
-            # Letzte 10 Aktionen laden
-            recent_raw = await self.redis.lrange(KEY_MANUAL_ACTIONS, 0, 9)
-            if len(recent_raw) < 2:
-                return
-
-            recent = []
+            recent = [action]
             for raw in recent_raw:
                 try:
-                    entry = json.loads(raw)
-                    recent.append(entry)
+                    recent.append(json.loads(raw))
                 except (json.JSONDecodeError, ValueError):
                     continue
 
             if len(recent) < 2:
-                return
+                return None
 
-            # Aktionen innerhalb von 5 Minuten gruppieren
             now_ts = datetime.fromisoformat(action["timestamp"])
             cluster_actions = []
             for entry in recent:
@@ -579,65 +686,74 @@ class LearningObserver:
                         cluster_actions.append(action_key)
 
             if len(cluster_actions) < 2:
-                return
+                return None
 
             # Cluster-Signatur erstellen (sortiert fuer Konsistenz)
             cluster_sig = "|".join(sorted(cluster_actions))
-            cluster_key = f"mha:learning:temporal_clusters:{person or 'global'}"
-            time_slot = action.get("time_slot", "")
+            sig_hash = hashlib.sha256(cluster_sig.encode()).hexdigest()[:12]
+            return sig_hash, cluster_actions
+        except Exception as e:
+            logger.debug("Temporal Cluster Check fehlgeschlagen: %s", e)
+            return None
 
-            # Cluster-Observation zaehlen
-            import hashlib
+    def _check_temporal_cluster(
+        self,
+        action: dict,
+        cluster: tuple[str, list[str]],
+        count: int,
+        followup,
+        person: str = "",
+    ) -> Optional[dict]:
+        """Erkennt automatisch zeitliche Cluster von manuellen Aktionen.
 
-            sig_hash = hashlib.sha256(cluster_sig.encode()).hexdigest()[:12]
-            count_key = f"{cluster_key}:{sig_hash}"
-            count = await self.redis.incr(count_key)
-            if count == 1:
-                await self.redis.expire(count_key, 90 * 86400)  # 90 Tage TTL
-                # Cluster-Details speichern
-                cluster_data = json.dumps(
-                    {
-                        "actions": cluster_actions,
-                        "time_slot": time_slot,
-                        "person": person,
-                        "first_seen": action["timestamp"],
-                    }
-                )
-                await self.redis.hset(f"{cluster_key}:details", sig_hash, cluster_data)
-                await self.redis.expire(f"{cluster_key}:details", 90 * 86400)
-
-            # Ab 3 Wiederholungen: Als abstraktes Konzept vorschlagen
-            if count == self.min_repetitions:
-                # Auto-Name aus Domains ableiten
-                domains = set()
-                for a in cluster_actions:
-                    domain = a.split(".")[0] if "." in a else a
-                    domains.add(domain)
-                auto_name = (
-                    "_".join(sorted(domains)) + f"_routine_{time_slot.replace(':', '')}"
-                )
+        Wenn innerhalb von 5 Minuten 2+ manuelle Aktionen passieren,
+        wird das als potenzieller Cluster gespeichert. Nach 3+ Wiederholungen
+        des gleichen Clusters wird er als abstraktes Konzept erkannt —
+        auch ohne expliziten trigger_text vom User.
+        """
+        sig_hash, cluster_actions = cluster
+        cluster_key = f"mha:learning:temporal_clusters:{person or 'global'}"
+        time_slot = action.get("time_slot", "")
 
-                logger.info(
-                    "Temporal Cluster erkannt: %d Aktionen, %d Wiederholungen, Signatur: %s",
-                    len(cluster_actions),
-                    count,
-                    auto_name,
-                )
+        if count == 1:
+            # Cluster-Details speichern
+            cluster_data = json.dumps(
+                {
+                    "actions": cluster_actions,
+                    "time_slot": time_slot,
+                    "person": person,
+                    "first_seen": action["timestamp"],
+                }
+            )
+            followup.hset(f"{cluster_key}:details", sig_hash, cluster_data)
+            followup.expire(f"{cluster_key}:details", 90 * 86400)
 
-                # Notify-Callback wenn vorhanden
-                if hasattr(self, "_notify_callback") and self._notify_callback:
-                    await self._notify_callback(
-                        {
-                            "type": "temporal_cluster",
-                            "actions": cluster_actions,
-                            "cluster_name": auto_name,
-                            "count": count,
-                            "time_slot": time_slot,
-                            "person": person,
-                        }
-                    )
-        except Exception as e:
-            logger.debug("Temporal Cluster Check fehlgeschlagen: %s", e)
+        # Ab 3 Wiederholungen: Als abstraktes Konzept vorschlagen
+        if count != self.min_repetitions:
+            return None
+
+        # Auto-Name aus Domains ableiten
+        domains = set()
+        for a in cluster_actions:
+            domain = a.split(".")[0] if "." in a else a
+            domains.add(domain)
+        auto_name = "_".join(sorted(domains)) + f"_routine_{time_slot.replace(':', '')}"
+
+        logger.info(
+            "Temporal Cluster erkannt: %d Aktionen, %d Wiederholungen, Signatur: %s",
+            len(cluster_actions),
+            count,
+            auto_name,
+        )
+
+        return {
+            "type": "temporal_cluster",
+            "actions": cluster_actions,
+            "cluster_name": auto_name,
+            "count": count,
+            "time_slot": time_slot,
+            "person": person,
+        }
 
     async def handle_response(
         self,
@@ -913,15 +1029,14 @@ class LearningObserver:
             return []
 
         try:
-            raw_actions = await self.redis.lrange(KEY_MANUAL_ACTIONS, 0, 499)
-            if len(raw_actions) < 6:
+            recent = await self._recent_manual_actions(500)
+            if len(recent) < 6:
                 return []
 
             # Aktionen chronologisch parsen
             actions = []
-            for raw in raw_actions:
+            for a in recent:
                 try:
-                    a = json.loads(raw if isinstance(raw, str) else raw.decode())
                     ts = datetime.fromisoformat(a.get("timestamp", ""))
                     actions.append(
                         {
@@ -930,7 +1045,7 @@ class LearningObserver:
                             "new_state": a.get("new_state", ""),
                         }
                     )
-                except (json.JSONDecodeError, ValueError):
+                except (ValueError, TypeError):
                     continue
 
             if not actions:
@@ -1503,8 +1618,8 @@ class LearningObserver:
 
         try:
             # Letzte manuelle Device-Aenderungen der letzten 5 Minuten holen
-            raw_actions = await self.redis.lrange(KEY_MANUAL_ACTIONS, 0, 19)
-            if not raw_actions:
+            recent = await self._recent_manual_actions(20)
+            if not recent:
                 return
 
             import time as _time
@@ -1513,9 +1628,8 @@ class LearningObserver:
             lookback_seconds = 300  # 5 Minuten
 
             recent_triggers = []
-            for raw in raw_actions:
+            for action in recent:
                 try:
-                    action = json.loads(raw if isinstance(raw, str) else raw.decode())
                     ts = datetime.fromisoformat(action.get("timestamp", ""))
                     age = now - ts.timestamp()
                     if age <= lookback_seconds:
@@ -1705,26 +1819,12 @@ class LearningObserver:
     _COMBO_WINDOW_SECONDS = 60  # 60s Fenster
     _COMBO_KEY = "mha:learning:cross_domain_last:{person}"
 
-    async def _check_cross_domain_combo(self, person: str, entity_id: str) -> None:
-        """Erkennt Cross-Domain-Combos: 2+ Domains in <60s.
-
-        Wenn Korrekturen in verschiedenen Domains (z.B. light + climate)
-        innerhalb von 60s passieren, wird ein Szene-Vorschlag gemacht.
-
-        Args:
-            person: Person die die Aenderung gemacht hat.
-            entity_id: Entity-ID der aktuellen Aenderung.
-        """
-        if not self.redis:
-            return
-
-        person_key = person or "global"
-        combo_key = self._COMBO_KEY.format(person=person_key)
-
+    def _combo_window(self, entity_id: str, raw) -> list[dict]:
+        """Aktionen der letzten 60s (aus Redis) plus die aktuelle Aenderung."""
         # Domain extrahieren
         domain = entity_id.split(".")[0] if "." in entity_id else ""
         if not domain:
-            return
+            return []
 
         # Room extrahieren (best effort)
         room = ""
@@ -1735,87 +1835,96 @@ class LearningObserver:
         except Exception:
             pass
 
-        try:
-            now = datetime.now(timezone.utc)
-            now_iso = now.isoformat()
-
-            # Letzte Aktionen laden
-            raw = await self.redis.get(combo_key)
-            recent_actions = []
-            if raw:
-                try:
-                    recent_actions = json.loads(raw)
-                except (json.JSONDecodeError, ValueError):
-                    recent_actions = []
+        now = datetime.now(timezone.utc)
+        recent_actions = []
+        if raw:
+            try:
+                recent_actions = json.loads(raw)
+            except (json.JSONDecodeError, ValueError):
+                recent_actions = []
 
-            # Alte Aktionen (>60s) entfernen
+        # Alte Aktionen (>60s) entfernen
+        try:
             recent_actions = [
                 a
                 for a in recent_actions
                 if (now - datetime.fromisoformat(a["ts"])).total_seconds()
                 <= self._COMBO_WINDOW_SECONDS
             ]
+        except (KeyError, TypeError, ValueError):
+            recent_actions = []
 
-            # Aktuelle Aktion hinzufuegen
-            recent_actions.append(
-                {
-                    "domain": domain,
-                    "entity_id": entity_id,
-                    "room": room,
-                    "ts": now_iso,
-                }
-            )
+        # Aktuelle Aktion hinzufuegen
+        recent_actions.append(
+            {
+                "domain": domain,
+                "entity_id": entity_id,
+                "room": room,
+                "ts": now.isoformat(),
+            }
+        )
+        return recent_actions
 
-            # Speichern (kurzes TTL)
-            await self.redis.setex(
-                combo_key,
-                self._COMBO_WINDOW_SECONDS * 2,
-                json.dumps(recent_actions),
-            )
+    def _check_cross_domain_combo(
+        self,
+        person: str,
+        recent_actions: list[dict],
+        cooldown_active: bool,
+        followup,
+    ) -> Optional[tuple]:
+        """Erkennt Cross-Domain-Combos: 2+ Domains in <60s.
 
-            # Combo pruefen: 2+ verschiedene Domains
-            domains = {a["domain"] for a in recent_actions}
-            if len(domains) < 2:
-                return
+        Wenn Korrekturen in verschiedenen Domains (z.B. light + climate)
+        innerhalb von 60s passieren, wird ein Szene-Vorschlag gemacht.
 
-            # Gleicher Raum pruefen (reduziert False Positives)
-            rooms = {a["room"] for a in recent_actions if a.get("room")}
-            if rooms and len(rooms) > 1:
-                return  # Verschiedene Raeume → wahrscheinlich Zufall
+        Args:
+            person: Person die die Aenderung gemacht hat.
+            recent_actions: Aktionen im Fenster inkl. der aktuellen (_combo_window).
+            cooldown_active: Heute schon ein Combo-Vorschlag gemacht.
+            followup: Redis-Pipeline fuer den Cooldown-Marker.
 
-            # Cooldown: Max 1 Combo-Vorschlag pro Tag
-            combo_cooldown_key = f"mha:learning:combo_cooldown:{person_key}"
-            if await self.redis.get(combo_cooldown_key):
-                return
-            await self.redis.setex(combo_cooldown_key, 86400, "1")
-
-            # Combo-Notification erstellen
-            domain_labels = {
-                "light": "Licht",
-                "climate": "Temperatur",
-                "cover": "Rollladen",
-                "switch": "Schalter",
-                "media_player": "Medien",
-            }
-            domain_names = [domain_labels.get(d, d) for d in sorted(domains)]
-            combo_desc = " und ".join(domain_names)
-            room_hint = f" im {rooms.pop()}" if rooms else ""
+        Returns:
+            Argumente fuer den Notify-Callback oder None.
+        """
+        # Combo pruefen: 2+ verschiedene Domains
+        domains = {a["domain"] for a in recent_actions}
+        if len(domains) < 2:
+            return None
 
-            logger.info(
-                "Cross-Domain-Combo erkannt: %s%s (%d Aktionen in %ds)",
-                combo_desc,
-                room_hint,
-                len(recent_actions),
-                self._COMBO_WINDOW_SECONDS,
-            )
+        # Gleicher Raum pruefen (reduziert False Positives)
+        rooms = {a["room"] for a in recent_actions if a.get("room")}
+        if rooms and len(rooms) > 1:
+            return None  # Verschiedene Raeume → wahrscheinlich Zufall
 
-            # Notification senden (via Callback wenn vorhanden)
-            if self._notify_callback:
-                await self._notify_callback(
-                    f"Du hast gerade {combo_desc}{room_hint} angepasst — "
-                    f"soll ich das als Szene speichern?",
-                    "combo_scene_suggest",
-                    "low",
-                )
-        except Exception as e:
-            logger.debug("Cross-Domain-Combo Fehler: %s", e)
+        # Cooldown: Max 1 Combo-Vorschlag pro Tag
+        if cooldown_active:
+            return None
+        person_key = person or "global"
+        followup.setex(f"mha:learning:combo_cooldown:{person_key}", 86400, "1")
+
+        # Combo-Notification erstellen
+        domain_labels = {
+            "light": "Licht",
+            "climate": "Temperatur",
+            "cover": "Rollladen",
+            "switch": "Schalter",
+            "media_player": "Medien",
+        }
+        domain_names = [domain_labels.get(d, d) for d in sorted(domains)]
+        combo_desc = " und ".join(domain_names)
+        room_hint = f" im {rooms.pop()}" if rooms else ""
+
+        logger.info(
+            "Cross-Domain-Combo erkannt: %s%s (%d Aktionen in %ds)",
+            combo_desc,
+            room_hint,
+            len(recent_actions),
+            self._COMBO_WINDOW_SECONDS,
+        )
+
+        return (
+            f"Du hast gerade {combo_desc}{room_hint} angepasst — "
+            f"soll ich das als Szene speichern?",
+            "combo_scene_suggest",
+            "low",
+        )
@@ -41,13 +41,19 @@ from fastapi import (
     WebSocketDisconnect,
 )
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import FileResponse, HTMLResponse, Response
+from fastapi.responses import (
+    FileResponse,
+    HTMLResponse,
+    Response,
+    StreamingResponse,
+)
 from fastapi.staticfiles import StaticFiles
 from pydantic import BaseModel
 from typing import Optional
 
 import yaml
 
+from .audio_convert import decode_to_16k_mono
 from .brain import AssistantBrain
 from .config import settings, yaml_config, load_yaml_config, get_person_title
 
@@ -73,6 +79,8 @@ from .request_context import (
     setup_structured_logging,
     get_request_id,
 )
+from .sentence_stream import REASONING_STARTERS, SentenceChunker
+from .tts_audio_cache import TTSAudioCache
 from .websocket import (
     ws_manager,
     emit_speaking,
@@ -452,6 +460,14 @@ async def lifespan(app: FastAPI):
             )
         )
 
+    # TTS-Audio-Cache: Haeufigste Phrasen im Hintergrund vorsynthetisieren
+    _configure_tts_audio_cache()
+    _tts_audio_cache.set_redis(brain.memory.redis)
+    prewarm_task = asyncio.create_task(_tts_audio_cache.prewarm(_wyoming_synthesize))
+    prewarm_task.add_done_callback(
+        lambda t: t.exception() if not t.cancelled() else None
+    )
+
     # Periodischer Token-Cleanup (alle 15 Min)
     cleanup_task = asyncio.create_task(_periodic_token_cleanup())
     cleanup_task.add_done_callback(
@@ -816,6 +832,15 @@ class ChatRequest(BaseModel):
     voice_metadata: Optional[dict] = None
     # Phase 9: Device-ID fuer Speaker Recognition (Satellite → Person Mapping)
     device_id: Optional[str] = None
+    # Sprach-Turn-ID: holt spekulativ vorgeladenen Kontext ab (/chat/partial)
+    request_id: Optional[str] = None
+
+
+class PartialTranscriptRequest(BaseModel):
+    request_id: str
+    text: str
+    person: Optional[str] = None
+    room: Optional[str] = None
 
 
 class TTSInfo(BaseModel):
@@ -931,8 +956,8 @@ async def jarvis_learning_progress():
             patterns = getattr(brain.anticipation, "_patterns", {})
             progress["patterns_learned"] = len(patterns)
         if hasattr(brain, "correction_memory"):
-            rules = getattr(brain.correction_memory, "_rules", {})
-            progress["corrections_applied"] = len(rules)
+            stats = await brain.correction_memory.get_stats()
+            progress["corrections_applied"] = stats.get("active_rules", 0)
         # Aktive Features auflisten
         _features = []
         for attr in [
@@ -1008,63 +1033,37 @@ async def character_break_stats():
     }
 
 
-@app.post("/api/assistant/chat", response_model=ChatResponse)
-async def chat(request: ChatRequest):
-    """
-    Hauptendpoint - Text an den Assistenten senden.
-
-    Beispiel:
-    POST /api/assistant/chat
-    {"text": "Mach das Licht im Wohnzimmer aus", "person": "Max"}
-    """
-    if not request.text.strip():
-        raise HTTPException(status_code=400, detail="Kein Text angegeben")
-
-    # Phase 9: Voice-Metadaten an MoodDetector weiterleiten
-    if request.voice_metadata:
-        brain.mood.analyze_voice_metadata(
-            request.voice_metadata, person=request.person or ""
-        )
-
-    try:
-        result = await asyncio.wait_for(
-            brain.process(
-                request.text,
-                request.person,
-                request.room,
-                voice_metadata=request.voice_metadata,
-                device_id=request.device_id,
-            ),
-            timeout=60.0,
-        )
-    except asyncio.TimeoutError:
+def _chat_fallback_result(request: ChatRequest, error: Exception) -> dict:
+    """Ersatz-Antwort wenn brain.process() haengt oder fehlschlaegt."""
+    if isinstance(error, asyncio.TimeoutError):
         logger.error("brain.process() Timeout nach 60s fuer: %s", request.text[:100])
-        result = {
+        return {
             "response": "Systeme überlastet. Nochmal, bitte.",
             "actions": [],
             "model_used": "timeout",
             "context_room": request.room or "unbekannt",
         }
-    except Exception as e:
-        logger.error(
-            "brain.process() Exception fuer '%s': %s",
-            request.text[:100],
-            e,
-            exc_info=True,
-        )
-        error_type = type(e).__name__
-        _error_msgs = [
-            "Da lief etwas nicht nach Plan. Einen Moment, ich versuche es anders.",
-            "Nicht ganz wie vorgesehen. Ich bleibe dran.",
-            "Suboptimal. Ich pruefe eine Alternative.",
-        ]
-        result = {
-            "response": random.choice(_error_msgs),
-            "actions": [],
-            "model_used": "error",
-            "context_room": request.room or "unbekannt",
-        }
+    logger.error(
+        "brain.process() Exception fuer '%s': %s",
+        request.text[:100],
+        error,
+        exc_info=error,
+    )
+    _error_msgs = [
+        "Da lief etwas nicht nach Plan. Einen Moment, ich versuche es anders.",
+        "Nicht ganz wie vorgesehen. Ich bleibe dran.",
+        "Suboptimal. Ich pruefe eine Alternative.",
+    ]
+    return {
+        "response": random.choice(_error_msgs),
+        "actions": [],
+        "model_used": "error",
+        "context_room": request.room or "unbekannt",
+    }
+
 
+def _chat_response(request: ChatRequest, result: dict) -> ChatResponse:
+    """Meldet Aktionen ans Addon und baut die ChatResponse."""
     # Aktionen ans Addon melden fuer Aktivitaeten-Log
     actions = result.get("actions", [])
     if actions:
@@ -1104,6 +1103,156 @@ async def chat(request: ChatRequest):
         )
 
 
+@app.post("/api/assistant/chat", response_model=ChatResponse)
+async def chat(request: ChatRequest):
+    """
+    Hauptendpoint - Text an den Assistenten senden.
+
+    Beispiel:
+    POST /api/assistant/chat
+    {"text": "Mach das Licht im Wohnzimmer aus", "person": "Max"}
+    """
+    if not request.text.strip():
+        raise HTTPException(status_code=400, detail="Kein Text angegeben")
+
+    # Phase 9: Voice-Metadaten an MoodDetector weiterleiten
+    if request.voice_metadata:
+        brain.mood.analyze_voice_metadata(
+            request.voice_metadata, person=request.person or ""
+        )
+
+    try:
+        result = await asyncio.wait_for(
+            brain.process(
+                request.text,
+                request.person,
+                request.room,
+                voice_metadata=request.voice_metadata,
+                device_id=request.device_id,
+                request_id=request.request_id,
+            ),
+            timeout=60.0,
+        )
+    except Exception as e:
+        result = _chat_fallback_result(request, e)
+
+    return _chat_response(request, result)
+
+
+def _sse_frame(event: str, data: dict) -> str:
+    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n"
+
+
+@app.post("/api/assistant/chat/stream")
+async def chat_stream(request: ChatRequest):
+    """
+    Wie /api/assistant/chat, aber als Server-Sent Events.
+
+    Die Antwort kommt satzweise, sobald das LLM einen Satz fertig hat —
+    TTS auf dem Satelliten kann mit dem ersten Satz starten statt auf die
+    komplette Antwort zu warten.
+
+    Frames:
+      event: tts    data: {"volume": 0.3, "target_speaker": "..."}  (vor dem Text)
+      event: delta  data: {"text": "Erster Satz. "}
+      event: done   data: {ChatResponse-Felder}
+
+    Der tts-Frame kommt vor dem ersten delta, damit der Client die
+    Lautstaerke (Nacht/Fluestern) setzen kann, bevor gesprochen wird.
+
+    Die Konkatenation aller delta-Texte ist die gesprochene Antwort. Wurde
+    nichts gestreamt (Shortcut, Reasoning unterdrueckt, Fehler), kommt die
+    komplette Antwort als ein delta vor dem done-Frame.
+    """
+    if not request.text.strip():
+        raise HTTPException(status_code=400, detail="Kein Text angegeben")
+
+    if request.voice_metadata:
+        brain.mood.analyze_voice_metadata(
+            request.voice_metadata, person=request.person or ""
+        )
+
+    chunker = SentenceChunker()
+    sentences: asyncio.Queue = asyncio.Queue()
+
+    async def _on_token(token: str):
+        for sentence in chunker.feed(token):
+            sentences.put_nowait(sentence)
+
+    async def _run_brain():
+        try:
+            return await asyncio.wait_for(
+                brain.process(
+                    request.text,
+                    request.person,
+                    request.room,
+                    stream_callback=_on_token,
+                    voice_metadata=request.voice_metadata,
+                    device_id=request.device_id,
+                    request_id=request.request_id,
+                ),
+                timeout=60.0,
+            )
+        finally:
+            sentences.put_nowait(None)
+
+    async def _events():
+        brain_task = asyncio.create_task(_run_brain())
+        try:
+            try:
+                preview = await asyncio.wait_for(
+                    brain.reply_tts_preview(request.room), timeout=2.0
+                )
+            except Exception as e:
+                logger.debug("TTS-Vorschau fuer Stream fehlgeschlagen: %s", e)
+            else:
+                yield _sse_frame("tts", preview)
+            while (sentence := await sentences.get()) is not None:
+                yield _sse_frame("delta", {"text": sentence})
+
+            try:
+                result = brain_task.result()
+            except Exception as e:
+                result = _chat_fallback_result(request, e)
+            else:
+                rest = chunker.flush()
+                if rest:
+                    yield _sse_frame("delta", {"text": rest})
+            if not chunker.streamed_text and result.get("response"):
+                yield _sse_frame("delta", {"text": result["response"]})
+
+            response = _chat_response(request, result)
+            yield _sse_frame("done", response.model_dump())
+        finally:
+            # Client weg (z.B. Pipeline abgebrochen) → Verarbeitung abbrechen
+            if not brain_task.done():
+                brain_task.cancel()
+
+    return StreamingResponse(
+        _events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@app.post("/api/assistant/chat/partial")
+async def chat_partial(request: PartialTranscriptRequest):
+    """
+    Teil-Transkript eines laufenden Sprach-Turns melden.
+
+    Startet spekulatives Kontext-Vorladen. Der finale /api/assistant/chat
+    Request mit derselben request_id uebernimmt die Ergebnisse.
+
+    Beispiel:
+    POST /api/assistant/chat/partial
+    {"request_id": "sat-42", "text": "Was weisst du ueber", "person": "Max"}
+    """
+    started = brain.prefetch_context(
+        request.request_id, request.text, request.person, request.room
+    )
+    return {"status": "ok", "prefetch_started": started}
+
+
 @app.get("/api/assistant/context")
 async def get_context():
     """Debug: Aktueller Kontext-Snapshot."""
@@ -1547,8 +1696,31 @@ _WHISPER_HOST = os.getenv("WHISPER_HOST", "whisper")
 _WHISPER_PORT = int(os.getenv("WHISPER_PORT", "10300"))
 
 
+_tts_audio_cache = TTSAudioCache()
+
+
+def _configure_tts_audio_cache() -> None:
+    """Uebernimmt tts_audio_cache-Einstellungen (Stimme aus speech.tts_voice)."""
+    cfg = yaml_config.get("tts_audio_cache", {})
+    _tts_audio_cache.configure(
+        enabled=cfg.get("enabled", True),
+        max_chars=int(cfg.get("max_chars", 160)),
+        max_memory_mb=float(cfg.get("max_memory_mb", 32)),
+        max_disk_mb=float(cfg.get("max_disk_mb", 128)),
+        disk_dir=cfg.get("disk_dir", "/app/data/tts_cache"),
+        prewarm_top_n=int(cfg.get("prewarm_top_n", 0)),
+        voice=yaml_config.get("speech", {}).get("tts_voice")
+        or os.getenv("PIPER_VOICE", ""),
+    )
+
+
 async def _wyoming_tts(text: str) -> bytes:
-    """Generiert Audio via Wyoming TTS (Piper). Gibt rohe PCM-Daten zurueck."""
+    """Audio fuer text — kurze, wiederkehrende Saetze aus dem TTS-Audio-Cache."""
+    return await _tts_audio_cache.get_or_synthesize(text, _wyoming_synthesize)
+
+
+async def _wyoming_synthesize(text: str) -> bytes:
+    """Generiert Audio via Wyoming TTS (Piper). Gibt WAV-Daten zurueck."""
     import struct
 
     reader, writer = await asyncio.wait_for(
@@ -1740,35 +1912,10 @@ async def stt_transcribe(audio: UploadFile = File(...)):
     if not audio_bytes:
         raise HTTPException(status_code=400, detail="Keine Audio-Daten")
 
-    content_type = audio.content_type or ""
-    sample_rate = 16000
-
     try:
-        # WAV oder WebM/OGG — in PCM konvertieren wenn noetig
-        if "wav" in content_type or audio_bytes[:4] == b"RIFF":
-            # WAV: PCM-Daten extrahieren
-            import io, wave
-
-            def _read_wav():
-                with wave.open(io.BytesIO(audio_bytes), "rb") as wf:
-                    return (
-                        wf.getframerate(),
-                        wf.readframes(wf.getnframes()),
-                        wf.getnchannels(),
-                        wf.getsampwidth(),
-                    )
-
-            sample_rate, pcm_data, _nch, _sw = await asyncio.to_thread(_read_wav)
-            # Resample zu 16kHz mono wenn noetig
-            if _nch > 1 or sample_rate != 16000 or _sw != 2:
-                pcm_data = await _convert_audio_to_16k_mono(audio_bytes)
-                sample_rate = 16000
-        else:
-            # WebM/OGG/MP3: ffmpeg konvertieren
-            pcm_data = await _convert_audio_to_16k_mono(audio_bytes)
-            sample_rate = 16000
-
-        text = await _wyoming_stt(pcm_data, sample_rate)
+        # WAV/OGG/FLAC/MP3 in-process, WebM & Co. via ffmpeg
+        pcm_data = await _convert_audio_to_16k_mono(audio_bytes)
+        text = await _wyoming_stt(pcm_data, 16000)
         return {"text": text.strip(), "language": "de"}
 
     except HTTPException:
@@ -1779,7 +1926,19 @@ async def stt_transcribe(audio: UploadFile = File(...)):
 
 
 async def _convert_audio_to_16k_mono(audio_bytes: bytes) -> bytes:
-    """Konvertiert beliebiges Audio zu 16kHz 16-bit mono PCM via ffmpeg."""
+    """Konvertiert beliebiges Audio zu 16kHz 16-bit mono PCM.
+
+    WAV, Ogg/Opus, FLAC und MP3 werden in-process dekodiert (audio_convert),
+    nur andere Container (WebM, MP4, ...) starten einen ffmpeg-Prozess.
+    """
+    try:
+        pcm = await asyncio.to_thread(decode_to_16k_mono, audio_bytes)
+    except Exception as e:
+        logger.warning("In-Process Audio-Dekodierung fehlgeschlagen, nutze ffmpeg: %s", e)
+        pcm = None
+    if pcm is not None:
+        return pcm
+
     proc = await asyncio.create_subprocess_exec(
         "ffmpeg",
         "-i",
@@ -1839,27 +1998,9 @@ async def voice_chat(
     if not audio_bytes:
         raise HTTPException(status_code=400, detail="Keine Audio-Daten")
 
-    content_type = audio.content_type or ""
-
     try:
         # 1. Audio zu PCM konvertieren
-        if "wav" in content_type or audio_bytes[:4] == b"RIFF":
-            import io, wave
-
-            def _read_wav_vc():
-                with wave.open(io.BytesIO(audio_bytes), "rb") as wf:
-                    return (
-                        wf.readframes(wf.getnframes()),
-                        wf.getframerate(),
-                        wf.getnchannels(),
-                        wf.getsampwidth(),
-                    )
-
-            pcm_data, sr, _nch, _sw = await asyncio.to_thread(_read_wav_vc)
-            if _nch > 1 or sr != 16000 or _sw != 2:
-                pcm_data = await _convert_audio_to_16k_mono(audio_bytes)
-        else:
-            pcm_data = await _convert_audio_to_16k_mono(audio_bytes)
+        pcm_data = await _convert_audio_to_16k_mono(audio_bytes)
 
         # 2. STT
         user_text = await _wyoming_stt(pcm_data, 16000)
@@ -2262,7 +2403,8 @@ async def websocket_endpoint(websocket: WebSocket):
     assistant.audio - TTS-Audio-Daten (Foundation F.3, via /api/assistant/voice)
 
     Events (Client -> Server):
-    assistant.text - Text-Eingabe (+ optional voice_metadata)
+    assistant.text - Text-Eingabe (+ optional voice_metadata, request_id)
+    assistant.partial - Teil-Transkript (request_id + text) fuer Context-Prefetch
     assistant.feedback - Feedback auf Meldung
     assistant.interrupt - Unterbrechung
     """
@@ -2287,17 +2429,15 @@ async def websocket_endpoint(websocket: WebSocket):
         return
 
     # Ping/Pong Keep-Alive: Alle 25 Sek einen Ping senden
+    # (ueber die Sende-Queue — nur der Writer-Task schreibt auf den Socket)
     async def _ws_keepalive():
         try:
             while True:
                 await asyncio.sleep(WS_KEEPALIVE_INTERVAL)
-                try:
-                    await websocket.send_json({"event": "ping", "data": {}})
-                except Exception as e:
-                    logger.debug(
-                        "WebSocket Keepalive fehlgeschlagen, beende Schleife: %s", e
-                    )
+                if websocket not in ws_manager.active_connections:
+                    logger.debug("WebSocket Keepalive: Verbindung weg, beende Schleife")
                     break
+                await ws_manager.send_personal(websocket, "ping")
         except asyncio.CancelledError:
             pass
 
@@ -2357,6 +2497,7 @@ async def websocket_endpoint(websocket: WebSocket):
                     room = message.get("data", {}).get("room")
                     voice_meta = message.get("data", {}).get("voice_metadata")
                     ws_device_id = message.get("data", {}).get("device_id")
+                    ws_request_id = message.get("data", {}).get("request_id")
                     use_stream = message.get("data", {}).get("stream", False)
                     if text:
                         # Interrupt-Flag zuruecksetzen vor neuer Verarbeitung
@@ -2379,25 +2520,6 @@ async def websocket_endpoint(websocket: WebSocket):
                                 _BUFFER_THRESHOLD = (
                                     12  # Tokens buffern bevor Streaming startet
                                 )
-                                _REASONING_STARTERS = [
-                                    "okay, the user",
-                                    "ok, the user",
-                                    "the user",
-                                    "let me ",
-                                    "i need to",
-                                    "i should ",
-                                    "i'll ",
-                                    "first, i",
-                                    "hmm,",
-                                    "so, the user",
-                                    "now, i",
-                                    "alright,",
-                                    "so the user",
-                                    "wait,",
-                                    "okay, so",
-                                    "right,",
-                                    "let's ",
-                                ]
 
                                 # Sentence-Level TTS: Saetze waehrend Streaming an TTS schicken
                                 _tts_sentence_buf = []  # Tokens seit letzter Satz-Grenze
@@ -2461,7 +2583,7 @@ async def websocket_endpoint(websocket: WebSocket):
                                     # Noch im Buffer-Modus: pruefen ob Reasoning
                                     if len(_stream_buffer) <= _BUFFER_THRESHOLD:
                                         buf_lower = buf_text.lower()
-                                        for starter in _REASONING_STARTERS:
+                                        for starter in REASONING_STARTERS:
                                             if buf_lower.startswith(starter):
                                                 _stream_suppressed = True
                                                 logger.info(
@@ -2498,6 +2620,7 @@ async def websocket_endpoint(websocket: WebSocket):
                                         stream_callback=_guarded_stream_token,
                                         voice_metadata=voice_meta,
                                         device_id=ws_device_id,
+                                        request_id=ws_request_id,
                                     )
 
                                 _brain_task = asyncio.create_task(_run_brain())
@@ -2687,6 +2810,7 @@ async def websocket_endpoint(websocket: WebSocket):
                                 room=room,
                                 voice_metadata=voice_meta,
                                 device_id=ws_device_id,
+                                request_id=ws_request_id,
                             )
 
                         # Aktionen ans Addon melden fuer Aktivitaeten-Log
@@ -2712,6 +2836,17 @@ async def websocket_endpoint(websocket: WebSocket):
                                     )
                                 )
 
+                elif event == "assistant.partial":
+                    # Teil-Transkript: Kontext spekulativ vorladen
+                    _p_data = message.get("data", {})
+                    if _p_data.get("request_id") and _p_data.get("text"):
+                        brain.prefetch_context(
+                            _p_data["request_id"],
+                            _p_data["text"],
+                            _p_data.get("person"),
+                            _p_data.get("room"),
+                        )
+
                 elif event == "assistant.feedback":
                     # Phase 5: Feedback ueber FeedbackTracker verarbeiten
                     fb_data = message.get("data", {})
@@ -4732,6 +4867,10 @@ def _reload_all_modules(yaml_cfg: dict, changed_settings: dict):
 
         _try_reload("response_cache", _reload_response_cache)
 
+    # TTS-Audio-Cache: Limits/Stimme nachladen (alte Stimme verfaellt per LRU)
+    if "tts_audio_cache" in changed_settings or "speech" in changed_settings:
+        _try_reload("tts_audio_cache", _configure_tts_audio_cache)
+
     # Incremental LLM: liest yaml_config live in brain.process() — nur Logging
     if "incremental_llm" in changed_settings:
         logger.info("incremental_llm Settings aktualisiert (live aus yaml_config)")
@@ -6975,13 +7114,24 @@ async def ui_get_action_log(
     offset: int = 0,
     type: str = "",
     period: str = "7d",
+    cursor: str = "",
+    total: str = "",
 ):
-    """Jarvis Action-Log vom MindHome Add-on holen (mit Filtern)."""
+    """Jarvis Action-Log vom MindHome Add-on holen (mit Filtern).
+
+    total: "exact" (Default des Add-ons), "approx" oder "none" (kein COUNT).
+    """
     await _check_token(token)
     try:
         params = f"limit={limit}&offset={offset}&period={period}"
         if type:
             params += f"&type={type}"
+        if total in ("exact", "approx", "none"):
+            params += f"&total={total}"
+        if cursor:
+            from urllib.parse import quote
+
+            params += f"&cursor={quote(cursor, safe='')}"
         result = await brain.ha.mindhome_get(f"/api/action-log?{params}")
         return result or {"items": [], "total": 0, "has_more": False}
     except Exception as e:
@@ -10809,6 +10959,41 @@ async def metrics():
     lines.append("# HELP mindhome_websocket_connections Aktive WebSocket-Verbindungen")
     lines.append("# TYPE mindhome_websocket_connections gauge")
     lines.append(f"mindhome_websocket_connections {len(ws_manager.active_connections)}")
+    _ws_stats = ws_manager.get_stats()
+    lines.append("# HELP mindhome_websocket_queued_frames Frames in WebSocket-Sende-Queues")
+    lines.append("# TYPE mindhome_websocket_queued_frames gauge")
+    lines.append(f"mindhome_websocket_queued_frames {_ws_stats['queued_frames']}")
+    lines.append("# HELP mindhome_websocket_dropped_frames_total Verworfene verlustbehaftete Frames")
+    lines.append("# TYPE mindhome_websocket_dropped_frames_total counter")
+    lines.append(f"mindhome_websocket_dropped_frames_total {_ws_stats['dropped_frames']}")
+    lines.append("# HELP mindhome_websocket_slow_disconnects_total Wegen voller Queue getrennte Clients")
+    lines.append("# TYPE mindhome_websocket_slow_disconnects_total counter")
+    lines.append(f"mindhome_websocket_slow_disconnects_total {_ws_stats['slow_disconnects']}")
+
+    # HA-Event-Verarbeitung (Proactive Worker-Pool)
+    try:
+        _ev = brain.proactive.get_event_stats()
+        lines.append("# HELP mindhome_ha_events_queued Wartende HA-Events pro Lane")
+        lines.append("# TYPE mindhome_ha_events_queued gauge")
+        for _lane, _n in _ev["queued_by_lane"].items():
+            lines.append(f'mindhome_ha_events_queued{{lane="{_lane}"}} {_n}')
+        lines.append("# HELP mindhome_ha_events_dropped_total Verworfene HA-Events pro Lane")
+        lines.append("# TYPE mindhome_ha_events_dropped_total counter")
+        for _lane, _n in _ev["dropped_by_lane"].items():
+            lines.append(f'mindhome_ha_events_dropped_total{{lane="{_lane}"}} {_n}')
+        lines.append("# HELP mindhome_ha_events_processed_total Verarbeitete HA-Events")
+        lines.append("# TYPE mindhome_ha_events_processed_total counter")
+        lines.append(f"mindhome_ha_events_processed_total {_ev['processed']}")
+        lines.append("# HELP mindhome_ha_event_lag_seconds Wartezeit bis Verarbeitungsstart")
+        lines.append("# TYPE mindhome_ha_event_lag_seconds gauge")
+        lines.append(f'mindhome_ha_event_lag_seconds{{stat="last"}} {_ev["last_lag_seconds"]}')
+        lines.append(f'mindhome_ha_event_lag_seconds{{stat="max"}} {_ev["max_lag_seconds"]}')
+        lines.append(f'mindhome_ha_event_lag_seconds{{stat="oldest_pending"}} {_ev["oldest_pending_seconds"]}')
+        lines.append("# HELP mindhome_ha_event_handler_seconds_total Summe der Handler-Laufzeiten")
+        lines.append("# TYPE mindhome_ha_event_handler_seconds_total counter")
+        lines.append(f"mindhome_ha_event_handler_seconds_total {_ev['handler_seconds_total']}")
+    except Exception as e:
+        logger.debug("Unhandled: %s", e)
 
     # Circuit Breaker Status
     try:
@@ -55,9 +55,9 @@ class MemoryManager:
                 host=_parsed.hostname or "localhost",
                 port=_parsed.port or 8000,
             )
-            from .embeddings import get_embedding_function
+            from .embeddings import aget_embedding_function
 
-            ef = get_embedding_function()
+            ef = await aget_embedding_function()
             col_kwargs = {
                 "name": "mha_conversations",
                 "metadata": {
@@ -20,9 +20,47 @@ import re
 from collections import deque
 
 from .config import settings, yaml_config
+from .intent_matcher import intent_matcher
 
 logger = logging.getLogger(__name__)
 
+# D1: Task-Typ Keywords (classify_task)
+_CREATIVE_KEYWORDS = (
+    "schreib",
+    "formulier",
+    "erfinde",
+    "stell dir vor",
+    "was waere wenn",
+    "was wäre wenn",
+    "hypothetisch",
+    "kreativ",
+    "idee",
+)
+_ANALYSIS_KEYWORDS = (
+    "analysier",
+    "vergleich",
+    "unterschied",
+    "vor- und nachteil",
+    "optimier",
+    "berechne",
+    "erklaer",
+    "warum genau",
+    "diagnos",
+)
+_FACTUAL_STARTS = (
+    "was ist",
+    "wann ",
+    "wo ",
+    "wer ",
+    "wie viel",
+    "wie hoch",
+    "wie warm",
+)
+
+intent_matcher.register("router.creative", _CREATIVE_KEYWORDS, "sub")
+intent_matcher.register("router.analysis", _ANALYSIS_KEYWORDS, "sub")
+intent_matcher.register("router.factual", _FACTUAL_STARTS, "start")
+
 
 class ModelRouter:
     """Routet Anfragen zum passenden lokalen Modell (3 Stufen)."""
@@ -325,6 +363,16 @@ class ModelRouter:
             return bool(re.search(r"\b" + re.escape(keyword) + r"\b", text))
         return keyword in text
 
+    def _features(self, text: str):
+        """Feature-Vektor aus dem gemeinsamen IntentMatcher.
+
+        Fast-/Deep-Keywords sind konfigurierbar und werden deshalb vor der
+        Nutzung (idempotent) registriert. Matching wie _word_match().
+        """
+        intent_matcher.register("router.fast", self.fast_keywords, "short_word")
+        intent_matcher.register("router.deep", self.deep_keywords, "short_word")
+        return intent_matcher.analyze(text)
+
     def get_tier_for_model(self, model: str) -> str:
         """Gibt den Tier-Namen fuer ein Modell zurueck.
 
@@ -356,33 +404,34 @@ class ModelRouter:
         """
         text_lower = text.lower().strip()
         word_count = len(text_lower.split())
+        features = self._features(text)
 
         # 1. Kurze Befehle -> schnelles Modell (wenn aktiviert)
         if word_count <= 6 and self._fast_enabled:
-            for keyword in self.fast_keywords:
-                if self._word_match(keyword, text_lower):
-                    logger.debug("FAST model fuer: '%s' (keyword: %s)", text, keyword)
-                    return self.model_fast, "fast", False
+            keyword = features.first("router.fast")
+            if keyword is not None:
+                logger.debug("FAST model fuer: '%s' (keyword: %s)", text, keyword)
+                return self.model_fast, "fast", False
 
         # 2. Deep-Keywords -> Deep-Modell (oder Smart wenn degradiert)
-        for keyword in self.deep_keywords:
-            if self._word_match(keyword, text_lower):
-                if self._deep_degraded:
-                    model = self._cap_model(self.model_smart)
-                    logger.debug(
-                        "DEEP→SMART (degradiert) fuer: '%s' (keyword: %s)",
-                        text,
-                        keyword,
-                    )
-                    return model, "smart", False
-                model = self._cap_model(self.model_deep)
+        keyword = features.first("router.deep")
+        if keyword is not None:
+            if self._deep_degraded:
+                model = self._cap_model(self.model_smart)
                 logger.debug(
-                    "DEEP model fuer: '%s' (keyword: %s, actual: %s)",
+                    "DEEP→SMART (degradiert) fuer: '%s' (keyword: %s)",
                     text,
                     keyword,
-                    model,
                 )
-                return model, "deep", True
+                return model, "smart", False
+            model = self._cap_model(self.model_deep)
+            logger.debug(
+                "DEEP model fuer: '%s' (keyword: %s, actual: %s)",
+                text,
+                keyword,
+                model,
+            )
+            return model, "deep", True
 
         # 3. Sehr lange Anfragen (>15 Woerter) -> Deep (oder Smart wenn degradiert)
         if word_count >= self.deep_min_words:
@@ -444,58 +493,26 @@ class ModelRouter:
         Returns:
             Task-Typ: 'command', 'factual', 'conversation', 'creative', 'analysis', 'default'
         """
-        text_lower = text.lower().strip()
+        features = self._features(text)
 
         # Command: Geraetesteuerung
-        for keyword in self.fast_keywords:
-            if self._word_match(keyword, text_lower):
-                return "command"
+        if features.has("router.fast"):
+            return "command"
 
         # Creative: Schreibaufgaben, Ideen
-        _creative_kw = (
-            "schreib",
-            "formulier",
-            "erfinde",
-            "stell dir vor",
-            "was waere wenn",
-            "was wäre wenn",
-            "hypothetisch",
-            "kreativ",
-            "idee",
-        )
-        if any(kw in text_lower for kw in _creative_kw):
+        if features.has("router.creative"):
             return "creative"
 
         # Analysis: Diagnose, Vergleich, Erklaerung
-        _analysis_kw = (
-            "analysier",
-            "vergleich",
-            "unterschied",
-            "vor- und nachteil",
-            "optimier",
-            "berechne",
-            "erklaer",
-            "warum genau",
-            "diagnos",
-        )
-        if any(kw in text_lower for kw in _analysis_kw):
+        if features.has("router.analysis"):
             return "analysis"
 
         # Factual: Kurze Fakten-Fragen
-        _factual_starts = (
-            "was ist",
-            "wann ",
-            "wo ",
-            "wer ",
-            "wie viel",
-            "wie hoch",
-            "wie warm",
-        )
-        if any(text_lower.startswith(w) for w in _factual_starts):
+        if features.has("router.factual"):
             return "factual"
 
         # Conversation: Laengerer Text, Fragen, Meinungen
-        if len(text_lower.split()) > 8 or "?" in text:
+        if features.word_count > 8 or "?" in text:
             return "conversation"
 
         return "default"
@@ -17,6 +17,8 @@ import re
 from dataclasses import dataclass
 from typing import Optional, Union
 
+from .intent_matcher import intent_matcher
+
 logger = logging.getLogger(__name__)
 
 
@@ -416,6 +418,29 @@ _EXPLAIN_PATTERNS = re.compile(
 )
 
 
+_ALLE_WORDS = ("alle", "alles", "überall", "ueberall")
+_DEVICE_CONTEXT_WORDS = ("maschine", "geraet", "gerät", "dose")
+
+# Alle Keyword-Tabellen im gemeinsamen Automaten (ein Scan pro Utterance).
+# classify() arbeitet auf ß→ss-normalisiertem Text → fold_sharp_s=True.
+intent_matcher.register("pc.device_nouns", _DEVICE_NOUNS, "sub", fold_sharp_s=True)
+intent_matcher.register(
+    "pc.device_actions", _DEVICE_ACTIONS, "lead", fold_sharp_s=True
+)
+intent_matcher.register("pc.alle", _ALLE_WORDS, "lead", fold_sharp_s=True)
+intent_matcher.register(
+    "pc.device_context", _DEVICE_CONTEXT_WORDS, "sub", fold_sharp_s=True
+)
+intent_matcher.register("pc.status_nouns", _STATUS_NOUNS, "sub", fold_sharp_s=True)
+intent_matcher.register("pc.memory", _MEMORY_KEYWORDS, "sub", fold_sharp_s=True)
+intent_matcher.register(
+    "pc.knowledge", _KNOWLEDGE_PATTERNS, "lead", fold_sharp_s=True
+)
+intent_matcher.register(
+    "pc.smart_home", _SMART_HOME_KEYWORDS, "sub", fold_sharp_s=True
+)
+
+
 class PreClassifier:
     """Klassifiziert Anfragen fuer selektive Subsystem-Aktivierung.
 
@@ -535,6 +560,8 @@ class PreClassifier:
         # both "schließe" and "schliesse" uniformly
         text_lower = text_lower.replace("ß", "ss")
         word_count = len(text_lower.split())
+        # Ein Automaten-Scan fuer alle Keyword-Tabellen (geteilt mit Brain/Router)
+        features = intent_matcher.analyze(text)
 
         # 1. Geraete-Befehle: Verb-Start oder Nomen+Aktion, max 12 Woerter
         #    (12 statt 8: Multi-Raum-Befehle wie "Mache die Rolllaeden im
@@ -551,19 +578,13 @@ class PreClassifier:
                 logger.debug("PreClassifier: DEVICE_FAST (verb: %s)", text)
                 return PROFILE_DEVICE_FAST
 
-            has_noun = any(n in text_lower for n in _DEVICE_NOUNS)
-            has_action = (
-                any(f" {a}" in f" {text_lower}" for a in _DEVICE_ACTIONS)
-                or "%" in text_lower
-            )
+            has_noun = features.has("pc.device_nouns")
+            has_action = features.has("pc.device_actions") or "%" in text_lower
             if has_noun and has_action:
                 logger.debug("PreClassifier: DEVICE_FAST (noun+action: %s)", text)
                 return PROFILE_DEVICE_FAST
             # "alles aus/zu/an" ohne spezifisches Geraete-Nomen
-            _has_alle = any(
-                f" {w}" in f" {text_lower}"
-                for w in ("alle", "alles", "überall", "ueberall")
-            )
+            _has_alle = features.has("pc.alle")
             if _has_alle and has_action:
                 logger.debug("PreClassifier: DEVICE_FAST (alles+action: %s)", text)
                 return PROFILE_DEVICE_FAST
@@ -579,11 +600,9 @@ class PreClassifier:
         #     Deutsche Trennverben: Verb am Anfang/Mitte, Praefix am Satzende
         if word_count <= 16 and not _is_question:
             if _DEVICE_VERBS_SEPARATED.search(text_lower):
-                _has_device_context = any(
-                    n in text_lower for n in _DEVICE_NOUNS
-                ) or any(
-                    w in text_lower for w in ("maschine", "geraet", "gerät", "dose")
-                )
+                _has_device_context = features.has(
+                    "pc.device_nouns"
+                ) or features.has("pc.device_context")
                 if _has_device_context:
                     logger.debug(
                         "PreClassifier: DEVICE_FAST (separated verb: %s)", text
@@ -599,8 +618,8 @@ class PreClassifier:
         # 2. Status-Abfragen: "Wie warm ist es?", "Sind die Rolllaeden offen?"
         if word_count <= 10:
             has_status_pattern = _STATUS_QUERY_PATTERNS.search(text_lower)
-            has_status_noun = any(
-                n in text_lower for n in _STATUS_NOUNS
+            has_status_noun = features.has(
+                "pc.status_nouns"
             ) or _STATUS_SHORT_WORDS.search(text_lower)
             if has_status_pattern and has_status_noun:
                 logger.debug("PreClassifier: DEVICE_QUERY (%s)", text)
@@ -621,16 +640,13 @@ class PreClassifier:
             return PROFILE_DEVICE_FAST
 
         # 3. Memory-Fragen
-        if any(kw in text_lower for kw in _MEMORY_KEYWORDS):
+        if features.has("pc.memory"):
             logger.debug("PreClassifier: MEMORY (%s)", text)
             return PROFILE_MEMORY
 
         # 5. Wissensfragen ohne Smart-Home-Bezug
-        is_knowledge = any(
-            text_lower.startswith(kw) or f" {kw}" in text_lower
-            for kw in _KNOWLEDGE_PATTERNS
-        )
-        has_smart_home = any(kw in text_lower for kw in _SMART_HOME_KEYWORDS)
+        is_knowledge = features.has("pc.knowledge")
+        has_smart_home = features.has("pc.smart_home")
 
         if is_knowledge and not has_smart_home:
             logger.debug("PreClassifier: KNOWLEDGE (%s)", text)
@@ -48,6 +48,12 @@ from .constants import (
     PROACTIVE_THREAT_STARTUP_DELAY,
     PROACTIVE_WS_RECONNECT_DELAY,
 )
+from .event_dispatcher import (
+    LANE_BULK,
+    LANE_CRITICAL,
+    LANE_NORMAL,
+    KeyedEventDispatcher,
+)
 from .ollama_client import validate_notification
 from .websocket import emit_proactive, emit_interrupt
 
@@ -79,6 +85,33 @@ _LOG_DOMAINS = (
     "alarm_control_panel.",
 )
 
+# Event-Lanes fuer die HA-Event-Verarbeitung: Sicherheit/Gefahr ueberholt
+# einen Rueckstau von Sensor-/Klima-Updates
+_CRITICAL_EVENT_PREFIXES = (
+    "alarm_control_panel.",
+    "lock.",
+    "siren.",
+    "binary_sensor.smoke",
+    "binary_sensor.rauch",
+    "binary_sensor.water",
+    "binary_sensor.wasser",
+    "binary_sensor.gas",
+)
+_CRITICAL_DEVICE_CLASSES = frozenset(
+    {"smoke", "gas", "carbon_monoxide", "moisture", "safety", "tamper"}
+)
+_BULK_EVENT_DOMAINS = (
+    "sensor.",
+    "climate.",
+    "weather.",
+    "sun.",
+    "number.",
+    "input_number.",
+    "water_heater.",
+)
+# Wetter-Rollen die Sofort-Reaktionen ausloesen (Sturmschutz, Regen)
+_URGENT_SENSOR_ROLES = ("wind_sensor", "rain_sensor")
+
 
 class ProactiveManager:
     """Verwaltet proaktive Meldungen basierend auf HA-Events."""
@@ -103,6 +136,17 @@ class ProactiveManager:
         self._quiet_start = int(quiet_cfg.get("quiet_start", 22))
         self._quiet_end = int(quiet_cfg.get("quiet_end", 7))
 
+        # HA-Events: Leseschleife reiht nur ein, Worker-Pool verarbeitet
+        # (Reihenfolge pro Entity bleibt erhalten)
+        self._events = KeyedEventDispatcher(
+            self._handle_event,
+            workers=proactive_cfg.get("event_workers", 4),
+            max_pending=proactive_cfg.get("event_queue_size", 2000),
+            name="proactive_events",
+        )
+        self._urgent_sensors: frozenset = frozenset()
+        self._urgent_sensors_ts = 0.0
+
         # Phase 15.4: Notification Batching (LOW sammeln)
         batch_cfg = proactive_cfg.get("batching", {})
         self.batch_enabled = batch_cfg.get("enabled", True)
@@ -901,6 +945,7 @@ class ProactiveManager:
             return
 
         self._running = True
+        self._events.start()
         self._task = self._create_loop_task(
             self._listen_ha_events(), name="proactive_ha_events"
         )
@@ -1028,6 +1073,7 @@ class ProactiveManager:
                 await self._task
             except asyncio.CancelledError:
                 pass
+        await self._events.stop()
         if self._diag_task:
             self._diag_task.cancel()
             try:
@@ -1172,13 +1218,61 @@ class ProactiveManager:
                         except (json.JSONDecodeError, TypeError):
                             continue
                         if data.get("type") == "event":
-                            await self._handle_event(data.get("event", {}))
+                            self._enqueue_event(data.get("event", {}))
                     elif msg.type in (
                         aiohttp.WSMsgType.ERROR,
                         aiohttp.WSMsgType.CLOSED,
                     ):
                         break
 
+    def _enqueue_event(self, event: dict):
+        """Reiht ein HA-Event fuer den Worker-Pool ein (blockiert nie)."""
+        data = event.get("data") or {}
+        if event.get("event_type") == "state_changed":
+            key = data.get("entity_id", "") or "state_changed"
+        else:
+            key = event.get("event_type", "") or "event"
+        if not self._events.submit(key, event, self._event_lane(event)):
+            logger.debug("HA-Event verworfen (Queue voll): %s", key)
+
+    def _event_lane(self, event: dict) -> str:
+        """Ordnet ein Event einer Prioritaets-Lane zu."""
+        if event.get("event_type") != "state_changed":
+            return LANE_NORMAL
+        data = event.get("data") or {}
+        entity_id = data.get("entity_id", "")
+        if entity_id.startswith(_CRITICAL_EVENT_PREFIXES) or "doorbell" in entity_id:
+            return LANE_CRITICAL
+        attrs = (data.get("new_state") or {}).get("attributes") or {}
+        if attrs.get("device_class") in _CRITICAL_DEVICE_CLASSES:
+            return LANE_CRITICAL
+        if entity_id in self._get_urgent_sensors():
+            return LANE_CRITICAL
+        if entity_id.startswith(_BULK_EVENT_DOMAINS):
+            return LANE_BULK
+        return LANE_NORMAL
+
+    def _get_urgent_sensors(self) -> frozenset:
+        """Wind-/Regen-Sensoren aus der Cover-Konfiguration (60s gecacht)."""
+        now = time.monotonic()
+        if now - self._urgent_sensors_ts > 60:
+            self._urgent_sensors_ts = now
+            try:
+                from .cover_config import get_sensor_by_role
+
+                self._urgent_sensors = frozenset(
+                    eid
+                    for eid in (get_sensor_by_role(r) for r in _URGENT_SENSOR_ROLES)
+                    if eid
+                )
+            except Exception as e:
+                logger.debug("Cover-Sensor-Rollen nicht ladbar: %s", e)
+        return self._urgent_sensors
+
+    def get_event_stats(self) -> dict:
+        """Queue-Tiefe und Lag der HA-Event-Verarbeitung (fuer /metrics)."""
+        return self._events.get_stats()
+
     async def _handle_event(self, event: dict):
         """Verarbeitet ein HA Event und entscheidet ob gemeldet werden soll."""
         try:
@@ -1202,6 +1296,14 @@ class ProactiveManager:
 
         if not new_state:
             return
+
+        # InsightEngine-Snapshot aktuell halten (auch reine Attribut-Aenderungen)
+        try:
+            if hasattr(self.brain, "insight_engine"):
+                self.brain.insight_engine.note_state(entity_id, new_state)
+        except Exception as _ie_err:
+            logger.debug("InsightEngine note_state Fehler: %s", _ie_err)
+
         if not old_state:
             # Power-Sensoren: Beim ersten Update nach Systemstart old_state=None
             # → auf "0" defaulten damit Power-Close getriggert werden kann
@@ -14,6 +14,7 @@ Nutzt bestehende Module:
 """
 
 import asyncio
+import json
 import logging
 import random
 from datetime import datetime, timedelta, timezone
@@ -41,6 +42,12 @@ KEY_GREETING_HISTORY = "mha:routine:greeting_history"
 KEY_ABSENCE_LOG = "mha:routine:absence_log"
 KEY_GUEST_MODE = "mha:routine:guest_mode"
 KEY_VACATION_SIM = "mha:routine:vacation_simulation"
+KEY_BRIEFING_PRERENDER = "mha:routine:briefing_prerender"
+# Gelernte Aufwach-Zeit (EMA, geschrieben von ProactiveManager D1)
+KEY_AVG_WAKEUP_HOUR = "mha:briefing:avg_wakeup_hour"
+
+# Wie oft der Pre-Render-Loop die naechste Aufwach-Zeit prueft (Sekunden)
+_PRERENDER_POLL_SECONDS = 300
 
 
 class RoutineEngine:
@@ -55,6 +62,8 @@ class RoutineEngine:
         self._semantic_memory = None  # Wird von brain.py gesetzt
         self._explainability = None  # Wird von brain.py gesetzt
         self._vacation_task: Optional[asyncio.Task] = None
+        self._prerender_task: Optional[asyncio.Task] = None
+        self._prerendered_for = ""  # Aufwach-Zeit fuer die schon vorgerendert wurde
 
         # Konfiguration
         routines_cfg = yaml_config.get("routines", {})
@@ -78,6 +87,14 @@ class RoutineEngine:
         self.weekday_style = mb_cfg.get("weekday_style", "kurz")
         self.weekend_style = mb_cfg.get("weekend_style", "ausfuehrlich")
         self.morning_actions = mb_cfg.get("morning_actions", {})
+        self.module_timeout = float(mb_cfg.get("module_timeout_seconds", 6))
+        pr_cfg = mb_cfg.get("prerender", {})
+        self.prerender_enabled = pr_cfg.get("enabled", False)
+        self.prerender_lead_minutes = int(pr_cfg.get("lead_minutes", 20))
+        self.prerender_max_age_minutes = int(pr_cfg.get("max_age_minutes", 120))
+        self.volatile_modules = pr_cfg.get(
+            "volatile_modules", ["weather", "house_status", "device_conflicts"]
+        )
 
         # Good Night Config
         gn_cfg = routines_cfg.get("good_night", {})
@@ -137,6 +154,14 @@ class RoutineEngine:
         self.weekday_style = mb_cfg.get("weekday_style", "kurz")
         self.weekend_style = mb_cfg.get("weekend_style", "ausfuehrlich")
         self.morning_actions = mb_cfg.get("morning_actions", {})
+        self.module_timeout = float(mb_cfg.get("module_timeout_seconds", 6))
+        pr_cfg = mb_cfg.get("prerender", {})
+        self.prerender_enabled = pr_cfg.get("enabled", False)
+        self.prerender_lead_minutes = int(pr_cfg.get("lead_minutes", 20))
+        self.prerender_max_age_minutes = int(pr_cfg.get("max_age_minutes", 120))
+        self.volatile_modules = pr_cfg.get(
+            "volatile_modules", ["weather", "house_status", "device_conflicts"]
+        )
 
         gn_cfg = routines_cfg.get("good_night", {})
         self.goodnight_enabled = gn_cfg.get("enabled", True)
@@ -169,12 +194,35 @@ class RoutineEngine:
             ],
         )
         self.guest_restrictions = gm_cfg.get("restrictions", {})
+        self._start_prerender_loop()
 
         logger.info("RoutineEngine Config hot-reloaded")
 
     async def initialize(self, redis_client: Optional[redis.Redis] = None):
         """Initialisiert mit Redis."""
         self.redis = redis_client
+        self._start_prerender_loop()
+
+    def _start_prerender_loop(self):
+        """Startet den Pre-Render-Loop fuer das Morning Briefing (opt-in)."""
+        if not self.prerender_enabled or not self.redis:
+            return
+        if self._prerender_task and not self._prerender_task.done():
+            return
+        self._prerender_task = asyncio.create_task(self._run_prerender_loop())
+        self._prerender_task.add_done_callback(
+            lambda t: t.exception() if not t.cancelled() else None
+        )
+
+    async def stop(self):
+        """Beendet den Pre-Render-Loop."""
+        task, self._prerender_task = self._prerender_task, None
+        if task and not task.done():
+            task.cancel()
+            try:
+                await task
+            except (asyncio.CancelledError, Exception):
+                pass
 
     def set_executor(self, executor):
         """Setzt den FunctionExecutor für Aktionen."""
@@ -224,24 +272,93 @@ class RoutineEngine:
                     logger.info("Morning Briefing bereits heute ausgeführt")
                     return {"text": "", "actions": []}
 
-        # Bausteine sammeln
-        parts = []
         now = datetime.now(tz=_TZ)
+        prerendered = None
+        if self.prerender_enabled:
+            prerendered = await self._take_prerendered(person, now)
+        if prerendered:
+            text, parts = await self._finish_prerendered(prerendered, person, now)
+        else:
+            style, sleep_note, contents = await self._collect_briefing(person, now)
+            parts = self._briefing_parts(sleep_note, contents)
+            if not parts:
+                return {"text": "", "actions": []}
+            text = await self._render_briefing(parts, style, person, now)
+
+        # Begleit-Aktionen ausführen
+        actions = await self._execute_morning_actions()
+
+        # Als erledigt markieren
+        if self.redis:
+            try:
+                today = datetime.now(tz=_TZ).strftime("%Y-%m-%d")
+                await self.redis.setex(KEY_MORNING_DONE, 86400, today)
+                await self.redis.setex(KEY_LAST_BRIEFING, 86400, now.isoformat())
+            except Exception as e:
+                logger.warning("Redis setex für Morning Briefing fehlgeschlagen: %s", e)
+
+        logger.info(
+            "Morning Briefing generiert (%d Bausteine, %d Aktionen)",
+            len(parts),
+            len(actions),
+        )
+        return {"text": text, "actions": actions}
+
+    async def _collect_briefing(
+        self, person: str, now: datetime
+    ) -> tuple[str, str, dict[str, str]]:
+        """Sammelt Stil, Schlaf-Hinweis und alle Bausteine (parallel).
+
+        Returns:
+            (style, sleep_note, {modul: inhalt})
+        """
         is_weekend = now.weekday() >= 5
         style = self.weekend_style if is_weekend else self.weekday_style
 
         # Phase 17.4: Sleep-Awareness — nach später Nacht kuerzeres Briefing
+        sleep_note = ""
         sleep_hint = await self._get_sleep_awareness()
         if sleep_hint:
             # Spaete Nacht → kuerzerer Stil, egal ob Wochentag
             if sleep_hint.get("was_late"):
                 style = "kurz"
-            parts.append(sleep_hint.get("briefing_note", ""))
+            sleep_note = sleep_hint.get("briefing_note", "")
+
+        contents = await self._gather_briefing_modules(
+            self.briefing_modules, person, style
+        )
+        return style, sleep_note, contents
+
+    async def _gather_briefing_modules(
+        self, modules: list[str], person: str, style: str
+    ) -> dict[str, str]:
+        """Holt Briefing-Bausteine parallel, jeder mit eigenem Timeout."""
+
+        async def _fetch(module: str) -> str:
+            try:
+                return await asyncio.wait_for(
+                    self._get_briefing_module(module, person, style),
+                    timeout=self.module_timeout,
+                )
+            except asyncio.TimeoutError:
+                logger.info(
+                    "Briefing-Modul '%s' Timeout nach %.0fs",
+                    module,
+                    self.module_timeout,
+                )
+                return ""
+
+        results = await asyncio.gather(*(_fetch(m) for m in modules))
+        return dict(zip(modules, results))
+
+    def _briefing_parts(self, sleep_note: str, contents: dict[str, str]) -> list[str]:
+        """Ordnet Bausteine: Schlaf-Hinweis, Begruessung, Rest nach Dringlichkeit."""
+        parts = [sleep_note] if sleep_note else []
 
         # Collect modules with content, then sort by urgency
         module_parts: list[tuple[int, str, str]] = []  # (urgency, module, content)
         for module in self.briefing_modules:
-            content = await self._get_briefing_module(module, person, style)
+            content = contents.get(module, "")
             if content:
                 urgency = self._get_module_urgency(module, content)
                 module_parts.append((urgency, module, content))
@@ -253,11 +370,12 @@ class RoutineEngine:
         greeting_parts = [c for u, m, c in module_parts if m == "greeting"]
         other_parts = [c for u, m, c in module_parts if m != "greeting"]
         parts.extend(greeting_parts + other_parts)
+        return parts
 
-        if not parts:
-            return {"text": "", "actions": []}
-
-        # LLM formuliert das Briefing natürlich
+    async def _render_briefing(
+        self, parts: list[str], style: str, person: str, now: datetime
+    ) -> str:
+        """LLM formuliert das Briefing natürlich (Fallback: rohe Bausteine)."""
         briefing_prompt = self._build_briefing_prompt(parts, style, person, now)
         try:
             response = await self.ollama.chat(
@@ -270,29 +388,147 @@ class RoutineEngine:
                 ],
                 model=settings.model_fast,
             )
-            text = response.get("message", {}).get("content", "")
+            return response.get("message", {}).get("content", "")
         except Exception as e:
             logger.error("Morning Briefing LLM Fehler: %s", e)
-            text = "\n".join(parts)
+            return "\n".join(parts)
 
-        # Begleit-Aktionen ausführen
-        actions = await self._execute_morning_actions()
+    # ------------------------------------------------------------------
+    # Pre-Render: Briefing vor dem Aufwachen vorbereiten (opt-in)
+    # ------------------------------------------------------------------
 
-        # Als erledigt markieren
-        if self.redis:
-            try:
-                today = datetime.now(tz=_TZ).strftime("%Y-%m-%d")
-                await self.redis.setex(KEY_MORNING_DONE, 86400, today)
-                await self.redis.setex(KEY_LAST_BRIEFING, 86400, now.isoformat())
-            except Exception as e:
-                logger.warning("Redis setex für Morning Briefing fehlgeschlagen: %s", e)
+    async def prerender_morning_briefing(self, person: str = "") -> bool:
+        """Rendert das Briefing vorab und legt es in Redis ab.
 
-        logger.info(
-            "Morning Briefing generiert (%d Bausteine, %d Aktionen)",
-            len(parts),
-            len(actions),
+        Beim Aufwachen prueft generate_morning_briefing nur noch die
+        volatilen Bausteine nach und liefert sonst sofort den fertigen Text.
+        """
+        if not self.briefing_enabled or not self.redis:
+            return False
+        now = datetime.now(tz=_TZ)
+        style, sleep_note, contents = await self._collect_briefing(person, now)
+        parts = self._briefing_parts(sleep_note, contents)
+        if not parts:
+            return False
+        text = await self._render_briefing(parts, style, person, now)
+        payload = {
+            "date": now.strftime("%Y-%m-%d"),
+            "created": now.isoformat(),
+            "person": person,
+            "style": style,
+            "sleep_note": sleep_note,
+            "modules": contents,
+            "text": text,
+        }
+        await self.redis.setex(
+            KEY_BRIEFING_PRERENDER,
+            self.prerender_max_age_minutes * 60,
+            json.dumps(payload, ensure_ascii=False),
         )
-        return {"text": text, "actions": actions}
+        logger.info("Morning Briefing vorgerendert (%d Bausteine)", len(parts))
+        return True
+
+    async def _take_prerendered(self, person: str, now: datetime) -> Optional[dict]:
+        """Holt und verbraucht ein passendes vorgerendertes Briefing.
+
+        Geloescht wird erst nach dem Abgleich — ein Briefing fuer eine andere
+        Person (z.B. manueller Chat-Request) laesst den Pre-Render liegen.
+        """
+        if not self.redis:
+            return None
+        try:
+            raw = await self.redis.get(KEY_BRIEFING_PRERENDER)
+            if not raw:
+                return None
+            payload = json.loads(raw)
+            created = datetime.fromisoformat(payload["created"])
+        except Exception as e:
+            logger.debug("Vorgerendertes Briefing nicht lesbar: %s", e)
+            return None
+        age_minutes = (now - created).total_seconds() / 60
+        if (
+            payload.get("date") != now.strftime("%Y-%m-%d")
+            or payload.get("person", "") != person
+            or not 0 <= age_minutes <= self.prerender_max_age_minutes
+        ):
+            return None
+        await self.redis.delete(KEY_BRIEFING_PRERENDER)
+        return payload
+
+    async def _finish_prerendered(
+        self, payload: dict, person: str, now: datetime
+    ) -> tuple[str, list[str]]:
+        """Frische-Check der volatilen Bausteine; LLM nur wenn sich etwas aenderte."""
+        contents = dict(payload.get("modules", {}))
+        style = payload.get("style", self.weekday_style)
+        volatile = [m for m in self.briefing_modules if m in self.volatile_modules]
+        fresh = await self._gather_briefing_modules(volatile, person, style)
+        changed = [m for m in volatile if fresh[m] != contents.get(m, "")]
+        contents.update(fresh)
+        parts = self._briefing_parts(payload.get("sleep_note", ""), contents)
+        if not changed and payload.get("text"):
+            logger.info("Morning Briefing aus Pre-Render geliefert")
+            return payload["text"], parts
+        logger.info("Pre-Render veraltet (%s) — neu formuliert", ", ".join(changed))
+        return await self._render_briefing(parts, style, person, now), parts
+
+    async def _next_wake_time(self, now: datetime) -> Optional[datetime]:
+        """Naechste Aufwach-Zeit: frühester Wecker, sonst gelernter Schnitt."""
+        from .timer_manager import KEY_ALARMS
+
+        horizon = now + timedelta(hours=24)
+        candidates = []
+        try:
+            for raw in (await self.redis.hgetall(KEY_ALARMS) or {}).values():
+                alarm = json.loads(raw)
+                if not alarm.get("active", True) or not alarm.get("next_trigger"):
+                    continue
+                trigger = datetime.fromisoformat(alarm["next_trigger"])
+                if trigger.tzinfo is None:
+                    trigger = trigger.replace(tzinfo=_TZ)
+                if now < trigger <= horizon:
+                    candidates.append(trigger)
+        except Exception as e:
+            logger.debug("Wecker fuer Pre-Render nicht lesbar: %s", e)
+        if candidates:
+            return min(candidates)
+
+        try:
+            raw = await self.redis.get(KEY_AVG_WAKEUP_HOUR)
+            avg_hour = float(raw) if raw else None
+        except (TypeError, ValueError):
+            avg_hour = None
+        if avg_hour is None:
+            return None
+        wake = now.replace(
+            hour=int(avg_hour),
+            minute=int((avg_hour % 1) * 60),
+            second=0,
+            microsecond=0,
+        )
+        return wake if wake > now else wake + timedelta(days=1)
+
+    async def _run_prerender_loop(self):
+        """Rendert das Briefing lead_minutes vor der naechsten Aufwach-Zeit."""
+        while self.prerender_enabled:
+            try:
+                now = datetime.now(tz=_TZ)
+                wake = await self._next_wake_time(now)
+                lead = timedelta(minutes=self.prerender_lead_minutes)
+                if (
+                    wake
+                    and wake - lead <= now
+                    and wake.isoformat() != self._prerendered_for
+                ):
+                    done = await self.redis.get(KEY_MORNING_DONE)
+                    if done != wake.strftime("%Y-%m-%d"):
+                        await self.prerender_morning_briefing()
+                    self._prerendered_for = wake.isoformat()
+            except asyncio.CancelledError:
+                break
+            except Exception as e:
+                logger.warning("Briefing Pre-Render fehlgeschlagen: %s", e)
+            await asyncio.sleep(_PRERENDER_POLL_SECONDS)
 
     async def _get_briefing_module(self, module: str, person: str, style: str) -> str:
         """Holt Daten für einen Briefing-Baustein."""
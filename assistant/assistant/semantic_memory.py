@@ -8,6 +8,8 @@ import asyncio
 import hashlib
 import json
 import logging
+import re
+import time
 from datetime import datetime, timedelta, timezone
 from typing import Optional
 from zoneinfo import ZoneInfo
@@ -66,6 +68,45 @@ FACT_CATEGORIES = [
     "scene_preference",  # "Max mag Filmabend mit 15% statt 10%"
 ]
 
+# Invertierter Index fuer den Redis-Fallback (Token/Stamm → Fakt-IDs) und
+# Sorted Sets fuer Confidence/Alter. Wird von store/update/delete gepflegt;
+# bestehende Daten werden beim Start einmalig nachindiziert.
+_FACT_INDEX_VERSION = "v1"
+_FACT_INDEX_VERSION_KEY = "mha:facts:idx:version"
+_FACT_INDEX_TOKEN = "mha:facts:idx:tok:"
+_FACT_INDEX_STEM = "mha:facts:idx:stem:"
+_FACT_INDEX_CONFIDENCE = "mha:facts:idx:confidence"
+_FACT_INDEX_UPDATED = "mha:facts:idx:updated"
+_TOKEN_RE = re.compile(r"\w+", re.UNICODE)
+
+# Bulk-Operationen: Chunk-Groessen fuer Redis-Pipelines und ChromaDB-Calls
+_BULK_CHUNK = 500
+_CHROMA_CHUNK = 256
+
+
+def _index_terms(content: str) -> tuple[set[str], set[str]]:
+    """Token und 4-Zeichen-Staemme eines Fakt-Inhalts (wie im Fallback-Scoring)."""
+    lower = (content or "").lower()
+    tokens = set(_TOKEN_RE.findall(lower))
+    stems = {w[:4] for w in lower.split() if len(w) >= 4}
+    stems.update(t[:4] for t in tokens if len(t) >= 4)
+    return tokens, stems
+
+
+def _iso_to_epoch(value) -> Optional[float]:
+    """ISO-Zeitstempel → Unix-Epoch (UTC angenommen wenn ohne Zeitzone)."""
+    if isinstance(value, bytes):
+        value = value.decode()
+    if not value:
+        return None
+    try:
+        parsed = datetime.fromisoformat(value)
+    except (ValueError, TypeError):
+        return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed.timestamp()
+
 
 class SemanticFact:
     """Ein einzelner semantischer Fakt."""
@@ -148,10 +189,17 @@ class SemanticMemory:
         self._relationship_cache_ts: float = 0.0
         self._relationship_lock = asyncio.Lock()
         self._last_contradiction: Optional[dict] = None
+        self._fact_index_ready = False
 
     async def initialize(self, redis_client: Optional[redis.Redis] = None):
         """Initialisiert die Verbindungen."""
         self.redis = redis_client
+        if self.redis:
+            try:
+                if not await self._is_fact_index_ready():
+                    await self.rebuild_fact_index()
+            except Exception as e:
+                logger.warning("Fakt-Index konnte nicht aufgebaut werden: %s", e)
 
         try:
             import chromadb
@@ -163,9 +211,9 @@ class SemanticMemory:
                 host=_parsed.hostname or "localhost",
                 port=_parsed.port or 8000,
             )
-            from .embeddings import get_embedding_function
+            from .embeddings import aget_embedding_function
 
-            ef = get_embedding_function()
+            ef = await aget_embedding_function()
             col_kwargs = {
                 "name": "mha_semantic_facts",
                 "metadata": {"description": "MindHome Assistant - Extrahierte Fakten"},
@@ -315,6 +363,13 @@ class SemanticMemory:
                     fact.fact_id,
                 )
                 pipe.sadd("mha:facts:all", fact.fact_id)
+                self._index_fact(
+                    pipe,
+                    fact.fact_id,
+                    fact.content,
+                    fact.confidence,
+                    fact.updated_at,
+                )
                 await pipe.execute()
             except Exception as e:
                 logger.error(
@@ -410,6 +465,10 @@ class SemanticMemory:
                 )
                 pipe.hset(f"mha:fact:{fact_id}", "confidence", str(new_confidence))
                 pipe.hset(f"mha:fact:{fact_id}", "content", new_fact.content)
+                self._unindex_fact(pipe, fact_id, old_content)
+                self._index_fact(
+                    pipe, fact_id, new_fact.content, new_confidence, now
+                )
                 await pipe.execute()
             except Exception as e:
                 logger.error("Fehler beim Redis-Update: %s", e)
@@ -422,6 +481,16 @@ class SemanticMemory:
         )
         return True
 
+    async def touch_fact(self, fact_id: str) -> None:
+        """Setzt updated_at eines Fakts auf jetzt (Hash + Alters-Index)."""
+        if not self.redis:
+            return
+        now = datetime.now(timezone.utc)
+        pipe = self.redis.pipeline()
+        pipe.hset(f"mha:fact:{fact_id}", "updated_at", now.isoformat())
+        pipe.zadd(_FACT_INDEX_UPDATED, {fact_id: now.timestamp()})
+        await pipe.execute()
+
     async def _store_fact_version(self, fact_id: str, old_fact: dict) -> None:
         """Speichert eine vorherige Version eines Fakts in Redis."""
         if not self.redis:
@@ -559,111 +628,211 @@ class SemanticMemory:
 
         return None
 
-    async def apply_decay(self):
+    async def apply_decay(self) -> dict:
         """Reduziert die Confidence alter Fakten ueber Zeit.
 
         Fakten die laenger als 30 Tage nicht bestaetigt wurden verlieren
         an Confidence. Explizite Fakten (confidence=1.0) werden langsamer
         abgebaut. Fakten unter 0.2 Confidence werden geloescht.
+
+        Ablauf: Kandidaten chunkweise lesen, neue Confidence fuer alle in
+        einem Durchlauf berechnen, dann EINE Redis-Pipeline fuer Updates und
+        Loeschungen und gechunkte Bulk-Calls an ChromaDB.
+
+        Returns:
+            Statistik: scanned, decayed, deleted, duration_ms, facts_per_s
         """
+        stats = {
+            "scanned": 0,
+            "decayed": 0,
+            "deleted": 0,
+            "duration_ms": 0.0,
+            "facts_per_s": 0.0,
+        }
         if not self.redis:
-            return
+            return stats
 
+        t0 = time.monotonic()
         try:
-            fact_ids = await self.redis.smembers("mha:facts:all")
             now = datetime.now(timezone.utc)
-            decayed = 0
-            deleted = 0
-
-            # Batch-fetch all fact data via pipeline to avoid N+1
-            fact_ids_list = list(fact_ids)
-            pipe = self.redis.pipeline()
-            for fact_id in fact_ids_list:
-                pipe.hgetall(f"mha:fact:{fact_id}")
-            all_data = await pipe.execute()
+            if await self._is_fact_index_ready():
+                # Nur Kandidaten die seit >= 30 Tagen nicht aktualisiert wurden
+                fact_ids = await self.redis.zrangebyscore(
+                    _FACT_INDEX_UPDATED,
+                    "-inf",
+                    (now - timedelta(days=30)).timestamp(),
+                )
+            else:
+                fact_ids = await self.redis.smembers("mha:facts:all")
+            fact_ids_list = [
+                fid if isinstance(fid, str) else fid.decode() for fid in fact_ids
+            ]
+            all_data = await self._fetch_fact_hashes(fact_ids_list)
+            stats["scanned"] = len(fact_ids_list)
 
+            # Neue Confidence fuer alle Kandidaten in einem Durchlauf
+            updates: dict[str, tuple[float, dict]] = {}
+            removals: dict[str, dict] = {}
             for fact_id, data in zip(fact_ids_list, all_data):
-                if not data:
-                    continue
-
-                updated_at = data.get("updated_at", "")
-                if not updated_at:
+                new_confidence = self._decayed_confidence(data, now)
+                if new_confidence is None:
                     continue
-
-                try:
-                    last_update = datetime.fromisoformat(updated_at)
-                    if last_update.tzinfo is None:
-                        last_update = last_update.replace(tzinfo=timezone.utc)
-                except (ValueError, TypeError):
-                    continue
-
-                days_since = (now - last_update).days
-                if days_since < 30:
-                    continue
-
-                confidence = float(data.get("confidence", 0.5))
-                source = data.get("source_conversation", "")
-
-                # Decay-Rate: Langsam genug damit Fakten monatelang nutzbar bleiben.
-                # Bei Confidence 0.8 und Rate 0.02 → nach 6 Monaten: ~0.68 → noch sichtbar.
-                # Erst nach ~20 Monaten (0.4) wird der Fakt unsichtbar im Kontext.
-                # Explizite Fakten ("merk dir") noch langsamer.
-                if source == "explicit":
-                    decay_rate = 0.005  # 0.5% pro 30-Tage-Zyklus — praktisch permanent
-                else:
-                    decay_rate = (
-                        0.02  # 2% pro 30-Tage-Zyklus — ~20 Monate bis unsichtbar
-                    )
-
-                # Haeufig bestaetigte Fakten langsamer abbauen
-                times_confirmed = int(data.get("times_confirmed", 1))
-                if times_confirmed >= 5:
-                    decay_rate *= 0.25  # 4x langsamer — praktisch permanent
-                elif times_confirmed >= 3:
-                    decay_rate *= 0.5  # 2x langsamer
-
-                new_confidence = max(0.0, confidence - decay_rate)
-
                 if new_confidence < 0.2:
                     # Fakt zu unsicher -> loeschen
-                    await self.delete_fact(fact_id)
-                    deleted += 1
-                elif new_confidence != confidence:
-                    await self.redis.hset(
+                    removals[fact_id] = data
+                else:
+                    updates[fact_id] = (new_confidence, data)
+
+            if updates or removals:
+                pipe = self.redis.pipeline()
+                for fact_id, (new_confidence, _data) in updates.items():
+                    pipe.hset(
                         f"mha:fact:{fact_id}",
                         "confidence",
                         str(round(new_confidence, 3)),
                     )
-                    if self.chroma_collection:
-                        try:
-                            # Metadata-Keys bereinigen: bytes dekodieren, nur
-                            # erlaubte String-Felder an ChromaDB weitergeben
-                            clean_meta = {}
-                            for k, v in data.items():
-                                key = k.decode() if isinstance(k, bytes) else k
-                                val = v.decode() if isinstance(v, bytes) else v
-                                if isinstance(val, str):
-                                    clean_meta[key] = val
-                            clean_meta["confidence"] = str(round(new_confidence, 3))
-                            await asyncio.to_thread(
-                                self.chroma_collection.update,
-                                ids=[fact_id],
-                                metadatas=[clean_meta],
-                            )
-                        except Exception as e:
-                            logger.debug("ChromaDB update in decay failed: %s", e)
-                    decayed += 1
+                    if self._fact_index_ready:
+                        pipe.zadd(
+                            _FACT_INDEX_CONFIDENCE,
+                            {fact_id: round(new_confidence, 3)},
+                        )
+                for fact_id, data in removals.items():
+                    self._queue_fact_removal(pipe, fact_id, data)
+                await pipe.execute()
 
-            if decayed or deleted:
+            if self.chroma_collection:
+                if updates:
+                    ids = list(updates)
+                    metadatas = []
+                    for fact_id in ids:
+                        new_confidence, data = updates[fact_id]
+                        meta = self._clean_chroma_meta(data)
+                        meta["confidence"] = str(round(new_confidence, 3))
+                        metadatas.append(meta)
+                    await self._chroma_bulk("update", ids, metadatas)
+                if removals:
+                    await self._chroma_bulk("delete", list(removals))
+
+            stats["decayed"] = len(updates)
+            stats["deleted"] = len(removals)
+            if updates or removals:
                 logger.info(
                     "Fact Decay: %d Fakten reduziert, %d geloescht",
-                    decayed,
-                    deleted,
+                    len(updates),
+                    len(removals),
                 )
 
         except Exception as e:
             logger.error("Fehler bei Fact Decay: %s", e)
 
+        elapsed = time.monotonic() - t0
+        stats["duration_ms"] = round(elapsed * 1000, 1)
+        stats["facts_per_s"] = (
+            round(stats["scanned"] / elapsed, 1) if elapsed > 0 else 0.0
+        )
+        return stats
+
+    @staticmethod
+    def _decayed_confidence(data: dict, now: datetime) -> Optional[float]:
+        """Neue Confidence eines Fakts nach einem Decay-Zyklus (None = unveraendert)."""
+        if not data:
+            return None
+        updated_at = data.get("updated_at", "")
+        if not updated_at:
+            return None
+        try:
+            last_update = datetime.fromisoformat(updated_at)
+            if last_update.tzinfo is None:
+                last_update = last_update.replace(tzinfo=timezone.utc)
+        except (ValueError, TypeError):
+            return None
+
+        days_since = (now - last_update).days
+        if days_since < 30:
+            return None
+
+        confidence = float(data.get("confidence", 0.5))
+        source = data.get("source_conversation", "")
+
+        # Decay-Rate: Langsam genug damit Fakten monatelang nutzbar bleiben.
+        # Bei Confidence 0.8 und Rate 0.02 → nach 6 Monaten: ~0.68 → noch sichtbar.
+        # Erst nach ~20 Monaten (0.4) wird der Fakt unsichtbar im Kontext.
+        # Explizite Fakten ("merk dir") noch langsamer.
+        if source == "explicit":
+            decay_rate = 0.005  # 0.5% pro 30-Tage-Zyklus — praktisch permanent
+        else:
+            decay_rate = 0.02  # 2% pro 30-Tage-Zyklus — ~20 Monate bis unsichtbar
+
+        # Haeufig bestaetigte Fakten langsamer abbauen
+        times_confirmed = int(data.get("times_confirmed", 1))
+        if times_confirmed >= 5:
+            decay_rate *= 0.25  # 4x langsamer — praktisch permanent
+        elif times_confirmed >= 3:
+            decay_rate *= 0.5  # 2x langsamer
+
+        new_confidence = max(0.0, confidence - decay_rate)
+        if new_confidence == confidence:
+            return None
+        return new_confidence
+
+    async def _fetch_fact_hashes(self, fact_ids: list[str]) -> list[dict]:
+        """Liest Fakt-Hashes gechunkt per Pipeline (Reihenfolge wie fact_ids)."""
+        results: list[dict] = []
+        for start in range(0, len(fact_ids), _BULK_CHUNK):
+            pipe = self.redis.pipeline()
+            for fact_id in fact_ids[start : start + _BULK_CHUNK]:
+                pipe.hgetall(f"mha:fact:{fact_id}")
+            results.extend(await pipe.execute())
+        return results
+
+    def _queue_fact_removal(self, pipe, fact_id: str, data: dict) -> None:
+        """Reiht das Entfernen eines Fakts (Hash, Sets, Index) in eine Pipeline ein."""
+        person = data.get("person", "unknown")
+        category = data.get("category", "general")
+        pipe.srem(f"mha:facts:person:{person}", fact_id)
+        pipe.srem(f"mha:facts:category:{category}", fact_id)
+        pipe.srem("mha:facts:all", fact_id)
+        pipe.delete(f"mha:fact:{fact_id}")
+        self._unindex_fact(pipe, fact_id, data.get("content", ""))
+
+    @staticmethod
+    def _clean_chroma_meta(data: dict) -> dict:
+        """Metadata fuer ChromaDB: bytes dekodieren, nur String-Felder."""
+        clean_meta = {}
+        for k, v in data.items():
+            key = k.decode() if isinstance(k, bytes) else k
+            val = v.decode() if isinstance(v, bytes) else v
+            if isinstance(val, str):
+                clean_meta[key] = val
+        return clean_meta
+
+    async def _chroma_bulk(
+        self, op: str, ids: list[str], metadatas: Optional[list[dict]] = None
+    ) -> int:
+        """Gechunkte Bulk-update/delete Calls an ChromaDB.
+
+        Fehler einzelner Chunks werden geloggt, die restlichen laufen weiter.
+        Gibt die Anzahl erfolgreich verarbeiteter IDs zurueck.
+        """
+        done = 0
+        for start in range(0, len(ids), _CHROMA_CHUNK):
+            chunk = ids[start : start + _CHROMA_CHUNK]
+            try:
+                if op == "update":
+                    await asyncio.to_thread(
+                        self.chroma_collection.update,
+                        ids=chunk,
+                        metadatas=metadatas[start : start + _CHROMA_CHUNK],
+                    )
+                else:
+                    await asyncio.to_thread(self.chroma_collection.delete, ids=chunk)
+                done += len(chunk)
+            except Exception as e:
+                logger.debug(
+                    "ChromaDB Bulk-%s (%d IDs) fehlgeschlagen: %s", op, len(chunk), e
+                )
+        return done
+
     async def verify_consistency(self):
         """Prueft Konsistenz zwischen Redis und ChromaDB.
 
@@ -729,6 +898,9 @@ class SemanticMemory:
                         else:
                             # Fakt-ID in Index aber keine Daten → Index bereinigen
                             await self.redis.srem("mha:facts:all", fact_id)
+                            if self._fact_index_ready:
+                                await self.redis.zrem(_FACT_INDEX_CONFIDENCE, fact_id)
+                                await self.redis.zrem(_FACT_INDEX_UPDATED, fact_id)
                             orphaned_redis += 1
                 except Exception as e:
                     logger.debug(
@@ -931,6 +1103,144 @@ class SemanticMemory:
         }
     )
 
+    # ------------------------------------------------------------------
+    # Invertierter Fakt-Index (Redis)
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _index_fact(
+        pipe, fact_id: str, content: str, confidence, updated_at
+    ) -> None:
+        """Traegt einen Fakt in Token-/Stamm-Index und Sorted Sets ein (Pipeline)."""
+        tokens, stems = _index_terms(content)
+        for token in tokens:
+            pipe.sadd(f"{_FACT_INDEX_TOKEN}{token}", fact_id)
+        for stem in stems:
+            pipe.sadd(f"{_FACT_INDEX_STEM}{stem}", fact_id)
+        try:
+            pipe.zadd(_FACT_INDEX_CONFIDENCE, {fact_id: float(confidence)})
+        except (ValueError, TypeError):
+            pass
+        epoch = _iso_to_epoch(updated_at)
+        if epoch is not None:
+            pipe.zadd(_FACT_INDEX_UPDATED, {fact_id: epoch})
+
+    @staticmethod
+    def _unindex_fact(pipe, fact_id: str, content) -> None:
+        """Entfernt einen Fakt aus allen Index-Strukturen (Pipeline)."""
+        if isinstance(content, bytes):
+            content = content.decode()
+        tokens, stems = _index_terms(content or "")
+        for token in tokens:
+            pipe.srem(f"{_FACT_INDEX_TOKEN}{token}", fact_id)
+        for stem in stems:
+            pipe.srem(f"{_FACT_INDEX_STEM}{stem}", fact_id)
+        pipe.zrem(_FACT_INDEX_CONFIDENCE, fact_id)
+        pipe.zrem(_FACT_INDEX_UPDATED, fact_id)
+
+    async def _is_fact_index_ready(self) -> bool:
+        """True wenn der invertierte Index aufgebaut ist (Version-Marker in Redis)."""
+        if self._fact_index_ready:
+            return True
+        if not self.redis:
+            return False
+        try:
+            version = await self.redis.get(_FACT_INDEX_VERSION_KEY)
+        except Exception:
+            return False
+        if isinstance(version, bytes):
+            version = version.decode()
+        self._fact_index_ready = version == _FACT_INDEX_VERSION
+        return self._fact_index_ready
+
+    async def rebuild_fact_index(self) -> int:
+        """Baut den invertierten Index aus allen gespeicherten Fakten neu auf.
+
+        Einmaliger Durchlauf beim Start (bestehende Daten ohne Index) oder
+        nach Versionswechsel. Gibt die Anzahl indizierter Fakten zurueck.
+        """
+        if not self.redis:
+            return 0
+        self._fact_index_ready = False
+        fact_ids = [
+            fid if isinstance(fid, str) else fid.decode()
+            for fid in await self.redis.smembers("mha:facts:all")
+        ]
+
+        stale_keys = [
+            key
+            async for key in self.redis.scan_iter(match="mha:facts:idx:*", count=500)
+        ]
+        if stale_keys:
+            await self.redis.delete(*stale_keys)
+
+        indexed = 0
+        for start in range(0, len(fact_ids), _BULK_CHUNK):
+            chunk = fact_ids[start : start + _BULK_CHUNK]
+            all_data = await self._fetch_fact_hashes(chunk)
+            pipe = self.redis.pipeline()
+            for fid, data in zip(chunk, all_data):
+                if not data:
+                    continue
+                self._index_fact(
+                    pipe,
+                    fid,
+                    data.get("content", ""),
+                    data.get("confidence", 0.5),
+                    data.get("updated_at", ""),
+                )
+                indexed += 1
+            await pipe.execute()
+
+        await self.redis.set(_FACT_INDEX_VERSION_KEY, _FACT_INDEX_VERSION)
+        self._fact_index_ready = True
+        logger.info("Fakt-Index aufgebaut: %d Fakten", indexed)
+        return indexed
+
+    async def _fact_index_candidates(
+        self,
+        query_words: set[str],
+        query_stems: set[str],
+        person: Optional[str],
+        min_confidence: float,
+    ) -> list[str]:
+        """Kandidaten-IDs fuer eine Keyword-Suche aus dem invertierten Index.
+
+        Vereinigung der Token- und Stamm-Postings, geschnitten mit dem
+        Personen-Set und gefiltert nach Confidence (Sorted Set).
+        """
+        tokens: set[str] = set()
+        stems = set(query_stems)
+        for w in query_words:
+            word_tokens, word_stems = _index_terms(w)
+            tokens.update(word_tokens)
+            stems.update(word_stems)
+        keys = [f"{_FACT_INDEX_TOKEN}{t}" for t in tokens]
+        keys += [f"{_FACT_INDEX_STEM}{s}" for s in stems]
+        if not keys:
+            return []
+
+        pipe = self.redis.pipeline()
+        pipe.sunion(keys)
+        if person:
+            pipe.smembers(f"mha:facts:person:{person}")
+        results = await pipe.execute()
+        candidates = {c if isinstance(c, str) else c.decode() for c in results[0]}
+        if person:
+            candidates &= {
+                c if isinstance(c, str) else c.decode() for c in results[1]
+            }
+        if not candidates:
+            return []
+
+        ordered = list(candidates)
+        scores = await self.redis.zmscore(_FACT_INDEX_CONFIDENCE, ordered)
+        return [
+            fid
+            for fid, score in zip(ordered, scores)
+            if score is None or score >= min_confidence
+        ]
+
     async def _search_facts_redis_fallback(
         self, query: str, limit: int, person: Optional[str] = None
     ) -> list[dict]:
@@ -940,21 +1250,6 @@ class SemanticMemory:
         fuer bessere Ergebnisse als einfaches Keyword-Matching.
         """
         try:
-            if person:
-                fact_ids = await self.redis.smembers(f"mha:facts:person:{person}")
-            else:
-                fact_ids = await self.redis.smembers("mha:facts:all")
-
-            if not fact_ids:
-                return []
-
-            fact_ids_list = list(fact_ids)
-            pipe = self.redis.pipeline()
-            for fid in fact_ids_list:
-                pipe.hgetall(f"mha:fact:{fid}")
-            all_data = await pipe.execute()
-
-            now = datetime.now(timezone.utc)
             min_confidence = float(
                 yaml_config.get("memory", {}).get("min_confidence_for_context", 0.4)
             )
@@ -971,6 +1266,26 @@ class SemanticMemory:
             # Wortstamm-Prefixe (erste 4 Zeichen) fuer unscharfes Matching
             query_stems = {w[:4] for w in query_words if len(w) >= 4}
 
+            if await self._is_fact_index_ready():
+                fact_ids_list = await self._fact_index_candidates(
+                    query_words, query_stems, person, min_confidence
+                )
+            else:
+                if person:
+                    fact_ids = await self.redis.smembers(f"mha:facts:person:{person}")
+                else:
+                    fact_ids = await self.redis.smembers("mha:facts:all")
+                fact_ids_list = list(fact_ids)
+
+            if not fact_ids_list:
+                return []
+
+            pipe = self.redis.pipeline()
+            for fid in fact_ids_list:
+                pipe.hgetall(f"mha:fact:{fid}")
+            all_data = await pipe.execute()
+
+            now = datetime.now(timezone.utc)
             facts = []
             for data in all_data:
                 if not data:
@@ -1475,6 +1790,7 @@ class SemanticMemory:
                 pipe.srem(f"mha:facts:category:{category}", fact_id)
                 pipe.srem("mha:facts:all", fact_id)
                 pipe.delete(f"mha:fact:{fact_id}")
+                self._unindex_fact(pipe, fact_id, data.get("content", ""))
                 await pipe.execute()
                 logger.info("Fakt geloescht: %s", fact_id)
                 return True
@@ -1991,6 +2307,10 @@ class SemanticMemory:
                     await self.redis.delete(key)
                 async for key in self.redis.scan_iter(match="mha:facts:category:*"):
                     await self.redis.delete(key)
+                # Invertierten Index leeren (bleibt als leerer Index gueltig)
+                async for key in self.redis.scan_iter(match="mha:facts:idx:*"):
+                    if key not in (_FACT_INDEX_VERSION_KEY, _FACT_INDEX_VERSION_KEY.encode()):
+                        await self.redis.delete(key)
             except Exception as e:
                 logger.error("Fehler beim Loeschen der Redis-Fakten: %s", e)
 
@@ -2021,9 +2341,9 @@ class SemanticMemory:
     async def expire_stale_facts(self, max_age_days: int = 90) -> int:
         """Entfernt Fakten die seit max_age_days nicht bestaetigt/aktualisiert wurden.
 
-        ChromaDB hat kein natives TTL, daher iteriert diese Methode ueber
-        alle Redis-Fakt-Metadaten und loescht veraltete Eintraege aus
-        beiden Speichern (Redis + ChromaDB).
+        ChromaDB hat kein natives TTL. Veraltete IDs kommen aus dem
+        updated_at-Index (sonst per Scan ueber alle Fakt-Hashes) und werden
+        in einer Redis-Pipeline plus gechunkten ChromaDB-Deletes entfernt.
         """
         if not self.redis or not self.chroma_collection:
             return 0
@@ -2032,40 +2352,46 @@ class SemanticMemory:
         cutoff = datetime.now(timezone.utc) - timedelta(days=max_age_days)
 
         try:
-            # Alle Fakt-IDs aus Redis scannen
-            stale_ids = []
-            async for key in self.redis.scan_iter(match="mha:fact:*", count=200):
-                key_str = key.decode() if isinstance(key, bytes) else key
-                # Nur Top-Level-Hashes (keine Sub-Keys)
-                if key_str.count(":") != 2:
-                    continue
-                try:
-                    updated_at = await self.redis.hget(key_str, "updated_at")
-                    if isinstance(updated_at, bytes):
-                        updated_at = updated_at.decode()
-                    if not updated_at:
+            if await self._is_fact_index_ready():
+                # Sorted Set nach updated_at: nur veraltete IDs, kein Scan
+                stale_ids = [
+                    fid if isinstance(fid, str) else fid.decode()
+                    for fid in await self.redis.zrangebyscore(
+                        _FACT_INDEX_UPDATED, "-inf", f"({cutoff.timestamp()}"
+                    )
+                ]
+            else:
+                # Alle Fakt-IDs aus Redis scannen
+                stale_ids = []
+                async for key in self.redis.scan_iter(match="mha:fact:*", count=200):
+                    key_str = key.decode() if isinstance(key, bytes) else key
+                    # Nur Top-Level-Hashes (keine Sub-Keys)
+                    if key_str.count(":") != 2:
+                        continue
+                    try:
+                        updated_at = await self.redis.hget(key_str, "updated_at")
+                        if isinstance(updated_at, bytes):
+                            updated_at = updated_at.decode()
+                        if not updated_at:
+                            continue
+                        last_update = datetime.fromisoformat(updated_at)
+                        if last_update.tzinfo is None:
+                            last_update = last_update.replace(tzinfo=timezone.utc)
+                        if last_update < cutoff:
+                            fact_id = key_str.split(":")[-1]
+                            stale_ids.append(fact_id)
+                    except (ValueError, TypeError):
                         continue
-                    last_update = datetime.fromisoformat(updated_at)
-                    if last_update.tzinfo is None:
-                        last_update = last_update.replace(tzinfo=timezone.utc)
-                    if last_update < cutoff:
-                        fact_id = key_str.split(":")[-1]
-                        stale_ids.append(fact_id)
-                except (ValueError, TypeError):
-                    continue
 
-            # Batch-Loeschung
-            for fact_id in stale_ids:
-                try:
-                    await asyncio.to_thread(
-                        self.chroma_collection.delete, ids=[fact_id]
-                    )
-                    await self.redis.delete(f"mha:fact:{fact_id}")
-                    deleted += 1
-                except Exception as e:
-                    logger.debug(
-                        "Stale fact %s Loeschung fehlgeschlagen: %s", fact_id, e
-                    )
+            if stale_ids:
+                # Bulk-Loeschung: ChromaDB gechunkt, Redis in einer Pipeline
+                await self._chroma_bulk("delete", stale_ids)
+                all_data = await self._fetch_fact_hashes(stale_ids)
+                pipe = self.redis.pipeline()
+                for fact_id, data in zip(stale_ids, all_data):
+                    self._queue_fact_removal(pipe, fact_id, data or {})
+                await pipe.execute()
+                deleted = len(stale_ids)
 
             if deleted:
                 logger.info(
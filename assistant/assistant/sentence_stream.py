@@ -0,0 +1,145 @@
+"""
+Sentence Stream — LLM-Tokens zu satzweisen Deltas buendeln.
+
+Fuer Streaming-Clients (HA Conversation Agent via SSE) sind einzelne Tokens
+zu feingranular: TTS braucht ganze Saetze. Der Chunker sammelt Tokens und
+gibt fertige Saetze zurueck, sobald auf ein Satzende (.!? oder Zeilenumbruch)
+Whitespace folgt — "3.5 Grad" wird so nicht zerrissen.
+
+Reasoning-Guard wie im WebSocket-Streaming: beginnt die Antwort mit
+Chain-of-Thought ("Okay, the user...") oder einem <think>-Block, wird
+nichts gestreamt bzw. der Block verworfen.
+
+Die Konkatenation aller Deltas ergibt exakt den gestreamten Text
+(Whitespace bleibt am Satzende erhalten).
+"""
+
+import re
+from typing import Optional
+
+# Typische Anfaenge von Chain-of-Thought statt Antwort (lowercase)
+REASONING_STARTERS = (
+    "okay, the user",
+    "ok, the user",
+    "the user",
+    "let me ",
+    "i need to",
+    "i should ",
+    "i'll ",
+    "first, i",
+    "hmm,",
+    "so, the user",
+    "now, i",
+    "alright,",
+    "so the user",
+    "wait,",
+    "okay, so",
+    "right,",
+    "let's ",
+)
+_MAX_STARTER_LEN = max(len(s) for s in REASONING_STARTERS)
+
+_THINK_OPEN = "<think>"
+_THINK_CLOSE = "</think>"
+
+# Satzende: Satzzeichen (optional mit schliessendem Anfuehrungszeichen/Klammer)
+# gefolgt von Whitespace, oder ein Zeilenumbruch
+_BOUNDARY_RE = re.compile(r"[.!?…]+[\"'»“”)\]]*\s+|\n+")
+
+
+class SentenceChunker:
+    """Buendelt Stream-Tokens zu Saetzen, mit Reasoning-Guard."""
+
+    def __init__(self, min_chars: int = 8):
+        # Kuerzere Fragmente ("Ja. ") werden mit dem naechsten Satz gesendet
+        self.min_chars = min_chars
+        self.suppressed = False
+        self._buf = ""
+        self._checked = False
+        self._in_think = False
+        self._sent: list[str] = []
+
+    @property
+    def streamed_text(self) -> str:
+        """Alles was bisher als Delta herausgegeben wurde."""
+        return "".join(self._sent)
+
+    def feed(self, token: str) -> list[str]:
+        """Nimmt ein Token auf und gibt fertige Saetze zurueck (ggf. leer)."""
+        if self.suppressed or not token:
+            return []
+        self._buf += token
+        if not self._strip_think() or not self._check_reasoning(final=False):
+            return []
+        return self._take_sentences()
+
+    def flush(self) -> Optional[str]:
+        """Gibt den Rest am Stream-Ende heraus (auch ohne Satzende)."""
+        if self.suppressed or self._in_think:
+            self._buf = ""
+            return None
+        if not self._check_reasoning(final=True):
+            return None
+        rest, self._buf = self._buf, ""
+        if not rest.strip():
+            return None
+        if not self._sent:
+            rest = rest.lstrip()
+        self._sent.append(rest)
+        return rest
+
+    # ------------------------------------------------------------------
+
+    def _strip_think(self) -> bool:
+        """Entfernt <think>-Bloecke. False solange ein Block offen ist."""
+        if self._in_think:
+            end = self._buf.find(_THINK_CLOSE)
+            if end < 0:
+                # Nur das moegliche Tag-Fragment am Ende behalten
+                self._buf = self._buf[-len(_THINK_CLOSE):]
+                return False
+            self._buf = self._buf[end + len(_THINK_CLOSE):]
+            self._in_think = False
+        if self._checked or self._sent:
+            return True
+        head = self._buf.lstrip()
+        if head.startswith(_THINK_OPEN):
+            self._in_think = True
+            self._buf = head[len(_THINK_OPEN):]
+            return self._strip_think()
+        # Angefangenes Tag ("<thi") — auf weitere Tokens warten
+        return not (head and _THINK_OPEN.startswith(head))
+
+    def _check_reasoning(self, final: bool) -> bool:
+        """True sobald feststeht dass die Antwort kein Reasoning ist."""
+        if self._checked:
+            return True
+        head = self._buf.lstrip().lower()
+        for starter in REASONING_STARTERS:
+            if head.startswith(starter):
+                self.suppressed = True
+                self._buf = ""
+                return False
+        if not final and len(head) < _MAX_STARTER_LEN:
+            # Koennte noch ein Reasoning-Anfang werden
+            if any(s.startswith(head) for s in REASONING_STARTERS):
+                return False
+        self._checked = True
+        return True
+
+    def _take_sentences(self) -> list[str]:
+        out = []
+        start = 0
+        for match in _BOUNDARY_RE.finditer(self._buf):
+            end = match.end()
+            if len(self._buf[start:end].strip()) < self.min_chars:
+                continue
+            out.append(self._buf[start:end])
+            start = end
+        if not out:
+            return []
+        self._buf = self._buf[start:]
+        if not self._sent:
+            out[0] = out[0].lstrip()
+        self._sent.extend(out)
+        return out
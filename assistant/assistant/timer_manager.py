@@ -10,9 +10,17 @@ Features:
 
 Basiert auf dem bewaehrten CookingTimer-Pattern aus cooking_assistant.py,
 aber generalisiert für beliebige Anwendungsfaelle.
+
+Scheduling: Timer, Erinnerungen und Wecker liegen gemeinsam in einem nach
+Faelligkeit sortierten Heap. Ein einziger Dispatcher-Task schlaeft bis zum
+naechsten faelligen Eintrag — statt eines schlafenden Tasks pro Eintrag.
+Abbrechen/Umplanen markiert den alten Heap-Eintrag nur als veraltet (lazy
+deletion), der Dispatcher verwirft ihn beim Erreichen der Spitze.
 """
 
 import asyncio
+import heapq
+import itertools
 import json
 import logging
 import random
@@ -60,6 +68,11 @@ KEY_REMINDERS = "mha:reminders:active"
 KEY_ALARMS = "mha:alarms:active"
 KEY_SCHEDULED_ACTIONS = "mha:scheduled_actions"  # Phase 5A
 
+# Eintragsarten im Scheduler-Heap
+KIND_TIMER = "timer"
+KIND_REMINDER = "reminder"
+KIND_ALARM = "alarm"
+
 
 @dataclass
 class GeneralTimer:
@@ -147,7 +160,15 @@ class TimerManager:
 
     def __init__(self):
         self.timers: dict[str, GeneralTimer] = {}
-        self._tasks: dict[str, asyncio.Task] = {}
+        # Scheduler: Heap aus (faellig_loop_time, seq, item_id); gueltig ist nur
+        # der Eintrag dessen seq in _scheduled steht (lazy deletion)
+        self._heap: list[tuple[float, int, str]] = []
+        self._scheduled: dict[str, tuple[int, str, object]] = {}
+        self._seq = itertools.count()
+        self._wakeup = asyncio.Event()
+        self._dispatcher: Optional[asyncio.Task] = None
+        # Gerade laufende Ausloesungen (Benachrichtigung/Aktion), per ID abbrechbar
+        self._firing: dict[str, asyncio.Task] = {}
         self._notify_callback = None
         self._action_callback = None  # Für Aktionen bei Ablauf (FunctionExecutor)
         self.redis: Optional[aioredis.Redis] = None
@@ -165,6 +186,117 @@ class TimerManager:
             len(self.timers),
         )
 
+    async def stop(self):
+        """Stoppt den Dispatcher. Geplante Eintraege bleiben in Redis erhalten."""
+        tasks = list(self._firing.values())
+        if self._dispatcher:
+            tasks.append(self._dispatcher)
+        for task in tasks:
+            task.cancel()
+        for task in tasks:
+            try:
+                await task
+            except (asyncio.CancelledError, Exception):
+                pass
+        self._dispatcher = None
+        self._firing.clear()
+
+    # ------------------------------------------------------------------
+    # Scheduler (ein Heap, ein Dispatcher-Task)
+    # ------------------------------------------------------------------
+
+    def _push(self, item_id: str, due_at: float, kind: str, payload) -> tuple:
+        """Legt einen Eintrag an bzw. ersetzt ihn (ohne Heap-Invariante)."""
+        seq = next(self._seq)
+        self._scheduled[item_id] = (seq, kind, payload)
+        # due_at ist Wall-Clock (time.time()) — im Heap steht die Loop-Zeit,
+        # damit Uhr-Spruenge (NTP) wie bisher bei asyncio.sleep nicht zaehlen
+        loop = asyncio.get_running_loop()
+        return (loop.time() + max(0.0, due_at - time.time()), seq, item_id)
+
+    def _schedule(self, item_id: str, due_at: float, kind: str, payload):
+        """Plant einen Eintrag ein oder um — O(log n)."""
+        entry = self._push(item_id, due_at, kind, payload)
+        heapq.heappush(self._heap, entry)
+        if self._heap[0] is entry:
+            self._wakeup.set()
+        self._ensure_dispatcher()
+
+    def _schedule_many(self, items: list[tuple[str, float, str, object]]):
+        """Bulk-Load (Restore): alle Eintraege anhaengen, einmal heapify."""
+        if not items:
+            return
+        self._heap.extend(self._push(*item) for item in items)
+        heapq.heapify(self._heap)
+        self._wakeup.set()
+        self._ensure_dispatcher()
+
+    def _unschedule(self, item_id: str) -> bool:
+        """Entfernt einen geplanten Eintrag (lazy) und bricht eine laufende
+        Ausloesung ab. True wenn etwas entfernt wurde."""
+        removed = self._scheduled.pop(item_id, None) is not None
+        task = self._firing.pop(item_id, None)
+        if task and task is not asyncio.current_task():
+            task.cancel()
+            removed = True
+        # Veraltete Eintraege aufraeumen wenn sie den Heap dominieren
+        if len(self._heap) > 64 and len(self._heap) > 2 * len(self._scheduled):
+            self._heap = [e for e in self._heap if self._is_live(e)]
+            heapq.heapify(self._heap)
+        return removed
+
+    def _is_live(self, entry: tuple[float, int, str]) -> bool:
+        current = self._scheduled.get(entry[2])
+        return current is not None and current[0] == entry[1]
+
+    def _ensure_dispatcher(self):
+        if self._dispatcher is None or self._dispatcher.done():
+            self._dispatcher = asyncio.create_task(self._dispatch_loop())
+            self._dispatcher.add_done_callback(
+                lambda t: t.exception() if not t.cancelled() else None
+            )
+
+    async def _dispatch_loop(self):
+        """Schlaeft bis zum naechsten faelligen Eintrag und loest ihn aus."""
+        loop = asyncio.get_running_loop()
+        while True:
+            while self._heap and not self._is_live(self._heap[0]):
+                heapq.heappop(self._heap)
+            self._wakeup.clear()
+            if not self._heap:
+                await self._wakeup.wait()
+                continue
+            delay = self._heap[0][0] - loop.time()
+            if delay > 0:
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), timeout=delay)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+            _, _, item_id = heapq.heappop(self._heap)
+            _, kind, payload = self._scheduled.pop(item_id)
+            self._fire(item_id, kind, payload)
+
+    def _fire(self, item_id: str, kind: str, payload):
+        """Startet die Ausloesung als eigenen kurzen Task, damit eine langsame
+        Benachrichtigung (TTS) nachfolgende Eintraege nicht verzoegert."""
+        if kind == KIND_TIMER:
+            coro = self._fire_timer(payload)
+        elif kind == KIND_REMINDER:
+            coro = self._fire_reminder(payload)
+        else:
+            coro = self._fire_alarm(item_id, payload)
+        task = asyncio.create_task(coro)
+        self._firing[item_id] = task
+
+        def _done(t, iid=item_id):
+            if self._firing.get(iid) is t:
+                self._firing.pop(iid, None)
+            if not t.cancelled():
+                t.exception()
+
+        task.add_done_callback(_done)
+
     def set_notify_callback(self, callback):
         """Setzt den Callback für Timer-Benachrichtigungen."""
         self._notify_callback = callback
@@ -216,10 +348,9 @@ class TimerManager:
         self.timers[timer_id] = timer
         await self._persist_timer(timer)
 
-        # Hintergrund-Task für Benachrichtigung
-        task = asyncio.create_task(self._timer_watcher(timer))
-        task.add_done_callback(lambda t: t.exception() if not t.cancelled() else None)
-        self._tasks[timer_id] = task
+        self._schedule(
+            timer_id, timer.started_at + timer.duration_seconds, KIND_TIMER, timer
+        )
 
         # Zeitformatierung
         if duration_minutes >= 60:
@@ -260,14 +391,7 @@ class TimerManager:
         if not target:
             return {"success": False, "message": "Timer nicht gefunden."}
 
-        # Task canceln und auf Abschluss warten
-        task = self._tasks.pop(target.id, None)
-        if task:
-            task.cancel()
-            try:
-                await task
-            except asyncio.CancelledError:
-                pass
+        self._unschedule(target.id)
 
         target.finished = True
         self.timers.pop(target.id, None)
@@ -313,13 +437,9 @@ class TimerManager:
                 hints.append(f"Timer '{timer.label}': noch {timer.format_remaining()}")
         return hints
 
-    async def _timer_watcher(self, timer: GeneralTimer):
-        """Überwacht einen Timer und benachrichtigt bei Ablauf."""
+    async def _fire_timer(self, timer: GeneralTimer):
+        """Benachrichtigt bei Timer-Ablauf und führt die optionale Aktion aus."""
         try:
-            remaining = timer.remaining_seconds
-            if remaining > 0:
-                await asyncio.sleep(remaining)
-
             timer.finished = True
             logger.info("Timer abgelaufen: %s (ID: %s)", timer.label, timer.id)
 
@@ -376,7 +496,6 @@ class TimerManager:
                         )
 
             # Aufraumen
-            self._tasks.pop(timer.id, None)
             await self._remove_timer(timer.id)
             # Timer im Dict behalten für Status-Abfrage, aber nach 5 Min entfernen
             asyncio.get_running_loop().call_later(
@@ -386,7 +505,7 @@ class TimerManager:
         except asyncio.CancelledError:
             pass
         except Exception as e:
-            logger.error("Timer-Watcher Fehler für '%s': %s", timer.label, e)
+            logger.error("Timer-Ausloesung Fehler für '%s': %s", timer.label, e)
 
     async def _persist_timer(self, timer: GeneralTimer):
         """Speichert Timer in Redis für Persistenz."""
@@ -415,6 +534,7 @@ class TimerManager:
             if not raw:
                 return
 
+            due, expired = [], []
             for timer_id, data in raw.items():
                 if isinstance(timer_id, bytes):
                     timer_id = timer_id.decode()
@@ -426,19 +546,26 @@ class TimerManager:
                 # Prüfen ob Timer noch laeuft (remaining_seconds ist jetzt float)
                 if timer.remaining_seconds > 0.0 and not timer.finished:
                     self.timers[timer.id] = timer
-                    task = asyncio.create_task(self._timer_watcher(timer))
-                    task.add_done_callback(
-                        lambda t: t.exception() if not t.cancelled() else None
+                    due.append(
+                        (
+                            timer.id,
+                            timer.started_at + timer.duration_seconds,
+                            KIND_TIMER,
+                            timer,
+                        )
                     )
-                    self._tasks[timer.id] = task
                     logger.info(
                         "Timer wiederhergestellt: '%s' (noch %s)",
                         timer.label,
                         timer.format_remaining(),
                     )
                 else:
-                    # Abgelaufener Timer entfernen
-                    await self._remove_timer(timer.id)
+                    expired.append(timer.id)
+
+            self._schedule_many(due)
+            if expired:
+                # Abgelaufene Timer in einem Aufruf entfernen
+                await self.redis.hdel(KEY_TIMERS, *expired)
         except Exception as e:
             logger.warning("Timer-Wiederherstellung fehlgeschlagen: %s", e)
 
@@ -520,10 +647,7 @@ class TimerManager:
         self.timers[reminder_id] = timer
         await self._persist_reminder(reminder_id, timer, target)
 
-        # Watcher-Task starten
-        task = asyncio.create_task(self._reminder_watcher(timer, target))
-        task.add_done_callback(lambda t: t.exception() if not t.cancelled() else None)
-        self._tasks[reminder_id] = task
+        self._schedule(reminder_id, target.timestamp(), KIND_REMINDER, timer)
 
         # Menschenlesbare Zeitangabe
         day_str = ""
@@ -540,13 +664,9 @@ class TimerManager:
             "reminder_id": reminder_id,
         }
 
-    async def _reminder_watcher(self, timer: GeneralTimer, target: datetime):
-        """Wartet bis zum Erinnerungs-Zeitpunkt und benachrichtigt."""
+    async def _fire_reminder(self, timer: GeneralTimer):
+        """Benachrichtigt zum Erinnerungs-Zeitpunkt."""
         try:
-            seconds_until = (target - _now()).total_seconds()
-            if seconds_until > 0:
-                await asyncio.sleep(seconds_until)
-
             timer.finished = True
             logger.info("Erinnerung ausgelöst: %s (ID: %s)", timer.label, timer.id)
 
@@ -561,7 +681,6 @@ class TimerManager:
                 )
 
             # Aufraumen
-            self._tasks.pop(timer.id, None)
             await self._remove_reminder(timer.id)
             asyncio.get_running_loop().call_later(
                 300, lambda tid=timer.id: self.timers.pop(tid, None)
@@ -569,7 +688,7 @@ class TimerManager:
         except asyncio.CancelledError:
             pass
         except Exception as e:
-            logger.error("Reminder-Watcher Fehler für '%s': %s", timer.label, e)
+            logger.error("Reminder-Ausloesung Fehler für '%s': %s", timer.label, e)
 
     async def _persist_reminder(
         self, reminder_id: str, timer: GeneralTimer, target: datetime
@@ -601,6 +720,7 @@ class TimerManager:
             raw = await self.redis.hgetall(KEY_REMINDERS)
             if not raw:
                 return
+            due, expired = [], []
             for rid, data in raw.items():
                 if isinstance(rid, bytes):
                     rid = rid.decode()
@@ -615,18 +735,18 @@ class TimerManager:
                 if target > _now():
                     timer = GeneralTimer.from_dict(info)
                     self.timers[timer.id] = timer
-                    task = asyncio.create_task(self._reminder_watcher(timer, target))
-                    task.add_done_callback(
-                        lambda t: t.exception() if not t.cancelled() else None
-                    )
-                    self._tasks[timer.id] = task
+                    due.append((timer.id, target.timestamp(), KIND_REMINDER, timer))
                     logger.info(
                         "Erinnerung wiederhergestellt: '%s' um %s",
                         timer.label,
                         target.strftime("%H:%M"),
                     )
                 else:
-                    await self._remove_reminder(rid)
+                    expired.append(rid)
+
+            self._schedule_many(due)
+            if expired:
+                await self.redis.hdel(KEY_REMINDERS, *expired)
         except Exception as e:
             logger.warning("Reminder-Wiederherstellung fehlgeschlagen: %s", e)
 
@@ -726,9 +846,7 @@ class TimerManager:
             started_at=time.time(),
         )
         self.timers[alarm_id] = timer
-        task = asyncio.create_task(self._alarm_watcher(alarm_id, alarm_data))
-        task.add_done_callback(lambda t: t.exception() if not t.cancelled() else None)
-        self._tasks[alarm_id] = task
+        self._schedule(alarm_id, target.timestamp(), KIND_ALARM, alarm_data)
 
         repeat_text = {
             "daily": " (taeglich)",
@@ -804,15 +922,7 @@ class TimerManager:
         if not target_id:
             return {"success": False, "message": "Wecker nicht gefunden."}
 
-        # Task canceln
-        task = self._tasks.pop(target_id, None)
-        if task:
-            task.cancel()
-            try:
-                await task
-            except asyncio.CancelledError:
-                pass
-
+        self._unschedule(target_id)
         self.timers.pop(target_id, None)
 
         # Aus Redis entfernen
@@ -856,16 +966,9 @@ class TimerManager:
             logger.debug("Wecker-Status Fehler: %s", e)
             return {"success": True, "message": "Keine Wecker gesetzt."}
 
-    async def _alarm_watcher(self, alarm_id: str, alarm_data: dict):
-        """Wartet bis zur Weckzeit, benachrichtigt, und plant ggf. Wiederholung."""
+    async def _fire_alarm(self, alarm_id: str, alarm_data: dict):
+        """Benachrichtigt zur Weckzeit und plant ggf. die Wiederholung."""
         try:
-            target = datetime.fromisoformat(alarm_data["next_trigger"])
-            if target.tzinfo is None:
-                target = target.replace(tzinfo=_TZ)
-            seconds_until = (target - _now()).total_seconds()
-            if seconds_until > 0:
-                await asyncio.sleep(seconds_until)
-
             logger.info(
                 "Wecker klingelt: %s um %s", alarm_data["label"], alarm_data["time"]
             )
@@ -881,7 +984,6 @@ class TimerManager:
                     }
                 )
 
-            self._tasks.pop(alarm_id, None)
             self.timers.pop(alarm_id, None)
 
             # Wiederholung planen
@@ -896,7 +998,7 @@ class TimerManager:
         except asyncio.CancelledError:
             pass
         except Exception as e:
-            logger.error("Wecker-Watcher Fehler: %s", e)
+            logger.error("Wecker-Ausloesung Fehler: %s", e)
 
     async def _schedule_next_alarm(self, alarm_id: str, alarm_data: dict):
         """Plant den nächsten Wecker-Termin für wiederkehrende Wecker."""
@@ -924,7 +1026,7 @@ class TimerManager:
             if self.redis:
                 await self.redis.hset(KEY_ALARMS, alarm_id, json.dumps(alarm_data))
 
-            # Neuen Timer + Task erstellen
+            # Neuen Timer anlegen und im Heap umplanen
             seconds_until = (next_target - now).total_seconds()
             timer = GeneralTimer(
                 id=alarm_id,
@@ -934,11 +1036,7 @@ class TimerManager:
                 started_at=time.time(),
             )
             self.timers[alarm_id] = timer
-            task = asyncio.create_task(self._alarm_watcher(alarm_id, alarm_data))
-            task.add_done_callback(
-                lambda t: t.exception() if not t.cancelled() else None
-            )
-            self._tasks[alarm_id] = task
+            self._schedule(alarm_id, next_target.timestamp(), KIND_ALARM, alarm_data)
 
             logger.info(
                 "Naechster Wecker: %s um %s",
@@ -956,6 +1054,7 @@ class TimerManager:
             raw = await self.redis.hgetall(KEY_ALARMS)
             if not raw:
                 return
+            due, expired = [], []
             for aid, data in raw.items():
                 if isinstance(aid, bytes):
                     aid = aid.decode()
@@ -971,7 +1070,7 @@ class TimerManager:
                     target = target.replace(tzinfo=_TZ)
 
                 if target > _now():
-                    # Noch in der Zukunft → Task starten
+                    # Noch in der Zukunft → einplanen
                     seconds_until = (target - _now()).total_seconds()
                     timer = GeneralTimer(
                         id=aid,
@@ -981,11 +1080,7 @@ class TimerManager:
                         started_at=time.time(),
                     )
                     self.timers[aid] = timer
-                    task = asyncio.create_task(self._alarm_watcher(aid, alarm_data))
-                    task.add_done_callback(
-                        lambda t: t.exception() if not t.cancelled() else None
-                    )
-                    self._tasks[aid] = task
+                    due.append((aid, target.timestamp(), KIND_ALARM, alarm_data))
                     logger.info(
                         "Wecker wiederhergestellt: '%s' um %s",
                         alarm_data["label"],
@@ -996,7 +1091,11 @@ class TimerManager:
                     await self._schedule_next_alarm(aid, alarm_data)
                 else:
                     # Vergangener einmaliger Wecker → entfernen
-                    await self.redis.hdel(KEY_ALARMS, aid)
+                    expired.append(aid)
+
+            self._schedule_many(due)
+            if expired:
+                await self.redis.hdel(KEY_ALARMS, *expired)
         except Exception as e:
             logger.warning("Wecker-Wiederherstellung fehlgeschlagen: %s", e)
 
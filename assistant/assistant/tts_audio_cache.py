@@ -0,0 +1,275 @@
+"""
+TTS Audio Cache — Fertig synthetisierte Sprachausgabe fuer wiederkehrende Saetze.
+
+Kurze, wiederkehrende Antworten ("Erledigt.", Timer-Ansagen, Begruessungen,
+Standard-Warnungen) werden nicht jedes Mal neu von Piper synthetisiert,
+sondern als WAV aus dem Cache geliefert.
+
+Cache-Key: SHA-256 aus (normalisierter Text, Stimme) — genau das, was an Piper
+geht; Speed/Volume/SSML aus tts_enhancer werden nicht mitgesendet.
+
+Speicher: LRU im RAM (Byte-Budget) plus optional auf Disk (Byte-Budget, LRU
+ueber mtime). Haeufigste Phrasen werden in Redis gezaehlt und koennen beim
+Start vorgewaermt werden.
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import os
+from collections import OrderedDict
+from pathlib import Path
+from typing import Awaitable, Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+# Redis-ZSET: Phrase -> Anzahl Synthesen
+KEY_PHRASES = "mha:tts_cache:phrases"
+_MAX_TRACKED_PHRASES = 500
+
+Synthesizer = Callable[[str], Awaitable[bytes]]
+
+
+def _normalize(text: str) -> str:
+    return " ".join(text.split())
+
+
+class TTSAudioCache:
+    """Inhaltsadressierter Cache fuer synthetisiertes Audio (RAM + Disk)."""
+
+    def __init__(self):
+        self._redis = None
+        self._enabled = True
+        self._max_chars = 160
+        self._max_memory_bytes = 32 * 1024 * 1024
+        self._max_disk_bytes = 128 * 1024 * 1024
+        self._disk_dir: Optional[Path] = None
+        self._prewarm_top_n = 0
+        self._voice = ""
+        self._memory: OrderedDict[str, bytes] = OrderedDict()
+        self._memory_bytes = 0
+        self._inflight: dict[str, asyncio.Future] = {}
+        self._tracked = 0
+        self._hits = 0
+        self._misses = 0
+
+    def configure(
+        self,
+        *,
+        enabled: bool = True,
+        max_chars: int = 160,
+        max_memory_mb: float = 32,
+        max_disk_mb: float = 128,
+        disk_dir: str = "",
+        prewarm_top_n: int = 0,
+        voice: str = "",
+    ):
+        """Konfiguriert den Cache (aus settings.yaml, Abschnitt tts_audio_cache)."""
+        self._enabled = enabled
+        self._max_chars = max_chars
+        self._max_memory_bytes = int(max_memory_mb * 1024 * 1024)
+        self._max_disk_bytes = int(max_disk_mb * 1024 * 1024)
+        self._prewarm_top_n = prewarm_top_n
+        self._voice = voice
+        self._disk_dir = None
+        if disk_dir and self._max_disk_bytes > 0:
+            try:
+                Path(disk_dir).mkdir(parents=True, exist_ok=True)
+                self._disk_dir = Path(disk_dir)
+            except OSError as e:
+                logger.warning("TTS-Cache-Verzeichnis %s nicht nutzbar: %s", disk_dir, e)
+        self._evict_memory()
+
+    def set_redis(self, redis_client) -> None:
+        """Setzt den Redis-Client (Phrasen-Statistik fuer Pre-Warming)."""
+        self._redis = redis_client
+
+    def make_key(self, text: str) -> str:
+        """Cache-Key aus normalisiertem Text und Stimme."""
+        parts = {"text": _normalize(text), "voice": self._voice}
+        raw = json.dumps(parts, sort_keys=True, ensure_ascii=False)
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def is_cacheable(self, text: str) -> bool:
+        return self._enabled and 0 < len(_normalize(text)) <= self._max_chars
+
+    async def get_or_synthesize(self, text: str, synthesize: Synthesizer) -> bytes:
+        """Liefert Audio aus dem Cache oder synthetisiert und speichert es.
+
+        Gleichzeitige Anfragen fuer denselben Key teilen sich eine Synthese.
+        """
+        if not self.is_cacheable(text):
+            return await synthesize(text)
+
+        key = self.make_key(text)
+        audio = await self._lookup(key)
+        if audio is not None:
+            self._hits += 1
+            await self._track(text)
+            return audio
+
+        self._misses += 1
+        pending = self._inflight.get(key)
+        if pending:
+            return await asyncio.shield(pending)
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            audio = await synthesize(text)
+            future.set_result(audio)
+        except BaseException as e:
+            future.set_exception(e)
+            future.exception()  # nicht abgeholte Exception nicht loggen
+            raise
+        finally:
+            self._inflight.pop(key, None)
+
+        await self._store(key, audio)
+        await self._track(text)
+        return audio
+
+    async def prewarm(self, synthesize: Synthesizer) -> int:
+        """Synthetisiert die haeufigsten Phrasen vorab (prewarm_top_n).
+
+        Returns: Anzahl neu synthetisierter Phrasen.
+        """
+        if not self._enabled or not self._redis or self._prewarm_top_n <= 0:
+            return 0
+        try:
+            members = await self._redis.zrevrange(
+                KEY_PHRASES, 0, self._prewarm_top_n - 1
+            )
+        except Exception as e:
+            logger.debug("TTS-Cache Phrasen-Abruf fehlgeschlagen: %s", e)
+            return 0
+
+        warmed = 0
+        for member in members:
+            try:
+                text = json.loads(member)["t"]
+            except (json.JSONDecodeError, KeyError, TypeError):
+                continue
+            if not self.is_cacheable(text):
+                continue
+            key = self.make_key(text)
+            if await self._lookup(key) is not None:
+                continue
+            try:
+                await self._store(key, await synthesize(text))
+                warmed += 1
+            except Exception as e:
+                logger.debug("TTS-Cache Pre-Warm '%s' fehlgeschlagen: %s", text, e)
+                break  # TTS nicht erreichbar — spaeter erneut
+        if warmed:
+            logger.info("TTS-Cache vorgewaermt: %d Phrasen", warmed)
+        return warmed
+
+    def get_stats(self) -> dict:
+        total = self._hits + self._misses
+        return {
+            "enabled": self._enabled,
+            "hits": self._hits,
+            "misses": self._misses,
+            "hit_rate": round(self._hits / total, 3) if total else 0.0,
+            "memory_entries": len(self._memory),
+            "memory_bytes": self._memory_bytes,
+            "disk": str(self._disk_dir) if self._disk_dir else "",
+        }
+
+    # ------------------------------------------------------------------
+    # Speicher
+    # ------------------------------------------------------------------
+
+    async def _lookup(self, key: str) -> Optional[bytes]:
+        audio = self._memory.get(key)
+        if audio is not None:
+            self._memory.move_to_end(key)
+            return audio
+        if not self._disk_dir:
+            return None
+        audio = await asyncio.to_thread(self._disk_read, key)
+        if audio is not None:
+            self._memory_put(key, audio)
+        return audio
+
+    async def _store(self, key: str, audio: bytes) -> None:
+        if not audio:
+            return
+        self._memory_put(key, audio)
+        if self._disk_dir:
+            try:
+                await asyncio.to_thread(self._disk_write, key, audio)
+            except OSError as e:
+                logger.debug("TTS-Cache Disk-Schreiben fehlgeschlagen: %s", e)
+
+    def _memory_put(self, key: str, audio: bytes) -> None:
+        if len(audio) > self._max_memory_bytes:
+            return
+        previous = self._memory.pop(key, None)
+        if previous is not None:
+            self._memory_bytes -= len(previous)
+        self._memory[key] = audio
+        self._memory_bytes += len(audio)
+        self._evict_memory()
+
+    def _evict_memory(self) -> None:
+        while self._memory and self._memory_bytes > self._max_memory_bytes:
+            _, audio = self._memory.popitem(last=False)
+            self._memory_bytes -= len(audio)
+
+    def _disk_path(self, key: str) -> Path:
+        return self._disk_dir / f"{key}.wav"
+
+    def _disk_read(self, key: str) -> Optional[bytes]:
+        path = self._disk_path(key)
+        try:
+            audio = path.read_bytes()
+            os.utime(path)  # mtime = letzter Zugriff (LRU)
+            return audio
+        except OSError:
+            return None
+
+    def _disk_write(self, key: str, audio: bytes) -> None:
+        path = self._disk_path(key)
+        tmp = path.with_suffix(".tmp")
+        tmp.write_bytes(audio)
+        os.replace(tmp, path)
+        self._evict_disk()
+
+    def _evict_disk(self) -> None:
+        files = []
+        total = 0
+        for path in self._disk_dir.glob("*.wav"):
+            try:
+                st = path.stat()
+            except OSError:
+                continue
+            files.append((st.st_mtime, st.st_size, path))
+            total += st.st_size
+        if total <= self._max_disk_bytes:
+            return
+        for _, size, path in sorted(files):
+            try:
+                path.unlink()
+            except OSError:
+                continue
+            total -= size
+            if total <= self._max_disk_bytes:
+                break
+
+    async def _track(self, text: str) -> None:
+        """Zaehlt die Phrase fuer das Pre-Warming (Top-N beim Start)."""
+        if not self._redis or self._prewarm_top_n <= 0:
+            return
+        member = json.dumps({"t": _normalize(text)}, ensure_ascii=False)
+        try:
+            await self._redis.zincrby(KEY_PHRASES, 1, member)
+            self._tracked += 1
+            if self._tracked % 50 == 0:
+                await self._redis.zremrangebyrank(
+                    KEY_PHRASES, 0, -_MAX_TRACKED_PHRASES - 1
+                )
+        except Exception as e:
+            logger.debug("TTS-Cache Phrasen-Zaehler Fehler: %s", e)
@@ -6,6 +6,7 @@ Sendet Events wie assistant.speaking, assistant.thinking, etc.
 import asyncio
 import json
 import logging
+from collections import deque
 from datetime import datetime, timezone
 from typing import Optional
 
@@ -14,13 +15,85 @@ from fastapi import WebSocket, WebSocketDisconnect
 logger = logging.getLogger(__name__)
 
 
+# Standard-Policy fuer verlustbehaftete Events (ueberschreibbar via websocket.*)
+# coalesce: nur der neueste wartende Frame pro Event bleibt in der Queue
+# drop:     bei voller Queue wird der Frame verworfen statt den Client zu trennen
+DEFAULT_COALESCE_EVENTS = (
+    "ping",
+    "assistant.thinking",
+    "assistant.listening",
+    "assistant.progress",
+    "workshop.printer",
+    "workshop.environment",
+)
+DEFAULT_DROP_EVENTS = ("assistant.stream_token",)
+
+
+def _frame(event: str, data: Optional[dict]) -> str:
+    """Serialisiert ein Event genau einmal — derselbe String geht an alle Clients."""
+    return json.dumps(
+        {
+            "event": event,
+            "data": data or {},
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+        }
+    )
+
+
+class _Client:
+    """Sende-Queue + Writer-Task einer einzelnen Verbindung."""
+
+    __slots__ = ("websocket", "queue", "wakeup", "task", "sending", "closing", "dropped")
+
+    def __init__(self, websocket: WebSocket):
+        self.websocket = websocket
+        self.queue: deque[tuple[str, str]] = deque()  # (event, frame)
+        self.wakeup = asyncio.Event()
+        self.task: Optional[asyncio.Task] = None
+        self.sending = False
+        self.closing = False
+        self.dropped = 0
+
+
 class ConnectionManager:
-    """Verwaltet aktive WebSocket-Verbindungen."""
+    """Verwaltet aktive WebSocket-Verbindungen.
+
+    Jede Verbindung hat eine begrenzte Sende-Queue und einen eigenen
+    Writer-Task. broadcast() serialisiert einmal, legt den Frame in alle
+    Queues und wartet nie auf einen Socket — ein langsamer oder halb-toter
+    Dashboard-Tab bremst die anderen Clients nicht mehr aus.
+
+    Volle Queue: verlustbehaftete Events (drop/coalesce) werden verworfen,
+    bei wichtigen Events wird der Client als zu langsam getrennt.
+    """
 
     MAX_CONNECTIONS = 50
+    QUEUE_SIZE = 256
+    SEND_TIMEOUT = 10.0
 
     def __init__(self):
         self.active_connections: list[WebSocket] = []
+        self._clients: dict[WebSocket, _Client] = {}
+        self.dropped_frames = 0
+        self.slow_disconnects = 0
+        self._load_policy()
+
+    def _load_policy(self) -> None:
+        """Queue-Groesse und Drop/Coalesce-Events aus settings.yaml (websocket.*)."""
+        cfg = {}
+        try:
+            from .config import yaml_config
+
+            cfg = yaml_config.get("websocket") or {}
+        except Exception as e:
+            logger.debug("WebSocket-Config nicht lesbar, nutze Defaults: %s", e)
+        self.queue_size = max(8, int(cfg.get("queue_size", self.QUEUE_SIZE)))
+        self.send_timeout = float(cfg.get("send_timeout_seconds", self.SEND_TIMEOUT))
+        self.coalesce_events = frozenset(cfg.get("coalesce_events", DEFAULT_COALESCE_EVENTS))
+        self.drop_events = frozenset(cfg.get("drop_events", DEFAULT_DROP_EVENTS))
+
+    def _is_lossy(self, event: str) -> bool:
+        return event in self.drop_events or event in self.coalesce_events
 
     async def connect(self, websocket: WebSocket) -> bool:
         """Neue Verbindung akzeptieren. Gibt False zurueck wenn Limit erreicht."""
@@ -29,6 +102,7 @@ class ConnectionManager:
             return False
         await websocket.accept()
         self.active_connections.append(websocket)
+        self._client(websocket)
         logger.info("WebSocket verbunden (%d aktiv)", len(self.active_connections))
         return True
 
@@ -38,54 +112,140 @@ class ConnectionManager:
             self.active_connections.remove(websocket)
         except ValueError:
             pass
+        client = self._clients.pop(websocket, None)
+        if client and client.task and not client.task.done():
+            if client.task is not asyncio.current_task():
+                client.task.cancel()
         logger.info("WebSocket getrennt (%d aktiv)", len(self.active_connections))
 
+    def _client(self, websocket: WebSocket) -> _Client:
+        """Client-State holen bzw. anlegen (inkl. Writer-Task)."""
+        client = self._clients.get(websocket)
+        if client is None:
+            client = _Client(websocket)
+            self._clients[websocket] = client
+            client.task = asyncio.create_task(self._writer(client))
+        return client
+
+    def _enqueue(self, client: _Client, event: str, frame: str) -> None:
+        """Frame einreihen — nie blockierend. Wendet die Drop/Coalesce-Policy an."""
+        if client.closing:
+            return
+        queue = client.queue
+        if event in self.coalesce_events:
+            # Veralteten Stand verwerfen, der neue Frame kommt ans Ende — sonst
+            # ueberholt er Frames, die nach dem alten eingereiht wurden
+            for i, (queued_event, _) in enumerate(queue):
+                if queued_event == event:
+                    del queue[i]
+                    break
+        if len(queue) >= self.queue_size:
+            if self._is_lossy(event):
+                client.dropped += 1
+                self.dropped_frames += 1
+                return
+            # Platz schaffen: aeltesten verlustbehafteten Frame opfern
+            for i, (queued_event, _) in enumerate(queue):
+                if self._is_lossy(queued_event):
+                    del queue[i]
+                    client.dropped += 1
+                    self.dropped_frames += 1
+                    break
+            else:
+                # Nur wichtige Frames und trotzdem voll → Client zu langsam
+                client.closing = True
+                self.slow_disconnects += 1
+                logger.warning(
+                    "WebSocket-Client zu langsam (%d Frames in Queue) — trenne",
+                    len(queue),
+                )
+                client.wakeup.set()
+                return
+        queue.append((event, frame))
+        client.wakeup.set()
+
+    async def _writer(self, client: _Client) -> None:
+        """Sendet die Queue eines Clients nacheinander (ein Sender pro Socket)."""
+        ws = client.websocket
+        try:
+            while True:
+                if client.closing:
+                    try:
+                        await asyncio.wait_for(
+                            ws.close(code=1013, reason="Client zu langsam"),
+                            timeout=self.send_timeout,
+                        )
+                    except Exception as e:
+                        logger.debug("WS close nach Overflow fehlgeschlagen: %s", e)
+                    break
+                if not client.queue:
+                    client.wakeup.clear()
+                    await client.wakeup.wait()
+                    continue
+                _event, frame = client.queue.popleft()
+                client.sending = True
+                try:
+                    await asyncio.wait_for(ws.send_text(frame), timeout=self.send_timeout)
+                except asyncio.CancelledError:
+                    raise
+                except Exception as e:
+                    # S8: Sende-Fehler nicht stumm verschlucken
+                    logger.debug("WS send failed: %s", e)
+                    break
+                finally:
+                    client.sending = False
+        except asyncio.CancelledError:
+            return
+        client.queue.clear()
+        if self._clients.get(ws) is client:
+            self.disconnect(ws)
+
     async def broadcast(self, event: str, data: Optional[dict] = None):
-        """Event an alle verbundenen Clients senden."""
+        """Event an alle verbundenen Clients senden (nur einreihen, nie warten)."""
         if not self.active_connections:
             return
-
-        message = json.dumps(
-            {
-                "event": event,
-                "data": data or {},
-                "timestamp": datetime.now(timezone.utc).isoformat(),
-            }
-        )
-
-        disconnected = []
+        frame = _frame(event, data)
         # Snapshot-Kopie um concurrent modification zu vermeiden
-        connections = list(self.active_connections)
-        for connection in connections:
-            try:
-                await connection.send_text(message)
-            except Exception as e:
-                # S8: Broadcast-Fehler nicht stumm verschlucken
-                logger.debug("WS broadcast send failed: %s", e)
-                disconnected.append(connection)
-
-        for conn in disconnected:
-            try:
-                self.active_connections.remove(conn)
-            except ValueError:
-                pass
+        for connection in list(self.active_connections):
+            self._enqueue(self._client(connection), event, frame)
 
     async def send_personal(
         self, websocket: WebSocket, event: str, data: Optional[dict] = None
     ):
-        """Event an einen bestimmten Client senden."""
-        message = json.dumps(
-            {
-                "event": event,
-                "data": data or {},
-                "timestamp": datetime.now(timezone.utc).isoformat(),
-            }
-        )
+        """Event an einen bestimmten Client senden.
+
+        Verbundene Clients bekommen den Frame ueber ihre Queue (Reihenfolge mit
+        Broadcasts bleibt erhalten, kein paralleles send_text auf einem Socket).
+        """
+        frame = _frame(event, data)
+        client = self._clients.get(websocket)
+        if client is not None:
+            self._enqueue(client, event, frame)
+            return
         try:
-            await websocket.send_text(message)
+            await websocket.send_text(frame)
         except Exception as e:
             logger.debug("send_personal fehlgeschlagen: %s", e)
 
+    async def drain(self, timeout: float = 5.0) -> bool:
+        """Wartet bis alle Queues geleert sind. True wenn rechtzeitig leer."""
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        while any(c.queue or c.sending for c in self._clients.values()):
+            if loop.time() >= deadline:
+                return False
+            await asyncio.sleep(0.001)
+        return True
+
+    def get_stats(self) -> dict:
+        """Queue-Fuellstand und verworfene Frames (fuer /metrics)."""
+        return {
+            "connections": len(self.active_connections),
+            "queued_frames": sum(len(c.queue) for c in self._clients.values()),
+            "dropped_frames": self.dropped_frames,
+            "slow_disconnects": self.slow_disconnects,
+        }
+
 
 # Globale Instanz
 ws_manager = ConnectionManager()
@@ -0,0 +1,318 @@
+"""
+E2E-Latenz-Benchmark fuer AssistantBrain.process.
+
+Spielt einen aufgezeichneten Korpus deutscher Utterances (corpus_de.jsonl)
+gegen den echten Brain + function_calling Pfad ab. Externe Dienste werden
+durch lokale Stand-ins ersetzt (siehe fakes.py):
+
+  - Home Assistant: FakeHomeAssistant (einige hundert Entities)
+  - Ollama:         StubOllama (deterministisch, Token-Latenz konfigurierbar)
+  - Redis:          fakeredis (falls installiert), lokaler Redis (--redis URL)
+                    oder ohne Redis (--redis none, degradierter Modus)
+  - ChromaDB:       nicht erreichbar → Brain laeuft wie im Degraded-Mode
+
+Gemeldet werden die Phasen aus RequestTrace (pre_classify, context_gather,
+llm_first_token, llm_complete, tts_first_audio, total) als p50/p95, dazu die
+Wall-Clock-Dauer von process() und die Zeit bis zum ersten Stream-Chunk.
+tts_first_audio wird ausserhalb von process() (TTS in main.py) markiert und
+erscheint daher nur, wenn ein Codepfad sie setzt.
+
+Aufruf (aus assistant/):
+    python -m benchmarks.e2e_latency --iterations 3 --save-baseline /tmp/base.json
+    python -m benchmarks.e2e_latency --baseline /tmp/base.json --fail-on-regression
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import platform
+import subprocess
+import sys
+import time
+from contextlib import ExitStack
+from pathlib import Path
+from unittest.mock import patch
+
+from .fakes import FakeHomeAssistant, StubOllama
+
+CORPUS_PATH = Path(__file__).with_name("corpus_de.jsonl")
+
+# Regression nur melden wenn relativ UND absolut spuerbar (Rauschen bei ~1ms)
+_MIN_ABS_DELTA_MS = 2.0
+
+
+def load_corpus(path: Path = CORPUS_PATH) -> list[dict]:
+    """Laedt den Utterance-Korpus (JSONL: text, room, person)."""
+    rows = []
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if line and not line.startswith("#"):
+                rows.append(json.loads(line))
+    return rows
+
+
+def percentile(values: list[float], p: float) -> float:
+    """Lineare Interpolation wie LatencyTracker.percentile."""
+    vals = sorted(values)
+    if not vals:
+        return 0.0
+    idx = (p / 100) * (len(vals) - 1)
+    lower = int(idx)
+    upper = min(lower + 1, len(vals) - 1)
+    return round(vals[lower] + (idx - lower) * (vals[upper] - vals[lower]), 1)
+
+
+def summarize(samples: dict[str, list[float]]) -> dict:
+    """{metrik: [ms, ...]} → {metrik: {p50, p95, count}}."""
+    return {
+        name: {
+            "p50": percentile(vals, 50),
+            "p95": percentile(vals, 95),
+            "count": len(vals),
+        }
+        for name, vals in samples.items()
+        if vals
+    }
+
+
+def diff_against_baseline(
+    current: dict, baseline: dict, threshold_pct: float = 10.0
+) -> list[dict]:
+    """Vergleicht p50/p95 aller Metriken. Gibt eine Zeile pro Metrik+Percentil."""
+    rows = []
+    for name, cur in sorted(current.get("metrics", {}).items()):
+        base = baseline.get("metrics", {}).get(name)
+        if not base:
+            continue
+        for pct in ("p50", "p95"):
+            b, c = base.get(pct), cur.get(pct)
+            if b is None or c is None:
+                continue
+            delta = c - b
+            rel = (delta / b * 100) if b else 0.0
+            rows.append({
+                "metric": name,
+                "pct": pct,
+                "baseline": b,
+                "current": c,
+                "delta_ms": round(delta, 1),
+                "delta_pct": round(rel, 1),
+                "regression": rel > threshold_pct and delta > _MIN_ABS_DELTA_MS,
+            })
+    return rows
+
+
+def _git_rev() -> str:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True, text=True, timeout=5,
+        ).stdout.strip()
+    except (OSError, subprocess.SubprocessError):
+        return ""
+
+
+def _redis_patches(mode: str) -> list:
+    """Patches fuer memory.redis.from_url je nach Redis-Modus."""
+    if mode != "fakeredis":
+        return []
+    try:
+        import fakeredis
+    except ImportError:
+        raise SystemExit(
+            "fakeredis nicht installiert — pip install fakeredis "
+            "oder --redis redis://localhost:6379 bzw. --redis none"
+        )
+    server = fakeredis.FakeServer()
+
+    def _from_url(url, **kwargs):
+        return fakeredis.aioredis.FakeRedis(server=server, **kwargs)
+
+    return [patch("assistant.memory.redis.from_url", _from_url)]
+
+
+async def run_benchmark(args) -> dict:
+    """Startet Stand-ins + Brain, spielt den Korpus ab, liefert den Report."""
+    ha = FakeHomeAssistant(entity_count=args.entities, latency_ms=args.ha_latency_ms)
+    llm = StubOllama(models=[], ttft_ms=args.ttft_ms, token_ms=args.token_ms)
+    ha_url = await ha.start()
+    llm_url = await llm.start()
+
+    # Settings werden beim Import aus der Umgebung gelesen
+    os.environ["HA_URL"] = ha_url
+    os.environ["HA_TOKEN"] = "benchmark"
+    os.environ["MINDHOME_URL"] = ha_url
+    os.environ["OLLAMA_URL"] = llm_url
+    os.environ["CHROMA_URL"] = "http://127.0.0.1:9"
+    if args.redis == "none":
+        os.environ["REDIS_URL"] = "redis://127.0.0.1:9"
+    elif args.redis != "fakeredis":
+        os.environ["REDIS_URL"] = args.redis
+
+    with ExitStack() as stack:
+        for p in _redis_patches(args.redis):
+            stack.enter_context(p)
+
+        from assistant.brain import AssistantBrain
+        from assistant.config import settings
+        from assistant.latency_tracker import LatencyTracker
+
+        llm.models = [
+            settings.model_fast,
+            settings.model_smart,
+            settings.model_deep,
+            settings.model_notify,
+        ]
+
+        t0 = time.perf_counter()
+        brain = AssistantBrain()
+        await brain.initialize()
+        init_ms = round((time.perf_counter() - t0) * 1000, 1)
+
+        corpus = load_corpus(Path(args.corpus))
+        samples: dict[str, list[float]] = {}
+
+        async def _one(row: dict, record: bool) -> None:
+            first_chunk: list[float] = []
+            start = time.perf_counter()
+
+            async def _on_chunk(_token):
+                if not first_chunk:
+                    first_chunk.append(time.perf_counter())
+
+            await brain.process(
+                row["text"],
+                person=row.get("person"),
+                room=row.get("room"),
+                stream_callback=_on_chunk if args.stream else None,
+            )
+            if not record:
+                return
+            samples.setdefault("process", []).append(
+                (time.perf_counter() - start) * 1000
+            )
+            if first_chunk:
+                samples.setdefault("first_chunk", []).append(
+                    (first_chunk[0] - start) * 1000
+                )
+
+        try:
+            for row in corpus[: args.warmup]:
+                await _one(row, record=False)
+
+            # Frischer Tracker: nur die gemessenen Durchlaeufe zaehlen
+            tracker = LatencyTracker(max_history=len(corpus) * args.iterations)
+            traces: list[dict] = []
+            _record = tracker.record
+
+            def _capture(trace):
+                durations = _record(trace)
+                traces.append(durations)
+                return durations
+
+            tracker.record = _capture
+            brain.latency_tracker = tracker
+            brain.context_prefetch.set_latency_tracker(tracker)
+
+            ha_before, llm_before = ha.requests, llm.requests
+            for _ in range(args.iterations):
+                for row in corpus:
+                    await _one(row, record=True)
+            runs = len(corpus) * args.iterations
+        finally:
+            await brain.shutdown()
+            await ha.stop()
+            await llm.stop()
+
+    for durations in traces:
+        for phase, ms in durations.items():
+            samples.setdefault(phase, []).append(ms)
+
+    return {
+        "meta": {
+            "git_rev": _git_rev(),
+            "python": platform.python_version(),
+            "corpus": Path(args.corpus).name,
+            "utterances": len(corpus),
+            "iterations": args.iterations,
+            "entities": args.entities,
+            "ttft_ms": args.ttft_ms,
+            "token_ms": args.token_ms,
+            "ha_latency_ms": args.ha_latency_ms,
+            "redis": args.redis if args.redis in ("fakeredis", "none") else "url",
+            "init_ms": init_ms,
+            "ha_requests_per_utterance": round((ha.requests - ha_before) / runs, 2),
+            "llm_requests_per_utterance": round((llm.requests - llm_before) / runs, 2),
+        },
+        "metrics": summarize(samples),
+    }
+
+
+def format_report(report: dict, diff: list[dict] = None) -> str:
+    meta = report["meta"]
+    lines = [
+        f"E2E-Latenz ({meta['utterances']} Utterances x {meta['iterations']}, "
+        f"{meta['entities']} Entities, rev {meta['git_rev'] or '?'})",
+        f"  init={meta['init_ms']:.0f}ms  HA-Requests/Utterance="
+        f"{meta['ha_requests_per_utterance']}  LLM-Requests/Utterance="
+        f"{meta['llm_requests_per_utterance']}",
+    ]
+    for name, m in report["metrics"].items():
+        lines.append(
+            f"  {name:18s} p50={m['p50']:>8.1f}ms  p95={m['p95']:>8.1f}ms  (n={m['count']})"
+        )
+    if diff:
+        lines.append("Vergleich mit Baseline:")
+        for row in diff:
+            flag = "  REGRESSION" if row["regression"] else ""
+            lines.append(
+                f"  {row['metric']:18s} {row['pct']}  {row['baseline']:>8.1f} → "
+                f"{row['current']:>8.1f}ms  ({row['delta_pct']:+.1f}%){flag}"
+            )
+    return "\n".join(lines)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--corpus", default=str(CORPUS_PATH))
+    parser.add_argument("--iterations", type=int, default=3)
+    parser.add_argument("--warmup", type=int, default=3)
+    parser.add_argument("--entities", type=int, default=300)
+    parser.add_argument("--ttft-ms", type=float, default=80.0)
+    parser.add_argument("--token-ms", type=float, default=8.0)
+    parser.add_argument("--ha-latency-ms", type=float, default=2.0)
+    parser.add_argument(
+        "--redis", default="fakeredis",
+        help="fakeredis | none | redis://host:port",
+    )
+    parser.add_argument("--stream", action="store_true", help="stream_callback nutzen")
+    parser.add_argument("--save-baseline", metavar="PATH")
+    parser.add_argument("--baseline", metavar="PATH")
+    parser.add_argument("--threshold", type=float, default=10.0, help="Regression ab +N%%")
+    parser.add_argument("--fail-on-regression", action="store_true")
+    parser.add_argument("--log-level", default="WARNING")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=getattr(logging, args.log_level.upper(), logging.WARNING))
+    report = asyncio.run(run_benchmark(args))
+
+    diff = None
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            diff = diff_against_baseline(report, json.load(f), args.threshold)
+    print(format_report(report, diff))
+
+    if args.save_baseline:
+        with open(args.save_baseline, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2, ensure_ascii=False)
+
+    if diff and args.fail_on_regression and any(r["regression"] for r in diff):
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,514 @@
+"""
+Lokale Stand-ins fuer den E2E-Latenz-Benchmark.
+
+  - FakeHomeAssistant: HA REST API (/api/states, /api/services, /api/config)
+    mit einigen hundert generierten Entities, Service-Calls aendern den State.
+  - StubOllama: Ollama API (/api/tags, /api/chat, /api/generate) mit
+    deterministischen Antworten und konfigurierbarer Token-Latenz.
+  - LatencyRedis: In-Memory-Teilmenge von redis.asyncio mit fester Latenz
+    pro Round-Trip und Round-Trip-Zaehler (Pipelines = ein Round-Trip).
+
+Die HTTP-Stand-ins laufen als aiohttp-Server im selben Event-Loop wie der
+Brain, so dass der echte HTTP-Pfad (ha_client, ollama_client) mitgemessen wird.
+"""
+
+import asyncio
+import json
+import random
+import re
+import time
+from typing import Optional
+
+from aiohttp import web
+
+ROOMS = (
+    ("wohnzimmer", "Wohnzimmer"),
+    ("kueche", "Küche"),
+    ("schlafzimmer", "Schlafzimmer"),
+    ("bad", "Bad"),
+    ("buero", "Büro"),
+    ("flur", "Flur"),
+    ("kinderzimmer", "Kinderzimmer"),
+    ("esszimmer", "Esszimmer"),
+    ("gaestezimmer", "Gästezimmer"),
+    ("keller", "Keller"),
+    ("garage", "Garage"),
+    ("terrasse", "Terrasse"),
+)
+
+# (domain, suffix, Anzeigename, state, attributes) pro Raum
+_ROOM_TEMPLATE = (
+    ("light", "decke", "Deckenlicht", "off", {"brightness": 0, "supported_color_modes": ["brightness"]}),
+    ("light", "stehlampe", "Stehlampe", "off", {"brightness": 0}),
+    ("cover", "rollladen", "Rollladen", "open", {"current_position": 100, "device_class": "shutter"}),
+    ("climate", "heizung", "Heizung", "heat", {"temperature": 21.0, "current_temperature": 20.5, "hvac_modes": ["off", "heat", "auto"]}),
+    ("sensor", "temperatur", "Temperatur", "20.5", {"unit_of_measurement": "°C", "device_class": "temperature"}),
+    ("sensor", "luftfeuchtigkeit", "Luftfeuchtigkeit", "48", {"unit_of_measurement": "%", "device_class": "humidity"}),
+    ("binary_sensor", "fenster", "Fenster", "off", {"device_class": "window"}),
+    ("binary_sensor", "bewegung", "Bewegung", "off", {"device_class": "motion"}),
+    ("media_player", "lautsprecher", "Lautsprecher", "idle", {"volume_level": 0.3}),
+    ("switch", "steckdose", "Steckdose", "off", {}),
+)
+
+
+def generate_entities(count: int = 300, seed: int = 42) -> list[dict]:
+    """Erzeugt deterministisch `count` HA-States verteilt auf Raeume."""
+    rng = random.Random(seed)
+    states: list[dict] = [
+        {"entity_id": "sun.sun", "state": "above_horizon", "attributes": {"elevation": 35.0, "azimuth": 180.0}},
+        {"entity_id": "weather.forecast_home", "state": "partlycloudy", "attributes": {"temperature": 14.0, "humidity": 60, "wind_speed": 12.0}},
+        {"entity_id": "person.max", "state": "home", "attributes": {"friendly_name": "Max"}},
+        {"entity_id": "person.lisa", "state": "not_home", "attributes": {"friendly_name": "Lisa"}},
+    ]
+    n = 0
+    while len(states) < count:
+        for slug, label in ROOMS:
+            for domain, suffix, name, state, attrs in _ROOM_TEMPLATE:
+                if len(states) >= count:
+                    break
+                idx = f"_{n}" if n else ""
+                attributes = dict(attrs)
+                attributes["friendly_name"] = f"{name} {label}" + (f" {n + 1}" if n else "")
+                if domain == "sensor" and suffix == "temperatur":
+                    state = f"{rng.uniform(18.5, 23.5):.1f}"
+                states.append({
+                    "entity_id": f"{domain}.{slug}_{suffix}{idx}",
+                    "state": state,
+                    "attributes": attributes,
+                    "last_changed": "2026-01-01T00:00:00+00:00",
+                })
+        n += 1
+    return states
+
+
+class FakeHomeAssistant:
+    """Minimaler HA REST-Server. Unbekannte Endpoints liefern 404 (wie HA)."""
+
+    def __init__(self, entity_count: int = 300, latency_ms: float = 2.0):
+        self.latency = latency_ms / 1000.0
+        self.states = {s["entity_id"]: s for s in generate_entities(entity_count)}
+        self.service_calls: list[tuple] = []
+        self.requests = 0
+        self._runner: Optional[web.AppRunner] = None
+        self.url = ""
+
+    def _app(self) -> web.Application:
+        app = web.Application(middlewares=[self._count])
+        app.router.add_get("/api/", self._api_root)
+        app.router.add_get("/api/config", self._config)
+        app.router.add_get("/api/states", self._get_states)
+        app.router.add_get("/api/states/{entity_id}", self._get_state)
+        app.router.add_post("/api/services/{domain}/{service}", self._call_service)
+        app.router.add_post("/api/events/{event_type}", self._fire_event)
+        return app
+
+    @web.middleware
+    async def _count(self, request, handler):
+        self.requests += 1
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        return await handler(request)
+
+    async def _api_root(self, request):
+        return web.json_response({"message": "API running."})
+
+    async def _config(self, request):
+        return web.json_response({
+            "location_name": "Benchmark",
+            "time_zone": "Europe/Berlin",
+            "latitude": 48.1,
+            "longitude": 11.6,
+            "unit_system": {"temperature": "°C"},
+            "version": "2026.1.0",
+        })
+
+    async def _get_states(self, request):
+        return web.json_response(list(self.states.values()))
+
+    async def _get_state(self, request):
+        state = self.states.get(request.match_info["entity_id"])
+        if state is None:
+            return web.json_response({"message": "Entity not found."}, status=404)
+        return web.json_response(state)
+
+    async def _fire_event(self, request):
+        return web.json_response({"message": "Event fired."})
+
+    async def _call_service(self, request):
+        domain = request.match_info["domain"]
+        service = request.match_info["service"]
+        try:
+            data = await request.json()
+        except (ValueError, json.JSONDecodeError):
+            data = {}
+        self.service_calls.append((domain, service, data))
+        entity_ids = data.get("entity_id") or []
+        if isinstance(entity_ids, str):
+            entity_ids = [entity_ids]
+        changed = []
+        for eid in entity_ids:
+            state = self.states.get(eid)
+            if state is None:
+                continue
+            self._apply(state, service, data)
+            changed.append(state)
+        return web.json_response(changed)
+
+    @staticmethod
+    def _apply(state: dict, service: str, data: dict) -> None:
+        attrs = state.setdefault("attributes", {})
+        if service == "turn_on":
+            state["state"] = "on"
+            if "brightness" in attrs or "brightness_pct" in data:
+                attrs["brightness"] = round(data.get("brightness_pct", 100) * 2.55)
+        elif service == "turn_off":
+            state["state"] = "off"
+        elif service == "toggle":
+            state["state"] = "off" if state["state"] == "on" else "on"
+        elif service in ("open_cover", "close_cover", "set_cover_position"):
+            pos = {"open_cover": 100, "close_cover": 0}.get(service, data.get("position", 50))
+            attrs["current_position"] = pos
+            state["state"] = "closed" if pos == 0 else "open"
+        elif service == "set_temperature" and "temperature" in data:
+            attrs["temperature"] = data["temperature"]
+        state["last_changed"] = time.strftime("%Y-%m-%dT%H:%M:%S+00:00", time.gmtime())
+
+    async def start(self, host: str = "127.0.0.1", port: int = 0) -> str:
+        self._runner = web.AppRunner(self._app(), access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, host, port)
+        await site.start()
+        self.url = f"http://{host}:{site._server.sockets[0].getsockname()[1]}"
+        return self.url
+
+    async def stop(self) -> None:
+        if self._runner:
+            await self._runner.cleanup()
+            self._runner = None
+
+
+# Deterministische Tool-Auswahl des Stub-LLM (Keyword → Tool)
+_TOOL_RULES = (
+    (re.compile(r"\b(licht|lampe|beleuchtung)\b"), "set_light"),
+    (re.compile(r"\b(rollladen|rolllaeden|rollläden|jalousie)\b"), "set_cover"),
+    (re.compile(r"\b(heizung|temperatur|grad)\b"), "set_climate"),
+)
+_OFF_WORDS = re.compile(r"\b(aus|zu|runter|schlie(?:ss|ß)\w*)\b")
+
+
+class StubOllama:
+    """Ollama-kompatibler Server mit deterministischen Antworten.
+
+    Latenz-Modell: ttft_ms bis zum ersten Token, danach token_ms pro Token.
+    Bei stream=True werden die Tokens einzeln als NDJSON gesendet.
+    """
+
+    def __init__(self, models: list[str], ttft_ms: float = 80.0, token_ms: float = 8.0):
+        self.models = list(dict.fromkeys(m for m in models if m))
+        self.ttft = ttft_ms / 1000.0
+        self.token_delay = token_ms / 1000.0
+        self.requests = 0
+        self._runner: Optional[web.AppRunner] = None
+        self.url = ""
+
+    def _app(self) -> web.Application:
+        app = web.Application(client_max_size=64 * 1024 * 1024)
+        app.router.add_get("/api/tags", self._tags)
+        app.router.add_post("/api/chat", self._chat)
+        app.router.add_post("/api/generate", self._generate)
+        return app
+
+    async def _tags(self, request):
+        return web.json_response({"models": [{"name": m} for m in self.models]})
+
+    @staticmethod
+    def _last_user_text(messages: list) -> str:
+        for msg in reversed(messages or []):
+            if msg.get("role") == "user":
+                return str(msg.get("content", ""))
+        return ""
+
+    def reply_for(self, text: str, tools: Optional[list]) -> tuple[str, list]:
+        """Deterministische Antwort (Text, Tool-Calls) fuer eine Anfrage."""
+        lower = text.lower()
+        tool_names = {t.get("function", {}).get("name") for t in (tools or [])}
+        room = next((slug for slug, label in ROOMS if slug in lower or label.lower() in lower), "wohnzimmer")
+        for pattern, tool in _TOOL_RULES:
+            if tool in tool_names and pattern.search(lower):
+                off = bool(_OFF_WORDS.search(lower))
+                if tool == "set_light":
+                    args = {"room": room, "state": "off" if off else "on"}
+                elif tool == "set_cover":
+                    args = {"room": room, "action": "close" if off else "open"}
+                else:
+                    args = {"room": room, "temperature": 21}
+                return "", [{"function": {"name": tool, "arguments": args}}]
+        words = re.findall(r"\w+", lower)[:6]
+        answer = (
+            "Sehr wohl. Ich habe mir das angesehen: "
+            + " ".join(words)
+            + ". Alles im Haus ist in Ordnung, weitere Details gerne auf Nachfrage."
+        )
+        return answer, []
+
+    @staticmethod
+    def _tokens(text: str) -> list[str]:
+        return re.findall(r"\S+\s*", text) or [text]
+
+    async def _chat(self, request):
+        self.requests += 1
+        payload = await request.json()
+        model = payload.get("model", "")
+        content, tool_calls = self.reply_for(
+            self._last_user_text(payload.get("messages")), payload.get("tools")
+        )
+        tokens = self._tokens(content) if content else [""]
+        if not payload.get("stream"):
+            await asyncio.sleep(self.ttft + self.token_delay * len(tokens))
+            message = {"role": "assistant", "content": content}
+            if tool_calls:
+                message["tool_calls"] = tool_calls
+            return web.json_response({
+                "model": model,
+                "message": message,
+                "done": True,
+                "eval_count": len(tokens),
+                "prompt_eval_count": 100,
+            })
+
+        resp = web.StreamResponse(headers={"Content-Type": "application/x-ndjson"})
+        await resp.prepare(request)
+        await asyncio.sleep(self.ttft)
+        for tok in tokens:
+            chunk = {"model": model, "message": {"role": "assistant", "content": tok}, "done": False}
+            await resp.write((json.dumps(chunk) + "\n").encode())
+            await asyncio.sleep(self.token_delay)
+        await resp.write((json.dumps({"model": model, "message": {"role": "assistant", "content": ""}, "done": True, "eval_count": len(tokens)}) + "\n").encode())
+        await resp.write_eof()
+        return resp
+
+    async def _generate(self, request):
+        self.requests += 1
+        payload = await request.json()
+        content, _ = self.reply_for(str(payload.get("prompt", ""))[-200:], None)
+        await asyncio.sleep(self.ttft + self.token_delay * len(self._tokens(content)))
+        return web.json_response({"model": payload.get("model", ""), "response": content, "done": True})
+
+    async def start(self, host: str = "127.0.0.1", port: int = 0) -> str:
+        self._runner = web.AppRunner(self._app(), access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, host, port)
+        await site.start()
+        self.url = f"http://{host}:{site._server.sockets[0].getsockname()[1]}"
+        return self.url
+
+    async def stop(self) -> None:
+        if self._runner:
+            await self._runner.cleanup()
+            self._runner = None
+
+
+class LatencyRedis:
+    """In-Memory Redis mit simulierter Netzwerk-Latenz pro Round-Trip.
+
+    Deckt die Befehle ab, die die Lern-/Beobachtungs-Pfade nutzen. TTLs
+    werden nur gespeichert (EXPIRE NX/TTL-Semantik), nicht abgelaufen.
+    ``round_trips`` zaehlt Einzelbefehle und Pipeline-execute() je einmal.
+    """
+
+    def __init__(self, rtt_ms: float = 0.5):
+        self.rtt = rtt_ms / 1000.0
+        self.round_trips = 0
+        self.commands = 0
+        self._data: dict = {}
+        self._ttl: dict = {}
+
+    async def _round_trip(self):
+        self.round_trips += 1
+        if self.rtt:
+            await asyncio.sleep(self.rtt)
+
+    def _run(self, name: str, *args, **kwargs):
+        self.commands += 1
+        return getattr(self, f"_cmd_{name}")(*args, **kwargs)
+
+    def __getattr__(self, name):
+        if not hasattr(type(self), f"_cmd_{name}"):
+            raise AttributeError(name)
+
+        async def _command(*args, **kwargs):
+            await self._round_trip()
+            return self._run(name, *args, **kwargs)
+
+        return _command
+
+    def pipeline(self, transaction: bool = True):
+        return _LatencyPipeline(self)
+
+    # -- Befehle (synchron, ohne Latenz) --------------------------------
+
+    def _cmd_get(self, key):
+        value = self._data.get(key)
+        return value if not isinstance(value, (list, dict)) else None
+
+    def _cmd_mget(self, *keys):
+        return [self._cmd_get(k) for k in keys]
+
+    def _cmd_set(self, key, value, ex=None, nx=False):
+        if nx and key in self._data:
+            return None
+        self._data[key] = str(value)
+        if ex:
+            self._ttl[key] = ex
+        return True
+
+    def _cmd_setex(self, key, seconds, value):
+        return self._cmd_set(key, value, ex=seconds)
+
+    def _cmd_incr(self, key):
+        value = int(self._data.get(key, 0)) + 1
+        self._data[key] = str(value)
+        return value
+
+    def _cmd_expire(self, key, seconds, nx=False):
+        if key not in self._data or (nx and key in self._ttl):
+            return False
+        self._ttl[key] = seconds
+        return True
+
+    def _cmd_ttl(self, key):
+        if key not in self._data:
+            return -2
+        return self._ttl.get(key, -1)
+
+    def _cmd_lpush(self, key, *values):
+        lst = self._data.setdefault(key, [])
+        for v in values:
+            lst.insert(0, v)
+        return len(lst)
+
+    def _cmd_ltrim(self, key, start, end):
+        if key in self._data:
+            self._data[key] = self._data[key][start:end + 1]
+        return True
+
+    def _cmd_lrange(self, key, start, end):
+        lst = self._data.get(key, [])
+        return list(lst[start:end + 1 if end >= 0 else None])
+
+    def _cmd_hset(self, key, field, value):
+        self._data.setdefault(key, {})[field] = value
+        return 1
+
+    def _cmd_hget(self, key, field):
+        return self._data.get(key, {}).get(field)
+
+    def _cmd_delete(self, *keys):
+        return sum(1 for k in keys if self._data.pop(k, None) is not None)
+
+    # Streams: Liste aus (id, fields), IDs als "<ms>-<seq>"
+
+    def _cmd_xadd(self, key, fields, id="*", maxlen=None, approximate=True):
+        stream = self._data.setdefault(key, _Stream())
+        last = _stream_id(stream[-1][0]) if stream else (0, 0)
+        if id == "*":
+            ms = max(int(time.time() * 1000), last[0])
+            new = (ms, last[1] + 1 if ms == last[0] else 0)
+        else:
+            new = _stream_id(id)
+            if new <= last:
+                raise ValueError("ID specified in XADD is equal or smaller")
+        stream_id = f"{new[0]}-{new[1]}"
+        stream.append((stream_id, dict(fields)))
+        if maxlen and len(stream) > maxlen:
+            del stream[: len(stream) - maxlen]
+        return stream_id
+
+    def _cmd_xlen(self, key):
+        return len(self._data.get(key, ()))
+
+    def _cmd_xrange(self, key, min="-", max="+", count=None):
+        low, high = _stream_bound(min, low=True), _stream_bound(max, low=False)
+        hits = [
+            (sid, dict(f))
+            for sid, f in self._data.get(key, ())
+            if low(_stream_id(sid)) and high(_stream_id(sid))
+        ]
+        return hits[:count] if count else hits
+
+    def _cmd_xrevrange(self, key, max="+", min="-", count=None):
+        hits = list(reversed(self._cmd_xrange(key, min=min, max=max)))
+        return hits[:count] if count else hits
+
+    # Sorted Sets: dict member -> score
+
+    def _cmd_zadd(self, key, mapping):
+        zset = self._data.setdefault(key, {})
+        added = sum(1 for m in mapping if m not in zset)
+        zset.update(mapping)
+        return added
+
+    def _zsorted(self, key):
+        return sorted(self._data.get(key, {}).items(), key=lambda kv: (kv[1], kv[0]))
+
+    def _cmd_zrevrangebyscore(self, key, max, min, start=None, num=None):
+        low = float(min) if min != "-inf" else float("-inf")
+        high = float(max) if max != "+inf" else float("inf")
+        hits = [m for m, sc in reversed(self._zsorted(key)) if low <= sc <= high]
+        if start is not None and num is not None:
+            hits = hits[start:start + num]
+        return hits
+
+    def _cmd_zremrangebyrank(self, key, start, end):
+        items = self._zsorted(key)
+        doomed = items[start:end + 1 if end != -1 else None]
+        for member, _ in doomed:
+            del self._data[key][member]
+        return len(doomed)
+
+
+class _Stream(list):
+    """Marker-Typ fuer Streams im LatencyRedis."""
+
+
+def _stream_id(value: str, default_seq: int = 0) -> tuple:
+    ms, _, seq = str(value).partition("-")
+    return int(ms), int(seq) if seq else default_seq
+
+
+def _stream_bound(value: str, low: bool):
+    """Vergleichsfunktion fuer XRANGE-Grenzen ("-", "+", "(id", "ms", "ms-seq")."""
+    value = str(value)
+    if value in ("-", "+"):
+        return lambda _sid: True
+    exclusive = value.startswith("(")
+    bound = _stream_id(value.lstrip("("), default_seq=0 if low else 2**63)
+    if low:
+        return (lambda sid: sid > bound) if exclusive else (lambda sid: sid >= bound)
+    return (lambda sid: sid < bound) if exclusive else (lambda sid: sid <= bound)
+
+
+class _LatencyPipeline:
+    """Sammelt Befehle; execute() kostet einen Round-Trip."""
+
+    def __init__(self, redis: LatencyRedis):
+        self._redis = redis
+        self._stack: list = []
+
+    def __getattr__(self, name):
+        if not hasattr(LatencyRedis, f"_cmd_{name}"):
+            raise AttributeError(name)
+
+        def _queue(*args, **kwargs):
+            self._stack.append((name, args, kwargs))
+            return self
+
+        return _queue
+
+    def __len__(self):
+        return len(self._stack)
+
+    async def execute(self):
+        stack, self._stack = self._stack, []
+        await self._redis._round_trip()
+        return [self._redis._run(n, *a, **kw) for n, a, kw in stack]
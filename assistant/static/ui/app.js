@@ -3604,7 +3604,12 @@ function renderPersonality() {
     fToggle('incremental_llm.enabled', 'Fast-Gather für einfache Befehle') +
     fInfo('Bei einfachen Geraetebefehlen ("Licht an") und Status-Abfragen ("Wie warm?") wird der Kontext-Gather mit kurzerem Timeout ausgeführt. Subsysteme die nicht rechtzeitig antworten (Anticipation, Patterns, Insights) werden übersprungen — das LLM startet frueher. Spart 500-1500ms bei einfachen Anfragen.') +
     fRange('incremental_llm.fast_gather_timeout', 'Fast-Gather Timeout (Sekunden)', 1.0, 10.0, 0.5, {1.0:'1s (aggressiv)',2.0:'2s',3.0:'3s (Standard)',5.0:'5s',10.0:'10s (konservativ)'}) +
-    fInfo('Maximale Wartezeit auf Kontext-Daten bei einfachen Befehlen. Niedrig = schnellere Antworten, aber weniger Kontext (Anticipation, gelernte Muster etc. fehlen möglicherweise). 3s reicht für Haus-Status und Raumprofil — die wichtigsten Daten für Geraetebefehle.')
+    fInfo('Maximale Wartezeit auf Kontext-Daten bei einfachen Befehlen. Niedrig = schnellere Antworten, aber weniger Kontext (Anticipation, gelernte Muster etc. fehlen möglicherweise). 3s reicht für Haus-Status und Raumprofil — die wichtigsten Daten für Geraetebefehle.') +
+    fSubheading('Spekulatives Vorladen') +
+    fToggle('speculative_prefetch.enabled', 'Kontext während des Sprechens vorladen') +
+    fInfo('Sobald ein Teil-Transkript ankommt (assistant.partial / chat/partial), lädt Jarvis schon Haus-Status, letzte Gespräche, Erinnerungen und Wissensbasis-Treffer. Beim finalen Text werden passende Ergebnisse übernommen, der Rest verworfen. Versteckt den Kontext-Gather hinter deiner eigenen Sprechzeit.') +
+    fRange('speculative_prefetch.max_age_seconds', 'Max. Alter vorgeladener Daten (Sekunden)', 5, 60, 5, {5:'5s',15:'15s (Standard)',30:'30s',60:'1 Min'}) +
+    fRange('speculative_prefetch.rag_min_overlap', 'Mindest-Übereinstimmung für Wissensbasis', 0.5, 1.0, 0.05, {0.5:'50%',0.75:'75% (Standard)',1.0:'100%'})
   ) +
   sectionWrap('&#10024;', 'LLM Enhancer',
     fInfo('Macht Jarvis intelligenter durch gezielte LLM-Nutzung. Jedes Feature nutzt einen separaten LLM-Call — mehr Features = bessere Antworten, aber hoehere Latenz und GPU-Last. Einzeln deaktivierbar.') +
@@ -8671,7 +8676,7 @@ async function loadProtocol() {
     // tts and notification are pseudo-types — filter client-side from jarvis_action
     const isClientFilter = (type === 'tts' || type === 'notification');
     const apiType = isClientFilter ? '' : type;
-    const params = `limit=200&period=${period}` + (apiType ? `&type=${apiType}` : '');
+    const params = `limit=200&period=${period}&total=none` + (apiType ? `&type=${apiType}` : '');
     const d = await api('/api/ui/action-log?' + params);
     let items = d.items || [];
     // Client-side filter for TTS/notification pseudo-types
@@ -0,0 +1,288 @@
+"""Tests fuer ActionJournal — Redis-Stream-Journal mit Indizes und Cursorn."""
+
+import json
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from assistant.action_journal import (
+    BACKFILL_KEY,
+    KIND_ACTION,
+    KIND_CORRECTION,
+    KIND_MANUAL,
+    KIND_OUTCOME,
+    STREAM_KEY,
+    ActionJournal,
+)
+from assistant.learning_observer import KEY_MANUAL_ACTIONS
+from benchmarks.fakes import LatencyRedis
+
+OUTCOMES = "mha:action_outcomes"
+ACTIONS = STREAM_KEY.format(KIND_ACTION)
+MANUAL = STREAM_KEY.format(KIND_MANUAL)
+_T0 = datetime(2026, 3, 2, 8, 0, tzinfo=timezone.utc)
+
+
+def _at(minutes: int) -> str:
+    return (_T0 + timedelta(minutes=minutes)).isoformat()
+
+
+async def _journal(redis=None) -> ActionJournal:
+    journal = ActionJournal()
+    await journal.initialize(redis or LatencyRedis(rtt_ms=0))
+    return journal
+
+
+def _push(redis, key, **entry):
+    redis._cmd_lpush(key, json.dumps(entry))
+
+
+async def _write(journal, kind, entry):
+    pipe = journal.redis.pipeline(transaction=False)
+    assert journal.append_to(pipe, kind, entry)
+    await pipe.execute()
+
+
+class TestBackfill:
+    @pytest.mark.asyncio
+    async def test_lists_merged_in_time_order(self):
+        redis = LatencyRedis(rtt_ms=0)
+        # Listen sind neueste-zuerst
+        _push(redis, "mha:action_log", action="a1", timestamp=_at(1))
+        _push(redis, "mha:action_log", action="a3", timestamp=_at(3))
+        _push(redis, KEY_MANUAL_ACTIONS, entity_id="light.flur", timestamp=_at(2))
+        redis._cmd_lpush("mha:action_outcomes", "kaputt")
+
+        journal = await _journal(redis)
+
+        assert journal.ready
+        actions = redis._cmd_xrange(ACTIONS)
+        assert [json.loads(f["data"])["action"] for _, f in actions] == ["a1", "a3"]
+        assert actions[0][0] == f"{int((_T0 + timedelta(minutes=1)).timestamp() * 1000)}-0"
+        assert [f["kind"] for _, f in redis._cmd_xrange(MANUAL)] == [KIND_MANUAL]
+        assert redis._cmd_get(BACKFILL_KEY) == "1"
+        everything = await journal.range()
+        assert [e["timestamp"] for e in everything] == [_at(1), _at(2), _at(3)]
+
+    @pytest.mark.asyncio
+    async def test_runs_only_once(self):
+        redis = LatencyRedis(rtt_ms=0)
+        _push(redis, "mha:action_log", action="a", timestamp=_at(1))
+        await _journal(redis)
+        await _journal(redis)
+        assert redis._cmd_xlen(ACTIONS) == 1
+
+    @pytest.mark.asyncio
+    async def test_same_millisecond_gets_sequence(self):
+        redis = LatencyRedis(rtt_ms=0)
+        for action in ("a", "b"):
+            _push(redis, "mha:action_log", action=action, timestamp=_at(1))
+        await _journal(redis)
+        ids = [sid for sid, _ in redis._cmd_xrange(ACTIONS)]
+        assert ids[0].endswith("-0") and ids[1].endswith("-1")
+
+
+class TestAppend:
+    @pytest.mark.asyncio
+    async def test_typed_fields_in_same_pipeline(self):
+        journal = await _journal()
+        redis = journal.redis
+        before = redis.round_trips
+        entry = {
+            "action": "set_light",
+            "args": json.dumps({"entity_id": "light.bad"}),
+            "person": "Max",
+            "timestamp": _at(0),
+        }
+        await _write(journal, KIND_ACTION, entry)
+
+        assert redis.round_trips == before + 1
+        (_, fields), = redis._cmd_xrange(ACTIONS)
+        assert fields["kind"] == KIND_ACTION
+        assert fields["entity_id"] == "light.bad"
+        assert fields["person"] == "max"
+        assert json.loads(fields["data"]) == entry
+
+    @pytest.mark.asyncio
+    async def test_not_ready_queues_nothing(self):
+        journal = ActionJournal()
+        redis = LatencyRedis(rtt_ms=0)
+        pipe = redis.pipeline()
+        assert journal.append_to(pipe, KIND_ACTION, {"action": "x"}) is False
+        assert len(pipe) == 0
+
+
+class TestRetention:
+    @pytest.mark.asyncio
+    async def test_caps_per_kind(self):
+        journal = await _journal()
+        journal.retention[KIND_MANUAL] = 5
+        await _write(journal, KIND_CORRECTION, {"n": "c", "timestamp": _at(0)})
+        for i in range(20):
+            await _write(journal, KIND_MANUAL, {"n": i, "timestamp": _at(i)})
+
+        assert journal.redis._cmd_xlen(MANUAL) == 5
+        cursor = journal.cursor((KIND_CORRECTION,), window=10)
+        assert await cursor.refresh() == 1
+        assert cursor.latest() == [{"n": "c", "timestamp": _at(0)}]
+
+    @pytest.mark.asyncio
+    async def test_rare_kind_reads_only_its_stream(self):
+        journal = await _journal()
+        for i in range(50):
+            await _write(journal, KIND_MANUAL, {"n": i, "timestamp": _at(i)})
+        await _write(journal, KIND_OUTCOME, {"n": "o", "timestamp": _at(60)})
+        commands = journal.redis.commands
+        cursor = journal.cursor((KIND_OUTCOME,), window=10)
+        assert await cursor.refresh() == 1
+        assert journal.redis.commands == commands + 1
+
+    @pytest.mark.asyncio
+    async def test_old_shared_stream_removed(self):
+        redis = LatencyRedis(rtt_ms=0)
+        redis._cmd_xadd("mha:journal", {"kind": KIND_ACTION, "data": "{}"})
+        redis._cmd_set("mha:journal:backfilled", "1")
+        _push(redis, "mha:action_log", action="a", timestamp=_at(1))
+        await _journal(redis)
+        assert redis._cmd_xlen("mha:journal") == 0
+        assert redis._cmd_xlen(ACTIONS) == 1
+
+
+class TestRange:
+    @pytest.mark.asyncio
+    async def test_time_window_and_kind_filter(self):
+        redis = LatencyRedis(rtt_ms=0)
+        for minute in (0, 30, 90):
+            _push(redis, "mha:action_outcomes", n=minute, timestamp=_at(minute))
+        _push(redis, "mha:action_log", n=40, timestamp=_at(40))
+        journal = await _journal(redis)
+
+        hits = await journal.range(
+            _T0 + timedelta(minutes=10),
+            _T0 + timedelta(minutes=60),
+            kinds=(KIND_OUTCOME,),
+        )
+        assert [e["n"] for e in hits] == [30]
+        everything = await journal.range(kinds=(KIND_OUTCOME,))
+        assert [e["n"] for e in everything] == [0, 30, 90]
+
+
+class TestCursor:
+    @pytest.mark.asyncio
+    async def test_initial_window_newest_first(self):
+        journal = await _journal()
+        for i in range(5):
+            await _write(journal, KIND_MANUAL, {"n": i, "timestamp": _at(i)})
+        await _write(journal, KIND_ACTION, {"n": 99, "timestamp": _at(9)})
+
+        cursor = journal.cursor((KIND_MANUAL,), window=3)
+        assert await cursor.refresh() == 3
+        assert [e["n"] for e in cursor.latest()] == [4, 3, 2]
+        assert [e["n"] for e in cursor.latest(1)] == [4]
+
+    @pytest.mark.asyncio
+    async def test_refresh_reads_only_new_entries(self):
+        journal = await _journal()
+        for i in range(50):
+            await _write(journal, KIND_MANUAL, {"n": i, "timestamp": _at(i)})
+        cursor = journal.cursor((KIND_MANUAL,), window=20)
+        await cursor.refresh()
+
+        await _write(journal, KIND_MANUAL, {"n": 50, "timestamp": _at(50)})
+        await _write(journal, KIND_ACTION, {"n": 51, "timestamp": _at(51)})
+        commands = journal.redis.commands
+        assert await cursor.refresh() == 1
+        assert journal.redis.commands == commands + 1
+        assert cursor.latest(2)[0]["n"] == 50
+        assert len(cursor.latest()) == 20
+        # Nichts Neues: leerer Lesevorgang, Fenster unveraendert
+        assert await cursor.refresh() == 0
+        assert cursor.latest(1)[0]["n"] == 50
+
+    @pytest.mark.asyncio
+    async def test_empty_stream_then_first_entry(self):
+        journal = await _journal()
+        cursor = journal.cursor((KIND_ACTION,), window=10)
+        assert await cursor.refresh() == 0
+        await _write(journal, KIND_ACTION, {"n": 1, "timestamp": _at(1)})
+        assert await cursor.refresh() == 1
+        assert cursor.latest() == [{"n": 1, "timestamp": _at(1)}]
+
+
+class TestIndexes:
+    @pytest.mark.asyncio
+    async def test_for_entity_and_person(self):
+        journal = await _journal()
+        for minute, (kind, entry) in enumerate((
+            (KIND_MANUAL, {"entity_id": "light.bad", "person": "Max"}),
+            (KIND_MANUAL, {"entity_id": "light.flur", "person": "Lisa"}),
+            (KIND_OUTCOME, {"args": {"entity_id": "light.bad"}, "person": "Lisa"}),
+        )):
+            entry["timestamp"] = _at(minute)
+            await _write(journal, kind, entry)
+
+        bad = await journal.for_entity("light.bad")
+        assert [e["timestamp"] for e in bad] == [_at(2), _at(0)]
+        lisa = await journal.for_person("Lisa", limit=1)
+        assert lisa[0]["timestamp"] == _at(2)
+
+    @pytest.mark.asyncio
+    async def test_sync_is_incremental(self):
+        journal = await _journal()
+        entry = {"entity_id": "light.a", "timestamp": _at(0)}
+        await _write(journal, KIND_MANUAL, entry)
+        assert await journal.sync_indexes() == 1
+        assert await journal.sync_indexes() == 0
+        await _write(journal, KIND_MANUAL, dict(entry, timestamp=_at(1)))
+        assert await journal.sync_indexes() == 1
+
+    @pytest.mark.asyncio
+    async def test_index_capped(self):
+        journal = await _journal()
+        journal.index_len = 3
+        for i in range(5):
+            entry = {"entity_id": "light.a", "n": i, "timestamp": _at(i)}
+            await _write(journal, KIND_MANUAL, entry)
+        hits = await journal.for_entity("light.a")
+        assert [e["n"] for e in hits] == [4, 3, 2]
+
+
+class TestConsumers:
+    @pytest.mark.asyncio
+    async def test_anticipation_writes_and_reads_journal(self):
+        from assistant.anticipation import AnticipationEngine
+
+        journal = await _journal()
+        engine = AnticipationEngine()
+        engine.redis = journal.redis
+        engine.set_action_journal(journal)
+
+        await engine.log_action("set_light", {"entity_id": "light.bad"}, person="Max")
+        await engine.log_action("set_cover", {"room": "bad"})
+
+        recent = await engine._recent_actions()
+        assert [e["action"] for e in recent] == ["set_cover", "set_light"]
+        assert len(journal.redis._cmd_lrange("mha:action_log", 0, -1)) == 2
+        assert (await journal.for_entity("light.bad"))[0]["action"] == "set_light"
+
+    @pytest.mark.asyncio
+    async def test_dialogue_state_uses_time_window(self):
+        from assistant.dialogue_state import DialogueStateManager
+
+        redis = LatencyRedis(rtt_ms=0)
+        now = datetime.now(timezone.utc)
+        for hours, desc in (
+            (30, "Rollladen runter"),
+            (24, "Licht im Bad an"),
+            (1, "Musik an"),
+        ):
+            ts = (now - timedelta(hours=hours)).isoformat()
+            _push(redis, OUTCOMES, action="x", description=desc, timestamp=ts)
+        journal = await _journal(redis)
+        dsm = DialogueStateManager()
+        dsm.set_redis(redis)
+        dsm.set_action_journal(journal)
+
+        hint = await dsm.resolve_temporal_reference_async("mach es wie gestern")
+        assert "Licht im Bad an" in hint
+        assert "Rollladen" not in hint and "Musik" not in hint
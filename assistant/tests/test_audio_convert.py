@@ -0,0 +1,105 @@
+"""Tests fuer audio_convert — In-Process Dekodierung + Resampling auf 16kHz mono."""
+
+import io
+import wave
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import numpy as np
+import pytest
+
+from assistant.audio_convert import decode_to_16k_mono, is_pcm16_mono_16k, resample
+
+
+def _wav(samples: np.ndarray, rate: int, channels: int = 1, width: int = 2) -> bytes:
+    """Erzeugt ein WAV aus float-Samples (-1..1), interleaved bei channels>1."""
+    if channels > 1:
+        samples = np.repeat(samples, channels)
+    if width == 2:
+        frames = (samples * 32767).astype("<i2").tobytes()
+    elif width == 3:
+        ints = (samples * 8388607).astype("<i4").tobytes()
+        frames = b"".join(ints[i:i + 3] for i in range(0, len(ints), 4))
+    else:
+        frames = (samples * 2147483647).astype("<i4").tobytes()
+    buf = io.BytesIO()
+    with wave.open(buf, "wb") as wf:
+        wf.setnchannels(channels)
+        wf.setsampwidth(width)
+        wf.setframerate(rate)
+        wf.writeframes(frames)
+    return buf.getvalue()
+
+
+def _tone(rate: int, freq: float = 440.0, seconds: float = 0.5) -> np.ndarray:
+    t = np.arange(int(rate * seconds)) / rate
+    return 0.5 * np.sin(2 * np.pi * freq * t)
+
+
+def _dominant_freq(pcm: bytes, rate: int = 16000) -> float:
+    data = np.frombuffer(pcm, dtype="<i2").astype(np.float32)
+    spectrum = np.abs(np.fft.rfft(data))
+    return float(np.argmax(spectrum) * rate / len(data))
+
+
+class TestDecode:
+    def test_target_format_passthrough(self):
+        wav = _wav(_tone(16000), 16000)
+        assert is_pcm16_mono_16k(wav)
+        with wave.open(io.BytesIO(wav), "rb") as wf:
+            expected = wf.readframes(wf.getnframes())
+        assert decode_to_16k_mono(wav) == expected
+
+    def test_48k_stereo_downmixed_and_resampled(self):
+        pcm = decode_to_16k_mono(_wav(_tone(48000), 48000, channels=2))
+        assert len(pcm) == 8000 * 2  # 0.5s @ 16kHz, 16 bit
+        assert abs(_dominant_freq(pcm) - 440) < 3
+
+    def test_24bit_and_32bit(self):
+        for width in (3, 4):
+            pcm = decode_to_16k_mono(_wav(_tone(44100), 44100, width=width))
+            assert len(pcm) == 8000 * 2
+            assert abs(_dominant_freq(pcm) - 440) < 3
+
+    def test_upsample_8k(self):
+        pcm = decode_to_16k_mono(_wav(_tone(8000, freq=300), 8000))
+        assert len(pcm) == 8000 * 2
+        assert abs(_dominant_freq(pcm) - 300) < 3
+
+    def test_flac_via_soundfile(self):
+        soundfile = pytest.importorskip("soundfile")
+        buf = io.BytesIO()
+        soundfile.write(buf, _tone(22050), 22050, format="FLAC")
+        pcm = decode_to_16k_mono(buf.getvalue())
+        assert pcm is not None
+        assert abs(_dominant_freq(pcm) - 440) < 3
+
+    def test_webm_left_to_ffmpeg(self):
+        assert decode_to_16k_mono(b"\x1a\x45\xdf\xa3" + b"\x00" * 64) is None
+        assert decode_to_16k_mono(b"") is None
+
+    def test_resample_removes_content_above_nyquist(self):
+        # 12kHz Ton ist bei 16kHz nicht darstellbar → darf nicht als Alias auftauchen
+        out = resample(_tone(48000, freq=12000), 48000, 16000)
+        assert np.max(np.abs(out)) < 0.01
+
+
+class TestConvertEndpointHelper:
+    @pytest.mark.asyncio
+    async def test_wav_never_spawns_ffmpeg(self):
+        from assistant.main import _convert_audio_to_16k_mono
+
+        with patch("asyncio.create_subprocess_exec", new=AsyncMock()) as spawn:
+            pcm = await _convert_audio_to_16k_mono(_wav(_tone(44100), 44100, channels=2))
+        spawn.assert_not_called()
+        assert len(pcm) == 8000 * 2
+
+    @pytest.mark.asyncio
+    async def test_unknown_container_falls_back_to_ffmpeg(self):
+        from assistant.main import _convert_audio_to_16k_mono
+
+        proc = MagicMock(returncode=0)
+        proc.communicate = AsyncMock(return_value=(b"\x00\x01" * 10, b""))
+        with patch("asyncio.create_subprocess_exec", new=AsyncMock(return_value=proc)) as spawn:
+            pcm = await _convert_audio_to_16k_mono(b"\x1a\x45\xdf\xa3" + b"\x00" * 64)
+        assert spawn.call_args.args[0] == "ffmpeg"
+        assert pcm == b"\x00\x01" * 10
@@ -0,0 +1,140 @@
+"""Tests fuer den E2E-Latenz-Benchmark (Stand-ins, Statistik, Baseline-Diff)."""
+
+import aiohttp
+import pytest
+
+from benchmarks.e2e_latency import (
+    diff_against_baseline,
+    load_corpus,
+    percentile,
+    summarize,
+)
+from benchmarks.fakes import FakeHomeAssistant, LatencyRedis, StubOllama, generate_entities
+
+
+class TestFakeHomeAssistant:
+    def test_entities_deterministic(self):
+        a = generate_entities(250)
+        assert len(a) == 250
+        assert a == generate_entities(250)
+        assert len({s["entity_id"] for s in a}) == 250
+
+    @pytest.mark.asyncio
+    async def test_service_call_changes_state(self):
+        ha = FakeHomeAssistant(entity_count=50, latency_ms=0)
+        url = await ha.start()
+        try:
+            async with aiohttp.ClientSession() as session:
+                async with session.post(
+                    f"{url}/api/services/light/turn_on",
+                    json={"entity_id": "light.wohnzimmer_decke"},
+                ) as resp:
+                    changed = await resp.json()
+                async with session.get(f"{url}/api/states/light.wohnzimmer_decke") as resp:
+                    state = await resp.json()
+                async with session.get(f"{url}/api/states/light.gibtsnicht") as resp:
+                    assert resp.status == 404
+        finally:
+            await ha.stop()
+        assert changed[0]["state"] == "on"
+        assert state["state"] == "on"
+        assert ha.service_calls == [("light", "turn_on", {"entity_id": "light.wohnzimmer_decke"})]
+
+
+class TestStubOllama:
+    def test_tool_call_for_device_command(self):
+        llm = StubOllama(models=["m"])
+        tools = [{"function": {"name": "set_light"}}, {"function": {"name": "set_cover"}}]
+        text, calls = llm.reply_for("Mach das Licht in der Küche aus", tools)
+        assert text == ""
+        assert calls == [{"function": {"name": "set_light", "arguments": {"room": "kueche", "state": "off"}}}]
+
+    def test_plain_answer_without_tools(self):
+        llm = StubOllama(models=["m"])
+        first = llm.reply_for("Wie geht es dir?", None)
+        assert first == llm.reply_for("Wie geht es dir?", None)
+        assert first[0] and first[1] == []
+
+    @pytest.mark.asyncio
+    async def test_stream_yields_tokens(self):
+        llm = StubOllama(models=["m"], ttft_ms=0, token_ms=0)
+        url = await llm.start()
+        chunks = []
+        try:
+            async with aiohttp.ClientSession() as session:
+                async with session.post(
+                    f"{url}/api/chat",
+                    json={"model": "m", "stream": True, "messages": [{"role": "user", "content": "Hallo du"}]},
+                ) as resp:
+                    async for line in resp.content:
+                        if line.strip():
+                            chunks.append(line)
+        finally:
+            await llm.stop()
+        assert len(chunks) > 3
+        assert b'"done": true' in chunks[-1]
+
+
+class TestLatencyRedis:
+    @pytest.mark.asyncio
+    async def test_pipeline_is_one_round_trip(self):
+        redis = LatencyRedis(rtt_ms=0)
+        await redis.set("a", "1")
+        pipe = redis.pipeline(transaction=False)
+        pipe.incr("a")
+        pipe.expire("a", 60, nx=True)
+        pipe.expire("a", 120, nx=True)
+        pipe.lpush("l", "x")
+        pipe.lrange("l", 0, 9)
+        assert len(pipe) == 5
+        assert await pipe.execute() == [2, True, False, 1, ["x"]]
+        assert redis.round_trips == 2
+        assert redis.commands == 6
+        assert await redis.ttl("a") == 60
+
+    @pytest.mark.asyncio
+    async def test_stream_range_bounds(self):
+        redis = LatencyRedis(rtt_ms=0)
+        for sid in ("100-0", "100-1", "200-0"):
+            await redis.xadd("s", {"n": sid}, id=sid)
+        assert [i for i, _ in await redis.xrange("s", min="100", max="100")] == [
+            "100-0",
+            "100-1",
+        ]
+        assert [i for i, _ in await redis.xrange("s", min="(100-1")] == ["200-0"]
+        assert [i for i, _ in await redis.xrevrange("s", count=1)] == ["200-0"]
+        with pytest.raises(ValueError):
+            await redis.xadd("s", {}, id="150-0")
+
+
+class TestStatistics:
+    def test_percentile_interpolates(self):
+        assert percentile([10, 20, 30, 40], 50) == 25.0
+        assert percentile([], 95) == 0.0
+
+    def test_summarize_skips_empty(self):
+        stats = summarize({"total": [1.0, 2.0, 3.0], "tts_first_audio": []})
+        assert stats == {"total": {"p50": 2.0, "p95": 2.9, "count": 3}}
+
+    def test_corpus_loads(self):
+        rows = load_corpus()
+        assert len(rows) >= 30
+        assert all(r["text"] for r in rows)
+
+
+class TestBaselineDiff:
+    def test_regression_flagged(self):
+        base = {"metrics": {"total": {"p50": 100.0, "p95": 200.0}}}
+        cur = {"metrics": {"total": {"p50": 130.0, "p95": 205.0}}}
+        rows = {r["pct"]: r for r in diff_against_baseline(cur, base, threshold_pct=10)}
+        assert rows["p50"]["regression"] is True
+        assert rows["p50"]["delta_pct"] == 30.0
+        assert rows["p95"]["regression"] is False
+
+    def test_small_absolute_delta_ignored(self):
+        base = {"metrics": {"pre_classify": {"p50": 1.0, "p95": 1.0}}}
+        cur = {"metrics": {"pre_classify": {"p50": 2.0, "p95": 2.0}}}
+        assert not any(r["regression"] for r in diff_against_baseline(cur, base))
+
+    def test_new_metric_without_baseline_skipped(self):
+        assert diff_against_baseline({"metrics": {"x": {"p50": 1, "p95": 1}}}, {"metrics": {}}) == []
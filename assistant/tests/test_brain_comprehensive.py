@@ -958,6 +958,44 @@ class TestGetStatesCached:
         brain.ha.get_states.assert_called_once()
 
 
+# ── reply_tts_preview ─────────────────────────────────
+
+
+class TestReplyTtsPreview:
+    def _setup(self, brain, activity, volume, whisper=False):
+        brain.activity = MagicMock()
+        brain.activity.should_deliver = AsyncMock(
+            return_value={"activity": activity, "volume": volume}
+        )
+        brain.tts_enhancer = MagicMock()
+        brain.tts_enhancer.is_whisper_mode = whisper
+        brain.tts_enhancer.get_volume = MagicMock(return_value=0.15)
+        brain.executor = MagicMock()
+        brain.executor._find_speaker_in_room = AsyncMock(
+            return_value="media_player.bad"
+        )
+
+    @pytest.mark.asyncio
+    async def test_activity_volume_and_room_speaker(self, brain):
+        self._setup(brain, "relaxing", 0.3)
+        brain._current_mood = "neutral"
+        preview = await brain.reply_tts_preview("bad")
+        assert preview == {"volume": 0.5, "target_speaker": "media_player.bad"}
+
+    @pytest.mark.asyncio
+    async def test_whisper_mode_keeps_enhancer_volume(self, brain):
+        self._setup(brain, "relaxing", 0.8, whisper=True)
+        preview = await brain.reply_tts_preview()
+        assert preview == {"volume": 0.15}
+
+    @pytest.mark.asyncio
+    async def test_tired_caps_volume(self, brain):
+        self._setup(brain, "relaxing", 0.9)
+        brain._current_mood = "tired"
+        preview = await brain.reply_tts_preview()
+        assert preview["volume"] == 0.6
+
+
 # ── process (lock + timeout) ─────────────────────────────────
 
 
@@ -1308,3 +1308,167 @@ class TestGetContextHintEdgeCases:
         hint = self._model().get_context_hint(states)
         assert "Buero" in hint
         assert "WARNUNG" in hint
+
+
+# ---------------------------------------------------------------------------
+# Batch-Simulation (mehrere Raeume/Varianten gemeinsam)
+# ---------------------------------------------------------------------------
+
+
+@patch("assistant.climate_model.yaml_config", {})
+class TestSimulateBatch:
+    """Batch-Ergebnisse muessen den Einzel-Simulationen entsprechen."""
+
+    def _model(self):
+        from assistant.climate_model import ClimateModel
+
+        model = ClimateModel()
+        model._room_params = {"bad": {"heat_loss_coefficient": 0.03}}
+        return model
+
+    def _state(self, **kw):
+        from assistant.climate_model import RoomThermalState
+
+        defaults = dict(room="Wohnzimmer", current_temp=19.0, outdoor_temp=4.0)
+        defaults.update(kw)
+        return RoomThermalState(**defaults)
+
+    def test_matches_single_simulations(self):
+        model = self._model()
+        states = [
+            self._state(heating_active=True, target_temp=22.0),
+            self._state(room="Bad", windows_open=1, sun_exposure=True),
+            self._state(current_temp=27.0, cooling_active=True, target_temp=22.0),
+            self._state(current_temp=21.0, target_temp=21.0),
+        ]
+        changes = [None, {"close_windows": True}, {"cooling_off": True}, {"open_windows": 2}]
+        batch = model.simulate_batch(states, 120, changes)
+        single = [model.simulate(s, 120, c) for s, c in zip(states, changes)]
+        assert batch == single
+
+    def test_variants_of_one_room(self):
+        model = self._model()
+        state = self._state(heating_active=True)
+        variants = [{"set_target": t} for t in (19, 20, 21, 22, 23)]
+        results = model.simulate_batch([state] * len(variants), 180, variants)
+        finals = [r["final_temp"] for r in results]
+        assert finals == sorted(finals)
+        assert [r["changes_applied"] for r in results] == variants
+
+    def test_shared_changes_dict(self):
+        model = self._model()
+        results = model.simulate_batch(
+            [self._state(windows_open=1), self._state(room="Bad", windows_open=2)],
+            60,
+            {"close_windows": True},
+        )
+        assert all("Fenster geschlossen" in r["description"] for r in results)
+
+    def test_length_mismatch_raises(self):
+        with pytest.raises(ValueError):
+            self._model().simulate_batch([self._state()], 60, [None, None])
+
+    def test_empty_and_disabled(self):
+        model = self._model()
+        assert model.simulate_batch([]) == []
+        model.enabled = False
+        assert model.simulate_batch([self._state()]) == [
+            {"error": "Climate Model deaktiviert"}
+        ]
+
+    def test_scenarios_match_single(self):
+        model = self._model()
+        pairs = [
+            ("heating_off", {"outdoor_temp": -5}),
+            ("windows_open", {"room": "bad", "outdoor_temp": 0}),
+            ("vacation_3days", {"outdoor_temp": -15}),
+            ("all_covers_closed", None),
+        ]
+        batch = model.simulate_scenarios(pairs, 24)
+        single = [model.simulate_scenario(s, 24, p) for s, p in pairs]
+        assert batch == single
+        # Urlaub laeuft 72h, die anderen Zeilen werden nach 24h abgeschnitten
+        assert batch[2]["timeline"][-1]["hour"] == 72
+        assert batch[0]["timeline"][-1]["hour"] == 24
+
+    def test_batch_without_numpy(self):
+        model = self._model()
+        states = [
+            self._state(heating_active=True, target_temp=22.0),
+            self._state(room="Bad", windows_open=1, sun_exposure=True),
+        ]
+        pairs = [("heating_off", None), ("vacation_3days", {"outdoor_temp": -15})]
+        with_numpy = model.simulate_batch(states, 120)
+        scenarios = model.simulate_scenarios(pairs, 24)
+        with patch("assistant.climate_model._numpy", return_value=None):
+            assert model.simulate_batch(states, 120) == with_numpy
+            assert model.simulate_scenarios(pairs, 24) == scenarios
+
+    def test_scalar_and_numpy_paths_identical(self):
+        """Skalar- und numpy-Pfad liefern bitgleiche Verlaeufe (ungerundet)."""
+        import random
+
+        np = pytest.importorskip("numpy")
+        model = self._model()
+        rng = random.Random(1234)
+        for _ in range(25):
+            sims = [
+                self._state(
+                    room=rng.choice(["Wohnzimmer", "Bad"]),
+                    current_temp=rng.uniform(0.0, 35.0),
+                    target_temp=rng.uniform(15.0, 26.0),
+                    outdoor_temp=rng.uniform(-20.0, 35.0),
+                    heating_active=rng.random() < 0.5,
+                    cooling_active=rng.random() < 0.3,
+                    windows_open=rng.choice([0, 1, 2, 3]),
+                    sun_exposure=rng.random() < 0.4,
+                )
+                for _ in range(rng.randint(2, 6))
+            ]
+            step = rng.choice([1, 2, 5])
+            assert model._integrate_numpy(np, sims, 240, step) == (
+                model._integrate_python(sims, 240, step)
+            )
+
+            rows = [
+                {
+                    "scenario": rng.choice(
+                        [
+                            "heating_off",
+                            "windows_open",
+                            "vacation_3days",
+                            "all_covers_closed",
+                        ]
+                    ),
+                    "room": rng.choice(["wohnzimmer", "bad"]),
+                    "current_temp": rng.uniform(12.0, 25.0),
+                    "outdoor_temp": rng.uniform(-20.0, 15.0),
+                    "target_temp": rng.uniform(16.0, 23.0),
+                    "critical_temp": rng.uniform(14.0, 19.0),
+                    "hours": rng.choice([12, 24, 72]),
+                }
+                for _ in range(rng.randint(2, 5))
+            ]
+            hours, trajectories, min_temps, times = model._integrate_scenarios_numpy(
+                np, rows, 10
+            )
+            scalar = model._integrate_scenarios_python(rows, 10)
+            s_hours, s_traj, s_min, s_times = scalar
+            assert hours == s_hours
+            assert min_temps == s_min
+            assert times == s_times
+            # numpy rechnet kuerzere Zeilen bis zur laengsten Dauer weiter
+            assert [t[: len(s)] for t, s in zip(trajectories, s_traj)] == s_traj
+
+    def test_comfort_times_batch(self):
+        model = self._model()
+        states = [
+            self._state(current_temp=21.2),
+            self._state(current_temp=19.0, outdoor_temp=18.0),
+            self._state(current_temp=5.0, outdoor_temp=-20.0, windows_open=3),
+        ]
+        batch = model.estimate_comfort_times(states, 21.0)
+        assert batch == [model.estimate_comfort_time(s, 21.0) for s in states]
+        assert batch[0]["minutes"] == 0
+        assert batch[1]["minutes"] > 0
+        assert batch[2]["minutes"] is None
@@ -0,0 +1,171 @@
+"""Tests fuer context_prefetch — Spekulatives Kontext-Vorladen."""
+
+import asyncio
+
+import pytest
+
+from assistant.context_prefetch import ContextPrefetcher
+from assistant.latency_tracker import LatencyTracker
+
+
+def _sources(calls: list, rag_result: str = "rag"):
+    async def _states():
+        calls.append("states")
+        return [{"entity_id": "light.wohnzimmer"}]
+
+    async def _conv():
+        calls.append("conv_mode_msgs")
+        return [{"role": "user", "content": "hallo"}]
+
+    async def _callback():
+        calls.append("memory_callback")
+        return "ERINNERUNG"
+
+    async def _rag():
+        calls.append("rag")
+        return rag_result
+
+    return {
+        "states": _states,
+        "conv_mode_msgs": _conv,
+        "memory_callback": _callback,
+        "rag": _rag,
+    }
+
+
+@pytest.fixture
+def prefetcher():
+    pf = ContextPrefetcher()
+    pf.set_latency_tracker(LatencyTracker())
+    return pf
+
+
+class TestStart:
+    @pytest.mark.asyncio
+    async def test_start_launches_all_sources(self, prefetcher):
+        calls = []
+        assert prefetcher.start("r1", "was weisst du ueber", _sources(calls))
+        await asyncio.sleep(0)
+        assert sorted(calls) == ["conv_mode_msgs", "memory_callback", "rag", "states"]
+        assert prefetcher.pending() == 1
+
+    def test_short_partial_ignored(self, prefetcher):
+        assert not prefetcher.start("r1", "was", _sources([]))
+        assert prefetcher.pending() == 0
+
+    def test_disabled(self, prefetcher):
+        prefetcher.configure(enabled=False)
+        assert not prefetcher.start("r1", "was weisst du", _sources([]))
+
+    def test_unknown_keys_ignored(self, prefetcher):
+        async def _x():
+            return 1
+
+        assert not prefetcher.start("r1", "was weisst du", {"context": _x})
+
+    @pytest.mark.asyncio
+    async def test_followup_partial_restarts_only_rag(self, prefetcher):
+        calls = []
+        prefetcher.start("r1", "was weisst du", _sources(calls))
+        await asyncio.sleep(0)
+        calls.clear()
+        prefetcher.start("r1", "was weisst du ueber pizza", _sources(calls))
+        await asyncio.sleep(0)
+        assert calls == ["rag"]
+
+    def test_max_entries_evicts_oldest(self, prefetcher):
+        prefetcher.configure(max_entries=2)
+        for rid in ("a", "b", "c"):
+            prefetcher.start(rid, "zwei worte", {})
+        assert prefetcher.pending() == 2
+        assert "a" not in prefetcher._entries
+
+
+class TestClaim:
+    @pytest.mark.asyncio
+    async def test_claim_hit_returns_tasks(self, prefetcher):
+        prefetcher.start("r1", "was weisst du ueber pizza", _sources([]), person="Max")
+        await asyncio.sleep(0)
+        tasks = prefetcher.claim("r1", "Was weisst du ueber Pizza", person="Max")
+        assert set(tasks) == {"states", "conv_mode_msgs", "memory_callback", "rag"}
+        assert await tasks["memory_callback"] == "ERINNERUNG"
+        assert prefetcher.pending() == 0
+
+    @pytest.mark.asyncio
+    async def test_claim_unknown_request(self, prefetcher):
+        assert prefetcher.claim("nope", "text") == {}
+        assert prefetcher.claim(None, "text") == {}
+
+    @pytest.mark.asyncio
+    async def test_rag_discarded_when_text_diverges(self, prefetcher):
+        prefetcher.start("r1", "was weisst du ueber pizza", _sources([]))
+        await asyncio.sleep(0)
+        tasks = prefetcher.claim("r1", "mach bitte das licht im flur aus")
+        assert "rag" not in tasks
+        assert "states" in tasks
+
+    @pytest.mark.asyncio
+    async def test_person_dependent_discarded_on_person_change(self, prefetcher):
+        prefetcher.start("r1", "was weisst du ueber pizza", _sources([]), person="Max")
+        await asyncio.sleep(0)
+        tasks = prefetcher.claim("r1", "was weisst du ueber pizza", person="Lisa")
+        assert "memory_callback" not in tasks
+        assert "conv_mode_msgs" in tasks
+
+    @pytest.mark.asyncio
+    async def test_expired_entry_is_miss(self, prefetcher):
+        prefetcher.configure(max_age_seconds=0)
+        prefetcher.start("r1", "was weisst du ueber pizza", _sources([]))
+        await asyncio.sleep(0.01)
+        assert prefetcher.claim("r1", "was weisst du ueber pizza") == {}
+
+    @pytest.mark.asyncio
+    async def test_discard_cancels_running(self, prefetcher):
+        started = asyncio.Event()
+
+        async def _slow():
+            started.set()
+            await asyncio.sleep(10)
+
+        prefetcher.start("r1", "zwei worte", {"rag": _slow})
+        await started.wait()
+        task = prefetcher._entries["r1"].tasks["rag"]
+        prefetcher.discard("r1")
+        await asyncio.sleep(0)
+        assert task.cancelled()
+
+
+class TestMetrics:
+    @pytest.mark.asyncio
+    async def test_hits_and_misses_recorded(self, prefetcher):
+        tracker = prefetcher._latency_tracker
+        prefetcher.start("r1", "was weisst du ueber pizza", _sources([]), person="Max")
+        await asyncio.sleep(0)
+        prefetcher.claim("r1", "mach das licht aus", person="Max")
+        stats = tracker.get_prefetch_stats()
+        assert stats["hits"] == 3
+        assert stats["misses"] == 1
+        assert stats["hit_rate"] == 0.75
+        assert "saved_ms_p50" in stats
+        assert tracker.get_stats()["prefetch"] == stats
+
+    def test_no_prefetch_stats_when_unused(self):
+        tracker = LatencyTracker()
+        assert tracker.get_prefetch_stats() == {}
+        assert "prefetch" not in tracker.get_stats()
+
+
+class TestTextMatch:
+    def test_prefix_match(self, prefetcher):
+        assert prefetcher._text_matches("was weisst du", "Was weisst du?")
+
+    def test_token_overlap(self, prefetcher):
+        assert prefetcher._text_matches(
+            "erzaehl mir was ueber pizza", "erzaehl mir was ueber pizza bitte"
+        )
+
+    def test_mismatch(self, prefetcher):
+        assert not prefetcher._text_matches("wie wird das wetter", "licht aus")
+
+    def test_empty(self, prefetcher):
+        assert not prefetcher._text_matches("", "licht aus")
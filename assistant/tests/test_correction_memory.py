@@ -16,6 +16,8 @@ from assistant.correction_memory import (
     MAX_RULE_TEXT_LEN,
     MIN_CONFIDENCE_FOR_RULE,
     RULES_PER_DAY_LIMIT,
+    _LOCAL_TZ,
+    _CorrectionIndex,
     _sanitize,
 )
 
@@ -874,6 +876,99 @@ class TestGetRelevantCorrectionsScoring:
         assert result is None
 
 
+def _entry(action, room="", person="", hour_offset=12, **extra):
+    """Eintrag dessen Stunde hour_offset Stunden von jetzt entfernt liegt."""
+    hour = (datetime.now(_LOCAL_TZ).hour + hour_offset) % 24
+    return dict(
+        original_action=action,
+        original_args={"room": room} if room else {},
+        correction_text=f"{action} {room} {person}".strip(),
+        person=person,
+        hour=hour,
+        **extra,
+    )
+
+
+class TestCorrectionIndex:
+    """Tests fuer den Speicher-Index hinter get_relevant_corrections."""
+
+    def test_buckets_and_eviction(self):
+        index = _CorrectionIndex(max_entries=2)
+        index.add(_entry("set_light", room="bad", person="Max"))
+        index.add(_entry("set_cover", room="bad"))
+        index.add(_entry("set_climate", person="Lisa"))
+        assert len(index) == 2
+        assert "set_light" not in index.by_action
+        assert "Max" not in index.by_person
+        assert len(index.by_room["bad"]) == 1
+        assert [e["original_action"] for e in index.latest()] == [
+            "set_climate",
+            "set_cover",
+        ]
+        assert len(index.latest(1)) == 1
+
+    @pytest.mark.asyncio
+    async def test_loaded_once_and_updated_by_store(self, memory):
+        memory.redis.lrange.return_value = [json.dumps(_entry("set_cover"))]
+        assert await memory.get_relevant_corrections("set_light") is None
+
+        await memory.store_correction(
+            "set_light", {"room": "bad"}, "Nein, das Bad meinte ich nicht"
+        )
+        result = await memory.get_relevant_corrections("set_light")
+        assert "Nein, das Bad" in result
+        patterns = await memory.get_correction_patterns()
+        assert patterns[0]["action"] == "set_light"
+        memory.redis.lrange.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_only_candidates_scored(self, memory):
+        entries = [_entry(f"action_{i}") for i in range(20)]
+        entries.append(_entry("set_light", person="Max"))
+        memory.redis.lrange.return_value = [json.dumps(e) for e in entries]
+        with patch.object(
+            CorrectionMemory, "_score", wraps=CorrectionMemory._score
+        ) as score:
+            result = await memory.get_relevant_corrections("set_light")
+        assert "set_light" in result
+        assert score.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_ties_newest_first(self, memory):
+        memory._max_context = 1
+        memory.redis.lrange.return_value = [
+            json.dumps(_entry("set_light", person="Neu")),
+            json.dumps(_entry("set_light", person="Alt")),
+        ]
+        result = await memory.get_relevant_corrections("set_light")
+        assert "Neu" in result and "Alt" not in result
+
+    @pytest.mark.asyncio
+    async def test_rules_cached_and_expired_dropped(self, memory):
+        now = time.time()
+        fresh = {
+            "type": "x",
+            "trigger": "set_light",
+            "confidence": 0.9,
+            "created_ts": now,
+            "text": "Frisch",
+        }
+        stale = dict(fresh, created_ts=now - 365 * 86400, text="Alt")
+        memory.redis.hgetall.return_value = {
+            "fresh": json.dumps(fresh),
+            "stale": json.dumps(stale),
+        }
+        first = await memory.get_active_rules("set_light")
+        second = await memory.get_active_rules("set_light")
+        assert [r["text"] for r in first] == [r["text"] for r in second] == ["Frisch"]
+        memory.redis.hgetall.assert_called_once()
+        memory.redis.hdel.assert_called_once_with(
+            "mha:correction_memory:rules", "stale"
+        )
+        # Decay veraendert die gecachte Regel nicht
+        assert memory._rules_cache["fresh"]["confidence"] == 0.9
+
+
 # ------------------------------------------------------------------
 # format_rules_for_prompt edge cases
 # ------------------------------------------------------------------
@@ -0,0 +1,155 @@
+"""Tests fuer KeyedEventDispatcher — Worker-Pool mit Lanes und Per-Key-Reihenfolge."""
+
+import asyncio
+
+import pytest
+
+from assistant.event_dispatcher import (
+    LANE_BULK,
+    LANE_CRITICAL,
+    LANE_NORMAL,
+    KeyedEventDispatcher,
+)
+
+
+async def _wait_idle(dispatcher, timeout=2.0):
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    while dispatcher.queued or dispatcher.get_stats()["in_flight"]:
+        assert loop.time() < deadline, "Dispatcher wurde nicht fertig"
+        await asyncio.sleep(0.005)
+
+
+class TestOrdering:
+    @pytest.mark.asyncio
+    async def test_per_key_order_preserved(self):
+        seen = []
+
+        async def handler(event):
+            # Spaetere Events sind schneller — ohne Per-Key-Sperre wuerden sie ueberholen
+            await asyncio.sleep(0.01 if event["n"] == 0 else 0)
+            seen.append((event["key"], event["n"]))
+
+        d = KeyedEventDispatcher(handler, workers=4)
+        d.start()
+        for n in range(5):
+            for key in ("light.a", "light.b"):
+                d.submit(key, {"key": key, "n": n})
+        await _wait_idle(d)
+        await d.stop()
+
+        for key in ("light.a", "light.b"):
+            assert [n for k, n in seen if k == key] == list(range(5))
+
+    @pytest.mark.asyncio
+    async def test_keys_processed_concurrently(self):
+        running = 0
+        peak = 0
+
+        async def handler(event):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.02)
+            running -= 1
+
+        d = KeyedEventDispatcher(handler, workers=3)
+        d.start()
+        for i in range(6):
+            d.submit(f"sensor.s{i}", {})
+        await _wait_idle(d)
+        await d.stop()
+        assert peak == 3
+
+
+class TestLanes:
+    @pytest.mark.asyncio
+    async def test_critical_bypasses_bulk_backlog(self):
+        order = []
+        gate = asyncio.Event()
+
+        async def handler(event):
+            await gate.wait()
+            order.append(event["id"])
+
+        d = KeyedEventDispatcher(handler, workers=1)
+        d.start()
+        d.submit("sensor.first", {"id": "first"}, LANE_BULK)
+        await asyncio.sleep(0)  # Worker haengt jetzt im ersten Event
+        for i in range(20):
+            d.submit(f"sensor.power_{i}", {"id": f"bulk{i}"}, LANE_BULK)
+        d.submit("lights", {"id": "normal"}, LANE_NORMAL)
+        d.submit("binary_sensor.smoke", {"id": "smoke"}, LANE_CRITICAL)
+        gate.set()
+        await _wait_idle(d)
+        await d.stop()
+        assert order[:3] == ["first", "smoke", "normal"]
+
+    @pytest.mark.asyncio
+    async def test_overflow_drops_oldest_bulk_never_critical(self):
+        gate = asyncio.Event()
+        handled = []
+
+        async def handler(event):
+            await gate.wait()
+            handled.append(event["id"])
+
+        d = KeyedEventDispatcher(handler, workers=1, max_pending=3)
+        d.start()
+        d.submit("busy", {"id": "busy"}, LANE_NORMAL)
+        await asyncio.sleep(0)
+        for i in range(3):
+            assert d.submit(f"sensor.{i}", {"id": f"bulk{i}"}, LANE_BULK)
+        # Voll: neues Bulk-Event verdraengt das aelteste Bulk-Event
+        assert d.submit("sensor.new", {"id": "bulk_new"}, LANE_BULK)
+        # Critical wird immer angenommen
+        for i in range(4):
+            assert d.submit(f"alarm_control_panel.{i}", {"id": f"crit{i}"}, LANE_CRITICAL)
+        # Normal findet nichts Verwerfbares mehr -> wird selbst verworfen
+        assert d.submit("light.x", {"id": "normal"}, LANE_NORMAL) is False
+
+        stats = d.get_stats()
+        assert stats["dropped_by_lane"][LANE_CRITICAL] == 0
+        assert stats["dropped_by_lane"][LANE_BULK] == 4
+        assert stats["dropped_by_lane"][LANE_NORMAL] == 1
+        gate.set()
+        await _wait_idle(d)
+        await d.stop()
+        assert all(f"crit{i}" in handled for i in range(4))
+        assert "bulk0" not in handled
+
+
+class TestStats:
+    @pytest.mark.asyncio
+    async def test_lag_and_counters(self):
+        async def handler(event):
+            if event.get("fail"):
+                raise RuntimeError("kaputt")
+
+        d = KeyedEventDispatcher(handler, workers=2)
+        d.submit("a", {})
+        d.submit("b", {"fail": True})
+        assert d.get_stats()["queued_by_lane"][LANE_NORMAL] == 2
+        await asyncio.sleep(0.02)
+        d.start()
+        await _wait_idle(d)
+        stats = d.get_stats()
+        await d.stop()
+        assert stats["processed"] == 2
+        assert stats["queued"] == 0
+        assert stats["max_lag_seconds"] >= 0.02
+        assert stats["workers"] == 2
+
+    @pytest.mark.asyncio
+    async def test_stop_clears_pending(self):
+        async def handler(event):
+            await asyncio.sleep(1)
+
+        d = KeyedEventDispatcher(handler, workers=1)
+        d.start()
+        for i in range(5):
+            d.submit("k", {"i": i})
+        await asyncio.sleep(0)
+        await d.stop()
+        assert d.queued == 0
+        assert d.get_stats()["workers"] == 0
@@ -0,0 +1,121 @@
+"""Tests fuer init_graph — Abhaengigkeits-basierter paralleler Startup."""
+
+import asyncio
+
+import pytest
+
+from assistant.init_graph import InitGraph
+from assistant.latency_tracker import LatencyTracker
+
+
+def _step(log: list, name: str, delay: float = 0.0, fail: bool = False):
+    async def _run():
+        log.append(f"{name}:start")
+        await asyncio.sleep(delay)
+        if fail:
+            raise RuntimeError(f"{name} kaputt")
+        log.append(f"{name}:end")
+
+    return _run
+
+
+class TestScheduling:
+    @pytest.mark.asyncio
+    async def test_independent_steps_run_concurrently(self):
+        log = []
+        graph = InitGraph()
+        graph.add("A", _step(log, "A", 0.01))
+        graph.add("B", _step(log, "B", 0.01))
+        await graph.run()
+        assert log.index("B:start") < log.index("A:end")
+        assert graph.ok("A") and graph.ok("B")
+
+    @pytest.mark.asyncio
+    async def test_requires_waits_for_dependency(self):
+        log = []
+        graph = InitGraph()
+        graph.add("A.start", _step(log, "A.start"), requires=("A",))
+        graph.add("A", _step(log, "A", 0.01))
+        await graph.run()
+        assert log.index("A:end") < log.index("A.start:start")
+
+    @pytest.mark.asyncio
+    async def test_failed_requirement_skips_dependent(self):
+        log = []
+        graph = InitGraph()
+        graph.add("A", _step(log, "A", fail=True))
+        graph.add("A.start", _step(log, "A.start"), requires=("A",))
+        await graph.run()
+        assert graph.degraded == ["A"]
+        assert graph.status["A.start"] == "skipped"
+        assert "A.start:start" not in log
+
+    @pytest.mark.asyncio
+    async def test_after_runs_despite_failure(self):
+        log = []
+        graph = InitGraph()
+        graph.add("A", _step(log, "A", fail=True))
+        graph.add("B", _step(log, "B"), after=("A",))
+        await graph.run()
+        assert graph.ok("B")
+
+    @pytest.mark.asyncio
+    async def test_critical_failure_raises(self):
+        graph = InitGraph()
+        graph.add("Core", _step([], "Core", fail=True), critical=True)
+        graph.add("Other", _step([], "Other"))
+        with pytest.raises(RuntimeError):
+            await graph.run()
+        assert graph.ok("Other")
+
+    @pytest.mark.asyncio
+    async def test_second_run_sees_earlier_results(self):
+        log = []
+        graph = InitGraph()
+        graph.add("A", _step(log, "A"))
+        await graph.run()
+        graph.add("B", _step(log, "B"), requires=("A",))
+        await graph.run()
+        assert log == ["A:start", "A:end", "B:start", "B:end"]
+
+
+class TestValidation:
+    @pytest.mark.asyncio
+    async def test_unknown_dependency(self):
+        graph = InitGraph()
+        graph.add("A", _step([], "A"), requires=("Nope",))
+        with pytest.raises(ValueError):
+            await graph.run()
+
+    @pytest.mark.asyncio
+    async def test_cycle_detected(self):
+        graph = InitGraph()
+        graph.add("A", _step([], "A"), after=("B",))
+        graph.add("B", _step([], "B"), after=("A",))
+        with pytest.raises(ValueError, match="Zyklus"):
+            await graph.run()
+
+    def test_duplicate_name(self):
+        graph = InitGraph()
+        graph.add("A", _step([], "A"))
+        with pytest.raises(ValueError):
+            graph.add("A", _step([], "A"))
+
+
+class TestTimings:
+    @pytest.mark.asyncio
+    async def test_timings_reported_to_latency_tracker(self):
+        tracker = LatencyTracker()
+        graph = InitGraph(on_timing=tracker.record_init)
+        graph.add("A", _step([], "A"))
+        graph.add("B", _step([], "B", fail=True))
+        graph.add("C", _step([], "C"), requires=("B",))
+        await graph.run()
+        stats = tracker.get_init_stats()
+        assert stats["steps"] == 2
+        assert stats["failed"] == ["B"]
+        assert set(stats["slowest"]) == {"A", "B"}
+        assert tracker.get_stats()["startup"] == stats
+
+    def test_no_startup_stats_without_init(self):
+        assert "startup" not in LatencyTracker().get_stats()
@@ -438,6 +438,123 @@ class TestRunAllChecks:
         assert result == []
 
 
+# ============================================================
+# Aenderungs-getriebene Auswertung (Snapshot + Dirty-Set)
+# ============================================================
+
+
+def _window(state="on"):
+    return {
+        "entity_id": "binary_sensor.fenster_bad",
+        "state": state,
+        "attributes": {"friendly_name": "Fenster Bad"},
+    }
+
+
+class TestChangeDrivenEvaluation:
+    STATES = [
+        {"entity_id": "weather.home", "state": "sunny", "attributes": {}},
+        {"entity_id": "sensor.bad_temperature", "state": "21.5", "attributes": {}},
+        _window("off"),
+    ]
+
+    @pytest.mark.asyncio
+    async def test_first_cycle_is_full_sweep(self, insight_engine):
+        insight_engine.ha.get_states = AsyncMock(return_value=self.STATES)
+        await insight_engine._run_all_checks()
+        assert insight_engine._snapshot_loaded
+        data = insight_engine._build_data()
+        assert data["weather"]["condition"] == "sunny"
+        assert data["temperatures"]["sensor.bad_temperature"]["value"] == 21.5
+        assert data["open_windows"] == []
+
+    @pytest.mark.asyncio
+    async def test_note_state_updates_aggregates(self, insight_engine):
+        insight_engine._load_snapshot(self.STATES)
+        insight_engine.note_state("binary_sensor.fenster_bad", _window("on"))
+        assert insight_engine._build_data()["open_windows"] == ["Fenster Bad"]
+        insight_engine.note_state("binary_sensor.fenster_bad", _window("off"))
+        assert insight_engine._build_data()["open_windows"] == []
+        assert insight_engine._dirty_sources == {"binary_sensor"}
+
+    def test_update_keeps_first_weather_and_alarm_order(self, insight_engine):
+        insight_engine._load_snapshot([
+            {"entity_id": "weather.home", "state": "sunny", "attributes": {}},
+            {"entity_id": "weather.openweathermap", "state": "rainy", "attributes": {}},
+            {"entity_id": "alarm_control_panel.haus", "state": "disarmed"},
+            {"entity_id": "alarm_control_panel.garage", "state": "armed_away"},
+        ])
+        insight_engine.note_state(
+            "weather.home",
+            {"state": "sunny", "attributes": {"temperature": 18}},
+        )
+        insight_engine.note_state(
+            "alarm_control_panel.haus", {"state": "disarmed", "attributes": {}}
+        )
+        data = insight_engine._build_data()
+        assert data["weather"] == {"condition": "sunny", "temp": 18, "humidity": None}
+        assert data["alarm_state"] == "armed_away"
+
+    @pytest.mark.asyncio
+    async def test_incremental_cycle_runs_only_affected_checks(self, insight_engine):
+        ran = []
+
+        def _spy(name):
+            async def check(data):
+                ran.append(name)
+
+            check.__name__ = name
+            return check
+
+        checks = [
+            (True, _spy("_check_frost_heating")),
+            (True, _spy("_check_calendar_travel")),
+        ]
+        insight_engine._get_check_list = lambda: checks
+        insight_engine.ha.get_states = AsyncMock(return_value=self.STATES)
+        await insight_engine._run_all_checks()
+        ran.clear()
+
+        insight_engine.note_state("climate.bad", {"state": "heat", "attributes": {}})
+        await insight_engine._run_all_checks()
+        assert ran == ["_check_frost_heating", "_check_calendar_travel"]
+
+        ran.clear()
+        insight_engine.note_state("light.flur", {"state": "on", "attributes": {}})
+        await insight_engine._run_all_checks()
+        # Licht betrifft keinen der beiden Checks, kein erneuter HA-Abruf
+        assert ran == []
+        insight_engine.ha.get_states.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_change_without_state_refetches_entity(self, insight_engine):
+        insight_engine._load_snapshot(self.STATES)
+        insight_engine.ha.get_state = AsyncMock(return_value=_window("on"))
+        insight_engine.note_state("binary_sensor.fenster_bad")
+        data = await insight_engine._current_data(need_calendar=False)
+        insight_engine.ha.get_state.assert_awaited_once_with(
+            "binary_sensor.fenster_bad"
+        )
+        assert data["open_windows"] == ["Fenster Bad"]
+
+    @pytest.mark.asyncio
+    async def test_full_sweep_after_interval(self, insight_engine):
+        insight_engine.ha.get_states = AsyncMock(return_value=self.STATES)
+        await insight_engine._run_all_checks()
+        await insight_engine._run_all_checks()
+        assert insight_engine.ha.get_states.call_count == 1
+        insight_engine._last_full_sweep -= insight_engine._full_sweep_interval
+        await insight_engine._run_all_checks()
+        assert insight_engine.ha.get_states.call_count == 2
+
+    def test_wildcard_source_needs_entity_change(self, insight_engine):
+        name = "_check_device_dependency_conflicts"
+        assert insight_engine._is_affected(name, {"clock"})
+        assert insight_engine._is_affected(name, {"cover", "clock"})
+        assert not insight_engine._is_affected("_check_frost_heating", {"clock"})
+        assert insight_engine._is_affected("_check_unbekannt", set())
+
+
 # ============================================================
 # Reload Config
 # ============================================================
@@ -0,0 +1,129 @@
+"""Tests fuer intent_matcher — Kompilierter Multi-Pattern-Automat."""
+
+import re
+
+import pytest
+
+from assistant.intent_matcher import IntentMatcher, intent_matcher
+
+
+def _reference(mode: str, kw: str, text: str) -> bool:
+    """Bisherige Einzel-Checks als Referenz-Implementierung."""
+    if mode == "sub":
+        return kw in text
+    if mode == "word":
+        return bool(re.search(r"\b" + re.escape(kw) + r"\b", text))
+    if mode == "short_word":
+        if len(kw) <= 3:
+            return bool(re.search(r"\b" + re.escape(kw) + r"\b", text))
+        return kw in text
+    if mode == "lead":
+        return text.startswith(kw) or f" {kw}" in text
+    if mode == "start":
+        return text.startswith(kw)
+    raise AssertionError(mode)
+
+
+_KEYWORDS = ["licht", "lichter", "an", "aus", "mach", "ach", "rollladen", "tür", "ss"]
+_TEXTS = [
+    "Mach das Licht an",
+    "Lichter im Wohnzimmer aus",
+    "Manuel macht Pause",
+    "Anfang",
+    "  mach   ",
+    "Schließe die Tür",
+    "rollladen runter, licht an!",
+    "",
+    "aus",
+    "ach so",
+]
+
+
+@pytest.fixture
+def matcher():
+    m = IntentMatcher()
+    for mode in ("sub", "word", "short_word", "lead", "start"):
+        m.register(mode, _KEYWORDS, mode)
+        m.register(f"{mode}_fold", _KEYWORDS, mode, fold_sharp_s=True)
+    return m
+
+
+class TestEquivalence:
+    @pytest.mark.parametrize("text", _TEXTS)
+    @pytest.mark.parametrize("mode", ["sub", "word", "short_word", "lead", "start"])
+    def test_matches_reference(self, matcher, text, mode):
+        norm = text.lower().strip()
+        feats = matcher.analyze(text)
+        expected = tuple(k for k in _KEYWORDS if _reference(mode, k, norm))
+        assert feats.matches(mode) == expected
+
+    @pytest.mark.parametrize("text", _TEXTS)
+    def test_fold_tables_use_ss_variant(self, matcher, text):
+        norm = text.lower().strip().replace("ß", "ss")
+        feats = matcher.analyze(text)
+        expected = tuple(k for k in _KEYWORDS if _reference("sub", k, norm))
+        assert feats.matches("sub_fold") == expected
+
+    def test_overlapping_keywords_all_found(self, matcher):
+        feats = matcher.analyze("lichter")
+        assert feats.matches("sub") == ("licht", "lichter")
+
+
+class TestFeatures:
+    def test_first_in_table_order(self, matcher):
+        feats = matcher.analyze("licht aus, mach")
+        assert feats.first("sub") == "licht"
+        assert feats.first("unbekannt") is None
+        assert not feats.has("unbekannt")
+
+    def test_word_count(self, matcher):
+        assert matcher.analyze("  mach das licht an ").word_count == 4
+
+    def test_empty_keyword_always_matches(self):
+        m = IntentMatcher()
+        m.register("t", ["", "x"])
+        assert m.analyze("abc").matches("t") == ("",)
+
+
+class TestRegistry:
+    def test_register_idempotent(self, matcher):
+        matcher.analyze("licht")
+        builds = matcher.stats()["builds"]
+        matcher.register("sub", list(_KEYWORDS), "sub")
+        matcher.analyze("licht an")
+        assert matcher.stats()["builds"] == builds
+
+    def test_register_change_rebuilds(self, matcher):
+        matcher.analyze("heizung")
+        assert not matcher.analyze("heizung").has("sub")
+        matcher.register("sub", ["heizung"], "sub")
+        assert matcher.analyze("heizung").has("sub")
+
+    def test_unknown_mode_rejected(self, matcher):
+        with pytest.raises(ValueError):
+            matcher.register("x", ["a"], "regex")
+
+    def test_cache_hit_counted(self, matcher):
+        matcher.analyze("Licht an")
+        matcher.analyze("licht an ")
+        stats = matcher.stats()
+        assert stats["scans"] == 1
+        assert stats["cache_hits"] == 1
+        assert "scan_us_p50" in stats
+
+
+class TestGlobalTables:
+    def test_classifier_tables_registered(self):
+        import assistant.brain  # noqa: F401
+        import assistant.model_router  # noqa: F401
+        import assistant.pre_classifier  # noqa: F401
+
+        names = intent_matcher.tables()
+        for expected in (
+            "pc.device_nouns",
+            "pc.knowledge",
+            "router.creative",
+            "brain.intent_memory",
+            "brain.tool_control",
+        ):
+            assert expected in names
@@ -5,6 +5,7 @@ Testet:
 - Node-Operationen (add, get, max_nodes guard)
 - Edge-Operationen (add, increment, TTL)
 - Query-Operationen (get_related, neighbors, 2-hop, context)
+- Gebuendelte Reads und Adjazenz-Cache
 - Pruning (schwache Kanten entfernen)
 - Stats und Disabled-Zustand
 """
@@ -17,6 +18,52 @@ import pytest
 from assistant.knowledge_graph import KnowledgeGraph
 
 
+def _graph_store(redis_mock, edges: dict, expired: tuple = ()) -> dict:
+    """Backend fuer Pipeline-Lesezugriffe: {relation: {"from>to": meta}}.
+
+    Liefert edge_meta-Hashes (HGETALL/HMGET) und die daraus folgenden
+    out:-Sets (SMEMBERS); out:-Keys in ``expired`` fehlen (TTL abgelaufen).
+    Gibt die Aufrufzaehler zurueck.
+    """
+    hashes = {
+        f"mha:kg:edge_meta:{rel}": {k: json.dumps(m) for k, m in rel_edges.items()}
+        for rel, rel_edges in edges.items()
+    }
+    sets: dict[str, set] = {}
+    for rel, rel_edges in edges.items():
+        for edge_key in rel_edges:
+            from_id, to_id = edge_key.split(">", 1)
+            out_key = f"mha:kg:out:{rel}:{from_id}"
+            if out_key not in expired:
+                sets.setdefault(out_key, set()).add(to_id)
+
+    queued = []
+    calls = {"hgetall": 0, "execute": 0}
+    pipe = redis_mock._pipeline
+
+    def _hgetall(key):
+        calls["hgetall"] += 1
+        queued.append(dict(hashes.get(key, {})))
+
+    def _smembers(key):
+        queued.append(set(sets.get(key, set())))
+
+    def _hmget(key, fields):
+        queued.append([hashes.get(key, {}).get(f) for f in fields])
+
+    async def _execute():
+        calls["execute"] += 1
+        out = list(queued)
+        queued.clear()
+        return out
+
+    pipe.hgetall = MagicMock(side_effect=_hgetall)
+    pipe.smembers = MagicMock(side_effect=_smembers)
+    pipe.hmget = MagicMock(side_effect=_hmget)
+    pipe.execute = AsyncMock(side_effect=_execute)
+    return calls
+
+
 @pytest.fixture
 def kg(redis_mock):
     """KnowledgeGraph mit Redis-Mock."""
@@ -189,32 +236,45 @@ class TestQueries:
 
     @pytest.mark.asyncio
     async def test_query_2hop(self, kg, redis_mock):
-        async def mock_smembers(key):
-            if "out:located_in:person:max" in key:
-                return {"room:wz"}
-            if "out:has_preference:room:wz" in key:
-                return {"pref:warm"}
-            return set()
-
-        redis_mock.smembers = mock_smembers
+        _graph_store(
+            redis_mock,
+            {
+                "located_in": {"person:max>room:wz": {"weight": 1.0}},
+                "has_preference": {"room:wz>pref:warm": {"weight": 1.0}},
+            },
+        )
         result = await kg.query_2hop("person:max", "located_in", "has_preference")
-        assert "pref:warm" in result
+        assert result == ["pref:warm"]
 
     @pytest.mark.asyncio
     async def test_query_2hop_deduplicates(self, kg, redis_mock):
         """Gleiche Ergebnisse ueber verschiedene Pfade werden dedupliziert."""
-
-        async def mock_smembers(key):
-            if "out:rel1:start" in key:
-                return {"mid1", "mid2"}
-            if "out:rel2:" in key:
-                return {"target"}
-            return set()
-
-        redis_mock.smembers = mock_smembers
+        _graph_store(
+            redis_mock,
+            {
+                "rel1": {"start>mid1": {}, "start>mid2": {}},
+                "rel2": {"mid1>target": {}, "mid2>target": {}},
+            },
+        )
         result = await kg.query_2hop("start", "rel1", "rel2")
         assert result == ["target"]
 
+    @pytest.mark.asyncio
+    async def test_query_2hop_uncached_single_eval(self, kg, redis_mock):
+        """Ohne Cache: ein Lua-Aufruf statt SMEMBERS pro Zwischenknoten."""
+        kg.cache_ttl = 0
+        redis_mock.eval = AsyncMock(return_value=[b"pref:warm"])
+        result = await kg.query_2hop("person:max", "located_in", "has_preference")
+        assert result == ["pref:warm"]
+        redis_mock.eval.assert_awaited_once()
+        args = redis_mock.eval.call_args[0]
+        assert args[1:] == (
+            1,
+            "mha:kg:out:located_in:person:max",
+            "mha:kg:out:has_preference:",
+        )
+        redis_mock.smembers.assert_not_called()
+
     @pytest.mark.asyncio
     async def test_no_redis_returns_empty(self):
         with patch("assistant.knowledge_graph.yaml_config", {}):
@@ -301,26 +361,15 @@ class TestQueryContext:
     @pytest.mark.asyncio
     async def test_query_context_basic(self, kg, redis_mock):
         """Grundlegende query_context liefert Praeferenzen und Geraete-Nutzung."""
-
-        async def mock_smembers(key):
-            if "out:prefers:person:max" in key:
-                return {"pref:warm"}
-            if "out:uses_often:person:max" in key:
-                return {"device:licht"}
-            return set()
-
-        redis_mock.smembers = mock_smembers
-        redis_mock.hget = AsyncMock(
-            return_value=json.dumps(
-                {
-                    "weight": 0.8,
-                    "relation": "prefers",
-                }
-            )
+        _graph_store(
+            redis_mock,
+            {
+                "prefers": {"person:max>pref:warm": {"weight": 0.8}},
+                "uses_often": {"person:max>device:licht": {"weight": 0.6}},
+            },
         )
-
         results = await kg.query_context("max")
-        assert len(results) >= 2
+        assert len(results) == 2
         types = {r["type"] for r in results}
         assert "preference" in types
         assert "device_usage" in types
@@ -328,46 +377,24 @@ class TestQueryContext:
     @pytest.mark.asyncio
     async def test_query_context_room_filter(self, kg, redis_mock):
         """Ergebnisse mit anderem Raum werden herausgefiltert."""
-
-        async def mock_smembers(key):
-            if "out:prefers:person:max" in key:
-                return {"pref:warm"}
-            return set()
-
-        redis_mock.smembers = mock_smembers
-        redis_mock.hget = AsyncMock(
-            return_value=json.dumps(
-                {
-                    "weight": 0.8,
-                    "relation": "prefers",
-                    "room": "kueche",
-                }
-            )
+        _graph_store(
+            redis_mock,
+            {"prefers": {"person:max>pref:warm": {"weight": 0.8, "room": "kueche"}}},
         )
-
         results = await kg.query_context("max", room="wohnzimmer")
         assert len(results) == 0
 
     @pytest.mark.asyncio
     async def test_query_context_time_filter(self, kg, redis_mock):
         """Ergebnisse mit anderem time_slot werden herausgefiltert."""
-
-        async def mock_smembers(key):
-            if "out:prefers:person:max" in key:
-                return {"pref:warm"}
-            return set()
-
-        redis_mock.smembers = mock_smembers
-        redis_mock.hget = AsyncMock(
-            return_value=json.dumps(
-                {
-                    "weight": 0.8,
-                    "relation": "prefers",
-                    "time_slot": "morning",
+        _graph_store(
+            redis_mock,
+            {
+                "prefers": {
+                    "person:max>pref:warm": {"weight": 0.8, "time_slot": "morning"}
                 }
-            )
+            },
         )
-
         results = await kg.query_context("max", time_slot="evening")
         assert len(results) == 0
 
@@ -382,56 +409,136 @@ class TestQueryContext:
     @pytest.mark.asyncio
     async def test_query_context_sorted_by_weight(self, kg, redis_mock):
         """Ergebnisse sind nach Gewicht absteigend sortiert."""
+        _graph_store(
+            redis_mock,
+            {
+                "prefers": {
+                    "person:max>pref:a": {"weight": 0.3},
+                    "person:max>pref:b": {"weight": 0.9},
+                    "person:max>pref:c": {"weight": 0.5},
+                }
+            },
+        )
+        results = await kg.query_context("max")
+        result_weights = [r["weight"] for r in results]
+        assert result_weights == [0.9, 0.5, 0.3]
 
-        async def mock_smembers(key):
-            if "out:prefers:person:max" in key:
-                return {"pref:a", "pref:b", "pref:c"}
-            return set()
+    @pytest.mark.asyncio
+    async def test_query_context_max_20_results(self, kg, redis_mock):
+        """query_context gibt maximal 20 Ergebnisse zurueck."""
+        # 15 Praeferenzen + 10 Geraete = 25, soll auf 20 begrenzt werden
+        _graph_store(
+            redis_mock,
+            {
+                "prefers": {f"person:max>pref:{i}": {"weight": 0.5} for i in range(15)},
+                "uses_often": {
+                    f"person:max>device:{i}": {"weight": 0.5} for i in range(10)
+                },
+            },
+        )
+        results = await kg.query_context("max")
+        assert len(results) == 20
 
-        weights = {
-            "person:max>pref:a": 0.3,
-            "person:max>pref:b": 0.9,
-            "person:max>pref:c": 0.5,
-        }
+    @pytest.mark.asyncio
+    async def test_query_context_other_person_ignored(self, kg, redis_mock):
+        _graph_store(
+            redis_mock,
+            {"prefers": {"person:lisa>pref:kalt": {}, "person:max>pref:warm": {}}},
+        )
+        results = await kg.query_context("max")
+        assert [r["target"] for r in results] == ["pref:warm"]
 
-        async def mock_hget(key, edge_key):
-            w = weights.get(edge_key, 0.5)
-            return json.dumps({"weight": w, "relation": "prefers"})
 
-        redis_mock.smembers = mock_smembers
-        redis_mock.hget = mock_hget
+class TestQueryContextBatching:
+    """Gebuendelte Reads und Adjazenz-Cache."""
 
+    @pytest.mark.asyncio
+    async def test_uncached_two_round_trips_no_hget(self, kg, redis_mock):
+        kg.cache_ttl = 0
+        calls = _graph_store(
+            redis_mock,
+            {
+                "prefers": {f"person:max>pref:{i}": {"weight": 0.5} for i in range(5)},
+                "uses_often": {"person:max>device:licht": {"weight": 0.7}},
+            },
+        )
         results = await kg.query_context("max")
-        result_weights = [r["weight"] for r in results]
-        assert result_weights == sorted(result_weights, reverse=True)
-        assert result_weights[0] == 0.9
+        assert len(results) == 6
+        assert results[0]["device"] == "device:licht"
+        assert calls["execute"] == 2
+        redis_mock.hget.assert_not_called()
+        redis_mock.smembers.assert_not_called()
 
     @pytest.mark.asyncio
-    async def test_query_context_max_20_results(self, kg, redis_mock):
-        """query_context gibt maximal 20 Ergebnisse zurueck."""
-        # 15 Praeferenzen + 10 Geraete = 25, soll auf 20 begrenzt werden
-        prefs = {f"pref:{i}" for i in range(15)}
-        devices = {f"device:{i}" for i in range(10)}
+    async def test_cache_answers_without_redis(self, kg, redis_mock):
+        calls = _graph_store(
+            redis_mock, {"prefers": {"person:max>pref:warm": {"weight": 0.8}}}
+        )
+        await kg.query_context("max")
+        await kg.query_context("max", room="bad")
+        await kg.query_2hop("person:max", "prefers", "uses_often")
+        # Erster Aufruf: HGETALL beider Relationen, dann SMEMBERS der Quellen
+        assert calls["execute"] == 2
+        assert calls["hgetall"] == 2
 
-        async def mock_smembers(key):
-            if "out:prefers:person:max" in key:
-                return prefs
-            if "out:uses_often:person:max" in key:
-                return devices
-            return set()
+    @pytest.mark.asyncio
+    async def test_cache_skips_edges_with_expired_out_set(self, kg, redis_mock):
+        _graph_store(
+            redis_mock,
+            {
+                "prefers": {
+                    "person:max>pref:warm": {"weight": 0.8},
+                    "person:lisa>pref:kalt": {"weight": 0.9},
+                },
+                "uses_often": {"pref:kalt>device:luefter": {}},
+            },
+            expired=("mha:kg:out:prefers:person:lisa",),
+        )
+        assert await kg.query_context("lisa") == []
+        assert await kg.query_2hop("person:lisa", "prefers", "uses_often") == []
+        assert [r["target"] for r in await kg.query_context("max")] == ["pref:warm"]
+        redis_mock._pipeline.hdel.assert_called_once_with(
+            "mha:kg:edge_meta:prefers", "person:lisa>pref:kalt"
+        )
 
-        redis_mock.smembers = mock_smembers
+    @pytest.mark.asyncio
+    async def test_add_and_increment_update_cache(self, kg, redis_mock):
+        calls = _graph_store(redis_mock, {"prefers": {}})
+        assert await kg.query_context("max") == []
+        await kg.add_edge("person:max", "prefers", "pref:warm", weight=0.4)
         redis_mock.hget = AsyncMock(
-            return_value=json.dumps(
-                {
-                    "weight": 0.5,
-                    "relation": "prefers",
-                }
-            )
+            return_value=json.dumps({"weight": 0.4, "relation": "prefers"})
         )
+        await kg.increment_edge("person:max", "prefers", "pref:warm", delta=0.2)
 
         results = await kg.query_context("max")
-        assert len(results) <= 20
+        assert [(r["target"], round(r["weight"], 2)) for r in results] == [
+            ("pref:warm", 0.6)
+        ]
+        assert calls["hgetall"] == 2  # kein Neuladen
+
+    @pytest.mark.asyncio
+    async def test_prune_invalidates_cache(self, kg, redis_mock):
+        calls = _graph_store(redis_mock, {"prefers": {"person:max>pref:x": {}}})
+        await kg.query_context("max")
+        redis_mock.hgetall = AsyncMock(
+            side_effect=lambda key: (
+                {"person:max>pref:x": json.dumps({"weight": 0.01})}
+                if key.endswith(":prefers")
+                else {}
+            )
+        )
+        assert await kg.prune_weak_edges(min_weight=0.1) == 1
+        await kg.query_context("max")
+        assert calls["hgetall"] == 3  # prefers neu geladen, uses_often aus Cache
+
+    @pytest.mark.asyncio
+    async def test_cache_expires(self, kg, redis_mock):
+        calls = _graph_store(redis_mock, {})
+        await kg.query_context("max")
+        with patch("assistant.knowledge_graph.time.monotonic", return_value=1e12):
+            await kg.query_context("max")
+        assert calls["hgetall"] == 4
 
 
 # ============================================================
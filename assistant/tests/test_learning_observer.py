@@ -3,11 +3,15 @@ Tests fuer LearningObserver — Muster-Erkennung + Wochentag + Response-Handling
 """
 
 import json
+from datetime import datetime, timedelta, timezone
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
+from assistant.action_journal import KIND_MANUAL, STREAM_KEY, ActionJournal
 from assistant.learning_observer import (
+    JARVIS_ACTION_KEY,
+    KEY_AUTOMATED,
     KEY_MANUAL_ACTIONS,
     KEY_PATTERNS,
     KEY_RESPONSES,
@@ -16,6 +20,7 @@ from assistant.learning_observer import (
     WEEKDAY_NAMES_DE,
     LearningObserver,
 )
+from benchmarks.fakes import LatencyRedis
 
 
 @pytest.fixture
@@ -27,110 +32,157 @@ def observer():
     return o
 
 
+def _memory_observer(**kwargs):
+    """Observer auf einem In-Memory-Redis (ohne Latenz) mit Round-Trip-Zaehler."""
+    o = LearningObserver()
+    o.redis = LatencyRedis(rtt_ms=0)
+    o.enabled = True
+    o.min_repetitions = 3
+    o._notify_callback = AsyncMock()
+    for key, value in kwargs.items():
+        o.redis._cmd_set(key, value)
+    return o
+
+
 class TestObserveStateChange:
     """Tests fuer observe_state_change()."""
 
     @pytest.mark.asyncio
-    async def test_records_manual_action(self, observer):
-        observer.redis.get.return_value = None  # Kein Jarvis-Marker
-        observer.redis.incr.return_value = 1
+    async def test_records_manual_action(self):
+        observer = _memory_observer()
         await observer.observe_state_change("light.wohnzimmer", "on", "off")
-        observer.redis.lpush.assert_called_once()
-        observer.redis.ltrim.assert_called_once()
+        stored = observer.redis._cmd_lrange(KEY_MANUAL_ACTIONS, 0, -1)
+        assert len(stored) == 1
+        assert json.loads(stored[0])["entity_id"] == "light.wohnzimmer"
 
     @pytest.mark.asyncio
-    async def test_ignores_jarvis_action(self, observer):
-        observer.redis.get.return_value = "1"  # Jarvis-Marker gesetzt
+    async def test_ignores_jarvis_action(self):
+        observer = _memory_observer(
+            **{f"{JARVIS_ACTION_KEY}:light.wohnzimmer": "1"}
+        )
         await observer.observe_state_change("light.wohnzimmer", "on", "off")
-        observer.redis.lpush.assert_not_called()
+        assert observer.redis._cmd_lrange(KEY_MANUAL_ACTIONS, 0, -1) == []
 
     @pytest.mark.asyncio
     async def test_ignores_irrelevant_domain(self, observer):
-        observer.redis.get.return_value = None
         await observer.observe_state_change("sensor.temperature", "22", "21")
-        observer.redis.lpush.assert_not_called()
+        observer.redis.pipeline.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_ignores_unavailable(self, observer):
-        observer.redis.get.return_value = None
         await observer.observe_state_change("light.flur", "unavailable", "on")
-        observer.redis.lpush.assert_not_called()
+        observer.redis.pipeline.assert_not_called()
 
+    @pytest.mark.asyncio
+    async def test_two_round_trips_without_suggestion(self):
+        observer = _memory_observer(**{"mha:weather:current_condition": "rainy"})
+        await observer.observe_state_change("light.wz", "on", "off", person="max")
+        await observer.observe_state_change("cover.wz", "closed", "open")
+        # Lesen + Schreiben pro Event; Cluster-Details (count=1) im dritten
+        assert observer.redis.round_trips == 2 + 3
+        observer._notify_callback.assert_not_called()
 
-class TestCheckPattern:
-    """Tests fuer _check_pattern() und Vorschlags-Generierung."""
+    @pytest.mark.asyncio
+    async def test_suggestion_after_repetitions(self):
+        observer = _memory_observer()
+        for _ in range(3):
+            await observer.observe_state_change("light.wz", "on", "off")
+        # Taeglicher Vorschlag; Wochentag wird wegen taeglichem unterdrueckt
+        observer._notify_callback.assert_called_once()
+        msg = observer._notify_callback.call_args[0][0]
+        assert msg["type"] == "learning_suggestion"
+        assert msg["count"] == 3
+        suggested = [k for k in observer.redis._data if k.startswith(KEY_SUGGESTED)]
+        assert len(suggested) == 1
+        # Beim 4. Mal kein erneuter Vorschlag
+        await observer.observe_state_change("light.wz", "on", "off")
+        observer._notify_callback.assert_called_once()
 
     @pytest.mark.asyncio
-    async def test_no_suggestion_below_threshold(self, observer):
-        pipe_mock = MagicMock()
-        pipe_mock.execute = AsyncMock(
-            return_value=[2, -2]
-        )  # count=2 (unter min_repetitions), ttl=-2
-        observer.redis.pipeline = MagicMock(return_value=pipe_mock)
-        callback = AsyncMock()
-        observer._notify_callback = callback
-        await observer._check_pattern("light.wz:on", "22:00", "light.wz", "on")
-        callback.assert_not_called()
+    async def test_suggestion_with_action_journal(self):
+        """Journal-XADD in derselben Pipeline verschiebt keine Zaehler-Ergebnisse."""
+        observer = _memory_observer(**{"mha:weather:current_condition": "rainy"})
+        journal = ActionJournal()
+        await journal.initialize(observer.redis)
+        observer.set_action_journal(journal)
+        for _ in range(3):
+            await observer.observe_state_change("light.wz", "on", "off", person="max")
+        observer._notify_callback.assert_called_once()
+        assert observer._notify_callback.call_args[0][0]["count"] == 3
+        manual = STREAM_KEY.format(KIND_MANUAL)
+        assert observer.redis._cmd_xlen(manual) == 3
 
     @pytest.mark.asyncio
-    async def test_suggestion_at_threshold(self, observer):
-        pipe_mock = MagicMock()
-        pipe_mock.execute = AsyncMock(
-            return_value=[3, 2592000]
-        )  # count=3 (at threshold), ttl set
-        observer.redis.pipeline = MagicMock(return_value=pipe_mock)
-        observer.redis.get = AsyncMock(return_value=None)  # Noch nicht vorgeschlagen
-        callback = AsyncMock()
-        observer._notify_callback = callback
-        await observer._check_pattern("light.wz:on", "22:00", "light.wz", "on")
-        callback.assert_called_once()
-        msg = callback.call_args[0][0]
+    async def test_counter_ttls_set_once(self):
+        observer = _memory_observer(**{"mha:weather:current_condition": "sunny"})
+        await observer.observe_state_change("light.wz", "on", "off")
+        ttls = observer.redis._ttl
+        pattern_keys = [k for k in ttls if k.startswith(KEY_PATTERNS)]
+        weekday_keys = [k for k in ttls if k.startswith(KEY_WEEKDAY_PATTERNS)]
+        weather_keys = [k for k in ttls if "weather_patterns" in k]
+        assert ttls[pattern_keys[0]] == 365 * 86400
+        assert ttls[weekday_keys[0]] == 60 * 86400
+        assert ttls[weather_keys[0]] == 120 * 86400
+
+
+class TestCheckPattern:
+    """Tests fuer _check_pattern() und Vorschlags-Generierung."""
+
+    def test_no_suggestion_below_threshold(self, observer):
+        followup = MagicMock()
+        # count=2 (unter min_repetitions)
+        assert (
+            observer._check_pattern(
+                "light.wz:on", "22:00", "light.wz", "on", 2, False, followup
+            )
+            is None
+        )
+        followup.setex.assert_not_called()
+
+    def test_suggestion_at_threshold(self, observer):
+        followup = MagicMock()
+        msg = observer._check_pattern(
+            "light.wz:on", "22:00", "light.wz", "on", 3, False, followup
+        )
         assert msg["type"] == "learning_suggestion"
         assert msg["time_slot"] == "22:00"
+        followup.setex.assert_called_once_with(
+            f"{KEY_SUGGESTED}:light.wz:on:22:00", 7 * 86400, "1"
+        )
 
-    @pytest.mark.asyncio
-    async def test_no_duplicate_suggestion(self, observer):
-        pipe_mock = MagicMock()
-        pipe_mock.execute = AsyncMock(return_value=[5, 2592000])  # count=5, ttl set
-        observer.redis.pipeline = MagicMock(return_value=pipe_mock)
-        observer.redis.get = AsyncMock(return_value="1")  # Schon vorgeschlagen
-        callback = AsyncMock()
-        observer._notify_callback = callback
-        await observer._check_pattern("light.wz:on", "22:00", "light.wz", "on")
-        callback.assert_not_called()
+    def test_no_duplicate_suggestion(self, observer):
+        followup = MagicMock()
+        # Schon vorgeschlagen
+        assert (
+            observer._check_pattern(
+                "light.wz:on", "22:00", "light.wz", "on", 5, True, followup
+            )
+            is None
+        )
 
 
 class TestWeekdayPattern:
     """Tests fuer _check_weekday_pattern()."""
 
-    @pytest.mark.asyncio
-    async def test_weekday_suggestion(self, observer):
-        observer.redis.incr.return_value = 3
-        # Kein Automated-Marker, kein taeglicher Vorschlag, kein Wochentag-Vorschlag
-        observer.redis.get.side_effect = [None, None, None]
-        callback = AsyncMock()
-        observer._notify_callback = callback
-
-        await observer._check_weekday_pattern(
-            "light.wz:on", "22:00", 0, "light.wz", "on"
+    def test_weekday_suggestion(self, observer):
+        followup = MagicMock()
+        msg = observer._check_weekday_pattern(
+            "light.wz:on", "22:00", 0, "light.wz", "on", 3, False, False, followup
         )
-
-        callback.assert_called_once()
-        msg = callback.call_args[0][0]
         assert msg["weekday"] == 0
         assert msg["weekday_name"] == "Montag"
         assert "Montag" in msg["message"]
-
-    @pytest.mark.asyncio
-    async def test_weekday_skipped_if_daily_exists(self, observer):
-        observer.redis.incr.return_value = 3
-        observer.redis.get.side_effect = ["1"]  # Taeglich schon vorgeschlagen
-        callback = AsyncMock()
-        observer._notify_callback = callback
-        await observer._check_weekday_pattern(
-            "light.wz:on", "22:00", 2, "light.wz", "on"
+        followup.setex.assert_called_once()
+
+    def test_weekday_skipped_if_daily_exists(self, observer):
+        followup = MagicMock()
+        # Taeglich schon vorgeschlagen
+        assert (
+            observer._check_weekday_pattern(
+                "light.wz:on", "22:00", 2, "light.wz", "on", 3, True, False, followup
+            )
+            is None
         )
-        callback.assert_not_called()
 
 
 class TestHandleResponse:
@@ -198,7 +250,7 @@ class TestObserveStateChangeExtended:
     async def test_disabled_observer(self, observer):
         observer.enabled = False
         await observer.observe_state_change("light.wz", "on", "off")
-        observer.redis.lpush.assert_not_called()
+        observer.redis.pipeline.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_no_redis(self, observer):
@@ -206,157 +258,147 @@ class TestObserveStateChangeExtended:
         await observer.observe_state_change("light.wz", "on", "off")
 
     @pytest.mark.asyncio
-    async def test_cover_domain(self, observer):
-        observer.redis.get.return_value = None
-        observer.redis.incr.return_value = 1
-        pipe_mock = MagicMock()
-        pipe_mock.execute = AsyncMock(return_value=[1, -2])
-        observer.redis.pipeline = MagicMock(return_value=pipe_mock)
+    async def test_cover_domain(self):
+        observer = _memory_observer()
         await observer.observe_state_change("cover.wz", "open", "closed")
-        observer.redis.lpush.assert_called_once()
+        assert len(observer.redis._cmd_lrange(KEY_MANUAL_ACTIONS, 0, -1)) == 1
 
     @pytest.mark.asyncio
-    async def test_media_player_domain(self, observer):
-        observer.redis.get.return_value = None
-        observer.redis.incr.return_value = 1
-        pipe_mock = MagicMock()
-        pipe_mock.execute = AsyncMock(return_value=[1, -2])
-        observer.redis.pipeline = MagicMock(return_value=pipe_mock)
+    async def test_media_player_domain(self):
+        observer = _memory_observer()
         await observer.observe_state_change("media_player.wz", "playing", "idle")
-        observer.redis.lpush.assert_called_once()
+        assert len(observer.redis._cmd_lrange(KEY_MANUAL_ACTIONS, 0, -1)) == 1
 
     @pytest.mark.asyncio
-    async def test_with_person(self, observer):
-        observer.redis.get.return_value = None
-        observer.redis.incr.return_value = 1
-        pipe_mock = MagicMock()
-        pipe_mock.execute = AsyncMock(return_value=[1, -2])
-        observer.redis.pipeline = MagicMock(return_value=pipe_mock)
+    async def test_with_person(self):
+        observer = _memory_observer()
         await observer.observe_state_change("light.wz", "on", "off", person="julia")
-        observer.redis.lpush.assert_called_once()
+        action = json.loads(observer.redis._cmd_lrange(KEY_MANUAL_ACTIONS, 0, 0)[0])
+        assert action["person"] == "julia"
+        assert any(k.startswith(f"{KEY_PATTERNS}:julia:") for k in observer.redis._data)
 
     @pytest.mark.asyncio
-    async def test_automated_entity_skipped(self, observer):
+    async def test_automated_entity_skipped(self):
         """F-053: Cycle detection — automated entities are skipped."""
+        observer = _memory_observer()
+        await observer.observe_state_change("light.wz", "on", "off")
+        slot = json.loads(observer.redis._cmd_lrange(KEY_MANUAL_ACTIONS, 0, 0)[0])[
+            "time_slot"
+        ]
+        observer.redis._cmd_set(f"{KEY_AUTOMATED}:light.wz:on:{slot}", "1")
+        await observer.observe_state_change("light.wz", "on", "off")
+        assert len(observer.redis._cmd_lrange(KEY_MANUAL_ACTIONS, 0, -1)) == 1
 
-        async def fake_get(key):
-            if "automated" in key:
-                return "1"
-            return None
-
-        observer.redis.get = AsyncMock(side_effect=fake_get)
+    @pytest.mark.asyncio
+    async def test_weekday_automated_not_counted(self):
+        """F-053: Automatisierte Wochentag-Muster werden nicht weitergezaehlt."""
+        observer = _memory_observer()
         await observer.observe_state_change("light.wz", "on", "off")
-        observer.redis.lpush.assert_not_called()
+        action = json.loads(observer.redis._cmd_lrange(KEY_MANUAL_ACTIONS, 0, 0)[0])
+        slot, weekday = action["time_slot"], action["weekday"]
+        weekday_key = f"{KEY_WEEKDAY_PATTERNS}:light.wz:on:{slot}:{weekday}"
+        observer.redis._cmd_set(f"{KEY_AUTOMATED}:light.wz:on:{slot}:{weekday}", "1")
+        await observer.observe_state_change("light.wz", "on", "off")
+        assert observer.redis._cmd_get(weekday_key) == "1"
+        assert observer.redis._cmd_get(f"{KEY_PATTERNS}:light.wz:on:{slot}") == "2"
 
     @pytest.mark.asyncio
     async def test_exception_handling(self, observer):
-        observer.redis.get.return_value = None
-        observer.redis.lpush.side_effect = Exception("Redis error")
+        pipe = MagicMock()
+        pipe.execute = AsyncMock(side_effect=Exception("Redis error"))
+        observer.redis.pipeline = MagicMock(return_value=pipe)
         # Should not raise
         await observer.observe_state_change("light.wz", "on", "off")
 
 
 class TestCheckPatternExtended:
-    @pytest.mark.asyncio
-    async def test_pattern_with_person(self, observer):
-        pipe_mock = MagicMock()
-        pipe_mock.execute = AsyncMock(return_value=[3, 2592000])
-        observer.redis.pipeline = MagicMock(return_value=pipe_mock)
-        observer.redis.get = AsyncMock(return_value=None)
-        callback = AsyncMock()
-        observer._notify_callback = callback
-        await observer._check_pattern(
-            "light.wz:on", "22:00", "light.wz", "on", person="julia"
+    def test_pattern_with_person(self, observer):
+        followup = MagicMock()
+        msg = observer._check_pattern(
+            "light.wz:on", "22:00", "light.wz", "on", 3, False, followup,
+            person="julia",
         )
-        callback.assert_called_once()
-        msg = callback.call_args[0][0]
         assert "julia" in msg.get("person", "")
+        assert "julia:" in followup.setex.call_args[0][0]
 
-    @pytest.mark.asyncio
-    async def test_expire_set_on_first_incr(self, observer):
-        pipe_mock = MagicMock()
-        pipe_mock.execute = AsyncMock(return_value=[1, -2])
-        observer.redis.pipeline = MagicMock(return_value=pipe_mock)
-        await observer._check_pattern("light.wz:on", "22:00", "light.wz", "on")
-        observer.redis.expire.assert_called()
-
-    @pytest.mark.asyncio
-    async def test_off_state_message(self, observer):
-        pipe_mock = MagicMock()
-        pipe_mock.execute = AsyncMock(return_value=[3, 2592000])
-        observer.redis.pipeline = MagicMock(return_value=pipe_mock)
-        observer.redis.get = AsyncMock(return_value=None)
-        callback = AsyncMock()
-        observer._notify_callback = callback
-        await observer._check_pattern("light.wz:off", "22:00", "light.wz", "off")
-        msg = callback.call_args[0][0]
+    def test_off_state_message(self, observer):
+        msg = observer._check_pattern(
+            "light.wz:off", "22:00", "light.wz", "off", 3, False, MagicMock()
+        )
         assert msg["new_state"] == "off"
+        assert "ausgeschaltet" in msg["message"]
 
     @pytest.mark.asyncio
-    async def test_no_callback_set(self, observer):
-        pipe_mock = MagicMock()
-        pipe_mock.execute = AsyncMock(return_value=[3, 2592000])
-        observer.redis.pipeline = MagicMock(return_value=pipe_mock)
-        observer.redis.get = AsyncMock(return_value=None)
+    async def test_no_callback_set(self):
+        """Ohne Notify-Callback: kein Fehler, Vorschlag wird trotzdem markiert."""
+        observer = _memory_observer()
         observer._notify_callback = None
-        await observer._check_pattern("light.wz:on", "22:00", "light.wz", "on")
-        # Should not raise
+        with patch("assistant.learning_observer.logger") as log:
+            for _ in range(3):
+                await observer.observe_state_change("light.wz", "on", "off")
+        log.warning.assert_not_called()
+        assert any(k.startswith(KEY_SUGGESTED) for k in observer.redis._data)
 
 
 class TestCheckWeekdayPatternExtended:
-    @pytest.mark.asyncio
-    async def test_weekday_automated_skipped(self, observer):
-        """F-053: Automated weekday patterns are skipped."""
-
-        async def fake_get(key):
-            if "automated" in key:
-                return "1"
-            return None
-
-        observer.redis.get = AsyncMock(side_effect=fake_get)
-        callback = AsyncMock()
-        observer._notify_callback = callback
-        await observer._check_weekday_pattern(
-            "light.wz:on", "22:00", 0, "light.wz", "on"
+    def test_weekday_already_suggested(self, observer):
+        assert (
+            observer._check_weekday_pattern(
+                "light.wz:on", "22:00", 2, "light.wz", "on", 3, False, True, MagicMock()
+            )
+            is None
         )
-        callback.assert_not_called()
 
-    @pytest.mark.asyncio
-    async def test_weekday_already_suggested(self, observer):
-        observer.redis.incr.return_value = 3
-        observer.redis.get.side_effect = [
-            None,
-            None,
-            "1",
-        ]  # automated=None, daily=None, weekday=already
-        callback = AsyncMock()
-        observer._notify_callback = callback
-        await observer._check_weekday_pattern(
-            "light.wz:on", "22:00", 2, "light.wz", "on"
+    def test_weekday_below_threshold(self, observer):
+        assert (
+            observer._check_weekday_pattern(
+                "light.wz:on", "22:00", 2, "light.wz", "on", 2, False, False, MagicMock()
+            )
+            is None
         )
-        callback.assert_not_called()
 
-    @pytest.mark.asyncio
-    async def test_weekday_no_callback(self, observer):
-        observer.redis.incr.return_value = 3
-        observer.redis.get.side_effect = [None, None, None]
+    def test_weekday_no_callback(self, observer):
+        """Der Check braucht keinen Callback — der Vorschlag ist der Rueckgabewert."""
         observer._notify_callback = None
-        await observer._check_weekday_pattern(
-            "light.wz:on", "22:00", 0, "light.wz", "on"
+        followup = MagicMock()
+        msg = observer._check_weekday_pattern(
+            "light.wz:on", "22:00", 0, "light.wz", "on", 3, False, False, followup
         )
+        assert msg["weekday_name"] == WEEKDAY_NAMES_DE[0]
+        followup.setex.assert_called_once()
 
-    @pytest.mark.asyncio
-    async def test_weekday_with_person(self, observer):
-        observer.redis.incr.return_value = 3
-        observer.redis.get.side_effect = [None, None, None]
-        callback = AsyncMock()
-        observer._notify_callback = callback
-        await observer._check_weekday_pattern(
-            "light.wz:on", "22:00", 0, "light.wz", "on", person="max"
+    def test_weekday_with_person(self, observer):
+        followup = MagicMock()
+        msg = observer._check_weekday_pattern(
+            "light.wz:on", "22:00", 0, "light.wz", "on", 3, False, False, followup,
+            person="max",
         )
-        callback.assert_called_once()
-        msg = callback.call_args[0][0]
         assert msg["person"] == "max"
+        assert followup.setex.call_args[0][0] == (
+            f"{KEY_SUGGESTED}:weekday:max:light.wz:on:22:00:0"
+        )
+
+
+class TestCheckWeatherPattern:
+    def test_higher_threshold(self, observer):
+        assert (
+            observer._check_weather_pattern(
+                "cover.wz:closed", "rainy", "cover.wz", "closed", 3, False, MagicMock()
+            )
+            is None
+        )
+
+    def test_suggestion_normalizes_weather(self, observer):
+        followup = MagicMock()
+        msg = observer._check_weather_pattern(
+            "cover.wz:closed", "lightning-rainy", "cover.wz", "closed", 4, False,
+            followup,
+        )
+        assert msg["weather"] == "lightning"
+        assert "Gewitter" in msg["message"]
+        followup.setex.assert_called_once_with(
+            f"{KEY_SUGGESTED}:weather:cover.wz:closed:lightning", 14 * 86400, "1"
+        )
 
 
 class TestHandleResponseExtended:
@@ -590,433 +632,202 @@ class TestInitialize:
 # =====================================================================
 
 
-class TestTemporalClustering:
-    """Tests fuer _check_temporal_cluster() — automatische Cluster-Erkennung."""
-
-    @pytest.fixture
-    def observer(self):
-        o = LearningObserver()
-        o.redis = AsyncMock()
-        o.enabled = True
-        o.min_repetitions = 3
-        o._notify_callback = AsyncMock()
-        return o
-
-    @pytest.mark.asyncio
-    async def test_cluster_with_recent_actions(self, observer):
-        """Mehrere manuelle Aktionen in 5 Min werden als Cluster erkannt."""
-        from datetime import datetime, timezone
-
-        now = datetime.now(timezone.utc)
-        two_min_ago = (now - __import__("datetime").timedelta(seconds=120)).isoformat()
-        three_min_ago = (
-            now - __import__("datetime").timedelta(seconds=180)
-        ).isoformat()
-        now_iso = now.isoformat()
-
-        recent1 = json.dumps(
-            {
-                "entity_id": "light.wohnzimmer",
-                "new_state": "on",
-                "domain": "light",
-                "timestamp": two_min_ago,
-            }
-        )
-        recent2 = json.dumps(
-            {
-                "entity_id": "cover.kueche",
-                "new_state": "closed",
-                "domain": "cover",
-                "timestamp": three_min_ago,
-            }
-        )
-        observer.redis.lrange = AsyncMock(return_value=[recent1, recent2])
-        observer.redis.incr = AsyncMock(return_value=1)
-
-        action = {
-            "entity_id": "cover.wohnzimmer",
-            "new_state": "closed",
-            "domain": "cover",
-            "timestamp": now_iso,
-        }
-        await observer._check_temporal_cluster(action, person="max")
-        observer.redis.incr.assert_called()
-
-    @pytest.mark.asyncio
-    async def test_no_cluster_with_single_action(self, observer):
-        """Nur 1 kuerzliche Aktion reicht nicht fuer einen Cluster."""
-        observer.redis.lrange = AsyncMock(return_value=["invalid_json"])
-
-        action = {
-            "entity_id": "light.wohnzimmer",
-            "new_state": "on",
-            "domain": "light",
-            "timestamp": __import__("datetime")
-            .datetime.now(
-                __import__("datetime").timezone.utc,
-            )
-            .isoformat(),
+def _entry(entity_id, state, seconds_ago, now):
+    return json.dumps(
+        {
+            "entity_id": entity_id,
+            "new_state": state,
+            "timestamp": (now - timedelta(seconds=seconds_ago)).isoformat(),
         }
-        await observer._check_temporal_cluster(action)
-        observer.redis.incr.assert_not_called()
+    )
 
-    @pytest.mark.asyncio
-    async def test_cluster_callback_at_min_repetitions(self, observer):
-        """Callback wird exakt bei min_repetitions (3) ausgeloest."""
-        from datetime import datetime, timedelta, timezone
 
-        now = datetime.now(timezone.utc)
-
-        recent1 = json.dumps(
-            {
-                "entity_id": "light.wohnzimmer",
-                "new_state": "on",
-                "domain": "light",
-                "timestamp": (now - timedelta(seconds=60)).isoformat(),
-            }
-        )
-        recent2 = json.dumps(
-            {
-                "entity_id": "cover.wohnzimmer",
-                "new_state": "closed",
-                "domain": "cover",
-                "timestamp": (now - timedelta(seconds=120)).isoformat(),
-            }
-        )
-        observer.redis.lrange = AsyncMock(return_value=[recent1, recent2])
-        # count == min_repetitions (3) → trigger callback
-        observer.redis.incr = AsyncMock(return_value=3)
+class TestTemporalClustering:
+    """Tests fuer _temporal_cluster() und _check_temporal_cluster()."""
 
-        action = {
-            "entity_id": "switch.wohnzimmer",
-            "new_state": "on",
-            "domain": "switch",
+    def _action(self, now, entity_id="switch.wohnzimmer", state="on", **extra):
+        return {
+            "entity_id": entity_id,
+            "new_state": state,
             "timestamp": now.isoformat(),
-            "time_slot": "22:00",
+            **extra,
         }
-        await observer._check_temporal_cluster(action, person="max")
-
-        observer._notify_callback.assert_called_once()
-        msg = observer._notify_callback.call_args[0][0]
-        assert msg["type"] == "temporal_cluster"
-        assert msg["count"] == 3
-        assert msg["person"] == "max"
-        assert msg["time_slot"] == "22:00"
-        assert "cluster_name" in msg
-        assert len(msg["actions"]) >= 2
-
-    @pytest.mark.asyncio
-    async def test_cluster_no_callback_below_min_repetitions(self, observer):
-        """Callback wird NICHT ausgeloest wenn count < min_repetitions."""
-        from datetime import datetime, timedelta, timezone
 
+    def test_cluster_with_recent_actions(self, observer):
+        """Mehrere manuelle Aktionen in 5 Min werden als Cluster erkannt."""
         now = datetime.now(timezone.utc)
+        recent = [
+            _entry("light.wohnzimmer", "on", 120, now),
+            _entry("cover.kueche", "closed", 180, now),
+        ]
+        sig, actions = observer._temporal_cluster(self._action(now), recent)
+        assert len(sig) == 12
+        assert actions == [
+            "switch.wohnzimmer:on",
+            "light.wohnzimmer:on",
+            "cover.kueche:closed",
+        ]
 
-        recent1 = json.dumps(
-            {
-                "entity_id": "light.wohnzimmer",
-                "new_state": "on",
-                "domain": "light",
-                "timestamp": (now - timedelta(seconds=60)).isoformat(),
-            }
-        )
-        recent2 = json.dumps(
-            {
-                "entity_id": "cover.wohnzimmer",
-                "new_state": "closed",
-                "domain": "cover",
-                "timestamp": (now - timedelta(seconds=120)).isoformat(),
-            }
-        )
-        observer.redis.lrange = AsyncMock(return_value=[recent1, recent2])
-        observer.redis.incr = AsyncMock(return_value=2)  # Below threshold
-
-        action = {
-            "entity_id": "switch.wohnzimmer",
-            "new_state": "on",
-            "domain": "switch",
-            "timestamp": now.isoformat(),
-        }
-        await observer._check_temporal_cluster(action)
-        observer._notify_callback.assert_not_called()
-
-    @pytest.mark.asyncio
-    async def test_cluster_no_callback_above_min_repetitions(self, observer):
-        """Callback wird NICHT erneut ausgeloest wenn count > min_repetitions."""
-        from datetime import datetime, timedelta, timezone
-
+    def test_signature_independent_of_order(self, observer):
         now = datetime.now(timezone.utc)
-
-        recent1 = json.dumps(
-            {
-                "entity_id": "light.wohnzimmer",
-                "new_state": "on",
-                "domain": "light",
-                "timestamp": (now - timedelta(seconds=60)).isoformat(),
-            }
+        a = observer._temporal_cluster(
+            self._action(now), [_entry("light.wz", "on", 30, now)]
         )
-        recent2 = json.dumps(
-            {
-                "entity_id": "cover.wohnzimmer",
-                "new_state": "closed",
-                "domain": "cover",
-                "timestamp": (now - timedelta(seconds=120)).isoformat(),
-            }
+        b = observer._temporal_cluster(
+            self._action(now, "light.wz"), [_entry("switch.wohnzimmer", "on", 30, now)]
         )
-        observer.redis.lrange = AsyncMock(return_value=[recent1, recent2])
-        observer.redis.incr = AsyncMock(return_value=5)  # Above threshold
-
-        action = {
-            "entity_id": "switch.wohnzimmer",
-            "new_state": "on",
-            "domain": "switch",
-            "timestamp": now.isoformat(),
-        }
-        await observer._check_temporal_cluster(action)
-        observer._notify_callback.assert_not_called()
-
-    @pytest.mark.asyncio
-    async def test_cluster_first_observation_sets_expire_and_details(self, observer):
-        """Erste Beobachtung (count=1) setzt TTL und speichert Cluster-Details."""
-        from datetime import datetime, timedelta, timezone
+        assert a[0] == b[0]
 
+    def test_no_cluster_with_invalid_entries(self, observer):
+        """Nur die aktuelle Aktion (Rest unlesbar) reicht nicht fuer einen Cluster."""
         now = datetime.now(timezone.utc)
+        assert observer._temporal_cluster(self._action(now), ["invalid_json"]) is None
 
-        recent1 = json.dumps(
-            {
-                "entity_id": "light.flur",
-                "new_state": "on",
-                "domain": "light",
-                "timestamp": (now - timedelta(seconds=30)).isoformat(),
-            }
-        )
-        recent2 = json.dumps(
-            {
-                "entity_id": "light.kueche",
-                "new_state": "on",
-                "domain": "light",
-                "timestamp": (now - timedelta(seconds=90)).isoformat(),
-            }
-        )
-        observer.redis.lrange = AsyncMock(return_value=[recent1, recent2])
-        observer.redis.incr = AsyncMock(return_value=1)
-
-        action = {
-            "entity_id": "light.bad",
-            "new_state": "on",
-            "domain": "light",
-            "timestamp": now.isoformat(),
-            "time_slot": "07:30",
-        }
-        await observer._check_temporal_cluster(action)
-
-        # expire should be called for count_key AND details key
-        assert observer.redis.expire.call_count == 2
-        observer.redis.hset.assert_called_once()
-
-    @pytest.mark.asyncio
-    async def test_cluster_old_actions_excluded(self, observer):
+    def test_cluster_old_actions_excluded(self, observer):
         """Aktionen aelter als 5 Minuten werden nicht in den Cluster aufgenommen."""
-        from datetime import datetime, timedelta, timezone
-
         now = datetime.now(timezone.utc)
+        recent = [
+            _entry("light.wohnzimmer", "on", 600, now),  # 10 min ago
+            _entry("cover.wohnzimmer", "closed", 60, now),
+        ]
+        _, actions = observer._temporal_cluster(self._action(now), recent)
+        assert "light.wohnzimmer:on" not in actions
+        assert len(actions) == 2
 
-        old_action = json.dumps(
-            {
-                "entity_id": "light.wohnzimmer",
-                "new_state": "on",
-                "domain": "light",
-                "timestamp": (now - timedelta(seconds=600)).isoformat(),  # 10 min ago
-            }
-        )
-        recent_action = json.dumps(
-            {
-                "entity_id": "cover.wohnzimmer",
-                "new_state": "closed",
-                "domain": "cover",
-                "timestamp": (now - timedelta(seconds=60)).isoformat(),
-            }
-        )
-        observer.redis.lrange = AsyncMock(return_value=[old_action, recent_action])
-
-        action = {
-            "entity_id": "switch.wohnzimmer",
-            "new_state": "on",
-            "domain": "switch",
-            "timestamp": now.isoformat(),
-        }
-        await observer._check_temporal_cluster(action)
-        # Only 1 recent action within 5 min → not enough for cluster
-        observer.redis.incr.assert_not_called()
-
-    @pytest.mark.asyncio
-    async def test_cluster_no_callback_when_none(self, observer):
-        """Kein Fehler wenn _notify_callback None ist bei min_repetitions."""
-        from datetime import datetime, timedelta, timezone
+    def test_cluster_deduplicates_actions(self, observer):
+        """Doppelte entity:state Paare zaehlen einmal — kein Cluster bei <2 unique."""
+        now = datetime.now(timezone.utc)
+        recent = [
+            _entry("light.wohnzimmer", "on", 60, now),
+            _entry("light.wohnzimmer", "on", 120, now),
+        ]
+        action = self._action(now, "light.wohnzimmer")
+        assert observer._temporal_cluster(action, recent) is None
 
+    def test_cluster_exception_is_caught(self, observer):
+        """Kaputte Eintraege (fehlende Felder) fuehren zu keinem Fehler."""
         now = datetime.now(timezone.utc)
+        broken = json.dumps({"timestamp": now.isoformat()})
+        assert observer._temporal_cluster(self._action(now), [broken]) is None
 
-        recent1 = json.dumps(
-            {
-                "entity_id": "light.wohnzimmer",
-                "new_state": "on",
-                "domain": "light",
-                "timestamp": (now - timedelta(seconds=60)).isoformat(),
-            }
-        )
-        recent2 = json.dumps(
-            {
-                "entity_id": "cover.wohnzimmer",
-                "new_state": "closed",
-                "domain": "cover",
-                "timestamp": (now - timedelta(seconds=120)).isoformat(),
-            }
+    def test_cluster_callback_at_min_repetitions(self, observer):
+        now = datetime.now(timezone.utc)
+        cluster = ("abc123def456", ["switch.wohnzimmer:on", "light.wohnzimmer:on"])
+        msg = observer._check_temporal_cluster(
+            self._action(now, time_slot="22:00"), cluster, 3, MagicMock(),
+            person="max",
         )
-        observer.redis.lrange = AsyncMock(return_value=[recent1, recent2])
-        observer.redis.incr = AsyncMock(return_value=3)
-        observer._notify_callback = None
-
-        action = {
-            "entity_id": "switch.wohnzimmer",
-            "new_state": "on",
-            "domain": "switch",
-            "timestamp": now.isoformat(),
-        }
-        # Should not raise
-        await observer._check_temporal_cluster(action)
-
-    @pytest.mark.asyncio
-    async def test_cluster_exception_is_caught(self, observer):
-        """Exception in _check_temporal_cluster wird abgefangen."""
-        observer.redis.lrange = AsyncMock(side_effect=Exception("Redis down"))
+        assert msg["type"] == "temporal_cluster"
+        assert msg["count"] == 3
+        assert msg["person"] == "max"
+        assert msg["time_slot"] == "22:00"
+        assert msg["cluster_name"] == "light_switch_routine_2200"
 
-        action = {
-            "entity_id": "light.wohnzimmer",
-            "new_state": "on",
-            "domain": "light",
-            "timestamp": "2026-03-20T10:00:00+00:00",
-        }
-        # Should not raise
-        await observer._check_temporal_cluster(action)
+    def test_cluster_no_callback_below_or_above_min_repetitions(self, observer):
+        now = datetime.now(timezone.utc)
+        cluster = ("abc123def456", ["switch.a:on", "light.b:on"])
+        for count in (2, 5):
+            assert (
+                observer._check_temporal_cluster(
+                    self._action(now), cluster, count, MagicMock()
+                )
+                is None
+            )
 
-    @pytest.mark.asyncio
-    async def test_cluster_global_key_when_no_person(self, observer):
+    def test_cluster_first_observation_stores_details(self, observer):
+        """Erste Beobachtung (count=1) speichert Cluster-Details mit TTL."""
+        now = datetime.now(timezone.utc)
+        followup = MagicMock()
+        cluster = ("abc123def456", ["light.bad:on", "light.flur:on"])
+        observer._check_temporal_cluster(
+            self._action(now, "light.bad", time_slot="07:30"), cluster, 1, followup
+        )
+        key, field, data = followup.hset.call_args[0]
+        assert key == "mha:learning:temporal_clusters:global:details"
+        assert field == "abc123def456"
+        assert json.loads(data)["time_slot"] == "07:30"
+        followup.expire.assert_called_once_with(key, 90 * 86400)
+
+    def test_cluster_global_key_when_no_person(self, observer):
         """Ohne Person wird 'global' im Cluster-Key verwendet."""
-        from datetime import datetime, timedelta, timezone
-
         now = datetime.now(timezone.utc)
+        cluster = ("abc123def456", ["light.wohnzimmer:on", "cover.wohnzimmer:closed"])
+        keys = {}
+        for person in ("", "max"):
+            followup = MagicMock()
+            observer._check_temporal_cluster(
+                self._action(now), cluster, 1, followup, person=person
+            )
+            keys[person] = followup.hset.call_args[0][0]
+        assert keys[""] == "mha:learning:temporal_clusters:global:details"
+        assert keys["max"] == "mha:learning:temporal_clusters:max:details"
 
-        recent1 = json.dumps(
-            {
-                "entity_id": "light.wohnzimmer",
-                "new_state": "on",
-                "domain": "light",
-                "timestamp": (now - timedelta(seconds=60)).isoformat(),
-            }
-        )
-        recent2 = json.dumps(
-            {
-                "entity_id": "cover.wohnzimmer",
-                "new_state": "closed",
-                "domain": "cover",
-                "timestamp": (now - timedelta(seconds=120)).isoformat(),
-            }
-        )
-        observer.redis.lrange = AsyncMock(return_value=[recent1, recent2])
-        observer.redis.incr = AsyncMock(return_value=1)
-
-        action = {
-            "entity_id": "switch.wohnzimmer",
-            "new_state": "on",
-            "domain": "switch",
-            "timestamp": now.isoformat(),
-        }
-        await observer._check_temporal_cluster(action, person="")
-
-        incr_key = observer.redis.incr.call_args[0][0]
-        assert "global" in incr_key
-
-    @pytest.mark.asyncio
-    async def test_cluster_deduplicates_actions(self, observer):
-        """Doppelte entity:state Paare werden im Cluster dedupliziert — kein Cluster bei <2 unique."""
-        from datetime import datetime, timedelta, timezone
-
+    def test_cluster_auto_name_contains_domains(self, observer):
+        """Auto-Name enthaelt die beteiligten Domains und den Zeitslot."""
         now = datetime.now(timezone.utc)
-
-        # Gleiche Aktion zweimal → nur 1 unique in cluster_actions
-        dup1 = json.dumps(
-            {
-                "entity_id": "light.wohnzimmer",
-                "new_state": "on",
-                "domain": "light",
-                "timestamp": (now - timedelta(seconds=60)).isoformat(),
-            }
-        )
-        dup2 = json.dumps(
-            {
-                "entity_id": "light.wohnzimmer",
-                "new_state": "on",
-                "domain": "light",
-                "timestamp": (now - timedelta(seconds=120)).isoformat(),
-            }
-        )
-        observer.redis.lrange = AsyncMock(return_value=[dup1, dup2])
-
-        action = {
-            "entity_id": "switch.wohnzimmer",
-            "new_state": "on",
-            "domain": "switch",
-            "timestamp": now.isoformat(),
-        }
-        await observer._check_temporal_cluster(action)
-        # Only 1 unique recent action after dedup → below threshold of 2 → no cluster
-        observer.redis.incr.assert_not_called()
+        action = self._action(now, time_slot="08:00")
+        recent = [
+            _entry("light.wohnzimmer", "on", 60, now),
+            _entry("cover.wohnzimmer", "closed", 120, now),
+        ]
+        cluster = observer._temporal_cluster(action, recent)
+        msg = observer._check_temporal_cluster(action, cluster, 3, MagicMock())
+        assert "cover" in msg["cluster_name"]
+        assert "light" in msg["cluster_name"]
+        assert "switch" in msg["cluster_name"]
+        assert "0800" in msg["cluster_name"]
 
     @pytest.mark.asyncio
-    async def test_cluster_auto_name_contains_domains(self, observer):
-        """Auto-Name enthaelt die beteiligten Domains."""
-        from datetime import datetime, timedelta, timezone
+    async def test_cluster_counted_via_observe(self):
+        observer = _memory_observer()
+        for _ in range(3):
+            await observer.observe_state_change("light.wz", "on", "off")
+            await observer.observe_state_change("cover.wz", "closed", "open")
+        clusters = [
+            m.args[0]
+            for m in observer._notify_callback.call_args_list
+            if isinstance(m.args[0], dict) and m.args[0]["type"] == "temporal_cluster"
+        ]
+        assert clusters
+        assert clusters[0]["count"] == 3
+        details = observer.redis._data["mha:learning:temporal_clusters:global:details"]
+        assert len(details) == 1
 
-        now = datetime.now(timezone.utc)
 
-        recent1 = json.dumps(
-            {
-                "entity_id": "light.wohnzimmer",
-                "new_state": "on",
-                "domain": "light",
-                "timestamp": (now - timedelta(seconds=60)).isoformat(),
-            }
-        )
-        recent2 = json.dumps(
-            {
-                "entity_id": "cover.wohnzimmer",
-                "new_state": "closed",
-                "domain": "cover",
-                "timestamp": (now - timedelta(seconds=120)).isoformat(),
-            }
+class TestCrossDomainCombo:
+    def test_combo_window_drops_old_entries(self, observer):
+        now = datetime.now(timezone.utc)
+        raw = json.dumps(
+            [
+                {"domain": "light", "entity_id": "light.a", "room": "",
+                 "ts": (now - timedelta(seconds=120)).isoformat()},
+                {"domain": "cover", "entity_id": "cover.a", "room": "",
+                 "ts": (now - timedelta(seconds=10)).isoformat()},
+            ]
         )
-        observer.redis.lrange = AsyncMock(return_value=[recent1, recent2])
-        observer.redis.incr = AsyncMock(return_value=3)
+        actions = observer._combo_window("climate.a", raw)
+        assert [a["domain"] for a in actions] == ["cover", "climate"]
 
-        action = {
-            "entity_id": "switch.wohnzimmer",
-            "new_state": "on",
-            "domain": "switch",
-            "timestamp": now.isoformat(),
-            "time_slot": "08:00",
-        }
-        await observer._check_temporal_cluster(action)
-
-        msg = observer._notify_callback.call_args[0][0]
-        # Auto-name is built from recent (cluster_actions) domains, not current action
-        assert "cover" in msg["cluster_name"]
-        assert "light" in msg["cluster_name"]
-        assert "0800" in msg["cluster_name"]
-
-
-# =====================================================================
-# B8: Dynamic Skill Acquisition — Abstract Concepts
-# =====================================================================
+    def test_combo_suggested_once_per_day(self, observer):
+        actions = [
+            {"domain": "light", "room": ""},
+            {"domain": "climate", "room": ""},
+        ]
+        followup = MagicMock()
+        args = observer._check_cross_domain_combo("max", actions, False, followup)
+        assert args[1] == "combo_scene_suggest"
+        assert "Temperatur und Licht" in args[0]
+        followup.setex.assert_called_once_with(
+            "mha:learning:combo_cooldown:max", 86400, "1"
+        )
+        assert observer._check_cross_domain_combo("max", actions, True, followup) is None
+
+    def test_combo_different_rooms_ignored(self, observer):
+        actions = [
+            {"domain": "light", "room": "bad"},
+            {"domain": "climate", "room": "kueche"},
+        ]
+        assert observer._check_cross_domain_combo("", actions, False, MagicMock()) is None
 
 
 class TestExtractConceptName:
@@ -414,6 +414,70 @@ class TestStartStop:
         assert pm._running is False
 
 
+# ── HA-Event Queue ───────────────────────────────────────────────────
+
+
+def _state_event(entity_id, device_class=None):
+    attrs = {"device_class": device_class} if device_class else {}
+    return {
+        "event_type": "state_changed",
+        "data": {
+            "entity_id": entity_id,
+            "old_state": {"state": "off"},
+            "new_state": {"state": "on", "attributes": attrs},
+        },
+    }
+
+
+class TestEventQueue:
+    @pytest.mark.parametrize(
+        "entity_id,device_class,lane",
+        [
+            ("alarm_control_panel.haus", None, "critical"),
+            ("binary_sensor.smoke_kueche", None, "critical"),
+            ("binary_sensor.flur_melder", "gas", "critical"),
+            ("binary_sensor.haustuer_doorbell", None, "critical"),
+            ("sensor.waschmaschine_power", None, "bulk"),
+            ("climate.wohnzimmer", None, "bulk"),
+            ("light.kueche", None, "normal"),
+            ("person.max", None, "normal"),
+        ],
+    )
+    def test_lane_classification(self, pm, entity_id, device_class, lane):
+        pm._urgent_sensors_ts = float("inf")  # Cover-Config nicht laden
+        assert pm._event_lane(_state_event(entity_id, device_class)) == lane
+
+    def test_wind_sensor_is_critical(self, pm):
+        with patch(
+            "assistant.cover_config.get_sensor_by_role",
+            side_effect=lambda role: "sensor.wind" if role == "wind_sensor" else None,
+        ):
+            assert pm._event_lane(_state_event("sensor.wind")) == "critical"
+        assert pm._event_lane(_state_event("sensor.other")) == "bulk"
+
+    @pytest.mark.asyncio
+    async def test_enqueue_keys_by_entity(self, pm):
+        pm._enqueue_event(_state_event("light.a"))
+        pm._enqueue_event(_state_event("light.a"))
+        pm._enqueue_event({"event_type": "mindhome_event", "data": {}})
+        stats = pm.get_event_stats()
+        assert stats["queued"] == 3
+        assert len(pm._events._pending["light.a"]) == 2
+        assert "mindhome_event" in pm._events._pending
+
+    @pytest.mark.asyncio
+    async def test_workers_dispatch_to_handler(self, pm):
+        pm._handle_state_change = AsyncMock()
+        pm._events.start()
+        pm._enqueue_event(_state_event("light.a"))
+        for _ in range(50):
+            if pm._handle_state_change.await_count:
+                break
+            await asyncio.sleep(0.01)
+        await pm._events.stop()
+        pm._handle_state_change.assert_awaited_once()
+
+
 # ── Delivery ─────────────────────────────────────────────────────────
 
 
@@ -3,6 +3,7 @@ Tests fuer RoutineEngine — Morning Briefing, Sleep-Awareness, Goodnight.
 """
 
 import asyncio
+import json
 from datetime import datetime, timedelta
 from unittest.mock import AsyncMock, MagicMock, patch
 from zoneinfo import ZoneInfo
@@ -1266,6 +1267,129 @@ class TestMorningBriefingLLMFallback:
         assert result["actions"] == []
 
 
+class TestBriefingConcurrency:
+    @pytest.mark.asyncio
+    async def test_modules_gathered_concurrently_with_timeout(self, engine):
+        engine.module_timeout = 0.2
+
+        async def fake_module(module, person, style):
+            if module == "weather":
+                await asyncio.sleep(5)
+            await asyncio.sleep(0.05)
+            return f"{module}: ok"
+
+        engine._get_briefing_module = fake_module
+        start = asyncio.get_running_loop().time()
+        contents = await engine._gather_briefing_modules(
+            ["greeting", "calendar", "weather"], "", "kurz"
+        )
+        elapsed = asyncio.get_running_loop().time() - start
+        assert contents == {
+            "greeting": "greeting: ok",
+            "calendar": "calendar: ok",
+            "weather": "",
+        }
+        assert elapsed < 0.5
+
+
+class TestBriefingPrerender:
+    @pytest.fixture
+    def store(self, engine, redis_mock):
+        data = {}
+
+        async def _setex(key, ttl, value):
+            data[key] = value
+
+        async def _delete(key):
+            data.pop(key, None)
+
+        redis_mock.get = AsyncMock(side_effect=lambda key: data.get(key))
+        redis_mock.setex = AsyncMock(side_effect=_setex)
+        redis_mock.delete = AsyncMock(side_effect=_delete)
+        redis_mock.sismember = AsyncMock(return_value=False)
+        redis_mock.set = AsyncMock(return_value=True)
+        engine.prerender_enabled = True
+        engine.volatile_modules = ["weather"]
+        engine._execute_morning_actions = AsyncMock(return_value=[])
+        return data
+
+    def _modules(self, engine, weather):
+        calls = []
+
+        async def fake_module(module, person, style):
+            calls.append(module)
+            return {"greeting": "Tag: Montag", "weather": weather}.get(module, "")
+
+        engine._get_briefing_module = fake_module
+        return calls
+
+    @pytest.mark.asyncio
+    async def test_unchanged_volatile_modules_reuse_text(
+        self, engine, store, ollama_mock
+    ):
+        self._modules(engine, "Wetter: Sonnig")
+        ollama_mock.chat = AsyncMock(
+            return_value={"message": {"content": "Guten Morgen, sonnig."}}
+        )
+        assert await engine.prerender_morning_briefing() is True
+
+        calls = self._modules(engine, "Wetter: Sonnig")
+        result = await engine.generate_morning_briefing()
+
+        assert result["text"] == "Guten Morgen, sonnig."
+        assert calls == ["weather"]
+        ollama_mock.chat.assert_called_once()
+        assert "mha:routine:briefing_prerender" not in store
+
+    @pytest.mark.asyncio
+    async def test_changed_volatile_module_rerenders(self, engine, store, ollama_mock):
+        self._modules(engine, "Wetter: Sonnig")
+        await engine.prerender_morning_briefing()
+
+        self._modules(engine, "Wetter: Gewitter")
+        await engine.generate_morning_briefing()
+
+        assert ollama_mock.chat.call_count == 2
+        prompt = ollama_mock.chat.call_args.kwargs["messages"][1]["content"]
+        assert "Gewitter" in prompt and "Tag: Montag" in prompt
+
+    @pytest.mark.asyncio
+    async def test_other_person_keeps_prerender(self, engine, store, ollama_mock):
+        self._modules(engine, "Wetter: Sonnig")
+        await engine.prerender_morning_briefing()
+
+        await engine.generate_morning_briefing(person="Lisa", force=True)
+
+        assert ollama_mock.chat.call_count == 2
+        assert "mha:routine:briefing_prerender" in store
+
+    @pytest.mark.asyncio
+    async def test_stop_cancels_prerender_loop(self, engine, store):
+        async def _forever():
+            await asyncio.sleep(3600)
+
+        engine._run_prerender_loop = _forever
+        engine._start_prerender_loop()
+        await asyncio.sleep(0)
+        task = engine._prerender_task
+        await engine.stop()
+        assert task.cancelled()
+        assert engine._prerender_task is None
+
+    @pytest.mark.asyncio
+    async def test_next_wake_time_prefers_alarm(self, engine, redis_mock):
+        now = datetime(2026, 3, 2, 5, 0, tzinfo=_TZ)
+        alarm = {"active": True, "next_trigger": "2026-03-02T06:15:00+01:00"}
+        redis_mock.hgetall = AsyncMock(return_value={"a1": json.dumps(alarm)})
+        redis_mock.get = AsyncMock(return_value="7.5")
+        wake = await engine._next_wake_time(now)
+        assert (wake.hour, wake.minute) == (6, 15)
+
+        redis_mock.hgetall = AsyncMock(return_value={})
+        wake = await engine._next_wake_time(now)
+        assert (wake.day, wake.hour, wake.minute) == (2, 7, 30)
+
+
 # ============================================================
 # Greeting Context
 # ============================================================
@@ -0,0 +1,262 @@
+"""Tests fuer den invertierten Fakt-Index des Semantic-Memory Redis-Fallbacks."""
+
+import fnmatch
+from datetime import datetime, timedelta, timezone
+from unittest.mock import MagicMock
+
+import pytest
+
+from assistant.semantic_memory import SemanticFact, SemanticMemory, _index_terms
+
+
+class _MiniRedis:
+    """Minimaler In-Memory Redis (Strings, Hashes, Sets, Sorted Sets)."""
+
+    def __init__(self):
+        self.data: dict = {}
+
+    async def get(self, key):
+        return self.data.get(key)
+
+    async def set(self, key, value, ex=None, nx=False):
+        if nx and key in self.data:
+            return False
+        self.data[key] = value
+        return True
+
+    async def delete(self, *keys):
+        for key in keys:
+            self.data.pop(key, None)
+
+    async def hset(self, key, field=None, value=None, mapping=None):
+        h = self.data.setdefault(key, {})
+        if mapping:
+            h.update(mapping)
+        if field is not None:
+            h[field] = value
+
+    async def hgetall(self, key):
+        return dict(self.data.get(key, {}))
+
+    async def hget(self, key, field):
+        return self.data.get(key, {}).get(field)
+
+    async def sadd(self, key, *members):
+        self.data.setdefault(key, set()).update(members)
+
+    async def srem(self, key, *members):
+        self.data.get(key, set()).difference_update(members)
+
+    async def smembers(self, key):
+        return set(self.data.get(key, set()))
+
+    async def sunion(self, keys):
+        result = set()
+        for key in keys:
+            result |= self.data.get(key, set())
+        return result
+
+    async def zadd(self, key, mapping):
+        self.data.setdefault(key, {}).update(mapping)
+
+    async def zrem(self, key, *members):
+        for m in members:
+            self.data.get(key, {}).pop(m, None)
+
+    async def zmscore(self, key, members):
+        z = self.data.get(key, {})
+        return [z.get(m) for m in members]
+
+    async def zrangebyscore(self, key, low, high):
+        def _bound(v):
+            if v == "-inf":
+                return float("-inf"), False
+            if isinstance(v, str) and v.startswith("("):
+                return float(v[1:]), True
+            return float(v), False
+
+        lo, _ = _bound(low)
+        hi, hi_excl = _bound(high)
+        return [
+            m
+            for m, score in sorted(self.data.get(key, {}).items(), key=lambda i: i[1])
+            if score >= lo and (score < hi if hi_excl else score <= hi)
+        ]
+
+    async def scan_iter(self, match="*", count=None):
+        for key in list(self.data):
+            if fnmatch.fnmatch(key, match):
+                yield key
+
+    def pipeline(self):
+        redis = self
+        ops = []
+
+        class _Pipe:
+            def __getattr__(self, name):
+                def _queue(*args, **kwargs):
+                    ops.append((name, args, kwargs))
+
+                return _queue
+
+            async def execute(self):
+                results = [await getattr(redis, n)(*a, **k) for n, a, k in ops]
+                ops.clear()
+                return results
+
+        return _Pipe()
+
+
+@pytest.fixture
+def memory():
+    sm = SemanticMemory()
+    sm.redis = _MiniRedis()
+    sm.chroma_collection = None
+    return sm
+
+
+async def _store(sm, content, person="max", confidence=0.8, age_days=0):
+    fact = SemanticFact(content=content, category="preference", person=person)
+    fact.confidence = confidence
+    if age_days:
+        fact.updated_at = (
+            datetime.now(timezone.utc) - timedelta(days=age_days)
+        ).isoformat()
+    assert await sm.store_fact(fact)
+    return fact.fact_id
+
+
+class TestIndexTerms:
+    def test_tokens_and_stems(self):
+        tokens, stems = _index_terms("Max trinkt gerne Kaffee.")
+        assert {"max", "trinkt", "gerne", "kaffee"} <= tokens
+        assert {"trin", "gern", "kaff"} <= stems
+
+
+class TestIndexMaintenance:
+    @pytest.mark.asyncio
+    async def test_store_indexes_fact(self, memory):
+        await memory.rebuild_fact_index()
+        fid = await _store(memory, "Max trinkt gerne Kaffee")
+        assert fid in memory.redis.data["mha:facts:idx:tok:kaffee"]
+        assert fid in memory.redis.data["mha:facts:idx:stem:kaff"]
+        assert memory.redis.data["mha:facts:idx:confidence"][fid] == 0.8
+
+    @pytest.mark.asyncio
+    async def test_delete_removes_postings(self, memory):
+        await memory.rebuild_fact_index()
+        fid = await _store(memory, "Max trinkt gerne Kaffee")
+        assert await memory.delete_fact(fid)
+        assert fid not in memory.redis.data["mha:facts:idx:tok:kaffee"]
+        assert fid not in memory.redis.data["mha:facts:idx:confidence"]
+
+    @pytest.mark.asyncio
+    async def test_rebuild_indexes_existing_facts(self, memory):
+        fid = await _store(memory, "Lisa mag Tee")
+        memory.redis.data = {
+            k: v for k, v in memory.redis.data.items() if ":idx:" not in k
+        }
+        memory._fact_index_ready = False
+        assert not await memory._is_fact_index_ready()
+        assert await memory.rebuild_fact_index() == 1
+        assert await memory._is_fact_index_ready()
+        assert fid in memory.redis.data["mha:facts:idx:tok:tee"]
+
+
+class TestIndexedSearch:
+    @pytest.mark.asyncio
+    async def test_only_candidates_are_fetched(self, memory):
+        await memory.rebuild_fact_index()
+        await _store(memory, "Max trinkt gerne Kaffee")
+        for i in range(20):
+            await _store(memory, f"Sonstiges Detail Nummer {i}")
+
+        fetched = []
+        original = memory.redis.hgetall
+
+        async def _spy(key):
+            fetched.append(key)
+            return await original(key)
+
+        memory.redis.hgetall = _spy
+        results = await memory._search_facts_redis_fallback("Kaffee", limit=5)
+        assert [r["content"] for r in results] == ["Max trinkt gerne Kaffee"]
+        assert len(fetched) == 1
+
+    @pytest.mark.asyncio
+    async def test_stem_match(self, memory):
+        await memory.rebuild_fact_index()
+        await _store(memory, "Max trinkt gerne Kaffee")
+        results = await memory._search_facts_redis_fallback("Kaffeemaschine", limit=5)
+        assert len(results) == 1
+
+    @pytest.mark.asyncio
+    async def test_person_and_confidence_filter(self, memory):
+        await memory.rebuild_fact_index()
+        await _store(memory, "Kaffee am Morgen", person="max")
+        await _store(memory, "Kaffee am Abend", person="lisa")
+        await _store(memory, "Kaffee mit Milch", person="max", confidence=0.1)
+        results = await memory._search_facts_redis_fallback(
+            "Kaffee", limit=5, person="max"
+        )
+        assert [r["content"] for r in results] == ["Kaffee am Morgen"]
+
+    @pytest.mark.asyncio
+    async def test_legacy_scan_without_index(self, memory):
+        await _store(memory, "Max trinkt gerne Kaffee")
+        memory._fact_index_ready = False
+        results = await memory._search_facts_redis_fallback("Kaffee", limit=5)
+        assert len(results) == 1
+
+
+class TestIndexedDecay:
+    @pytest.mark.asyncio
+    async def test_decay_touches_only_old_facts(self, memory):
+        await memory.rebuild_fact_index()
+        old = await _store(memory, "Alter Fakt ueber Kaffee", age_days=45)
+        await _store(memory, "Neuer Fakt ueber Tee")
+        await memory.apply_decay()
+        assert memory.redis.data["mha:facts:idx:confidence"][old] == pytest.approx(0.78)
+        assert memory.redis.data[f"mha:fact:{old}"]["confidence"] == "0.78"
+
+    @pytest.mark.asyncio
+    async def test_expire_stale_uses_age_index(self, memory):
+        await memory.rebuild_fact_index()
+        memory.chroma_collection = MagicMock()
+        old = await _store(memory, "Uralter Fakt", age_days=120)
+        fresh = await _store(memory, "Frischer Fakt")
+        assert await memory.expire_stale_facts(max_age_days=90) == 1
+        assert old not in memory.redis.data["mha:facts:all"]
+        assert fresh in memory.redis.data["mha:facts:all"]
+        memory.chroma_collection.delete.assert_called_once_with(ids=[old])
+
+
+class TestBulkDecay:
+    @pytest.mark.asyncio
+    async def test_chroma_updates_chunked_and_stats_reported(self, memory, monkeypatch):
+        monkeypatch.setattr("assistant.semantic_memory._CHROMA_CHUNK", 4)
+        await memory.rebuild_fact_index()
+        for i in range(10):
+            await _store(memory, f"Alter Fakt {i}", age_days=40)
+        weak = await _store(memory, "Schwacher Fakt", confidence=0.21, age_days=40)
+        memory.chroma_collection = MagicMock()
+
+        stats = await memory.apply_decay()
+
+        assert stats["scanned"] == 11
+        assert stats["decayed"] == 10
+        assert stats["deleted"] == 1
+        assert stats["duration_ms"] >= 0
+        assert memory.chroma_collection.update.call_count == 3
+        memory.chroma_collection.delete.assert_called_once_with(ids=[weak])
+        assert weak not in memory.redis.data["mha:facts:all"]
+        assert weak not in memory.redis.data["mha:facts:idx:updated"]
+
+    @pytest.mark.asyncio
+    async def test_chroma_chunk_failure_does_not_abort(self, memory, monkeypatch):
+        monkeypatch.setattr("assistant.semantic_memory._CHROMA_CHUNK", 2)
+        memory.chroma_collection = MagicMock()
+        memory.chroma_collection.delete.side_effect = [RuntimeError("down"), None]
+        done = await memory._chroma_bulk("delete", ["a", "b", "c", "d"])
+        assert done == 2
+        assert memory.chroma_collection.delete.call_count == 2
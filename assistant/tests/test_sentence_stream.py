@@ -0,0 +1,140 @@
+"""Tests fuer SentenceChunker und den SSE-Endpoint /api/assistant/chat/stream."""
+
+import json
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from assistant.sentence_stream import SentenceChunker
+
+
+def _feed_all(chunker, tokens):
+    out = []
+    for token in tokens:
+        out.extend(chunker.feed(token))
+    rest = chunker.flush()
+    if rest:
+        out.append(rest)
+    return out
+
+
+class TestSentenceChunker:
+    def test_splits_on_sentence_end_followed_by_space(self):
+        tokens = ["Das Licht", " ist aus", ". Im Bad", " sind es 21.5", " Grad", "."]
+        chunks = _feed_all(SentenceChunker(), tokens)
+        assert chunks == ["Das Licht ist aus. ", "Im Bad sind es 21.5 Grad."]
+
+    def test_sentence_emitted_before_stream_end(self):
+        c = SentenceChunker()
+        assert c.feed("Erledigt, das Licht ist aus.") == []
+        assert c.feed(" Sonst") == ["Erledigt, das Licht ist aus. "]
+
+    def test_short_fragment_joined_with_next(self):
+        chunks = _feed_all(SentenceChunker(), ["Ja. ", "Das Fenster ist offen. ", "Gut"])
+        assert chunks == ["Ja. Das Fenster ist offen. ", "Gut"]
+
+    def test_concatenation_preserves_text(self):
+        text = "Hallo! Wie geht's?\nMir geht es gut. Danke."
+        c = SentenceChunker()
+        chunks = _feed_all(c, list(text))
+        assert "".join(chunks) == text
+        assert c.streamed_text == text
+
+    def test_reasoning_suppressed(self):
+        c = SentenceChunker()
+        chunks = _feed_all(c, ["Okay,", " the user", " wants the light off. ", "Done."])
+        assert chunks == []
+        assert c.suppressed
+
+    def test_reasoning_prefix_waits_until_decided(self):
+        c = SentenceChunker()
+        # "Let" koennte noch "let me " werden — erst mit "Letz" entschieden
+        assert c.feed("Let") == []
+        assert c.feed("zte Frage war gut. ") == ["Letzte Frage war gut. "]
+
+    def test_think_block_dropped(self):
+        tokens = ["<thi", "nk>Der Nutzer will. ", "Noch mehr.</th", "ink>\n", "Licht ist aus."]
+        chunks = _feed_all(SentenceChunker(), tokens)
+        assert chunks == ["Licht ist aus."]
+
+    def test_unclosed_think_yields_nothing(self):
+        assert _feed_all(SentenceChunker(), ["<think>Hmm. Ueberlegen. "]) == []
+
+
+def _parse_sse(body: str):
+    frames = []
+    for block in body.strip().split("\n\n"):
+        lines = dict(line.split(": ", 1) for line in block.splitlines())
+        frames.append((lines["event"], json.loads(lines["data"])))
+    return frames
+
+
+async def _collect(response):
+    parts = []
+    async for chunk in response.body_iterator:
+        parts.append(chunk if isinstance(chunk, str) else chunk.decode())
+    return _parse_sse("".join(parts))
+
+
+class TestChatStreamEndpoint:
+    @pytest.mark.asyncio
+    async def test_streams_sentences_then_done(self):
+        from assistant.main import ChatRequest, chat_stream
+
+        async def fake_process(text, person, room, stream_callback=None, **kw):
+            for token in ["Das Licht", " ist aus. ", "Sonst noch", " etwas?"]:
+                await stream_callback(token)
+            return {
+                "response": "Das Licht ist aus. Sonst noch etwas?",
+                "actions": [],
+                "model_used": "fast",
+                "context_room": "bad",
+                "tts": {"text": "x", "volume": 0.4},
+            }
+
+        brain = MagicMock()
+        brain.process = fake_process
+        brain.reply_tts_preview = AsyncMock(return_value={"volume": 0.3})
+        with patch("assistant.main.brain", brain):
+            resp = await chat_stream(ChatRequest(text="Licht aus", room="bad"))
+            frames = await _collect(resp)
+
+        assert resp.media_type == "text/event-stream"
+        # Lautstaerke kommt vor dem ersten Satz
+        assert frames[0] == ("tts", {"volume": 0.3})
+        brain.reply_tts_preview.assert_awaited_once_with("bad")
+        assert frames[1] == ("delta", {"text": "Das Licht ist aus. "})
+        assert frames[2] == ("delta", {"text": "Sonst noch etwas?"})
+        event, done = frames[3]
+        assert event == "done"
+        assert done["model_used"] == "fast"
+        assert done["tts"]["volume"] == 0.4
+
+    @pytest.mark.asyncio
+    async def test_unstreamed_response_sent_as_single_delta(self):
+        from assistant.main import ChatRequest, chat_stream
+
+        brain = MagicMock()
+        brain.process = AsyncMock(
+            return_value={"response": "Erledigt.", "actions": [{"function": "x"}]}
+        )
+        brain.ha.log_actions = AsyncMock()
+        with patch("assistant.main.brain", brain):
+            frames = await _collect(await chat_stream(ChatRequest(text="Licht aus")))
+
+        assert [e for e, _ in frames] == ["delta", "done"]
+        assert frames[0][1]["text"] == "Erledigt."
+        brain.ha.log_actions.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_error_yields_fallback(self):
+        from assistant.main import ChatRequest, chat_stream
+
+        brain = MagicMock()
+        brain.process = AsyncMock(side_effect=RuntimeError("kaputt"))
+        with patch("assistant.main.brain", brain):
+            frames = await _collect(await chat_stream(ChatRequest(text="Hallo")))
+
+        assert frames[-1][0] == "done"
+        assert frames[-1][1]["model_used"] == "error"
+        assert frames[0][1]["text"] == frames[-1][1]["response"]
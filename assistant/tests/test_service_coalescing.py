@@ -0,0 +1,167 @@
+"""Tests fuer Service-Coalescing: ha_client.service_batch + Bulk-Gruppen-Calls."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+pydantic_settings = pytest.importorskip("pydantic_settings")
+from assistant.function_calling import FunctionExecutor
+from assistant.ha_client import HomeAssistantClient, service_batch
+
+
+def _make_client():
+    with patch("assistant.ha_client.settings") as s_mock:
+        s_mock.ha_url = "http://ha.local:8123"
+        s_mock.ha_token = "test-token"
+        s_mock.mindhome_url = "http://mh.local:8099"
+        s_mock.assistant_api_key = ""
+        client = HomeAssistantClient()
+    client._call_service_now = AsyncMock(return_value=True)
+    return client
+
+
+class TestServiceBatch:
+    @pytest.mark.asyncio
+    async def test_compatible_calls_coalesced(self):
+        client = _make_client()
+        with service_batch(client) as batch:
+            results = await asyncio.gather(
+                client.call_service("light", "turn_off", {"entity_id": "light.a"}),
+                client.call_service("light", "turn_off", {"entity_id": "light.b"}),
+            )
+        assert results == [True, True]
+        client._call_service_now.assert_awaited_once_with(
+            "light", "turn_off", {"entity_id": ["light.a", "light.b"]}
+        )
+        assert batch.calls == 2
+        assert batch.requests == 1
+
+    @pytest.mark.asyncio
+    async def test_different_data_separate_groups(self):
+        client = _make_client()
+        with service_batch(client) as batch:
+            await asyncio.gather(
+                client.call_service(
+                    "cover", "set_cover_position", {"entity_id": "cover.a", "position": 0}
+                ),
+                client.call_service(
+                    "cover", "set_cover_position", {"entity_id": "cover.b", "position": 0}
+                ),
+                client.call_service(
+                    "cover", "set_cover_position", {"entity_id": "cover.c", "position": 100}
+                ),
+            )
+        assert batch.requests == 2
+        sent = {
+            c.args[2]["position"]: c.args[2]["entity_id"]
+            for c in client._call_service_now.await_args_list
+        }
+        assert sent == {0: ["cover.a", "cover.b"], 100: "cover.c"}
+
+    @pytest.mark.asyncio
+    async def test_same_entity_keeps_order(self):
+        client = _make_client()
+        with service_batch(client):
+            await asyncio.gather(
+                client.call_service("light", "turn_on", {"entity_id": "light.a"}),
+                client.call_service("light", "turn_off", {"entity_id": "light.a"}),
+            )
+        services = [c.args[1] for c in client._call_service_now.await_args_list]
+        assert services == ["turn_on", "turn_off"]
+
+    @pytest.mark.asyncio
+    async def test_without_entity_id_sent_directly(self):
+        client = _make_client()
+        with service_batch(client) as batch:
+            await client.call_service("scene", "turn_on", {"scene_id": "x"})
+        client._call_service_now.assert_awaited_once()
+        assert batch.requests == 1
+
+    @pytest.mark.asyncio
+    async def test_error_propagates_to_all_members(self):
+        client = _make_client()
+        client._call_service_now = AsyncMock(side_effect=RuntimeError("boom"))
+        with service_batch(client):
+            results = await asyncio.gather(
+                client.call_service("light", "turn_off", {"entity_id": "light.a"}),
+                client.call_service("light", "turn_off", {"entity_id": "light.b"}),
+                return_exceptions=True,
+            )
+        assert all(isinstance(r, RuntimeError) for r in results)
+
+    @pytest.mark.asyncio
+    async def test_no_batch_outside_context(self):
+        client = _make_client()
+        await client.call_service("light", "turn_off", {"entity_id": "light.a"})
+        client._call_service_now.assert_awaited_once_with(
+            "light", "turn_off", {"entity_id": "light.a"}
+        )
+
+
+class TestGroupedBulkOps:
+    def _executor(self, states):
+        ha = AsyncMock()
+        ha.get_states = AsyncMock(return_value=states)
+        ha.call_service = AsyncMock(return_value=True)
+        ha._skip_dep_check_depth = 0
+        ex = FunctionExecutor(ha)
+        ex._is_safe_cover = AsyncMock(return_value=True)
+        ex._is_markise = MagicMock(return_value=False)
+        ex._translate_cover_position = lambda eid, pos: pos
+        ex._mark_cover_jarvis_acting = AsyncMock()
+        return ex
+
+    @pytest.mark.asyncio
+    async def test_call_service_grouped(self):
+        ex = self._executor([])
+        count = await ex._call_service_grouped(
+            "cover",
+            "set_cover_position",
+            [
+                ("cover.a", {"position": 0}),
+                ("cover.b", {"position": 0}),
+                ("cover.c", {"position": 30}),
+            ],
+        )
+        assert count == 3
+        assert ex.ha.call_service.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_cover_all_single_request(self):
+        states = [
+            {"entity_id": f"cover.raum_{i}", "state": "open", "attributes": {}}
+            for i in range(5)
+        ]
+        ex = self._executor(states)
+        with (
+            patch("assistant.function_calling.is_entity_annotated", return_value=True),
+            patch("assistant.function_calling.is_entity_hidden", return_value=False),
+        ):
+            result = await ex._exec_set_cover_all(0, "rollladen")
+        assert result["success"] is True
+        assert "5 geschaltet" in result["message"]
+        ex.ha.call_service.assert_awaited_once_with(
+            "cover",
+            "set_cover_position",
+            {"entity_id": [s["entity_id"] for s in states], "position": 0},
+        )
+        assert ex._mark_cover_jarvis_acting.await_count == 5
+
+    @pytest.mark.asyncio
+    async def test_light_all_off_single_request(self):
+        states = [
+            {"entity_id": "light.a", "state": "on"},
+            {"entity_id": "light.b", "state": "on"},
+            {"entity_id": "light.c", "state": "off"},
+        ]
+        ex = self._executor(states)
+        with (
+            patch("assistant.function_calling.is_entity_annotated", return_value=True),
+            patch("assistant.function_calling.is_entity_hidden", return_value=False),
+        ):
+            result = await ex._exec_set_light_all({}, "off")
+        assert "2 geschaltet" in result["message"]
+        ex.ha.call_service.assert_awaited_once_with(
+            "light", "turn_off", {"entity_id": ["light.a", "light.b"]}
+        )
@@ -5,7 +5,7 @@ Tests: GeneralTimer dataclass (remaining_seconds, is_done, format_remaining, to_
 TimerManager (create_timer, cancel_timer, get_status, get_context_hints,
 create_reminder, set_wakeup_alarm, cancel_alarm, get_alarms,
 _persist_timer, _remove_timer, _restore_timers, _restore_reminders, _restore_alarms,
-_timer_watcher, _reminder_watcher, _alarm_watcher, action whitelist).
+_fire_timer, Heap-Scheduler, action whitelist).
 """
 
 import asyncio
@@ -273,10 +273,10 @@ class TestCreateTimer:
         redis_mock.hset.assert_called()
 
     @pytest.mark.asyncio
-    async def test_watcher_task_created(self, tm_redis):
+    async def test_timer_scheduled(self, tm_redis):
         result = await tm_redis.create_timer(5, label="Watch")
         tid = result["timer_id"]
-        assert tid in tm_redis._tasks
+        assert tid in tm_redis._scheduled
 
 
 # ── Cancel Timer ──────────────────────────────────────────────────────
@@ -380,7 +380,7 @@ class TestTimerWatcher:
         tm_redis.timers["w1"] = timer
 
         with patch("assistant.timer_manager.get_person_title", return_value="Sir"):
-            await tm_redis._timer_watcher(timer)
+            await tm_redis._fire_timer(timer)
 
         notify.assert_called()
         call_data = notify.call_args[0][0]
@@ -404,7 +404,7 @@ class TestTimerWatcher:
         tm_redis.timers["w2"] = timer
 
         with patch("assistant.timer_manager.get_person_title", return_value="Sir"):
-            await tm_redis._timer_watcher(timer)
+            await tm_redis._fire_timer(timer)
 
         action_cb.assert_called_once_with("set_light", {"state": "off"})
 
@@ -425,7 +425,7 @@ class TestTimerWatcher:
         tm_redis.timers["w3"] = timer
 
         with patch("assistant.timer_manager.get_person_title", return_value="Sir"):
-            await tm_redis._timer_watcher(timer)
+            await tm_redis._fire_timer(timer)
 
         action_cb.assert_not_called()
         # Should still notify about blocked action
@@ -452,7 +452,7 @@ class TestTimerWatcher:
         tm_redis.timers["w4"] = timer
 
         with patch("assistant.timer_manager.get_person_title", return_value="Sir"):
-            await tm_redis._timer_watcher(timer)
+            await tm_redis._fire_timer(timer)
         # Should not crash
 
 
@@ -737,6 +737,122 @@ class TestRestoreTimers:
         # Should not crash
 
 
+# ── Heap-Scheduler ───────────────────────────────────────────────────
+
+
+class TestScheduler:
+    @pytest.mark.asyncio
+    async def test_fires_in_deadline_order_with_one_task(self, tm):
+        fired = []
+
+        async def fake_fire(timer):
+            fired.append(timer.id)
+
+        tm._fire_timer = fake_fire
+        tasks_before = len(asyncio.all_tasks())
+        now = time.time()
+        for tid, offset in (("c", 0.06), ("a", 0.02), ("b", 0.04)):
+            tm._schedule(tid, now + offset, "timer", GeneralTimer(tid, tid, 0))
+        # Nur der Dispatcher kommt hinzu, kein Task pro Eintrag
+        assert len(asyncio.all_tasks()) == tasks_before + 1
+        await asyncio.sleep(0.15)
+        assert fired == ["a", "b", "c"]
+        assert tm._scheduled == {}
+        await tm.stop()
+
+    @pytest.mark.asyncio
+    async def test_cancel_and_reschedule(self, tm):
+        fired = []
+
+        async def fake_fire(timer):
+            fired.append(timer.id)
+
+        tm._fire_timer = fake_fire
+        now = time.time()
+        tm._schedule("x", now + 0.02, "timer", GeneralTimer("x", "x", 0))
+        tm._schedule("y", now + 0.02, "timer", GeneralTimer("y", "y", 0))
+        assert tm._unschedule("x") is True
+        assert tm._unschedule("x") is False
+        # Umplanen ersetzt den alten Eintrag
+        tm._schedule("y", now + 0.08, "timer", GeneralTimer("y", "y", 0))
+        await asyncio.sleep(0.05)
+        assert fired == []
+        await asyncio.sleep(0.08)
+        assert fired == ["y"]
+        await tm.stop()
+
+    @pytest.mark.asyncio
+    async def test_earlier_entry_wakes_dispatcher(self, tm):
+        fired = []
+
+        async def fake_fire(timer):
+            fired.append(timer.id)
+
+        tm._fire_timer = fake_fire
+        now = time.time()
+        tm._schedule("late", now + 3600, "timer", GeneralTimer("late", "l", 0))
+        await asyncio.sleep(0)
+        tm._schedule("soon", now + 0.01, "timer", GeneralTimer("soon", "s", 0))
+        await asyncio.sleep(0.05)
+        assert fired == ["soon"]
+        assert "late" in tm._scheduled
+        await tm.stop()
+
+    @pytest.mark.asyncio
+    async def test_stale_entries_compacted(self, tm):
+        now = time.time()
+        for i in range(200):
+            tm._schedule(f"t{i}", now + 3600, "timer", GeneralTimer(f"t{i}", "t", 0))
+        for i in range(150):
+            tm._unschedule(f"t{i}")
+        assert len(tm._heap) <= 2 * len(tm._scheduled)
+        await tm.stop()
+
+    @pytest.mark.asyncio
+    async def test_restore_bulk_load(self, tm_redis, redis_mock):
+        now = time.time()
+        raw = {
+            f"r{i}".encode(): json.dumps(
+                {"id": f"r{i}", "label": "R", "duration_seconds": 600 + i, "started_at": now}
+            ).encode()
+            for i in range(50)
+        }
+        raw[b"old1"] = json.dumps(
+            {"id": "old1", "label": "O", "duration_seconds": 1, "started_at": now - 100}
+        ).encode()
+        raw[b"old2"] = json.dumps(
+            {"id": "old2", "label": "O", "duration_seconds": 1, "started_at": now - 100}
+        ).encode()
+        redis_mock.hgetall = AsyncMock(return_value=raw)
+
+        await tm_redis._restore_timers()
+
+        assert len(tm_redis._scheduled) == 50
+        assert tm_redis._heap[0][2] == "r0"
+        redis_mock.hdel.assert_called_once_with(KEY_TIMERS, "old1", "old2")
+        await tm_redis.stop()
+
+    @pytest.mark.asyncio
+    async def test_recurring_alarm_rescheduled(self, tm_redis):
+        notify = AsyncMock()
+        tm_redis.set_notify_callback(notify)
+        alarm = {
+            "id": "al1",
+            "time": "07:00",
+            "label": "Wecker",
+            "repeat": "daily",
+            "active": True,
+            "next_trigger": datetime.now(_TZ).isoformat(),
+        }
+        with patch("assistant.timer_manager.get_person_title", return_value="Sir"):
+            await tm_redis._fire_alarm("al1", alarm)
+
+        notify.assert_called_once()
+        assert tm_redis._scheduled["al1"][1] == "alarm"
+        assert "al1" in tm_redis.timers
+        await tm_redis.stop()
+
+
 # ── Timer Action Whitelist ───────────────────────────────────────────
 
 
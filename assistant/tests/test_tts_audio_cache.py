@@ -0,0 +1,133 @@
+"""Tests fuer TTSAudioCache — inhaltsadressierter Audio-Cache (RAM + Disk)."""
+
+import asyncio
+import json
+from unittest.mock import AsyncMock
+
+import pytest
+
+from assistant.tts_audio_cache import KEY_PHRASES, TTSAudioCache
+
+
+class _Synth:
+    def __init__(self, delay: float = 0):
+        self.calls: list[str] = []
+        self.delay = delay
+
+    async def __call__(self, text: str) -> bytes:
+        self.calls.append(text)
+        await asyncio.sleep(self.delay)
+        return f"WAV:{text}".encode()
+
+
+@pytest.fixture
+def cache():
+    c = TTSAudioCache()
+    c.configure(voice="de_DE-thorsten-high")
+    return c
+
+
+class TestKey:
+    def test_whitespace_normalized(self, cache):
+        assert cache.make_key("Erledigt.") == cache.make_key("  Erledigt.\n")
+
+    def test_voice_changes_key(self, cache):
+        base = cache.make_key("Erledigt.")
+        cache.configure(voice="de_DE-kerstin-low")
+        assert base != cache.make_key("Erledigt.")
+
+
+class TestGetOrSynthesize:
+    @pytest.mark.asyncio
+    async def test_second_call_is_hit(self, cache):
+        synth = _Synth()
+        first = await cache.get_or_synthesize("Erledigt.", synth)
+        second = await cache.get_or_synthesize("Erledigt. ", synth)
+        assert first == second == b"WAV:Erledigt."
+        assert synth.calls == ["Erledigt."]
+        assert cache.get_stats()["hits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_long_text_bypasses_cache(self, cache):
+        synth = _Synth()
+        text = "Lang " * 50
+        await cache.get_or_synthesize(text, synth)
+        await cache.get_or_synthesize(text, synth)
+        assert len(synth.calls) == 2
+        assert cache.get_stats()["memory_entries"] == 0
+
+    @pytest.mark.asyncio
+    async def test_concurrent_requests_share_synthesis(self, cache):
+        synth = _Synth(delay=0.05)
+        results = await asyncio.gather(
+            *(cache.get_or_synthesize("Timer abgelaufen.", synth) for _ in range(3))
+        )
+        assert len(set(results)) == 1
+        assert synth.calls == ["Timer abgelaufen."]
+
+    @pytest.mark.asyncio
+    async def test_memory_lru_eviction(self, cache):
+        cache.configure(max_memory_mb=30 / (1024 * 1024))  # 30 Bytes
+        synth = _Synth()
+        for text in ("Eins.", "Zwei.", "Drei."):  # je 9-10 Bytes
+            await cache.get_or_synthesize(text, synth)
+        await cache.get_or_synthesize("Eins.", synth)  # Eins wieder vorne
+        await cache.get_or_synthesize("Vier.", synth)
+        await cache.get_or_synthesize("Eins.", synth)
+        await cache.get_or_synthesize("Zwei.", synth)
+        assert synth.calls == ["Eins.", "Zwei.", "Drei.", "Vier.", "Zwei."]
+
+
+class TestDisk:
+    @pytest.mark.asyncio
+    async def test_survives_restart(self, tmp_path):
+        first = TTSAudioCache()
+        first.configure(disk_dir=str(tmp_path))
+        await first.get_or_synthesize("Guten Morgen.", _Synth())
+
+        second = TTSAudioCache()
+        second.configure(disk_dir=str(tmp_path))
+        synth = _Synth()
+        assert await second.get_or_synthesize("Guten Morgen.", synth) == (
+            b"WAV:Guten Morgen."
+        )
+        assert synth.calls == []
+
+    @pytest.mark.asyncio
+    async def test_disk_budget_evicts_oldest(self, tmp_path):
+        cache = TTSAudioCache()
+        cache.configure(disk_dir=str(tmp_path), max_disk_mb=25 / (1024 * 1024))
+        synth = _Synth()
+        for text in ("Eins.", "Zwei.", "Drei."):
+            await cache.get_or_synthesize(text, synth)
+        files = list(tmp_path.glob("*.wav"))
+        assert len(files) == 2
+        assert sum(f.stat().st_size for f in files) <= 25
+
+
+class TestPrewarm:
+    @pytest.mark.asyncio
+    async def test_top_phrases_synthesized(self, cache, redis_mock):
+        cache.configure(prewarm_top_n=2)
+        cache.set_redis(redis_mock)
+        redis_mock.zrevrange = AsyncMock(
+            return_value=[
+                json.dumps({"t": "Erledigt."}),
+                json.dumps({"t": "Gute Nacht."}),
+            ]
+        )
+        synth = _Synth()
+        assert await cache.prewarm(synth) == 2
+        redis_mock.zrevrange.assert_awaited_once_with(KEY_PHRASES, 0, 1)
+
+        hit = _Synth()
+        await cache.get_or_synthesize("Erledigt.", hit)
+        assert hit.calls == []
+        redis_mock.zincrby.assert_awaited()
+
+    @pytest.mark.asyncio
+    async def test_disabled_without_top_n(self, cache, redis_mock):
+        cache.set_redis(redis_mock)
+        assert await cache.prewarm(_Synth()) == 0
+        await cache.get_or_synthesize("Erledigt.", _Synth())
+        redis_mock.zincrby.assert_not_called()
@@ -68,6 +68,7 @@ class TestConnectionManager:
         ws = AsyncMock()
         await cm.connect(ws)
         await cm.broadcast("test.event", {"key": "value"})
+        await cm.drain()
 
         ws.send_text.assert_called_once()
         sent = json.loads(ws.send_text.call_args[0][0])
@@ -83,6 +84,7 @@ class TestConnectionManager:
         await cm.connect(ws1)
         await cm.connect(ws2)
         await cm.broadcast("event", {"x": 1})
+        await cm.drain()
 
         assert ws1.send_text.call_count == 1
         assert ws2.send_text.call_count == 1
@@ -100,6 +102,7 @@ class TestConnectionManager:
         assert len(cm.active_connections) == 2
 
         await cm.broadcast("event", {})
+        await cm.drain()
         assert len(cm.active_connections) == 1
         assert ws_ok in cm.active_connections
 
@@ -241,6 +244,7 @@ class TestBroadcastCleanupValueError:
 
         # First broadcast removes it, second cleanup should handle ValueError
         await cm.broadcast("test", {})
+        await cm.drain()
         # Connection should be gone
         assert ws_broken not in cm.active_connections
 
@@ -476,3 +480,151 @@ class TestEmitInterrupt:
                     await emit_interrupt("Test", "event")
                     second_call = mock_ws.broadcast.call_args_list[1]
                     assert second_call[0][1]["actions_taken"] == []
+
+
+# ============================================================
+# Per-Client Sende-Queues (Backpressure, Drop/Coalesce)
+# ============================================================
+
+
+import asyncio
+
+
+def _blocked_ws():
+    """WebSocket dessen send_text haengt bis das Event gesetzt wird."""
+    ws = AsyncMock()
+    release = asyncio.Event()
+    sent = []
+
+    async def _send(frame):
+        await release.wait()
+        sent.append(json.loads(frame)["event"])
+
+    ws.send_text.side_effect = _send
+    return ws, release, sent
+
+
+class TestSendQueues:
+    @pytest.mark.asyncio
+    async def test_slow_client_does_not_block_others(self):
+        cm = ConnectionManager()
+        slow, release, _ = _blocked_ws()
+        fast = AsyncMock()
+        await cm.connect(slow)
+        await cm.connect(fast)
+
+        await asyncio.wait_for(cm.broadcast("assistant.speaking", {"text": "a"}), 0.5)
+        for _ in range(20):
+            await asyncio.sleep(0)
+        assert fast.send_text.call_count == 1
+        release.set()
+        assert await cm.drain()
+        assert slow.send_text.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_broadcast_serialises_once(self):
+        cm = ConnectionManager()
+        ws1, ws2 = AsyncMock(), AsyncMock()
+        await cm.connect(ws1)
+        await cm.connect(ws2)
+        with patch("assistant.websocket.json.dumps", wraps=json.dumps) as dumps:
+            await cm.broadcast("event", {"x": 1})
+        assert dumps.call_count == 1
+        await cm.drain()
+        assert ws1.send_text.call_args[0][0] is ws2.send_text.call_args[0][0]
+
+    @pytest.mark.asyncio
+    async def test_coalesce_keeps_newest_progress(self):
+        cm = ConnectionManager()
+        ws, release, sent = _blocked_ws()
+        await cm.connect(ws)
+        await cm.broadcast("assistant.speaking", {"text": "x"})
+        await asyncio.sleep(0)  # Writer haengt im ersten send
+        for i in range(5):
+            await cm.broadcast("assistant.progress", {"step": str(i)})
+        assert len(cm._clients[ws].queue) == 1
+        release.set()
+        await cm.drain()
+        assert sent == ["assistant.speaking", "assistant.progress"]
+        last = json.loads(ws.send_text.call_args[0][0])
+        assert last["data"]["step"] == "4"
+
+    @pytest.mark.asyncio
+    async def test_coalesced_frame_moves_to_tail(self):
+        cm = ConnectionManager()
+        ws, release, sent = _blocked_ws()
+        await cm.connect(ws)
+        await cm.broadcast("assistant.speaking", {"text": "x"})
+        await asyncio.sleep(0)
+        await cm.broadcast("assistant.progress", {"step": "0"})
+        await cm.broadcast("assistant.response", {"text": "fertig"})
+        await cm.broadcast("assistant.progress", {"step": "1"})
+        release.set()
+        await cm.drain()
+        assert sent == ["assistant.speaking", "assistant.response", "assistant.progress"]
+
+    @pytest.mark.asyncio
+    async def test_full_queue_drops_tokens_keeps_important(self):
+        cm = ConnectionManager()
+        cm.queue_size = 8
+        ws, release, sent = _blocked_ws()
+        await cm.connect(ws)
+        await cm.broadcast("assistant.stream_start", {})
+        await asyncio.sleep(0)
+        for i in range(20):
+            await cm.broadcast("assistant.stream_token", {"token": str(i)})
+        await cm.broadcast("assistant.stream_end", {"text": "fertig"})
+        assert cm.dropped_frames > 0
+        release.set()
+        await cm.drain()
+        assert sent[-1] == "assistant.stream_end"
+        assert ws in cm.active_connections
+
+    @pytest.mark.asyncio
+    async def test_overflow_with_important_frames_disconnects(self):
+        cm = ConnectionManager()
+        cm.queue_size = 8
+        ws, release, _ = _blocked_ws()
+        await cm.connect(ws)
+        await cm.broadcast("assistant.speaking", {})
+        await asyncio.sleep(0)
+        for _ in range(10):
+            await cm.broadcast("assistant.proactive", {})
+        release.set()
+        await cm.drain()
+        for _ in range(5):
+            await asyncio.sleep(0)
+        assert ws not in cm.active_connections
+        assert cm.slow_disconnects == 1
+        ws.close.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_send_personal_ordered_with_broadcast(self):
+        cm = ConnectionManager()
+        ws, release, sent = _blocked_ws()
+        await cm.connect(ws)
+        await cm.broadcast("assistant.thinking", {})
+        await cm.send_personal(ws, "error", {"message": "x"})
+        await cm.broadcast("assistant.speaking", {})
+        release.set()
+        await cm.drain()
+        assert sent == ["assistant.thinking", "error", "assistant.speaking"]
+
+    @pytest.mark.asyncio
+    async def test_disconnect_cancels_writer(self):
+        cm = ConnectionManager()
+        ws = AsyncMock()
+        await cm.connect(ws)
+        task = cm._clients[ws].task
+        cm.disconnect(ws)
+        await asyncio.sleep(0)
+        assert task.cancelled() or task.done()
+        assert cm.get_stats()["connections"] == 0
+
+    def test_policy_from_config(self):
+        cfg = {"websocket": {"queue_size": 32, "drop_events": ["x.y"], "coalesce_events": []}}
+        with patch("assistant.config.yaml_config", cfg):
+            cm = ConnectionManager()
+        assert cm.queue_size == 32
+        assert cm.drop_events == frozenset({"x.y"})
+        assert not cm.coalesce_events
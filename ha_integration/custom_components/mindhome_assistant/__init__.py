@@ -38,7 +38,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
     _LOGGER.info(
-        "MindHome Assistant v1.1.2 geladen: %s", entry.data["url"]
+        "MindHome Assistant v1.2.0 geladen: %s", entry.data["url"]
     )
     return True
 
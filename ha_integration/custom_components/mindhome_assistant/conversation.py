@@ -3,8 +3,13 @@ Conversation Agent - Verbindet HA Voice Pipeline mit MindHome Assistant.
 
 Phase 9: Erweitert um Voice-Metadaten, TTS-Volume-Steuerung,
 SSML-Durchleitung und automatische Raumerkennung.
+
+Streaming: Antworten kommen satzweise per SSE (/api/assistant/chat/stream)
+und werden direkt in das HA Chat-Log geschrieben — die Pipeline startet TTS
+mit dem ersten Satz statt auf die komplette LLM-Antwort zu warten.
 """
 
+import json
 import logging
 import time
 from typing import Literal
@@ -12,10 +17,12 @@ from typing import Literal
 import aiohttp
 
 from homeassistant.components.conversation import (
+    AssistantContent,
     ChatLog,
     ConversationEntity,
     ConversationInput,
     ConversationResult,
+    async_get_result_from_chat_log,
 )
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
@@ -49,10 +56,12 @@ class MindHomeAssistantAgent(ConversationEntity):
     - Automatische Raumerkennung aus Device-Kontext
     - TTS-Volume-Steuerung vor Sprachausgabe
     - SSML-Durchleitung an Piper TTS
+    - Satzweises Streaming ins Chat-Log (Fallback: /api/assistant/chat)
     """
 
     _attr_has_entity_name = True
     _attr_name = "MindHome Assistant"
+    _attr_supports_streaming = True
 
     def __init__(self, hass: HomeAssistant, entry: ConfigEntry) -> None:
         self.hass = hass
@@ -62,6 +71,8 @@ class MindHomeAssistantAgent(ConversationEntity):
         self._attr_unique_id = f"{entry.entry_id}_conversation"
         self._last_request_time: float = 0.0
         self._cached_speaker: str | None = None
+        # False sobald der Server kein /chat/stream kennt (aeltere Version)
+        self._stream_supported = True
 
     @property
     def supported_languages(self) -> Literal["*"]:
@@ -97,6 +108,17 @@ class MindHomeAssistantAgent(ConversationEntity):
         if ha_device_id:
             payload["device_id"] = ha_device_id
 
+        if self._stream_supported:
+            result = await self._async_handle_streaming(
+                user_input, chat_log, payload
+            )
+            if result is not None:
+                return result
+            _LOGGER.info(
+                "MindHome Assistant ohne Streaming-Endpoint, nutze /api/assistant/chat"
+            )
+            self._stream_supported = False
+
         response_text = "Ich kann gerade nicht denken."
         tts_data = None
 
@@ -138,6 +160,100 @@ class MindHomeAssistantAgent(ConversationEntity):
             conversation_id=user_input.conversation_id,
         )
 
+    # ------------------------------------------------------------------
+    # Streaming (SSE)
+    # ------------------------------------------------------------------
+
+    async def _async_handle_streaming(
+        self,
+        user_input: ConversationInput,
+        chat_log: ChatLog,
+        payload: dict,
+    ) -> ConversationResult | None:
+        """Streamt die Antwort satzweise ins Chat-Log.
+
+        Gibt None zurueck wenn der Server den Endpoint nicht kennt —
+        dann uebernimmt der klassische /api/assistant/chat Pfad.
+        """
+        meta: dict = {}
+        try:
+            session = async_get_clientsession(self.hass)
+            headers = {"Accept": "text/event-stream"}
+            if self._api_key:
+                headers["X-API-Key"] = self._api_key
+            async with session.post(
+                f"{self._url}/api/assistant/chat/stream",
+                json=payload,
+                headers=headers,
+                # Kein Gesamt-Timeout: 30s Funkstille zwischen zwei Frames
+                timeout=aiohttp.ClientTimeout(total=None, sock_read=30),
+            ) as resp:
+                if resp.status in (404, 405):
+                    return None
+                async for _content in chat_log.async_add_delta_content_stream(
+                    self.entity_id, self._stream_deltas(resp, meta)
+                ):
+                    pass
+        except Exception as e:
+            _LOGGER.error("MindHome Assistant nicht erreichbar: %s", e)
+            chat_log.async_add_assistant_content_without_tools(
+                AssistantContent(
+                    agent_id=self.entity_id,
+                    content=(
+                        "Ich kann gerade nicht denken. "
+                        "Der Assistant-Server ist nicht erreichbar."
+                    ),
+                )
+            )
+
+        # Volume wurde schon mit dem tts-Frame vor dem ersten Satz gesetzt;
+        # hier nur nachziehen, falls der done-Frame anders entschieden hat
+        # (oder ein aelterer Server keinen tts-Frame schickt). SSML entfaellt
+        # beim Streaming — die Pipeline spricht den Text aus dem Chat-Log.
+        tts_data = meta.get("tts")
+        early = meta.get("tts_early") or {}
+        if (
+            tts_data
+            and tts_data.get("volume") is not None
+            and tts_data["volume"] != early.get("volume")
+        ):
+            await self._set_tts_volume(
+                tts_data["volume"], target_speaker=tts_data.get("target_speaker")
+            )
+
+        return async_get_result_from_chat_log(user_input, chat_log)
+
+    async def _stream_deltas(self, resp: aiohttp.ClientResponse, meta: dict):
+        """SSE-Frames → Chat-Log Deltas. tts-/done-Frame landen in meta.
+
+        Der tts-Frame kommt vor dem ersten Satz: die Lautstaerke wird gesetzt,
+        bevor die Pipeline zu sprechen beginnt.
+        """
+        yield {"role": "assistant"}
+        if resp.status != 200:
+            _LOGGER.error("MindHome Assistant Fehler: HTTP %d", resp.status)
+            yield {"content": "Da stimmt etwas nicht."}
+            return
+        streamed = False
+        try:
+            async for event, data in _iter_sse(resp.content):
+                if event == "delta" and data.get("text"):
+                    streamed = True
+                    yield {"content": data["text"]}
+                elif event == "tts" and not streamed:
+                    meta["tts_early"] = data
+                    if data.get("volume") is not None:
+                        await self._set_tts_volume(
+                            data["volume"], target_speaker=data.get("target_speaker")
+                        )
+                elif event == "done":
+                    meta.update(data)
+        except (aiohttp.ClientError, TimeoutError) as e:
+            # Schon gesprochene Saetze bleiben stehen, nur der Rest fehlt
+            _LOGGER.error("MindHome Assistant Stream abgebrochen: %s", e)
+            if not streamed:
+                yield {"content": "Da stimmt etwas nicht."}
+
     # ------------------------------------------------------------------
     # Person Resolution: UUID -> Display Name
     # ------------------------------------------------------------------
@@ -337,3 +453,26 @@ class MindHomeAssistantAgent(ConversationEntity):
 
         _LOGGER.warning("Kein TTS-Speaker gefunden (alle ausgeschlossen oder unavailable)")
         return None
+
+
+async def _iter_sse(stream: aiohttp.StreamReader):
+    """Liest Server-Sent Events zeilenweise → (event, data-dict)."""
+    event, data_lines = "message", []
+    async for raw in stream:
+        line = raw.decode("utf-8").rstrip("\r\n")
+        if not line:
+            if data_lines:
+                try:
+                    yield event, json.loads("\n".join(data_lines))
+                except ValueError:
+                    _LOGGER.debug("Ungueltiger SSE-Frame: %s", data_lines)
+            event, data_lines = "message", []
+            continue
+        if line.startswith(":"):
+            continue
+        field, _, value = line.partition(":")
+        value = value.removeprefix(" ")
+        if field == "event":
+            event = value
+        elif field == "data":
+            data_lines.append(value)